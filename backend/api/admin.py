@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Session, Bill, Speaker, Statement
+from .models import Session, Bill, Speaker, Statement, LLMBatchCheckpoint
 
 @admin.register(Session)
 class SessionAdmin(admin.ModelAdmin):
@@ -27,3 +27,14 @@ class StatementAdmin(admin.ModelAdmin):
     list_filter = ('session__era_co', 'speaker__plpt_nm')
     search_fields = ('text', 'speaker__naas_nm')
     raw_id_fields = ('session', 'bill', 'speaker')
+
+@admin.register(LLMBatchCheckpoint)
+class LLMBatchCheckpointAdmin(admin.ModelAdmin):
+    list_display = ('session', 'kind', 'status', 'bill_name', 'model_name',
+                    'segment_start', 'segment_end', 'estimated_tokens',
+                    'attempts', 'updated_at')
+    list_filter = ('status', 'kind', 'prompt_version', 'model_name')
+    search_fields = ('session__conf_id', 'bill_name', 'batch_key')
+    raw_id_fields = ('session',)
+    readonly_fields = ('result', 'error', 'started_at', 'finished_at',
+                       'created_at', 'updated_at')
@@ -0,0 +1,512 @@
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+
+from .json_stream import StreamingJSONArrayParser
+from .models import Session, Statement
+
+logger = logging.getLogger(__name__)
+
+# Lifecycle of an offline batch job, as stored in its manifest
+JOB_CREATED = 'created'
+JOB_SUBMITTED = 'submitted'
+JOB_RUNNING = 'running'
+JOB_SUCCEEDED = 'succeeded'
+JOB_FAILED = 'failed'
+JOB_INGESTED = 'ingested'
+ACTIVE_JOB_STATES = (JOB_SUBMITTED, JOB_RUNNING)
+
+REQUESTS_FILE = 'requests.jsonl'
+RESULTS_FILE = 'results.jsonl'
+MANIFEST_FILE = 'manifest.json'
+
+
+def get_batch_job_root():
+    return Path(
+        getattr(settings, 'LLM_BATCH_JOB_DIR',
+                Path(settings.BASE_DIR) / 'llm_batch_jobs'))
+
+
+def get_batch_job_dir(job_id):
+    return get_batch_job_root() / job_id
+
+
+def make_request_id(session_id, offset, batch_segments):
+    """
+    Stable ID for one batch request: the same session, transcript offset and
+    segment texts always produce the same ID, so rebuilding a job or
+    re-ingesting its results never duplicates work.
+    """
+    digest = hashlib.sha1(
+        '\x1e'.join(batch_segments).encode('utf-8')).hexdigest()[:12]
+    return f"{session_id}-{offset:07d}-{digest}"
+
+
+def assign_segments_to_bills(text, segment_spans, bill_names):
+    """
+    Attribute each ◯ segment to the known bill whose first mention in the
+    transcript most recently precedes it (None before any bill is named).
+    This stands in for LLM discovery, which is interactive.
+    """
+    mentions = []
+    for bill_name in bill_names or []:
+        search_terms = [bill_name.strip(), bill_name.split('(')[0].strip()]
+        positions = [
+            text.find(term) for term in search_terms if len(term) > 3
+        ]
+        positions = [pos for pos in positions if pos != -1]
+        if positions:
+            mentions.append((min(positions), bill_name))
+    mentions.sort()
+
+    assigned = []
+    for offset, _ in segment_spans:
+        current = None
+        for position, bill_name in mentions:
+            if position > offset:
+                break
+            current = bill_name
+        assigned.append(current)
+    return assigned
+
+
+def build_session_requests(session, full_text, model_name):
+    """
+    Turn one session transcript into batch requests.
+
+    Uses the same ◯ splitting, procedural filter, token-budget planner and
+    prompt as live analysis. Returns (request_lines, manifest_entries), both
+    keyed by stable request ID.
+    """
+    from .tasks import (BATCH_ANALYSIS_RESPONSE_SCHEMA, TURN_MEMBER,
+                        build_batch_analysis_prompt, classify_turn,
+                        clean_pdf_text, get_session_bill_names,
+                        plan_segment_batches, split_speech_segments)
+
+    cleaned_text = clean_pdf_text(full_text)
+    segment_spans = split_speech_segments(cleaned_text) or []
+    bill_names = get_session_bill_names(session.conf_id)
+    assigned_bills = assign_segments_to_bills(cleaned_text, segment_spans,
+                                              bill_names)
+
+    # Contiguous runs of segments attributed to the same bill
+    groups = []
+    for (offset, segment), bill_name in zip(segment_spans, assigned_bills):
+        if classify_turn(segment)[0] != TURN_MEMBER:
+            continue
+        if not groups or groups[-1]['bill_name'] != bill_name:
+            groups.append({'bill_name': bill_name, 'spans': []})
+        groups[-1]['spans'].append((offset, segment))
+
+    request_lines = []
+    manifest_entries = {}
+    for group in groups:
+        segments = [segment for _, segment in group['spans']]
+        for entry in plan_segment_batches(segments):
+            batch_segments = segments[entry['start']:entry['end']]
+            prompt, cleaned_segments = build_batch_analysis_prompt(
+                batch_segments, group['bill_name'])
+            if not cleaned_segments:
+                continue
+
+            offset = group['spans'][entry['start']][0]
+            request_id = make_request_id(session.conf_id, offset,
+                                         batch_segments)
+            request_lines.append({
+                'key': request_id,
+                'request': {
+                    'contents': [{
+                        'role': 'user',
+                        'parts': [{
+                            'text': prompt
+                        }]
+                    }],
+                    'generation_config': {
+                        'response_mime_type': 'application/json',
+                        'response_schema': BATCH_ANALYSIS_RESPONSE_SCHEMA
+                    }
+                }
+            })
+            manifest_entries[request_id] = {
+                'session_id': session.conf_id,
+                'bill_name': group['bill_name'],
+                'offset': offset,
+                'segments': batch_segments,
+                'estimated_tokens': entry['estimated_tokens'],
+                'model': model_name
+            }
+    return request_lines, manifest_entries
+
+
+def get_pending_session_ids(era_co=None, limit=None):
+    """Sessions with a transcript URL but no statements yet, newest first."""
+    sessions = Session.objects.exclude(down_url__isnull=True).exclude(
+        down_url='').filter(statements__isnull=True).distinct()
+    if era_co:
+        sessions = sessions.filter(era_co__in=[era_co, f'제{era_co}대'])
+    session_ids = sessions.order_by('-conf_dt').values_list('conf_id',
+                                                            flat=True)
+    if limit:
+        session_ids = session_ids[:limit]
+    return list(session_ids)
+
+
+def save_batch_job(job):
+    job['updated_at'] = datetime.now().isoformat()
+    job_dir = get_batch_job_dir(job['job_id'])
+    job_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = job_dir / MANIFEST_FILE
+    temp_path = manifest_path.with_suffix('.tmp')
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(job, f, ensure_ascii=False, indent=2)
+    temp_path.replace(manifest_path)
+    return job
+
+
+def load_batch_job(job_id):
+    manifest_path = get_batch_job_dir(job_id) / MANIFEST_FILE
+    if not manifest_path.exists():
+        logger.error(f"❌ Batch job {job_id} not found at {manifest_path}")
+        return None
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def create_batch_job(session_ids,
+                     model_name=None,
+                     executor='gemini',
+                     transcript_loader=None):
+    """
+    Write a JSONL job file covering every pending segment of the sessions.
+
+    transcript_loader(session) returns the raw transcript text and defaults
+    to downloading the session PDF. Returns the job manifest, or None if
+    no requests were produced.
+    """
+    from .tasks import CASCADE_LITE_MODEL, download_session_transcript
+
+    model_name = model_name or CASCADE_LITE_MODEL
+    transcript_loader = transcript_loader or download_session_transcript
+
+    request_lines = []
+    requests_meta = {}
+    sessions_done = []
+    for session in Session.objects.filter(conf_id__in=session_ids):
+        try:
+            full_text = transcript_loader(session)
+        except Exception as e:
+            logger.error(
+                f"❌ Could not load transcript for session {session.conf_id}: {e}"
+            )
+            continue
+        if not full_text or not full_text.strip():
+            logger.warning(f"Empty transcript for session {session.conf_id}")
+            continue
+
+        lines, entries = build_session_requests(session, full_text,
+                                                model_name)
+        for line in lines:
+            if line['key'] not in requests_meta:
+                request_lines.append(line)
+                requests_meta[line['key']] = entries[line['key']]
+        sessions_done.append(session.conf_id)
+        logger.info(
+            f"📝 Session {session.conf_id}: {len(lines)} batch requests")
+
+    if not request_lines:
+        logger.warning("No batch requests produced; job not created")
+        return None
+
+    digest = hashlib.sha1(''.join(sorted(requests_meta)).encode(
+        'utf-8')).hexdigest()[:6]
+    job_id = f"llm-batch-{datetime.now():%Y%m%d-%H%M%S}-{digest}"
+    job_dir = get_batch_job_dir(job_id)
+    job_dir.mkdir(parents=True, exist_ok=True)
+    with open(job_dir / REQUESTS_FILE, 'w', encoding='utf-8') as f:
+        for line in request_lines:
+            f.write(json.dumps(line, ensure_ascii=False) + '\n')
+
+    job = {
+        'job_id': job_id,
+        'state': JOB_CREATED,
+        'executor': executor,
+        'model': model_name,
+        'created_at': datetime.now().isoformat(),
+        'session_ids': sessions_done,
+        'request_count': len(request_lines),
+        'estimated_tokens': sum(meta['estimated_tokens']
+                                for meta in requests_meta.values()),
+        'handle': None,
+        'requests': requests_meta,
+        'ingested': [],
+        'failed_requests': [],
+    }
+    save_batch_job(job)
+    logger.info(
+        f"✅ Created batch job {job_id}: {len(request_lines)} requests, "
+        f"~{job['estimated_tokens']} tokens for {len(sessions_done)} sessions")
+    return job
+
+
+class LocalBatchExecutor:
+    """
+    In-process stand-in for a batch API, used for tests and small runs.
+
+    Every request is answered synchronously at submit time by
+    responder(request_id, request) -> response text (default: the
+    configured Gemini client), and the results file is written in the same
+    JSONL shape the Gemini batch API produces.
+    """
+
+    name = 'local'
+
+    def __init__(self, responder=None):
+        self.responder = responder or self._gemini_responder
+
+    @staticmethod
+    def _gemini_responder(request_id, request):
+        from .tasks import BATCH_ANALYSIS_RESPONSE_SCHEMA, _stream_gemini_text
+        prompt = request['contents'][0]['parts'][0]['text']
+        return ''.join(
+            _stream_gemini_text(
+                prompt, response_schema=BATCH_ANALYSIS_RESPONSE_SCHEMA))
+
+    def submit(self, job):
+        job_dir = get_batch_job_dir(job['job_id'])
+        with open(job_dir / REQUESTS_FILE, 'r', encoding='utf-8') as src, \
+                open(job_dir / RESULTS_FILE, 'w', encoding='utf-8') as dst:
+            for line in src:
+                if not line.strip():
+                    continue
+                item = json.loads(line)
+                try:
+                    text = self.responder(item['key'], item['request'])
+                    result = {
+                        'key': item['key'],
+                        'response': {
+                            'candidates': [{
+                                'content': {
+                                    'parts': [{
+                                        'text': text
+                                    }]
+                                }
+                            }]
+                        }
+                    }
+                except Exception as e:
+                    result = {'key': item['key'], 'error': {'message': str(e)}}
+                dst.write(json.dumps(result, ensure_ascii=False) + '\n')
+        return f"local:{job['job_id']}"
+
+    def poll(self, job):
+        results_path = get_batch_job_dir(job['job_id']) / RESULTS_FILE
+        return JOB_SUCCEEDED if results_path.exists() else JOB_FAILED
+
+    def download_results(self, job):
+        return get_batch_job_dir(job['job_id']) / RESULTS_FILE
+
+
+class GeminiBatchExecutor:
+    """Runs a job through the Gemini batch API (google.genai SDK)."""
+
+    name = 'gemini'
+    STATE_MAP = {
+        'JOB_STATE_PENDING': JOB_SUBMITTED,
+        'JOB_STATE_QUEUED': JOB_SUBMITTED,
+        'JOB_STATE_RUNNING': JOB_RUNNING,
+        'JOB_STATE_SUCCEEDED': JOB_SUCCEEDED,
+        'JOB_STATE_FAILED': JOB_FAILED,
+        'JOB_STATE_CANCELLED': JOB_FAILED,
+        'JOB_STATE_EXPIRED': JOB_FAILED,
+    }
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is not None:
+            return self._client
+        from .tasks import get_gemini_client
+        client = get_gemini_client()
+        if not client or not hasattr(client, 'batches'):
+            raise RuntimeError(
+                "Gemini batch API requires the google.genai client")
+        return client
+
+    def submit(self, job):
+        from .tasks import types
+        requests_path = get_batch_job_dir(job['job_id']) / REQUESTS_FILE
+        uploaded = self.client.files.upload(
+            file=str(requests_path),
+            config=types.UploadFileConfig(display_name=job['job_id'],
+                                          mime_type='jsonl'))
+        batch = self.client.batches.create(
+            model=job['model'],
+            src=uploaded.name,
+            config={'display_name': job['job_id']})
+        return batch.name
+
+    def poll(self, job):
+        batch = self.client.batches.get(name=job['handle'])
+        state = getattr(batch.state, 'name', str(batch.state))
+        return self.STATE_MAP.get(state, JOB_RUNNING)
+
+    def download_results(self, job):
+        batch = self.client.batches.get(name=job['handle'])
+        content = self.client.files.download(file=batch.dest.file_name)
+        results_path = get_batch_job_dir(job['job_id']) / RESULTS_FILE
+        with open(results_path, 'wb') as f:
+            f.write(content)
+        return results_path
+
+
+BATCH_EXECUTORS = {
+    LocalBatchExecutor.name: LocalBatchExecutor,
+    GeminiBatchExecutor.name: GeminiBatchExecutor,
+}
+
+
+def get_batch_executor(name):
+    executor_class = BATCH_EXECUTORS.get(name)
+    if executor_class is None:
+        raise ValueError(f"Unknown batch executor: {name}")
+    return executor_class()
+
+
+def submit_batch_job(job_id, executor=None):
+    job = load_batch_job(job_id)
+    if not job:
+        return None
+    if job['state'] != JOB_CREATED:
+        logger.info(f"Batch job {job_id} already {job['state']}")
+        return job
+
+    executor = executor or get_batch_executor(job['executor'])
+    job['handle'] = executor.submit(job)
+    job['state'] = JOB_SUBMITTED
+    job['submitted_at'] = datetime.now().isoformat()
+    logger.info(f"🚀 Submitted batch job {job_id} as {job['handle']}")
+    return save_batch_job(job)
+
+
+def refresh_batch_job(job_id, executor=None):
+    """Poll the executor and record the job state. Returns the manifest."""
+    job = load_batch_job(job_id)
+    if not job or job['state'] not in ACTIVE_JOB_STATES:
+        return job
+
+    executor = executor or get_batch_executor(job['executor'])
+    state = executor.poll(job)
+    if state == JOB_SUCCEEDED:
+        executor.download_results(job)
+    if state != job['state']:
+        logger.info(f"Batch job {job_id}: {job['state']} -> {state}")
+        job['state'] = state
+        save_batch_job(job)
+    return job
+
+
+def _result_text(result):
+    """Response text of one batch result line, or None on error."""
+    response = result.get('response') or {}
+    try:
+        parts = response['candidates'][0]['content']['parts']
+    except (KeyError, IndexError, TypeError):
+        return None
+    return ''.join(part.get('text', '') for part in parts)
+
+
+def ingest_batch_results(job_id):
+    """
+    Turn downloaded batch results into Statement rows.
+
+    Results are validated exactly like live responses. Already-ingested
+    request IDs are skipped, so ingestion can be re-run safely. Returns a
+    dict of counters.
+    """
+    from .tasks import (_analysis_segment_position, _analysis_to_statement,
+                        get_all_assembly_members,
+                        process_extracted_statements_data)
+
+    job = load_batch_job(job_id)
+    if not job:
+        return None
+    results_path = get_batch_job_dir(job_id) / RESULTS_FILE
+    if job['state'] not in (JOB_SUCCEEDED,
+                            JOB_INGESTED) or not results_path.exists():
+        logger.warning(
+            f"Batch job {job_id} has no results to ingest (state: {job['state']})"
+        )
+        return None
+
+    assembly_members = get_all_assembly_members()
+    ingested = set(job['ingested'])
+    failed = set(job['failed_requests'])
+    statements_by_session = {}
+    counts = {'requests': 0, 'statements': 0, 'failed': 0, 'skipped': 0}
+
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            result = json.loads(line)
+            request_id = result.get('key')
+            meta = job['requests'].get(request_id)
+            if not meta or request_id in ingested:
+                counts['skipped'] += 1
+                continue
+
+            text = _result_text(result)
+            if text is None:
+                failed.add(request_id)
+                counts['failed'] += 1
+                logger.warning(
+                    f"Batch request {request_id} failed: {result.get('error')}"
+                )
+                continue
+
+            # Objects are matched to segments by the 구간 ID they echo
+            segment_ids = {
+                position + 1: position
+                for position in range(len(meta['segments']))
+            }
+            answered = set()
+            parser = StreamingJSONArrayParser()
+            for _, analysis_json in parser.feed(text):
+                position = _analysis_segment_position(
+                    analysis_json, segment_ids) if isinstance(
+                        analysis_json, dict) else None
+                if position is None or position in answered:
+                    continue
+                answered.add(position)
+                statement = _analysis_to_statement(analysis_json, position,
+                                                   meta['segments'],
+                                                   assembly_members, 0)
+                if statement:
+                    statement['associated_bill_name'] = meta['bill_name']
+                    statements_by_session.setdefault(meta['session_id'],
+                                                     []).append(statement)
+                    counts['statements'] += 1
+            ingested.add(request_id)
+            failed.discard(request_id)
+            counts['requests'] += 1
+
+    for session in Session.objects.filter(
+            conf_id__in=list(statements_by_session)):
+        # Statements carry their own text; indices are segment-relative
+        process_extracted_statements_data(
+            statements_by_session[session.conf_id], session, None)
+
+    job['ingested'] = sorted(ingested)
+    job['failed_requests'] = sorted(failed)
+    job['state'] = JOB_INGESTED
+    save_batch_job(job)
+    logger.info(
+        f"✅ Ingested batch job {job_id}: {counts['requests']} requests, "
+        f"{counts['statements']} statements, {counts['failed']} failed")
+    return counts
@@ -0,0 +1,343 @@
+import csv
+import hashlib
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+# How long a process keeps its catalog before re-reading the source. Commands
+# that change categories bump the shared PolicyCatalogRevision, which every
+# process checks before serving its copy; the TTL only backs that up (e.g.
+# categories edited by hand in the admin).
+CATEGORY_CATALOG_TTL_SECONDS = 3600
+
+# Primary key of the single PolicyCatalogRevision row
+CATALOG_REVISION_PK = 1
+
+# Discovery prompt lists only the first few subcategories per category
+DISCOVERY_SUBCATEGORIES_PER_CATEGORY = 3
+
+FALLBACK_CATEGORY_NAMES = [
+    "경제정책",
+    "사회정책",
+    "외교안보정책",
+    "법행정제도",
+    "과학기술정책",
+    "문화체육정책",
+    "인권소수자정책",
+    "지역균형정책",
+    "정치정책",
+]
+
+
+def _code_file_candidates():
+    base_dir = Path(settings.BASE_DIR)
+    return [
+        base_dir.parent / "Additional_Files" / "code.txt",
+        base_dir / "Additional_Files" / "code.txt",
+        Path("../Additional_Files/code.txt"),
+        Path("Additional_Files/code.txt"),
+    ]
+
+
+class CategoryCatalog:
+    """
+    Immutable snapshot of the policy category tree plus the prompt text
+    derived from it.
+
+    `categories` maps category name to {'id', 'description', 'subcategories'}
+    (ids are None when the catalog was not loaded from the database).
+    `category_index` / `subcategory_index` are the 1-based indices the
+    discovery prompt uses, `category_ids` / `subcategory_ids` map names to
+    database ids for tagging, and `version` is a hash of the content so
+    caches keyed on it are dropped whenever the categories change.
+    `revision` is the shared PolicyCatalogRevision it was built at.
+    """
+
+    def __init__(self, categories, source):
+        self.categories = categories
+        self.source = source
+        self.loaded_at = time.time()
+        self.revision = None
+        self.version = hashlib.sha1(
+            json.dumps(categories, ensure_ascii=False,
+                       sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        self._prompt_prefixes = {}
+        self._prefix_lock = threading.Lock()
+
+        self.category_ids = {}
+        self.subcategory_ids = {}
+        for cat_name, cat_data in categories.items():
+            if cat_data['id'] is None:
+                continue
+            self.category_ids[cat_name] = cat_data['id']
+            for sub in cat_data['subcategories']:
+                self.subcategory_ids[(cat_name, sub['name'])] = sub['id']
+
+        self.category_index = {}
+        self.subcategory_index = {}
+        section = "**POLICY CATEGORIES (use index numbers):**\n"
+        subcategory_number = 1
+        for category_number, (cat_name, cat_data) in enumerate(
+                categories.items(), start=1):
+            section += f"{category_number}. {cat_name}\n"
+            self.category_index[category_number] = cat_name
+            for sub in cat_data['subcategories'][:
+                                                 DISCOVERY_SUBCATEGORIES_PER_CATEGORY]:
+                section += f"  {subcategory_number}. {sub['name']}\n"
+                self.subcategory_index[subcategory_number] = (category_number,
+                                                              sub['name'])
+                subcategory_number += 1
+        self.discovery_categories_section = section.rstrip("\n")
+
+        categories_list = []
+        for cat_name, cat_data in categories.items():
+            subcats = [
+                f"  - {sub['name']}: {sub['description']}"
+                for sub in cat_data['subcategories']
+            ]
+            categories_list.append(f"{cat_name}:\n" + "\n".join(subcats))
+        self.analysis_categories_text = "\n\n".join(categories_list)
+
+    def __len__(self):
+        return len(self.categories)
+
+    @property
+    def subcategory_count(self):
+        return sum(
+            len(cat['subcategories']) for cat in self.categories.values())
+
+    def get_prompt_prefix(self, key, builder):
+        """
+        Return the static prompt prefix registered under `key`, building it
+        once per catalog version with builder(catalog).
+        """
+        with self._prefix_lock:
+            if key not in self._prompt_prefixes:
+                self._prompt_prefixes[key] = builder(self)
+            return self._prompt_prefixes[key]
+
+
+def _load_from_database():
+    from .models import Category
+
+    categories = {}
+    for category in Category.objects.prefetch_related(
+            'subcategories').order_by('id'):
+        categories[category.name] = {
+            'id': category.id,
+            'description': category.description,
+            'subcategories': [{
+                'id': sub.id,
+                'name': sub.name,
+                'description': sub.description
+            } for sub in sorted(category.subcategories.all(),
+                                key=lambda sub: sub.id)]
+        }
+    return categories
+
+
+def _load_from_code_file():
+    code_file_path = next(
+        (path for path in _code_file_candidates() if path.exists()), None)
+    if code_file_path is None:
+        return {}
+
+    categories = {}
+    with open(code_file_path, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            main_category = (row.get('대범주') or '').strip()
+            sub_category = (row.get('소범주') or '').strip()
+            if not main_category:
+                continue
+
+            cat_data = categories.setdefault(
+                main_category, {
+                    'id': None,
+                    'description': (row.get('대범주 설명') or '').strip(),
+                    'subcategories': []
+                })
+            if sub_category and all(sub['name'] != sub_category
+                                    for sub in cat_data['subcategories']):
+                cat_data['subcategories'].append({
+                    'id': None,
+                    'name': sub_category,
+                    'description': (row.get('소범주 설명') or '').strip()
+                })
+    return categories
+
+
+def _build_catalog():
+    try:
+        categories = _load_from_database()
+        if categories:
+            return CategoryCatalog(categories, 'database')
+    except Exception as e:
+        logger.warning(f"Could not load policy categories from database: {e}")
+
+    try:
+        categories = _load_from_code_file()
+        if categories:
+            return CategoryCatalog(categories, 'code.txt')
+    except Exception as e:
+        logger.warning(f"Could not load policy categories from code.txt: {e}")
+
+    logger.warning("❌ No policy categories found, using fallback categories")
+    return CategoryCatalog(
+        {
+            name: {
+                'id': None,
+                'description': '',
+                'subcategories': []
+            }
+            for name in FALLBACK_CATEGORY_NAMES
+        }, 'fallback')
+
+
+def _shared_revision():
+    """The shared PolicyCatalogRevision, or None if it cannot be read."""
+    from .models import PolicyCatalogRevision
+
+    try:
+        return PolicyCatalogRevision.objects.filter(
+            pk=CATALOG_REVISION_PK).values_list('revision',
+                                                flat=True).first() or 0
+    except Exception as e:
+        logger.debug(f"Could not read policy category revision: {e}")
+        return None
+
+
+def _bump_shared_revision():
+    """Move the shared revision on, creating its row on first use."""
+    from .models import PolicyCatalogRevision
+
+    try:
+        if not PolicyCatalogRevision.objects.filter(
+                pk=CATALOG_REVISION_PK).update(revision=F('revision') + 1):
+            PolicyCatalogRevision.objects.get_or_create(
+                pk=CATALOG_REVISION_PK, defaults={'revision': 1})
+    except Exception as e:
+        logger.warning(f"Could not bump policy category revision: {e}")
+
+
+def _is_current(catalog, revision):
+    return (catalog is not None
+            and (revision is None or catalog.revision == revision)
+            and time.time() - catalog.loaded_at < CATEGORY_CATALOG_TTL_SECONDS)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_category_catalog():
+    """
+    Return the process-wide category catalog, loading it on first use and
+    reloading it once the shared revision has moved, i.e. another process
+    changed the categories.
+    """
+    global _catalog
+    # Read before building, so a change made during the build is seen next time
+    revision = _shared_revision()
+    catalog = _catalog
+    if _is_current(catalog, revision):
+        return catalog
+
+    with _catalog_lock:
+        if not _is_current(_catalog, revision):
+            _catalog = _build_catalog()
+            _catalog.revision = revision
+            logger.info(
+                f"📂 Loaded policy category catalog {_catalog.version} from {_catalog.source}: "
+                f"{len(_catalog)} categories, {_catalog.subcategory_count} subcategories"
+            )
+        return _catalog
+
+
+def invalidate_category_catalog():
+    """
+    Drop the cached catalog and bump the shared revision, so this and every
+    other process (e.g. running Celery workers) reload it on next access.
+    """
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
+    _bump_shared_revision()
+
+
+def resolve_category_ids(main_category,
+                         sub_category=None,
+                         create=False,
+                         catalog=None):
+    """
+    (category_id, subcategory_id) for policy category names, from the
+    cached catalog so tagging does not query per statement or bill. Bulk
+    writers pass the catalog they took once for the whole batch.
+
+    Unknown names resolve to None unless create is set, in which case the
+    missing Category/Subcategory row is created and the catalog dropped.
+    """
+    if catalog is None:
+        catalog = get_category_catalog()
+    category_id = catalog.category_ids.get(main_category)
+    if category_id is None:
+        if not create:
+            return None, None
+        from .models import Category
+        category_id = Category.objects.get_or_create(
+            name=main_category,
+            defaults={'description': f'{main_category} 관련 정책'})[0].id
+        invalidate_category_catalog()
+
+    if not sub_category:
+        return category_id, None
+    subcategory_id = catalog.subcategory_ids.get((main_category, sub_category))
+    if subcategory_id is None and create:
+        from .models import Subcategory
+        subcategory_id = Subcategory.objects.get_or_create(
+            name=sub_category,
+            category_id=category_id,
+            defaults={
+                'description': f'{sub_category} 관련 세부 정책 ({main_category})'
+            })[0].id
+        invalidate_category_catalog()
+    return category_id, subcategory_id
+
+
+def save_category_links(build_links, save_links, table_names):
+    """
+    Build category links with build_links(catalog) and write them with
+    save_links(links) in a savepoint whose foreign keys (deferred until
+    commit otherwise) are checked before it is released.
+
+    Ids from a catalog that another process made stale, e.g. with
+    load_policy_categories --clear-existing, fail that check; the catalog is
+    then reloaded and the links rebuilt once. If they still fail only the
+    savepoint is rolled back, so the caller's own writes in the enclosing
+    transaction are kept, and None is returned.
+    """
+    catalog = get_category_catalog()
+    for attempt in range(2):
+        links = build_links(catalog)
+        if not links:
+            return links
+        try:
+            with transaction.atomic():
+                save_links(links)
+                connection.check_constraints(table_names=table_names)
+            return links
+        except IntegrityError as e:
+            if attempt:
+                logger.error(f"❌ Could not save policy category links: {e}")
+                return None
+            logger.warning(
+                f"⚠️ Policy category ids are stale, reloading the catalog: {e}")
+            invalidate_category_catalog()
+            catalog = get_category_catalog()
@@ -0,0 +1,119 @@
+import logging
+
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+logger = logging.getLogger(__name__)
+
+COUNTER_RECONCILE_BATCH_SIZE = 500
+
+
+def _count_subquery(model, field):
+    """Correlated COUNT(*) of model rows whose `field` is the outer row."""
+    counts = model.objects.filter(**{
+        field: OuterRef('pk')
+    }).order_by().values(field).annotate(rows=Count('pk')).values('rows')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def refresh_session_counters(session_ids):
+    """
+    Recompute Session.statement_count and Session.bill_count for the given
+    sessions with one UPDATE. Counting in the database keeps the columns
+    exact even when bulk inserts skip conflicting rows.
+    """
+    from .models import Bill, Session, Statement
+
+    session_ids = [session_id for session_id in set(session_ids) if session_id]
+    if not session_ids:
+        return 0
+    return Session.objects.filter(pk__in=session_ids).update(
+        statement_count=_count_subquery(Statement, 'session'),
+        bill_count=_count_subquery(Bill, 'session'))
+
+
+def refresh_bill_counters(bill_ids):
+    """Recompute Bill.statement_count for the given bills with one UPDATE."""
+    from .models import Bill, Statement
+
+    bill_ids = [bill_id for bill_id in set(bill_ids) if bill_id]
+    if not bill_ids:
+        return 0
+    return Bill.objects.filter(pk__in=bill_ids).update(
+        statement_count=_count_subquery(Statement, 'bill'))
+
+
+def statement_counter_targets(statements):
+    """
+    (session_ids, bill_ids) whose counters depend on the given Statement
+    queryset. Read them before deleting or moving the statements, then pass
+    them to refresh_counters.
+    """
+    session_ids, bill_ids = set(), set()
+    for session_id, bill_id in statements.order_by().values_list(
+            'session_id', 'bill_id').distinct():
+        session_ids.add(session_id)
+        bill_ids.add(bill_id)
+    return session_ids, bill_ids
+
+
+def refresh_counters(session_ids=(), bill_ids=()):
+    """Refresh the counters of the given sessions and bills."""
+    return (refresh_session_counters(session_ids) +
+            refresh_bill_counters(bill_ids))
+
+
+def _reconcile(model, refresh, batch_size, dry_run):
+    """Refresh the counters of every row of model, batch_size rows at a time."""
+    drifted = 0
+    updated = 0
+    pks = model.objects.order_by('pk').values_list('pk', flat=True)
+    last_pk = None
+    while True:
+        batch_qs = pks if last_pk is None else pks.filter(pk__gt=last_pk)
+        batch = list(batch_qs[:batch_size])
+        if not batch:
+            break
+        last_pk = batch[-1]
+        drifted += model.objects.filter(pk__in=batch).alias(
+            **_expected_counts(model)).exclude(**_matching_counts(model)).count()
+        if not dry_run:
+            updated += refresh(batch)
+    return {'rows': updated, 'drifted': drifted}
+
+
+def _expected_counts(model):
+    from .models import Bill, Session, Statement
+
+    if model is Session:
+        return {
+            'expected_statements': _count_subquery(Statement, 'session'),
+            'expected_bills': _count_subquery(Bill, 'session'),
+        }
+    return {'expected_statements': _count_subquery(Statement, 'bill')}
+
+
+def _matching_counts(model):
+    from .models import Session
+
+    matching = {'statement_count': F('expected_statements')}
+    if model is Session:
+        matching['bill_count'] = F('expected_bills')
+    return matching
+
+
+def reconcile_counters(batch_size=COUNTER_RECONCILE_BATCH_SIZE, dry_run=False):
+    """
+    Repair the denormalized statement/bill counters of all sessions and
+    bills. Returns, per model, how many rows had drifted and how many were
+    rewritten (none with dry_run).
+    """
+    from .models import Bill, Session
+
+    result = {
+        'sessions': _reconcile(Session, refresh_session_counters, batch_size,
+                               dry_run),
+        'bills': _reconcile(Bill, refresh_bill_counters, batch_size, dry_run),
+    }
+    logger.info(f"🔢 Counter reconciliation: {result}")
+    return result
@@ -0,0 +1,193 @@
+import functools
+import logging
+import threading
+import time
+
+from celery.signals import task_postrun, task_prerun
+from django.db import close_old_connections, connection
+from django.db.utils import DatabaseError, InterfaceError, OperationalError
+
+logger = logging.getLogger(__name__)
+
+# SQLSTATEs after which the connection is gone: class 08 (connection
+# exception) and the server-side shutdown/startup codes
+RECONNECT_SQLSTATE_CLASSES = ('08', )
+RECONNECT_SQLSTATES = {'57P01', '57P02', '57P03'}
+# Transaction aborted by the server; the same statements can simply rerun
+TRANSIENT_SQLSTATES = {'40001', '40P01'}
+
+DB_RETRY_RECONNECT = 'reconnect'
+DB_RETRY_TRANSIENT = 'transient'
+
+DB_METRICS_LOG_INTERVAL = 100  # Tasks between connection metric summaries
+
+
+def get_sqlstate(exc):
+    """SQLSTATE of a database error or the driver error it wraps, if any."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        sqlstate = getattr(exc, 'pgcode', None) or getattr(
+            exc, 'sqlstate', None)
+        if sqlstate:
+            return sqlstate
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+class DatabaseConnectionMetrics:
+    """
+    Thread-safe per-process counters for connection reuse across Celery
+    tasks and for retried database operations.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.stats = {
+                'tasks': 0,
+                'reused': 0,
+                'opened': 0,
+                'discarded': 0,
+                'reconnects': 0,
+                'transient_retries': 0,
+                'by_sqlstate': {},
+            }
+
+    def record_task(self, had_connection, kept_connection):
+        """One task start: reused, discarded (stale or too old) or no open connection."""
+        with self._lock:
+            self.stats['tasks'] += 1
+            if kept_connection:
+                self.stats['reused'] += 1
+            else:
+                self.stats['opened'] += 1
+                if had_connection:
+                    self.stats['discarded'] += 1
+            return self.stats['tasks']
+
+    def record_retry(self, kind, sqlstate):
+        with self._lock:
+            key = 'reconnects' if kind == DB_RETRY_RECONNECT else 'transient_retries'
+            self.stats[key] += 1
+            sqlstate = sqlstate or 'none'
+            self.stats['by_sqlstate'][sqlstate] = self.stats[
+                'by_sqlstate'].get(sqlstate, 0) + 1
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats, by_sqlstate=dict(self.stats['by_sqlstate']))
+        stats['reuse_rate'] = round(stats['reused'] / stats['tasks'],
+                                    3) if stats['tasks'] else 0.0
+        return stats
+
+
+db_connection_metrics = DatabaseConnectionMetrics()
+
+
+class DatabaseRetryPolicy:
+    """
+    Decide whether a failed database operation is retried, by SQLSTATE.
+
+    Connection errors (class 08, 57P01-57P03, or driver errors without a
+    SQLSTATE such as "server closed the connection unexpectedly") close the
+    connection so the retry opens a new one; serialization failures and
+    deadlocks (40001, 40P01) are retried as is. Anything else, and any
+    error inside an atomic block (the transaction is already lost), is
+    raised. Waits grow exponentially from base_delay up to max_delay.
+    """
+
+    def __init__(self, max_retries=3, base_delay=1.0, max_delay=8.0,
+                 metrics=None):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.metrics = metrics or db_connection_metrics
+
+    @staticmethod
+    def classify(exc):
+        """DB_RETRY_RECONNECT, DB_RETRY_TRANSIENT or None (not retryable)."""
+        sqlstate = get_sqlstate(exc)
+        if sqlstate:
+            if sqlstate.startswith(
+                    RECONNECT_SQLSTATE_CLASSES) or sqlstate in RECONNECT_SQLSTATES:
+                return DB_RETRY_RECONNECT
+            if sqlstate in TRANSIENT_SQLSTATES:
+                return DB_RETRY_TRANSIENT
+            return None
+        # Client-side connection failures carry no SQLSTATE
+        if isinstance(exc, (InterfaceError, OperationalError)):
+            return DB_RETRY_RECONNECT
+        return None
+
+    def delay(self, attempt):
+        return min(self.max_delay, self.base_delay * 2**attempt)
+
+    def call(self, func, *args, **kwargs):
+        for attempt in range(self.max_retries):
+            try:
+                return func(*args, **kwargs)
+            except DatabaseError as e:
+                kind = self.classify(e)
+                if kind is None or connection.in_atomic_block:
+                    raise
+                if attempt == self.max_retries - 1:
+                    logger.error(
+                        f"Max retries ({self.max_retries}) exceeded for database operation: {e}"
+                    )
+                    raise
+                sqlstate = get_sqlstate(e)
+                self.metrics.record_retry(kind, sqlstate)
+                if kind == DB_RETRY_RECONNECT:
+                    try:
+                        connection.close()
+                    except DatabaseError:
+                        pass  # The connection is already unusable
+                wait_time = self.delay(attempt)
+                logger.warning(
+                    f"🔁 Database {kind} error (SQLSTATE {sqlstate or 'none'}) on attempt "
+                    f"{attempt + 1}/{self.max_retries}, retrying in {wait_time:.0f}s: {e}"
+                )
+                time.sleep(wait_time)
+
+    def wrap(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+
+        return wrapper
+
+
+@task_prerun.connect
+def _recycle_connection_before_task(sender=None, **kwargs):
+    """
+    Celery does not fire Django's request signals, so apply CONN_MAX_AGE and
+    CONN_HEALTH_CHECKS per task: drop connections that are too old or broke
+    in an earlier task, and health-check the rest on first use.
+    """
+    if connection.in_atomic_block:
+        return
+    had_connection = connection.connection is not None
+    close_old_connections()
+    kept_connection = connection.connection is not None
+    tasks = db_connection_metrics.record_task(had_connection, kept_connection)
+    logger.debug(
+        f"🔌 Task {getattr(sender, 'name', sender)}: "
+        f"{'reusing' if kept_connection else 'opening'} database connection")
+    if tasks % DB_METRICS_LOG_INTERVAL == 0:
+        log_db_connection_status()
+
+
+@task_postrun.connect
+def _release_connection_after_task(sender=None, **kwargs):
+    if not connection.in_atomic_block:
+        close_old_connections()
+
+
+def log_db_connection_status():
+    stats = db_connection_metrics.get_stats()
+    logger.info(f"📊 Database connection status: {stats}")
+    return stats
@@ -0,0 +1,270 @@
+import json
+import random
+import re
+import threading
+import time
+
+from .sentiment_lexicon import get_lexicon_scorer
+
+# Marker lines the prompt builders in tasks.py put around their inputs
+# (segment texts are single-line once cleaned for the prompt)
+_BATCH_SEGMENT_PATTERN = re.compile(r'--- 구간 (\d+) ---\n([^\n]*)')
+_KNOWN_BILLS_PATTERN = re.compile(r'--- KNOWN BILLS ---\n(.*?)\n\n', re.DOTALL)
+_TRANSCRIPT_PATTERN = re.compile(r'\*\*TRANSCRIPT[^\n]*\n(?:[^\n]*\n)*?---\n(.*)\n---\n?$',
+                                 re.DOTALL)
+_SPEAKER_PATTERN = re.compile(r'^◯\s*(\S+)')
+_STATEMENT_BLOCK_PATTERN = re.compile(
+    r'### 발언 (\d+)\n(?:[^\n]*\n)*?발언 내용: "(.*?)"(?=\n\n### 발언 |\s*$)', re.DOTALL)
+_CATEGORY_ID_PATTERN = re.compile(r'^\[(\d+)\] ', re.MULTILINE)
+
+FAKE_DISCOVERED_BILL_NAME = '회의 안건'
+FAKE_CHARS_PER_TOKEN = 3
+
+
+class FakeGeminiError(Exception):
+    """Error raised by the fake client, shaped like the SDK's API errors."""
+
+    def __init__(self, code, status, message):
+        super().__init__(f"{code} {status}. {message}")
+        self.code = code
+        self.status = status
+
+
+class _FakeChunk:
+
+    def __init__(self, text):
+        self.text = text
+
+
+class _FakeModels:
+
+    def __init__(self, fake):
+        self._fake = fake
+
+    def generate_content_stream(self, model, contents, config=None):
+        return self._fake.stream(model, contents, config)
+
+    def generate_content(self, model, contents, config=None):
+        return _FakeChunk(''.join(
+            chunk.text for chunk in self._fake.stream(model, contents, config)))
+
+
+class FakeGeminiClient:
+    """
+    Stand-in for google.genai.Client that needs no API key. Only the
+    google.genai surface is implemented, so the google-genai package from
+    requirements.txt must be installed for tasks.py to take that path.
+
+    Install it with tasks.set_gemini_client(). It answers the batch analysis
+    prompt with one analysis object per "--- 구간 N ---" segment (indices
+    consistent with the segment text, sentiment from the lexicon scorer),
+    the LLMPolicyAnalyzer batch prompt with one object per "### 발언 ID"
+    block, and the discovery prompt with spans around each known bill
+    mention.
+
+    latency is the mean simulated seconds per call (jittered by +/-
+    latency_jitter), except for a tail_rate share of calls that take
+    tail_latency seconds; rate_limit_rate and malformed_rate are the chances
+    that a call raises a 429 or returns JSON cut off half way. A call whose
+    first chunk would come later than the request's http_options timeout
+    raises a 504 at the timeout. Per-call statistics are collected in
+    `stats` and `latencies`.
+    """
+
+    def __init__(self,
+                 latency=0.0,
+                 latency_jitter=0.5,
+                 rate_limit_rate=0.0,
+                 malformed_rate=0.0,
+                 chunk_chars=512,
+                 tail_rate=0.0,
+                 tail_latency=0.0,
+                 seed=None):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        self.chunk_chars = max(1, chunk_chars)
+        self.tail_rate = tail_rate
+        self.tail_latency = tail_latency
+        self.models = _FakeModels(self)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                'requests': 0,
+                'rate_limited': 0,
+                'malformed': 0,
+                'timed_out': 0,
+                'batch_requests': 0,
+                'discovery_requests': 0,
+                'segments': 0,
+                'prompt_tokens': 0,
+                'output_tokens': 0,
+            }
+            self.latencies = []
+
+    def _draw(self):
+        """Latency, 429 and malformed draws for one call, under the lock."""
+        with self._lock:
+            jitter = self._random.uniform(-self.latency_jitter,
+                                          self.latency_jitter)
+            latency = max(0.0, self.latency * (1 + jitter))
+            if self.tail_rate and self._random.random() < self.tail_rate:
+                latency = self.tail_latency
+            return (latency,
+                    self._random.random() < self.rate_limit_rate,
+                    self._random.random() < self.malformed_rate)
+
+    def _record(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                self.stats[key] += value
+
+    def stream(self, model, contents, config=None):
+        prompt = ''.join(str(part) for part in contents)
+        latency, rate_limited, malformed = self._draw()
+        started = time.perf_counter()
+        self._record(requests=1,
+                     prompt_tokens=len(prompt) // FAKE_CHARS_PER_TOKEN)
+
+        # Half the latency before the first chunk, the rest spread over them
+        timeout = self._timeout_seconds(config)
+        if timeout is not None and latency / 2 > timeout:
+            time.sleep(timeout)
+            self._record(timed_out=1)
+            with self._lock:
+                self.latencies.append(time.perf_counter() - started)
+            raise FakeGeminiError(504, 'DEADLINE_EXCEEDED',
+                                  'Fake request timed out')
+        time.sleep(latency / 2)
+        if rate_limited:
+            self._record(rate_limited=1)
+            with self._lock:
+                self.latencies.append(time.perf_counter() - started)
+            raise FakeGeminiError(429, 'RESOURCE_EXHAUSTED',
+                                  'Fake quota exceeded')
+
+        text = self.respond(prompt)
+        if malformed:
+            self._record(malformed=1)
+            text = text[:len(text) // 2]
+        self._record(output_tokens=len(text) // FAKE_CHARS_PER_TOKEN)
+
+        chunks = [
+            text[i:i + self.chunk_chars]
+            for i in range(0, len(text), self.chunk_chars)
+        ] or ['']
+        for chunk in chunks:
+            time.sleep(latency / 2 / len(chunks))
+            yield _FakeChunk(chunk)
+        with self._lock:
+            self.latencies.append(time.perf_counter() - started)
+
+    @staticmethod
+    def _timeout_seconds(config):
+        http_options = getattr(config, 'http_options', None)
+        timeout = getattr(http_options, 'timeout', None)
+        return timeout / 1000 if timeout else None
+
+    def respond(self, prompt):
+        """Canned response text for a prompt built by tasks.py."""
+        if '--- KNOWN BILLS ---' in prompt:
+            self._record(discovery_requests=1)
+            return json.dumps(self._discovery_response(prompt),
+                              ensure_ascii=False)
+        statements = _STATEMENT_BLOCK_PATTERN.findall(prompt)
+        if statements:
+            self._record(batch_requests=1, segments=len(statements))
+            return json.dumps(self._statement_batch_response(prompt, statements),
+                              ensure_ascii=False)
+        segments = _BATCH_SEGMENT_PATTERN.findall(prompt)
+        if segments:
+            self._record(batch_requests=1, segments=len(segments))
+            return json.dumps(self._batch_response(segments),
+                              ensure_ascii=False)
+        return 'OK'
+
+    @staticmethod
+    def _batch_response(segments):
+        texts = [text for _, text in segments]
+        scores = get_lexicon_scorer().score_texts(texts)
+        results = []
+        for (number, text), score in zip(segments, scores):
+            match = _SPEAKER_PATTERN.match(text)
+            speaker = match.group(1) if match else ''
+            start_idx = match.end() if match else 0
+            results.append({
+                'segment_index': int(number),
+                'speaker_name': speaker,
+                'start_idx': start_idx,
+                'end_idx': len(text),
+                'is_valid_member': bool(speaker),
+                'is_substantial': len(text) - start_idx > 50,
+                'sentiment_score': round(float(score), 3),
+                'bill_relevance_score': 0.8,
+                'confidence': 0.9,
+            })
+        return results
+
+    @staticmethod
+    def _statement_batch_response(prompt, statements):
+        # Every statement goes to the first category of the prompt's list
+        match = _CATEGORY_ID_PATTERN.search(prompt)
+        categories = [{
+            'category_id': int(match.group(1)),
+            'subcategory_id': None,
+            'confidence_score': 0.7
+        }] if match else []
+        scores = get_lexicon_scorer().score_texts(
+            [text for _, text in statements])
+        return [{
+            'statement_id': int(statement_id),
+            'sentiment_score': round(float(score), 3),
+            'sentiment_reason': '가짜 응답 (사전 기반 점수)',
+            'categories': categories,
+            'policy_keywords': [],
+        } for (statement_id, _), score in zip(statements, scores)]
+
+    @staticmethod
+    def _discovery_response(prompt):
+        match = _KNOWN_BILLS_PATTERN.search(prompt)
+        known_bills = [
+            line[2:].strip() for line in (match.group(1) if match else '').splitlines()
+            if line.startswith('- ')
+        ]
+        match = _TRANSCRIPT_PATTERN.search(prompt)
+        transcript = match.group(1) if match else ''
+
+        mentions = sorted((transcript.find(name), name) for name in known_bills
+                          if name and transcript.find(name) != -1)
+        if not mentions:
+            return {
+                'bills_found': [],
+                'newly_discovered': [{
+                    'bill_name': FAKE_DISCOVERED_BILL_NAME,
+                    'start_index': 0,
+                    'end_index': len(transcript),
+                    'category_id': 1,
+                    'subcategory_ids': [],
+                    'keywords': [],
+                    'stance': 'M'
+                }] if transcript else []
+            }
+
+        bills_found = []
+        for i, (start, name) in enumerate(mentions):
+            end = mentions[i + 1][0] if i + 1 < len(mentions) else len(transcript)
+            bills_found.append({
+                'bill_name': name,
+                'start_index': start,
+                'end_index': end,
+                'category_id': 1,
+                'subcategory_ids': [1],
+                'keywords': [name[:10]],
+                'stance': 'M'
+            })
+        return {'bills_found': bills_found, 'newly_discovered': []}
@@ -0,0 +1,120 @@
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingJSONArrayParser:
+    """
+    Incremental parser for JSON streamed from the LLM in chunks.
+
+    Every object that is a direct element of an array is emitted as soon as
+    its closing brace arrives, together with the key of the array that holds
+    it (None for a top-level array). For example, feeding
+    '{"bills_found": [{"a": 1}, {"b"' yields ('bills_found', {'a': 1}) and
+    keeps the incomplete object buffered until the next chunk.
+
+    Text outside JSON containers (e.g. ```json fences) is ignored, so a
+    response that stops half way still yields every complete object.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._stack = []  # (container char, array key)
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        self._last_string = None
+        self._item_start = None
+        self._item_depth = None
+        self._item_key = None
+        self.started = False
+        self.items_emitted = 0
+
+    @property
+    def is_complete(self):
+        """True once the outermost JSON container has been closed."""
+        return self.started and not self._stack
+
+    def feed(self, chunk):
+        """Consume a chunk of text and return the list of (array_key, obj) completed by it."""
+        if not chunk:
+            return []
+
+        self._text += chunk
+        completed = []
+        text = self._text
+
+        while self._pos < len(text):
+            char = text[self._pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._stack and self._stack[-1][0] == '{':
+                        try:
+                            self._last_string = json.loads(
+                                text[self._string_start:self._pos + 1])
+                        except json.JSONDecodeError:
+                            self._last_string = None
+                self._pos += 1
+                continue
+
+            if char == '"':
+                if self._stack:
+                    self._in_string = True
+                    self._string_start = self._pos
+            elif char == '{':
+                if (self._item_start is None and self._stack
+                        and self._stack[-1][0] == '['):
+                    self._item_start = self._pos
+                    self._item_depth = len(self._stack) + 1
+                    self._item_key = self._stack[-1][1]
+                self._stack.append(('{', None))
+                self.started = True
+            elif char == '[':
+                array_key = None
+                if self._stack and self._stack[-1][0] == '{':
+                    array_key = self._last_string
+                self._stack.append(('[', array_key))
+                self.started = True
+            elif char in '}]' and self._stack:
+                closing_depth = len(self._stack)
+                self._stack.pop()
+                if (char == '}' and self._item_start is not None
+                        and closing_depth == self._item_depth):
+                    raw_item = text[self._item_start:self._pos + 1]
+                    try:
+                        completed.append((self._item_key, json.loads(raw_item)))
+                        self.items_emitted += 1
+                    except json.JSONDecodeError as e:
+                        logger.warning(
+                            f"Skipping malformed streamed JSON object: {e}")
+                    self._item_start = None
+                    self._item_depth = None
+                    self._item_key = None
+
+            self._pos += 1
+
+        self._compact()
+        return completed
+
+    def _compact(self):
+        """Drop already-consumed text that no pending object or string refers to."""
+        if self._in_string or self._item_start is not None:
+            return
+        self._text = self._text[self._pos:]
+        self._pos = 0
+
+
+def iter_json_array_items(chunks):
+    """Yield (array_key, obj) pairs from an iterable of JSON text chunks."""
+    parser = StreamingJSONArrayParser()
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
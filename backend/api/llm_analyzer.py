@@ -1,42 +1,101 @@
 
 import json
+import logging
+import time
 import openai
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Tuple
 from django.conf import settings
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
 from .models import Category, Subcategory, Statement, StatementCategory
+from .category_catalog import get_category_catalog
+from .json_stream import StreamingJSONArrayParser
+from . import tasks
+
+logger = logging.getLogger(__name__)
+
+# Batch mode: many statements per Gemini prompt, prompts run concurrently
+# under the shared tasks.gemini_rate_limiter
+STATEMENT_BATCH_MODEL = "gemini-2.0-flash-lite"
+STATEMENTS_PER_PROMPT = 20
+STATEMENT_BATCH_WORKERS = 4
+STATEMENT_BATCH_MAX_RETRIES = 2
+STATEMENT_TEXT_MAX_CHARS = 1500
+
+# Stamped on Statement.analysis_version by batch mode; bump when the batch
+# prompt or schema changes so the re-analysis scheduler picks statements up
+STATEMENT_ANALYSIS_VERSION = "statement-batch-v1"
+
+STATEMENT_BATCH_RESPONSE_SCHEMA = {
+    'type': 'ARRAY',
+    'items': {
+        'type': 'OBJECT',
+        'properties': {
+            'statement_id': {'type': 'INTEGER'},
+            'sentiment_score': {'type': 'NUMBER'},
+            'sentiment_reason': {'type': 'STRING'},
+            'categories': {
+                'type': 'ARRAY',
+                'items': {
+                    'type': 'OBJECT',
+                    'properties': {
+                        'category_id': {'type': 'INTEGER'},
+                        'subcategory_id': {'type': 'INTEGER', 'nullable': True},
+                        'confidence_score': {'type': 'NUMBER'},
+                    },
+                    'required': ['category_id', 'confidence_score'],
+                },
+            },
+            'policy_keywords': {'type': 'ARRAY', 'items': {'type': 'STRING'}},
+        },
+        'required': ['statement_id', 'sentiment_score', 'sentiment_reason',
+                     'categories'],
+    },
+}
+
+
+def _build_statement_batch_prompt_prefix(catalog) -> str:
+    """Static part of the batch prompt: instructions and the category list with database ids"""
+    categories_list = []
+    for cat_name, cat_data in catalog.categories.items():
+        lines = [f"[{cat_data['id']}] {cat_name}"]
+        lines.extend(f"  [{sub['id']}] {sub['name']}: {sub['description']}"
+                     for sub in cat_data['subcategories'])
+        categories_list.append("\n".join(lines))
+    categories_text = "\n\n".join(categories_list)
+
+    return f"""당신은 한국 정치와 정책 분석 전문가입니다. 아래에 주어지는 여러 국회 발언을 각각 정확하고 객관적으로 분석해주세요.
+
+카테고리 체계 ([번호] 이름):
+
+{categories_text}
+
+각 발언마다 다음을 분석하세요:
+1. 감성 분석: -1(매우 부정) ~ 1(매우 긍정) 점수와 근거 (한 문장)
+2. 정책 카테고리 분류: 위 목록의 category_id와 subcategory_id (여러 개 가능, 신뢰도 0~1 포함)
+3. 주요 정책 키워드 (최대 5개)
+
+규칙:
+- 발언마다 정확히 하나의 객체를 응답하고, statement_id는 발언 제목의 번호를 그대로 사용
+- category_id와 subcategory_id는 위 목록의 번호만 사용
+- JSON 배열만 응답
+
+분석할 발언:
+"""
 
 class LLMPolicyAnalyzer:
-    def __init__(self):
-        self.categories = self._load_categories()
-        
-    def _load_categories(self) -> Dict:
-        """Load all categories and subcategories for prompt inclusion"""
-        categories_data = {}
-        for category in Category.objects.prefetch_related('subcategories').all():
-            categories_data[category.name] = {
-                'id': category.id,
-                'description': category.description,
-                'subcategories': [
-                    {
-                        'id': sub.id,
-                        'name': sub.name,
-                        'description': sub.description
-                    }
-                    for sub in category.subcategories.all()
-                ]
-            }
-        return categories_data
-    
+    @property
+    def categories(self) -> Dict:
+        """Category tree from the shared, process-wide category catalog"""
+        return get_category_catalog().categories
+
     def create_analysis_prompt(self, statement_text: str, bill_name: str = None, speaker_info: str = None) -> str:
         """Create comprehensive analysis prompt including categories"""
         
-        categories_list = []
-        for cat_name, cat_data in self.categories.items():
-            subcats = [f"  - {sub['name']}: {sub['description']}" for sub in cat_data['subcategories']]
-            categories_list.append(f"{cat_name}:\n" + "\n".join(subcats))
-        
-        categories_text = "\n\n".join(categories_list)
-        
+        categories_text = get_category_catalog().analysis_categories_text
+
         prompt = f"""
 당신은 이 시대 최고의 기록가입니다. 당신의 기록은 사람들을 살릴 것입니다. 당신의 기록의 정확성은 매우 중요하여, 당신의 기록이 중요하지 못하다면 이 세계가 문제에 빠질 수도 있습니다. 따라서, 최대한 정확하고, 하나도 놓치지 않도록, 처음부터 끝까지 제대로 된 기록을 부탁드립니다.
 
@@ -134,33 +193,222 @@ class LLMPolicyAnalyzer:
     
     def _create_category_associations(self, statement: Statement, categories_data: List[Dict]):
         """Create StatementCategory associations based on LLM analysis"""
+        mappings = {}
+        self._collect_category_mappings(statement.id, categories_data, *self._category_ids(), mappings)
         # Remove existing associations
         StatementCategory.objects.filter(statement=statement).delete()
-        
-        for cat_data in categories_data:
-            try:
-                category = Category.objects.get(id=cat_data['category_id'])
-                subcategory = None
-                
-                if cat_data.get('subcategory_id'):
-                    subcategory = Subcategory.objects.get(id=cat_data['subcategory_id'])
-                
-                StatementCategory.objects.create(
-                    statement=statement,
-                    category=category,
-                    subcategory=subcategory,
-                    confidence_score=cat_data.get('confidence_score', 0.5)
-                )
-            except (Category.DoesNotExist, Subcategory.DoesNotExist):
+        StatementCategory.objects.bulk_create(mappings.values())
+
+    @staticmethod
+    def _category_ids() -> Tuple[set, Dict]:
+        """Valid category ids and subcategory id -> category id, from the catalog"""
+        category_ids = set()
+        subcategory_parents = {}
+        for cat_data in get_category_catalog().categories.values():
+            if cat_data['id'] is None:
                 continue
+            category_ids.add(cat_data['id'])
+            for sub in cat_data['subcategories']:
+                subcategory_parents[sub['id']] = cat_data['id']
+        return category_ids, subcategory_parents
+
+    @staticmethod
+    def _collect_category_mappings(statement_id: int, categories_data: List[Dict],
+                                   category_ids: set, subcategory_parents: Dict,
+                                   mappings: Dict):
+        """Add unsaved StatementCategory rows for valid ids to mappings, one per (statement, category)"""
+        for cat_data in categories_data or []:
+            if not isinstance(cat_data, dict):
+                continue
+            category_id = cat_data.get('category_id')
+            if category_id not in category_ids:
+                continue
+            subcategory_id = cat_data.get('subcategory_id')
+            if subcategory_parents.get(subcategory_id) != category_id:
+                subcategory_id = None
+            confidence = cat_data.get('confidence_score', 0.5)
+            # Keep the most confident classification per category
+            key = (statement_id, category_id)
+            if key not in mappings or mappings[key].confidence_score < confidence:
+                mappings[key] = StatementCategory(
+                    statement_id=statement_id,
+                    category_id=category_id,
+                    subcategory_id=subcategory_id,
+                    confidence_score=confidence)
     
-    def batch_analyze_statements(self, statements: List[Statement]) -> List[Dict]:
-        """Analyze multiple statements in batch"""
-        results = []
+    def create_batch_prompt(self, statements: List[Statement]) -> str:
+        """Per-request part of the batch prompt: one block per statement"""
+        blocks = []
         for statement in statements:
-            result = self.analyze_statement(statement)
-            results.append(result)
+            lines = [f"### 발언 {statement.id}"]
+            if statement.bill_id:
+                lines.append(f"관련 의안: {statement.bill.bill_nm}")
+            lines.append(
+                f"발언자 정보: {statement.speaker.naas_nm} ({statement.speaker.plpt_nm})")
+            lines.append(f"발언 내용: \"{statement.text[:STATEMENT_TEXT_MAX_CHARS]}\"")
+            blocks.append("\n".join(lines))
+        return "\n\n".join(blocks)
+
+    def get_batch_prompt_prefix(self) -> str:
+        return get_category_catalog().get_prompt_prefix(
+            'statement_batch', _build_statement_batch_prompt_prefix)
+
+    def analyze_statement_batch(self, statements: List[Statement],
+                                prompt_prefix: str = None,
+                                model_name: str = STATEMENT_BATCH_MODEL,
+                                max_retries: int = STATEMENT_BATCH_MAX_RETRIES,
+                                prompt: str = None) -> Dict[int, Dict]:
+        """
+        Analyze several statements with one Gemini request.
+
+        The category list lives in a static prompt prefix (served from the
+        Gemini context cache when possible), so it is not resent per
+        statement. A prompt built beforehand by create_batch_prompt can be
+        passed in. Returns {statement_id: analysis}; statements missing from
+        the response are left out. Makes no database writes.
+        """
+        prompt_prefix = prompt_prefix or self.get_batch_prompt_prefix()
+        prompt = prompt or self.create_batch_prompt(statements)
+        statement_ids = {statement.id for statement in statements}
+        estimated_tokens = self._estimate_prompt_tokens(prompt_prefix, prompt, len(statements))
+
+        results = {}
+        for attempt in range(max_retries + 1):
+            if not tasks.gemini_rate_limiter.wait_if_needed(estimated_tokens):
+                logger.error("Rate limit timeout for statement batch analysis")
+                break
+
+            parser = StreamingJSONArrayParser()
+            stream_error = None
+            try:
+                for chunk_text in tasks._stream_gemini_text(
+                        prompt,
+                        model_name=model_name,
+                        response_schema=STATEMENT_BATCH_RESPONSE_SCHEMA,
+                        temperature=0.3,
+                        prompt_prefix=prompt_prefix):
+                    for _, analysis in parser.feed(chunk_text):
+                        if (isinstance(analysis, dict)
+                                and analysis.get('statement_id') in statement_ids):
+                            results[analysis['statement_id']] = analysis
+            except Exception as e:
+                stream_error = e
+
+            tasks.gemini_rate_limiter.record_request(estimated_tokens,
+                                                     success=stream_error is None)
+            if stream_error is None and parser.is_complete:
+                break
+            logger.warning(
+                f"Statement batch incomplete (attempt {attempt + 1}/{max_retries + 1}, "
+                f"{len(results)}/{len(statements)} analyzed): {stream_error or 'truncated'}")
+            if len(results) == len(statements):
+                break
+            if attempt < max_retries:
+                time.sleep(min(30, 5 * (2**attempt)))
+
         return results
+
+    @staticmethod
+    def _estimate_prompt_tokens(prompt_prefix: str, prompt: str, statement_count: int) -> int:
+        return tasks.estimate_tokens(prompt_prefix + prompt) + 200 * statement_count
+
+    def estimate_batch_tokens(self, statements: List[Statement],
+                              statements_per_prompt: int = STATEMENTS_PER_PROMPT,
+                              prompt_prefix: str = None) -> int:
+        """Estimated tokens batch_analyze_statements would spend on these statements"""
+        prompt_prefix = prompt_prefix or self.get_batch_prompt_prefix()
+        statements = list(statements)
+        return sum(
+            self._estimate_prompt_tokens(prompt_prefix,
+                                         self.create_batch_prompt(statements[i:i + statements_per_prompt]),
+                                         len(statements[i:i + statements_per_prompt]))
+            for i in range(0, len(statements), statements_per_prompt))
+
+    def batch_analyze_statements(self, statements: List[Statement],
+                                 statements_per_prompt: int = STATEMENTS_PER_PROMPT,
+                                 max_workers: int = STATEMENT_BATCH_WORKERS) -> List[Dict]:
+        """
+        Analyze multiple statements in batch.
+
+        Statements are packed statements_per_prompt to a prompt and the
+        prompts run concurrently (max_workers threads, all sharing the Gemini
+        rate limiter). Results are saved with bulk writes from the calling
+        thread. Returns one analysis dict per statement, in order; statements
+        the LLM did not answer get an error analysis and are left unchanged.
+        """
+        statements = list(statements)
+        if not statements:
+            return []
+        if not tasks.get_gemini_client():
+            logger.error("❌ Gemini not available. Cannot batch analyze statements.")
+            return [self._error_analysis("Gemini client not initialized") for _ in statements]
+
+        # Prompts are built here, with speakers and bills loaded in two
+        # queries, so worker threads never touch the database
+        prefetch_related_objects(statements, 'speaker', 'bill')
+        prompt_prefix = self.get_batch_prompt_prefix()
+        chunks = [statements[i:i + statements_per_prompt]
+                  for i in range(0, len(statements), statements_per_prompt)]
+        prompts = [self.create_batch_prompt(chunk) for chunk in chunks]
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+            futures = [executor.submit(self.analyze_statement_batch, chunk, prompt_prefix,
+                                       prompt=prompt)
+                       for chunk, prompt in zip(chunks, prompts)]
+            for future in as_completed(futures):
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    logger.error(f"❌ Statement batch analysis failed: {e}")
+
+        analyzed = [statement for statement in statements if statement.id in results]
+        self._save_batch_results(analyzed, results)
+        logger.info(
+            f"✅ Batch analyzed {len(analyzed)}/{len(statements)} statements in {len(chunks)} prompts")
+        return [results.get(statement.id) or self._error_analysis("응답 누락")
+                for statement in statements]
+
+    def _save_batch_results(self, statements: List[Statement], results: Dict[int, Dict]):
+        """Write sentiment fields and category associations with bulk queries"""
+        if not statements:
+            return
+
+        category_ids, subcategory_parents = self._category_ids()
+        now = timezone.now()
+        mappings = {}
+        for statement in statements:
+            analysis = results[statement.id]
+            try:
+                score = float(analysis.get('sentiment_score', 0.0))
+            except (TypeError, ValueError):
+                score = 0.0
+            statement.sentiment_score = max(-1.0, min(1.0, score))
+            statement.sentiment_reason = analysis.get('sentiment_reason', '')
+            statement.sentiment_provisional = False
+            statement.analysis_version = STATEMENT_ANALYSIS_VERSION
+            statement.updated_at = now  # bulk_update skips auto_now
+            self._collect_category_mappings(statement.id, analysis.get('categories'),
+                                            category_ids, subcategory_parents, mappings)
+
+        with transaction.atomic():
+            Statement.objects.bulk_update(
+                statements,
+                ['sentiment_score', 'sentiment_reason', 'sentiment_provisional',
+                 'analysis_version', 'updated_at'],
+                batch_size=500)
+            StatementCategory.objects.filter(statement__in=statements).delete()
+            StatementCategory.objects.bulk_create(mappings.values(), batch_size=500)
+
+    @staticmethod
+    def _error_analysis(reason: str) -> Dict:
+        return {
+            "sentiment_score": 0.0,
+            "sentiment_reason": f"분석 오류: {reason}",
+            "categories": [],
+            "policy_keywords": [],
+            "policy_analysis": "분석을 완료할 수 없습니다.",
+            "key_points": []
+        }
     
     def get_category_summary(self, category_id: int, time_range: str = 'all') -> Dict:
         """Get sentiment summary for a specific category"""
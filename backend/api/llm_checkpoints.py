@@ -0,0 +1,185 @@
+import hashlib
+import logging
+import threading
+
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from .models import LLMBatchCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the discovery or batch analysis prompts/schemas change;
+# checkpoints from other versions are ignored, so every batch reruns.
+LLM_PROMPT_VERSION = "segment-v3"
+
+SESSION_RUN_KEY = "session-run"
+
+
+def make_batch_key(kind, model_name, bill_name, parts):
+    """Content-addressed key: the same work always maps to the same checkpoint."""
+    digest = hashlib.sha1('\x1e'.join([model_name or '', bill_name or ''] +
+                                      list(parts)).encode('utf-8'))
+    return f"{kind}:{digest.hexdigest()[:32]}"
+
+
+class SessionCheckpoints:
+    """
+    Checkpoint store for one session run under one prompt version.
+
+    Results of finished batches are loaded once; a resumed run takes them
+    from here instead of calling the LLM again. Safe to share between the
+    threads working on the session.
+    """
+
+    def __init__(self, session_id, prompt_version=LLM_PROMPT_VERSION):
+        self.session_id = session_id
+        self.prompt_version = prompt_version
+        self._lock = threading.Lock()
+        self._done = {
+            row['batch_key']: row['result']
+            for row in self._rows().filter(
+                status=LLMBatchCheckpoint.STATUS_DONE).values(
+                    'batch_key', 'result')
+        }
+        self.reused = 0
+
+    def _rows(self):
+        return LLMBatchCheckpoint.objects.filter(
+            session_id=self.session_id, prompt_version=self.prompt_version)
+
+    @property
+    def finished_count(self):
+        with self._lock:
+            return len(self._done)
+
+    def get_done(self, batch_key):
+        """Stored result of a finished batch, or None."""
+        with self._lock:
+            result = self._done.get(batch_key)
+            if result is not None:
+                self.reused += 1
+            return result
+
+    def plan(self, entries):
+        """Record planned batches (dicts of checkpoint fields incl. batch_key) not seen before."""
+        LLMBatchCheckpoint.objects.bulk_create([
+            LLMBatchCheckpoint(session_id=self.session_id,
+                               prompt_version=self.prompt_version,
+                               **entry) for entry in entries
+        ],
+                                               ignore_conflicts=True)
+
+    def start(self, batch_key, kind, **fields):
+        checkpoint, _ = LLMBatchCheckpoint.objects.update_or_create(
+            session_id=self.session_id,
+            prompt_version=self.prompt_version,
+            batch_key=batch_key,
+            defaults=dict(fields,
+                          kind=kind,
+                          status=LLMBatchCheckpoint.STATUS_IN_FLIGHT,
+                          started_at=timezone.now(),
+                          finished_at=None,
+                          error=''))
+        self._rows().filter(pk=checkpoint.pk).update(attempts=F('attempts') + 1)
+
+    def finish(self, batch_key, result):
+        self._rows().filter(batch_key=batch_key).update(
+            status=LLMBatchCheckpoint.STATUS_DONE,
+            result=result,
+            finished_at=timezone.now(),
+            updated_at=timezone.now())
+        with self._lock:
+            self._done[batch_key] = result
+
+    def fail(self, batch_key, error):
+        self._rows().filter(batch_key=batch_key).update(
+            status=LLMBatchCheckpoint.STATUS_FAILED,
+            error=str(error)[:2000],
+            finished_at=timezone.now(),
+            updated_at=timezone.now())
+
+
+_active_runs = {}
+_active_runs_lock = threading.Lock()
+
+
+def begin_session_run(session_id, prompt_version=LLM_PROMPT_VERSION):
+    """
+    Mark a session run in flight and make its checkpoints available to the
+    LLM pipeline through get_active_checkpoints(session_id).
+    """
+    checkpoints = SessionCheckpoints(session_id, prompt_version)
+    checkpoints.start(SESSION_RUN_KEY, LLMBatchCheckpoint.KIND_SESSION)
+    with _active_runs_lock:
+        _active_runs[session_id] = checkpoints
+    resumable = checkpoints.finished_count
+    if resumable:
+        logger.info(
+            f"♻️ Resuming session {session_id}: {resumable} finished LLM batches "
+            f"checkpointed under {prompt_version}")
+    return checkpoints
+
+
+def end_session_run(session_id, error=None):
+    """Close the run: done when statements were stored, failed otherwise."""
+    with _active_runs_lock:
+        checkpoints = _active_runs.pop(session_id, None)
+    if checkpoints is None:
+        return
+    if error is None:
+        checkpoints.finish(SESSION_RUN_KEY, {'reused_batches': checkpoints.reused})
+    else:
+        checkpoints.fail(SESSION_RUN_KEY, error)
+
+
+def get_active_checkpoints(session_id):
+    with _active_runs_lock:
+        return _active_runs.get(session_id)
+
+
+def has_unfinished_run(session_id, prompt_version=LLM_PROMPT_VERSION):
+    """True if a run for the session started but never completed (e.g. a worker crash)."""
+    return LLMBatchCheckpoint.objects.filter(
+        session_id=session_id,
+        prompt_version=prompt_version,
+        batch_key=SESSION_RUN_KEY).exclude(
+            status=LLMBatchCheckpoint.STATUS_DONE).exists()
+
+
+def unfinished_session_ids(prompt_version=LLM_PROMPT_VERSION):
+    return list(
+        LLMBatchCheckpoint.objects.filter(
+            prompt_version=prompt_version,
+            batch_key=SESSION_RUN_KEY).exclude(
+                status=LLMBatchCheckpoint.STATUS_DONE).order_by(
+                    '-session__conf_dt').values_list('session_id', flat=True))
+
+
+def get_checkpoint_progress(session_ids=None,
+                            prompt_version=LLM_PROMPT_VERSION):
+    """
+    Per-session batch counts by status plus planned/finished token
+    estimates, for sessions with analysis checkpoints.
+    """
+    rows = LLMBatchCheckpoint.objects.filter(
+        prompt_version=prompt_version).exclude(
+            kind=LLMBatchCheckpoint.KIND_SESSION)
+    if session_ids:
+        rows = rows.filter(session_id__in=session_ids)
+
+    aggregates = {
+        status: Count('id', filter=Q(status=status))
+        for status, _ in LLMBatchCheckpoint.STATUS_CHOICES
+    }
+    progress = []
+    for row in rows.values('session_id').annotate(
+            total=Count('id'),
+            tokens=Sum('estimated_tokens'),
+            tokens_done=Sum('estimated_tokens',
+                            filter=Q(status=LLMBatchCheckpoint.STATUS_DONE)),
+            **aggregates).order_by('session_id'):
+        row['tokens'] = row['tokens'] or 0
+        row['tokens_done'] = row['tokens_done'] or 0
+        progress.append(row)
+    return progress
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from api.party_membership import PARTY_SYNC_BATCH_SIZE, backfill_party_membership
+
+
+class Command(BaseCommand):
+    help = ('Populate Speaker.current_party and the speaker party history '
+            'from the \'/\'-joined plpt_nm, consolidating renamed parties')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=PARTY_SYNC_BATCH_SIZE,
+            help=f'Speakers synced per transaction (default: {PARTY_SYNC_BATCH_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        synced = backfill_party_membership(batch_size=options['batch_size'])
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Synced party membership for {synced:,} speakers'))
@@ -0,0 +1,216 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from django.core.management.base import BaseCommand, CommandError
+
+from api import tasks
+from api.fake_gemini import FakeGeminiClient
+
+
+class Command(BaseCommand):
+    help = ('Benchmark LLM discovery and segment analysis on recorded '
+            'transcripts using the fake Gemini client (no API key needed)')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'corpus',
+            type=str,
+            help='Directory of recorded transcripts (*.txt). An optional '
+            '<name>.bills.txt next to a transcript lists its known bills, one per line',
+        )
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.5,
+            help='Mean simulated seconds per Gemini call (default: 0.5)',
+        )
+        parser.add_argument(
+            '--jitter',
+            type=float,
+            default=0.5,
+            help='Relative latency jitter, 0.5 = +/-50%% (default: 0.5)',
+        )
+        parser.add_argument(
+            '--rate-limit-rate',
+            type=float,
+            default=0.0,
+            help='Fraction of calls answered with 429 (default: 0)',
+        )
+        parser.add_argument(
+            '--malformed-rate',
+            type=float,
+            default=0.0,
+            help='Fraction of calls returning truncated JSON (default: 0)',
+        )
+        parser.add_argument(
+            '--tail-rate',
+            type=float,
+            default=0.0,
+            help='Fraction of calls that take --tail-latency seconds (default: 0)',
+        )
+        parser.add_argument(
+            '--tail-latency',
+            type=float,
+            default=0.0,
+            help='Simulated seconds for tail calls (default: 0)',
+        )
+        parser.add_argument(
+            '--rpm',
+            type=int,
+            default=0,
+            help='Requests per minute for the rate limiter (default: unlimited)',
+        )
+        parser.add_argument(
+            '--tpm',
+            type=int,
+            default=0,
+            help='Tokens per minute for the rate limiter (default: unlimited)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Transcripts processed concurrently (default: 1)',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            help='Only use the first N transcripts',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help='Random seed for latency and error draws (default: 0)',
+        )
+
+    def handle(self, *args, **options):
+        if not tasks.GENAI_AVAILABLE:
+            # The fake only implements the google.genai Client surface
+            raise CommandError('google-genai is not installed '
+                               '(pip install -r requirements.txt)')
+        transcripts = self._load_corpus(Path(options['corpus']),
+                                        options.get('limit'))
+        fake = FakeGeminiClient(latency=options['latency'],
+                                latency_jitter=options['jitter'],
+                                rate_limit_rate=options['rate_limit_rate'],
+                                malformed_rate=options['malformed_rate'],
+                                tail_rate=options['tail_rate'],
+                                tail_latency=options['tail_latency'],
+                                seed=options['seed'])
+        unlimited = 10**12
+        limiter = tasks.GeminiRateLimiter(
+            max_tokens_per_minute=options['tpm'] or unlimited,
+            max_requests_per_minute=options['rpm'] or unlimited,
+            max_tokens_per_day=unlimited)
+
+        self.stdout.write(
+            f'🏁 Benchmarking {len(transcripts)} transcripts '
+            f'(latency {options["latency"]}s, 429 rate {options["rate_limit_rate"]}, '
+            f'malformed rate {options["malformed_rate"]}, workers {options["workers"]})')
+
+        previous_client = tasks.set_gemini_client(fake)
+        previous_limiter = tasks.gemini_rate_limiter
+        tasks.gemini_rate_limiter = limiter
+        tasks.gemini_latency_tracker.reset()
+        tasks.gemini_concurrency.reset()
+        try:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(
+                    max_workers=max(1, options['workers'])) as executor:
+                runs = list(executor.map(self._run_transcript, transcripts))
+            elapsed = time.perf_counter() - started
+        finally:
+            tasks.gemini_rate_limiter = previous_limiter
+            tasks.set_gemini_client(previous_client)
+
+        self._report(runs, fake, elapsed)
+
+    def _load_corpus(self, corpus_dir, limit):
+        if not corpus_dir.is_dir():
+            raise CommandError(f'Corpus directory not found: {corpus_dir}')
+
+        transcripts = []
+        for path in sorted(corpus_dir.glob('*.txt')):
+            if path.name.endswith('.bills.txt'):
+                continue
+            bills_path = path.with_name(f'{path.stem}.bills.txt')
+            bills = []
+            if bills_path.exists():
+                bills = [
+                    line.strip() for line in bills_path.read_text(
+                        encoding='utf-8').splitlines() if line.strip()
+                ]
+            transcripts.append({
+                'session_id': f'bench-{path.stem}',
+                'text': path.read_text(encoding='utf-8'),
+                'bills': bills
+            })
+        if limit:
+            transcripts = transcripts[:limit]
+        if not transcripts:
+            raise CommandError(f'No transcripts (*.txt) in {corpus_dir}')
+        return transcripts
+
+    def _run_transcript(self, transcript):
+        started = time.perf_counter()
+        text = tasks.clean_pdf_text(transcript['text'])
+        statements = tasks.extract_statements_with_llm_discovery(
+            text, transcript['session_id'], transcript['bills'], None,
+            debug=True)
+        return {
+            'segments': len(tasks.split_speech_segments(text) or []),
+            'statements': len(statements),
+            'seconds': time.perf_counter() - started
+        }
+
+    def _report(self, runs, fake, elapsed):
+        stats = fake.stats
+        segments = sum(run['segments'] for run in runs)
+        tokens = stats['prompt_tokens'] + stats['output_tokens']
+        elapsed = max(elapsed, 1e-9)
+
+        self.stdout.write('')
+        self.stdout.write('📊 Throughput:')
+        self.stdout.write(f'   Wall time: {elapsed:.2f}s')
+        self.stdout.write(
+            f'   ◯ segments: {segments:,} ({segments / elapsed:.1f}/s)')
+        self.stdout.write(
+            f'   Statements extracted: {sum(run["statements"] for run in runs):,}')
+        self.stdout.write(
+            f'   Tokens: {tokens:,} ({tokens / elapsed:,.0f}/s; '
+            f'{stats["prompt_tokens"]:,} prompt, {stats["output_tokens"]:,} output)')
+
+        self.stdout.write('')
+        self.stdout.write('📡 Gemini calls:')
+        self.stdout.write(
+            f'   Requests: {stats["requests"]:,} '
+            f'({stats["discovery_requests"]} discovery, {stats["batch_requests"]} batch, '
+            f'{stats["segments"]:,} segments sent)')
+        self.stdout.write(
+            f'   429s: {stats["rate_limited"]}, malformed: {stats["malformed"]}, '
+            f'timed out: {stats["timed_out"]}')
+        hedging = tasks.gemini_latency_tracker.get_stats()
+        self.stdout.write(
+            f'   Hedged: {hedging["hedged"]} of {hedging["calls"]} calls '
+            f'({hedging["hedge_wins"]} won by the hedge), '
+            f'deadline exceeded: {hedging["deadline_exceeded"]}')
+        concurrency = tasks.gemini_concurrency.get_stats()
+        self.stdout.write(
+            f'🎚️ Concurrency window: {concurrency["window"]} '
+            f'(max {concurrency["max_window"]}; {concurrency["increases"]} increases, '
+            f'{concurrency["decreases"]} cuts after {concurrency["overloads"]} overload errors)')
+
+        self._print_latency('Per-call latency', fake.latencies)
+        self._print_latency('Per-transcript latency',
+                            [run['seconds'] for run in runs])
+
+    def _print_latency(self, label, samples):
+        if not samples:
+            return
+        p50, p95, p99 = np.percentile(np.array(samples), [50, 95, 99])
+        self.stdout.write(
+            f'⏱️ {label}: p50 {p50:.3f}s, p95 {p95:.3f}s, p99 {p99:.3f}s, '
+            f'max {max(samples):.3f}s (n={len(samples)})')
@@ -1,5 +1,6 @@
 
 from django.core.management.base import BaseCommand
+from api.counters import refresh_counters, statement_counter_targets
 from api.models import Statement
 from django.db import transaction
 import re
@@ -132,7 +133,10 @@ class Command(BaseCommand):
             if not dry_run:
                 with transaction.atomic():
                     statement_ids = [item['statement'].id for item in malformed_statements]
-                    deleted_count = Statement.objects.filter(id__in=statement_ids).delete()[0]
+                    statements = Statement.objects.filter(id__in=statement_ids)
+                    counter_targets = statement_counter_targets(statements)
+                    deleted_count = statements.delete()[0]
+                    refresh_counters(*counter_targets)
                     
                 self.stdout.write(
                     self.style.SUCCESS(f'✅ Successfully deleted {deleted_count} malformed statements')
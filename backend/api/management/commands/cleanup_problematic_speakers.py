@@ -1,5 +1,6 @@
 
 from django.core.management.base import BaseCommand
+from api.counters import refresh_counters, statement_counter_targets
 from api.models import Speaker, Statement, Party
 from django.db.models import Q
 from django.db import transaction
@@ -58,8 +59,11 @@ class Command(BaseCommand):
                 
                 if not dry_run:
                     with transaction.atomic():
-                        Statement.objects.filter(speaker=speaker).delete()
+                        statements = Statement.objects.filter(speaker=speaker)
+                        counter_targets = statement_counter_targets(statements)
+                        statements.delete()
                         speaker.delete()
+                        refresh_counters(*counter_targets)
                         removed_speakers += 1
                         self.stdout.write(f'   ✅ Removed {speaker.naas_nm}')
                 else:
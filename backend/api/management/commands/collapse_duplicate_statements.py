@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from api.counters import reconcile_counters
+from api.statement_dedupe import DEDUPE_BATCH_SIZE, collapse_duplicate_statements
+
+
+class Command(BaseCommand):
+    help = ('Collapse statements that share (session, text_hash), keeping the '
+            'oldest row and moving its duplicates\' category links to it')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEDUPE_BATCH_SIZE,
+            help=f'Duplicate groups collapsed per transaction (default: {DEDUPE_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count duplicate groups and the rows that would be removed',
+        )
+
+    def handle(self, *args, **options):
+        result = collapse_duplicate_statements(batch_size=options['batch_size'],
+                                               dry_run=options['dry_run'])
+        if options['dry_run']:
+            self.stdout.write(
+                f'🔍 {result["groups"]:,} duplicate groups, '
+                f'{result["removed"]:,} rows would be removed')
+            return
+        if result['removed']:
+            reconcile_counters()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Collapsed {result["groups"]:,} duplicate groups, '
+                f'removed {result["removed"]:,} rows'))
@@ -0,0 +1,151 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api import batch_jobs
+from api.tasks import is_celery_available, poll_llm_batch_job
+
+
+class Command(BaseCommand):
+    help = 'Analyze pending session transcripts through an offline LLM batch job'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action',
+            choices=['create', 'submit', 'status', 'ingest', 'run'],
+            help='create: write the JSONL job file; submit: hand it to the '
+            'executor; status: poll it; ingest: store results as statements; '
+            'run: all of the above',
+        )
+        parser.add_argument(
+            '--job-id',
+            type=str,
+            help='Existing job ID (for submit, status and ingest)',
+        )
+        parser.add_argument(
+            '--sessions',
+            type=str,
+            help='Comma-separated session IDs (default: pending sessions)',
+        )
+        parser.add_argument(
+            '--era',
+            type=int,
+            help='Only pending sessions of this assembly era (e.g. 22)',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='Maximum number of pending sessions (default: 20)',
+        )
+        parser.add_argument(
+            '--executor',
+            choices=sorted(batch_jobs.BATCH_EXECUTORS),
+            default='gemini',
+            help='Batch executor (default: gemini)',
+        )
+        parser.add_argument(
+            '--model',
+            type=str,
+            help='Model to run the batch on (default: cascade lite model)',
+        )
+        parser.add_argument(
+            '--wait',
+            action='store_true',
+            help='Block and poll until the job finishes instead of queueing a poller',
+        )
+
+    def handle(self, *args, **options):
+        action = options['action']
+        job_id = options.get('job_id')
+
+        if action in ('create', 'run'):
+            job = self._create(options)
+            if not job:
+                return
+            job_id = job['job_id']
+            if action == 'create':
+                return
+        elif not job_id:
+            raise CommandError(f'--job-id is required for {action}')
+
+        if action in ('submit', 'run'):
+            job = batch_jobs.submit_batch_job(job_id)
+            if not job:
+                raise CommandError(f'Batch job {job_id} not found')
+            self.stdout.write(f'🚀 Submitted {job_id} ({job["handle"]})')
+            if action == 'submit':
+                return
+
+        if action == 'run' and not options['wait'] and is_celery_available():
+            poll_llm_batch_job.delay(job_id=job_id)
+            self.stdout.write(
+                self.style.SUCCESS(f'✅ Queued poller for batch job {job_id}'))
+            return
+
+        if action == 'ingest':
+            self._ingest(job_id)
+            return
+
+        job = self._wait(job_id, options['wait'] or action == 'run')
+        self._print_status(job)
+        if action == 'run' and job['state'] == batch_jobs.JOB_SUCCEEDED:
+            self._ingest(job_id)
+
+    def _create(self, options):
+        if options.get('sessions'):
+            session_ids = [
+                s.strip() for s in options['sessions'].split(',') if s.strip()
+            ]
+        else:
+            session_ids = batch_jobs.get_pending_session_ids(
+                era_co=options.get('era'), limit=options['limit'])
+        if not session_ids:
+            self.stdout.write(self.style.WARNING('No sessions to process'))
+            return None
+
+        self.stdout.write(
+            f'Building batch job for {len(session_ids)} sessions...')
+        job = batch_jobs.create_batch_job(session_ids,
+                                          model_name=options.get('model'),
+                                          executor=options['executor'])
+        if not job:
+            self.stdout.write(
+                self.style.WARNING('No pending segments; no job created'))
+            return None
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Created {job["job_id"]}: {job["request_count"]} requests, '
+                f'~{job["estimated_tokens"]:,} tokens'))
+        return job
+
+    def _wait(self, job_id, wait):
+        job = batch_jobs.refresh_batch_job(job_id)
+        if not job:
+            raise CommandError(f'Batch job {job_id} not found')
+        while wait and job['state'] in batch_jobs.ACTIVE_JOB_STATES:
+            self.stdout.write(f'⏳ {job_id}: {job["state"]}')
+            time.sleep(60)
+            job = batch_jobs.refresh_batch_job(job_id)
+        return job
+
+    def _print_status(self, job):
+        self.stdout.write(f'Job:        {job["job_id"]}')
+        self.stdout.write(f'State:      {job["state"]}')
+        self.stdout.write(f'Executor:   {job["executor"]} ({job["model"]})')
+        self.stdout.write(f'Sessions:   {len(job["session_ids"])}')
+        self.stdout.write(
+            f'Requests:   {len(job["ingested"])}/{job["request_count"]} ingested, '
+            f'{len(job["failed_requests"])} failed')
+
+    def _ingest(self, job_id):
+        batch_jobs.refresh_batch_job(job_id)
+        counts = batch_jobs.ingest_batch_results(job_id)
+        if counts is None:
+            raise CommandError(f'Batch job {job_id} has no results to ingest')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Ingested {counts["requests"]} requests: '
+                f'{counts["statements"]} statements, {counts["failed"]} failed, '
+                f'{counts["skipped"]} skipped'))
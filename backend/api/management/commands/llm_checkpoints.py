@@ -0,0 +1,118 @@
+from django.core.management.base import BaseCommand
+
+from api.llm_checkpoints import (LLM_PROMPT_VERSION, get_checkpoint_progress,
+                                 unfinished_session_ids)
+from api.models import LLMBatchCheckpoint
+from api.tasks import is_celery_available, process_session_pdf
+
+
+class Command(BaseCommand):
+    help = 'Show, resume or reset checkpointed per-session LLM runs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action',
+            nargs='?',
+            choices=['status', 'resume', 'reset'],
+            default='status',
+            help='status: batch progress per session (default); resume: rerun '
+            'interrupted sessions, skipping finished batches; reset: delete checkpoints',
+        )
+        parser.add_argument(
+            '--session-id',
+            type=str,
+            help='Only this session (status shows its individual batches)',
+        )
+        parser.add_argument(
+            '--prompt-version',
+            type=str,
+            default=LLM_PROMPT_VERSION,
+            help=f'Prompt version (default: {LLM_PROMPT_VERSION})',
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=10,
+            help='Maximum number of sessions to resume (default: 10)',
+        )
+
+    def handle(self, *args, **options):
+        action = options['action']
+        if action == 'resume':
+            self._resume(options)
+        elif action == 'reset':
+            self._reset(options)
+        elif options.get('session_id'):
+            self._session_detail(options['session_id'],
+                                 options['prompt_version'])
+        else:
+            self._status(options['prompt_version'])
+
+    def _status(self, prompt_version):
+        progress = get_checkpoint_progress(prompt_version=prompt_version)
+        unfinished = set(unfinished_session_ids(prompt_version))
+        if not progress:
+            self.stdout.write(f'No checkpoints for prompt version {prompt_version}')
+            return
+
+        self.stdout.write(f'📊 LLM batch checkpoints ({prompt_version}):')
+        for row in progress:
+            pct = row['done'] / row['total'] * 100 if row['total'] else 0
+            state = '⏸️ interrupted' if row['session_id'] in unfinished else '✅'
+            self.stdout.write(
+                f'   {row["session_id"]}: {row["done"]}/{row["total"]} done ({pct:.0f}%), '
+                f'{row["in_flight"]} in flight, {row["failed"]} failed, {row["planned"]} planned, '
+                f'~{row["tokens_done"]:,}/{row["tokens"]:,} tokens  {state}')
+        self.stdout.write('')
+        self.stdout.write(
+            f'{len(progress)} sessions, {len(unfinished)} interrupted runs '
+            f'(resume with: manage.py llm_checkpoints resume)')
+
+    def _session_detail(self, session_id, prompt_version):
+        checkpoints = LLMBatchCheckpoint.objects.filter(
+            session_id=session_id,
+            prompt_version=prompt_version).order_by('created_at')
+        if not checkpoints.exists():
+            self.stdout.write(f'No checkpoints for session {session_id}')
+            return
+
+        self.stdout.write(f'📋 Checkpoints for session {session_id} ({prompt_version}):')
+        for checkpoint in checkpoints:
+            segments = ''
+            if checkpoint.segment_start is not None:
+                segments = f' segments {checkpoint.segment_start + 1}-{checkpoint.segment_end}'
+            line = (f'   [{checkpoint.status}] {checkpoint.kind}{segments} '
+                    f'{checkpoint.model_name} {checkpoint.bill_name[:40]} '
+                    f'(~{checkpoint.estimated_tokens} tokens, {checkpoint.attempts} attempts)')
+            if checkpoint.error:
+                line += f' - {checkpoint.error[:80]}'
+            self.stdout.write(line)
+
+    def _resume(self, options):
+        if options.get('session_id'):
+            session_ids = [options['session_id']]
+        else:
+            session_ids = unfinished_session_ids(
+                options['prompt_version'])[:options['limit']]
+        if not session_ids:
+            self.stdout.write(self.style.SUCCESS('✅ No interrupted runs to resume'))
+            return
+
+        for session_id in session_ids:
+            self.stdout.write(f'♻️ Resuming session: {session_id}')
+            if is_celery_available():
+                process_session_pdf.delay(session_id=session_id, force=True)
+            else:
+                from api.tasks import process_session_pdf_direct
+                process_session_pdf_direct(session_id=session_id, force=True)
+        self.stdout.write(
+            self.style.SUCCESS(f'✅ Resumed {len(session_ids)} sessions'))
+
+    def _reset(self, options):
+        checkpoints = LLMBatchCheckpoint.objects.filter(
+            prompt_version=options['prompt_version'])
+        if options.get('session_id'):
+            checkpoints = checkpoints.filter(session_id=options['session_id'])
+        deleted, _ = checkpoints.delete()
+        self.stdout.write(
+            self.style.SUCCESS(f'🗑️ Deleted {deleted} checkpoints'))
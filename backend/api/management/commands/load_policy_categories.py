@@ -1,6 +1,7 @@
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from api.models import Category, Subcategory
+from api.category_catalog import invalidate_category_catalog
 import csv
 import logging
 
@@ -35,6 +36,7 @@ class Command(BaseCommand):
             with transaction.atomic():
                 Subcategory.objects.all().delete()
                 Category.objects.all().delete()
+            invalidate_category_catalog()
             self.stdout.write(
                 self.style.SUCCESS("✅ Existing data cleared")
             )
@@ -114,6 +116,9 @@ class Command(BaseCommand):
                             )
                             continue
 
+                # Cached catalog and prompt prefixes must be rebuilt
+                invalidate_category_catalog()
+
                 # Summary
                 self.stdout.write(
                     self.style.SUCCESS(
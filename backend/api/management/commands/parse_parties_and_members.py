@@ -7,6 +7,7 @@ from django.conf import settings
 import logging
 import os
 from api.models import Party, SpeakerPartyHistory
+from api.party_membership import backfill_party_membership
 
 logger = logging.getLogger(__name__)
 
@@ -354,57 +355,8 @@ class Command(BaseCommand):
         )
     def process_speaker_party_histories(self):
         """Process all speakers and create party history records"""
-        from api.models import Party, SpeakerPartyHistory
-
         self.stdout.write('🔄 Processing speaker party histories...')
-
-        speakers = Speaker.objects.all()
-        processed_count = 0
-
-        for speaker in speakers:
-            try:
-                party_list = speaker.get_party_list()
-                if not party_list:
-                    continue
-
-                # Clear existing history for this speaker
-                SpeakerPartyHistory.objects.filter(speaker=speaker).delete()
-
-                # Create party history records
-                for order, party_name in enumerate(party_list):
-                    try:
-                        party, created = Party.objects.get_or_create(
-                            name=party_name,
-                            defaults={'description': f'{party_name} - 자동 생성됨'}
-                        )
-
-                        is_current = (order == len(party_list) - 1)  # Last party is current
-
-                        SpeakerPartyHistory.objects.create(
-                            speaker=speaker,
-                            party=party,
-                            order=order,
-                            is_current=is_current
-                        )
-
-                        # Set current party
-                        if is_current:
-                            speaker.current_party = party
-                            speaker.save(update_fields=['current_party'])
-
-                    except Exception as e:
-                        self.stdout.write(f'⚠️  Warning: Could not process party "{party_name}" for {speaker.naas_nm}: {e}')
-                        continue
-
-                processed_count += 1
-
-                if processed_count % 50 == 0:
-                    self.stdout.write(f'🔄 Processed {processed_count} speakers...')
-
-            except Exception as e:
-                self.stdout.write(f'❌ Error processing speaker {speaker.naas_nm}: {e}')
-                continue
-
+        processed_count = backfill_party_membership()
         self.stdout.write(
             self.style.SUCCESS(f'✅ Speaker party histories processed: {processed_count} speakers')
         )
@@ -590,67 +542,8 @@ class Command(BaseCommand):
 
     def update_speaker_party_relationships(self):
         """Update Speaker-Party relationships using party history from plpt_nm field"""
-        from api.models import Party, SpeakerPartyHistory
-
-        speakers = Speaker.objects.all()
-        processed_count = 0
-
-        self.stdout.write(f'🔗 Processing {speakers.count()} speakers for party relationships...')
-
-        for speaker in speakers:
-            try:
-                # Clear existing party history for this speaker
-                SpeakerPartyHistory.objects.filter(speaker=speaker).delete()
-
-                # Get party list from plpt_nm field
-                party_list = speaker.get_party_list()
-
-                if not party_list:
-                    self.stdout.write(f'⚠️ No party history found for {speaker.naas_nm}')
-                    continue
-
-                # Create party history records
-                for order, party_name in enumerate(party_list):
-                    try:
-                        # Get or create the party
-                        party, created = Party.objects.get_or_create(
-                            name=party_name,
-                            defaults={
-                                'description': f'{party_name} - 국회의원 데이터에서 추출',
-                                'slogan': '',
-                                'logo_url': ''
-                            }
-                        )
-
-                        # Determine if this is the current party (last in the list)
-                        is_current = (order == len(party_list) - 1)
-
-                        # Create party history record
-                        SpeakerPartyHistory.objects.create(
-                            speaker=speaker,
-                            party=party,
-                            order=order,
-                            is_current=is_current
-                        )
-
-                        # Set current party
-                        if is_current:
-                            speaker.current_party = party
-                            speaker.save(update_fields=['current_party'])
-
-                    except Exception as e:
-                        self.stdout.write(f'⚠️ Warning: Could not process party "{party_name}" for {speaker.naas_nm}: {e}')
-                        continue
-
-                processed_count += 1
-
-                if processed_count % 50 == 0:
-                    self.stdout.write(f'🔄 Processed {processed_count} speakers...')
-
-            except Exception as e:
-                self.stdout.write(f'❌ Error processing speaker {speaker.naas_nm}: {e}')
-                continue
-
+        self.stdout.write('🔗 Processing speakers for party relationships...')
+        processed_count = backfill_party_membership()
         self.stdout.write(
             self.style.SUCCESS(f'✅ Updated party relationships for {processed_count} speakers')
         )
\ No newline at end of file
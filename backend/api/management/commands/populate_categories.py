@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from api.models import Category, Subcategory
+from api.category_catalog import invalidate_category_catalog
 
 
 class Command(BaseCommand):
@@ -205,6 +206,8 @@ class Command(BaseCommand):
                         self.style.SUCCESS(f'  Created subcategory: {subcategory.name}')
                     )
 
+        invalidate_category_catalog()
+
         self.stdout.write(
             self.style.SUCCESS(
                 f'\nCompleted! Created {created_categories} categories and {created_subcategories} subcategories.'
@@ -1,7 +1,8 @@
 
 from django.core.management.base import BaseCommand
 from api.models import Statement
-from api.llm_analyzer import LLMAnalyzer
+from api.sentiment_lexicon import (get_lexicon_scorer, LEXICON_ANALYSIS_VERSION,
+                                   LEXICON_SENTIMENT_REASON)
 from django.db.models import Q
 import logging
 from datetime import datetime
@@ -29,11 +30,31 @@ class Command(BaseCommand):
             action='store_true',
             help='Re-analyze statements that already have sentiment scores',
         )
+        parser.add_argument(
+            '--statements-per-prompt',
+            type=int,
+            default=20,
+            help='Statements packed into each LLM prompt (default: 20)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Concurrent LLM prompts, sharing the Gemini rate limiter (default: 4)',
+        )
+        parser.add_argument(
+            '--lexicon',
+            action='store_true',
+            help='Score offline with the lexicon scorer (provisional, no LLM quota used)',
+        )
 
     def handle(self, *args, **options):
         batch_size = options.get('batch_size', 100)
         dry_run = options.get('dry_run', False)
         force = options.get('force', False)
+        lexicon = options.get('lexicon', False)
+        statements_per_prompt = options.get('statements_per_prompt', 20)
+        workers = options.get('workers', 4)
         
         self.stdout.write(
             self.style.SUCCESS('🎯 Starting sentiment score population...')
@@ -45,9 +66,18 @@ class Command(BaseCommand):
                 session__era_co__in=['22', '제22대']
             ).order_by('created_at')
             self.stdout.write('🔄 Force mode: Re-analyzing ALL statements')
-        else:
+        elif lexicon:
             statements_qs = Statement.objects.filter(
                 Q(sentiment_score__isnull=True) | Q(sentiment_score=0.0),
+                sentiment_provisional=False,
+                session__era_co__in=['22', '제22대']
+            ).order_by('created_at')
+            self.stdout.write('📖 Lexicon mode: Provisionally scoring statements without sentiment scores')
+        else:
+            # Provisional lexicon scores are queued for LLM refinement
+            statements_qs = Statement.objects.filter(
+                Q(sentiment_score__isnull=True) | Q(sentiment_score=0.0)
+                | Q(sentiment_provisional=True),
                 session__era_co__in=['22', '제22대']
             ).order_by('created_at')
             self.stdout.write('✨ Analyzing statements without sentiment scores')
@@ -66,56 +96,54 @@ class Command(BaseCommand):
             self.stdout.write(f'Would process {total_statements} statements in batches of {batch_size}')
             return
         
+        if lexicon:
+            self._populate_with_lexicon(statements_qs, total_statements, batch_size)
+            return
+
         # Initialize LLM analyzer
-        try:
-            analyzer = LLMAnalyzer()
-            self.stdout.write('🤖 LLM Analyzer initialized successfully')
-        except Exception as e:
+        from api.llm_analyzer import LLMPolicyAnalyzer
+        from api.tasks import get_gemini_client
+        if not get_gemini_client():
             self.stdout.write(
-                self.style.ERROR(f'❌ Failed to initialize LLM Analyzer: {e}')
+                self.style.ERROR('❌ Failed to initialize LLM Analyzer: Gemini client not available')
             )
+            self.stdout.write('💡 Use --lexicon to score provisionally without the LLM')
             return
-        
+        analyzer = LLMPolicyAnalyzer()
+        self.stdout.write(
+            f'🤖 LLM Analyzer initialized ({statements_per_prompt} statements per prompt, {workers} concurrent prompts)'
+        )
+
         processed = 0
         errors = 0
-        
-        # Process in batches
-        for i in range(0, total_statements, batch_size):
-            batch_statements = statements_qs[i:i + batch_size]
-            
+        last_id = 0
+        started = datetime.now()
+
+        while True:
+            # Keyset pagination by id; stays correct as rows get scored
+            batch_statements = list(
+                statements_qs.filter(id__gt=last_id).order_by('id')
+                .select_related('speaker', 'bill')[:batch_size]
+            )
+            if not batch_statements:
+                break
+            last_id = batch_statements[-1].id
+
+            results = analyzer.batch_analyze_statements(
+                batch_statements,
+                statements_per_prompt=statements_per_prompt,
+                max_workers=workers
+            )
+            # Analyses the LLM actually returned echo their statement_id
+            batch_errors = sum(1 for result in results if 'statement_id' not in result)
+            processed += len(batch_statements) - batch_errors
+            errors += batch_errors
+
+            elapsed = max((datetime.now() - started).total_seconds(), 1e-6)
             self.stdout.write(
-                f'🔄 Processing batch {i//batch_size + 1}/{(total_statements + batch_size - 1)//batch_size} '
-                f'(statements {i+1}-{min(i+batch_size, total_statements)})'
+                f'   ✅ Processed {processed}/{total_statements} statements '
+                f'({errors} errors, {processed / elapsed:.1f}/s)'
             )
-            
-            for statement in batch_statements:
-                try:
-                    # Analyze sentiment
-                    analysis_result = analyzer.analyze_statement(statement.text)
-                    
-                    if analysis_result and 'sentiment_score' in analysis_result:
-                        statement.sentiment_score = analysis_result['sentiment_score']
-                        statement.sentiment_reason = analysis_result.get('sentiment_reason', '')
-                        statement.category_analysis = analysis_result.get('category_analysis', '')
-                        statement.policy_keywords = analysis_result.get('policy_keywords', '')
-                        statement.save()
-                        
-                        processed += 1
-                        
-                        if processed % 10 == 0:
-                            self.stdout.write(f'   ✅ Processed {processed}/{total_statements} statements')
-                    else:
-                        self.stdout.write(
-                            f'   ⚠️  No sentiment analysis result for statement {statement.id}'
-                        )
-                        errors += 1
-                        
-                except Exception as e:
-                    self.stdout.write(
-                        f'   ❌ Error processing statement {statement.id}: {e}'
-                    )
-                    errors += 1
-                    continue
         
         # Summary
         self.stdout.write('')
@@ -152,3 +180,42 @@ class Command(BaseCommand):
                     f'⚠️  COMPLETE WITH ERRORS - Processed {processed} statements with {errors} errors'
                 )
             )
+
+    def _populate_with_lexicon(self, statements_qs, total_statements, batch_size):
+        """Score statements in bulk with the offline lexicon and flag them provisional"""
+        scorer = get_lexicon_scorer()
+        processed = 0
+        last_id = 0
+        started = datetime.now()
+
+        while True:
+            # Keyset pagination: scored rows drop out of the queryset
+            batch = list(
+                statements_qs.filter(id__gt=last_id).order_by('id')
+                .only('id', 'text')[:batch_size]
+            )
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            scores = scorer.score_texts([stmt.text for stmt in batch])
+            for stmt, score in zip(batch, scores):
+                stmt.sentiment_score = round(float(score), 3)
+                stmt.sentiment_reason = LEXICON_SENTIMENT_REASON
+                stmt.sentiment_provisional = True
+                stmt.analysis_version = LEXICON_ANALYSIS_VERSION
+            Statement.objects.bulk_update(
+                batch, ['sentiment_score', 'sentiment_reason', 'sentiment_provisional',
+                        'analysis_version']
+            )
+            processed += len(batch)
+            self.stdout.write(f'   ✅ Scored {processed}/{total_statements} statements')
+
+        elapsed = max((datetime.now() - started).total_seconds(), 1e-6)
+        self.stdout.write('')
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ COMPLETE - Provisionally scored {processed} statements '
+                f'({processed / elapsed:.0f}/s). Run without --lexicon to refine them with the LLM.'
+            )
+        )
@@ -0,0 +1,109 @@
+from django.core.management.base import BaseCommand
+
+from api.llm_analyzer import STATEMENT_BATCH_WORKERS, STATEMENTS_PER_PROMPT
+from api.reanalysis import (CURRENT_BILL_ANALYSIS_VERSION,
+                            CURRENT_STATEMENT_ANALYSIS_VERSIONS,
+                            REANALYSIS_CHUNK_SIZE, ReanalysisScheduler,
+                            get_staleness_summary)
+
+
+class Command(BaseCommand):
+    help = ('Re-analyze statements and bills whose analysis version is older '
+            'than the current prompts, newest sessions first, under a token budget')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'action',
+            nargs='?',
+            choices=['status', 'run'],
+            default='status',
+            help='status: stale row counts per analysis version (default); '
+            'run: re-analyze stale rows',
+        )
+        parser.add_argument(
+            '--token-budget',
+            type=int,
+            default=1_000_000,
+            help='Estimated tokens this run may spend (default: 1,000,000)',
+        )
+        parser.add_argument(
+            '--era',
+            type=int,
+            help='Only sessions of this assembly era (e.g. 22)',
+        )
+        parser.add_argument(
+            '--bills',
+            action='store_true',
+            help='Also reprocess sessions whose bills were analyzed by an older prompt',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=REANALYSIS_CHUNK_SIZE,
+            help=f'Stale statements fetched per keyset page (default: {REANALYSIS_CHUNK_SIZE})',
+        )
+        parser.add_argument(
+            '--statements-per-prompt',
+            type=int,
+            default=STATEMENTS_PER_PROMPT,
+            help=f'Statements packed into one LLM prompt (default: {STATEMENTS_PER_PROMPT})',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=STATEMENT_BATCH_WORKERS,
+            help=f'Concurrent LLM prompts (default: {STATEMENT_BATCH_WORKERS})',
+        )
+
+    def handle(self, *args, **options):
+        if options['action'] == 'run':
+            self._run(options)
+        else:
+            self._status(options.get('era'))
+
+    def _status(self, era_co):
+        summary = get_staleness_summary(era_co)
+        self.stdout.write(
+            f'📊 Current versions: statements {", ".join(CURRENT_STATEMENT_ANALYSIS_VERSIONS)}, '
+            f'bills {CURRENT_BILL_ANALYSIS_VERSION}')
+        for label, counts in (('Statements', summary['statements']),
+                              ('Bills', summary['bills'])):
+            self.stdout.write(
+                f'{label}: {counts["stale"]:,} stale of {counts["total"]:,}')
+            for version, count in counts['by_version'].items():
+                self.stdout.write(f'   {version or "(unversioned)"}: {count:,}')
+
+    def _run(self, options):
+        def report(progress):
+            self.stdout.write(
+                f'   ✅ {progress["statements_reanalyzed"]:,} re-analyzed, '
+                f'{progress["statements_failed"]:,} failed, '
+                f'{progress["sessions_completed"]} sessions done, '
+                f'~{progress["tokens_estimated"]:,}/{progress["token_budget"]:,} tokens')
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'🔄 Re-analyzing stale rows (budget ~{options["token_budget"]:,} tokens)'))
+        scheduler = ReanalysisScheduler(
+            options['token_budget'],
+            era_co=options.get('era'),
+            include_bills=options['bills'],
+            chunk_size=options['chunk_size'],
+            statements_per_prompt=options['statements_per_prompt'],
+            max_workers=options['workers'],
+            on_progress=report)
+        progress = scheduler.run()
+
+        if progress['stale_statements_remaining'] is None:
+            self.stdout.write(
+                self.style.ERROR('❌ Gemini client not available'))
+            return
+        if progress['budget_exhausted']:
+            self.stdout.write(
+                self.style.WARNING('💰 Token budget reached; rerun to continue'))
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ COMPLETE - {progress["statements_reanalyzed"]:,} statements re-analyzed, '
+                f'{progress["bill_sessions_queued"]} sessions queued for bills; '
+                f'{progress["stale_statements_remaining"]:,} stale statements and '
+                f'{progress["stale_bills_remaining"]:,} stale bills remain'))
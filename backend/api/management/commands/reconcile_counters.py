@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from api.counters import COUNTER_RECONCILE_BATCH_SIZE, reconcile_counters
+
+
+class Command(BaseCommand):
+    help = ('Recount the denormalized statement/bill counters on sessions '
+            'and bills and repair the rows that drifted')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=COUNTER_RECONCILE_BATCH_SIZE,
+            help=f'Rows recounted per UPDATE (default: {COUNTER_RECONCILE_BATCH_SIZE})',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only count the sessions and bills whose counters drifted',
+        )
+
+    def handle(self, *args, **options):
+        result = reconcile_counters(batch_size=options['batch_size'],
+                                    dry_run=options['dry_run'])
+        sessions, bills = result['sessions'], result['bills']
+        if options['dry_run']:
+            self.stdout.write(
+                f'🔍 {sessions["drifted"]:,} sessions and '
+                f'{bills["drifted"]:,} bills have drifted counters')
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'✅ Recounted {sessions["rows"]:,} sessions and '
+                f'{bills["rows"]:,} bills, repaired '
+                f'{sessions["drifted"]:,} and {bills["drifted"]:,}'))
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.2 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0022_bill_bill_specific_keywords_json'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='statement',
+            name='sentiment_provisional',
+            field=models.BooleanField(db_index=True, default=False, help_text='사전 기반 임시 점수 여부 (LLM 재분석 필요)', verbose_name='임시 감성 점수'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.2 on 2026-10-18 21:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0023_statement_sentiment_provisional'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMBatchCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prompt_version', models.CharField(max_length=50, verbose_name='프롬프트 버전')),
+                ('kind', models.CharField(choices=[('session', '세션 실행'), ('discovery', '의안 구간 탐색'), ('analysis', '발언 분석 배치')], max_length=20, verbose_name='작업 종류')),
+                ('batch_key', models.CharField(help_text='배치 내용 기반 고유 키', max_length=100, verbose_name='배치 키')),
+                ('bill_name', models.CharField(blank=True, max_length=500, verbose_name='의안명')),
+                ('model_name', models.CharField(blank=True, max_length=100, verbose_name='모델')),
+                ('segment_start', models.IntegerField(blank=True, null=True, verbose_name='시작 구간')),
+                ('segment_end', models.IntegerField(blank=True, null=True, verbose_name='끝 구간')),
+                ('estimated_tokens', models.IntegerField(default=0, verbose_name='예상 토큰')),
+                ('status', models.CharField(choices=[('planned', '계획됨'), ('in_flight', '처리 중'), ('done', '완료'), ('failed', '실패')], db_index=True, default='planned', max_length=20, verbose_name='상태')),
+                ('attempts', models.IntegerField(default=0, verbose_name='시도 횟수')),
+                ('result', models.JSONField(blank=True, help_text='완료된 배치의 분석 결과', null=True, verbose_name='결과')),
+                ('error', models.TextField(blank=True, verbose_name='오류')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='시작일시')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='완료일시')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='생성일시')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+                ('session', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='llm_checkpoints', to='api.session', verbose_name='관련 회의')),
+            ],
+            options={
+                'verbose_name': 'LLM 배치 체크포인트',
+                'verbose_name_plural': 'LLM 배치 체크포인트 목록',
+                'ordering': ['session', 'created_at'],
+                'unique_together': {('session', 'prompt_version', 'batch_key')},
+            },
+        ),
+    ]
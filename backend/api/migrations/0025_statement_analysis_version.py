@@ -0,0 +1,27 @@
+# Generated by Django 5.0.2 on 2026-10-18 21:56
+
+from django.db import migrations, models
+
+
+def stamp_lexicon_statements(apps, schema_editor):
+    """Lexicon-scored statements get the lexicon version; the rest stay unversioned."""
+    Statement = apps.get_model('api', 'Statement')
+    Statement.objects.filter(sentiment_provisional=True).update(
+        analysis_version='lexicon-v1')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_llmbatchcheckpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='statement',
+            name='analysis_version',
+            field=models.CharField(blank=True, db_index=True, help_text='감성/정책 분석 프롬프트 버전 (빈 값: 버전 기록 이전)', max_length=30, verbose_name='분석 버전'),
+        ),
+        migrations.RunPython(stamp_lexicon_statements,
+                             migrations.RunPython.noop),
+    ]
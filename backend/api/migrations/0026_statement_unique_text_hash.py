@@ -0,0 +1,78 @@
+# Generated by Django 5.0.2 on 2026-10-18 22:12
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+COLLAPSE_BATCH_SIZE = 500
+
+
+def collapse_duplicates(apps, schema_editor):
+    """
+    The constraint cannot be added while duplicate rows remain. Keep the
+    oldest statement of each (session, text_hash) group; category links of
+    the removed rows move to it unless it already has that category.
+    """
+    Statement = apps.get_model('api', 'Statement')
+    StatementCategory = apps.get_model('api', 'StatementCategory')
+
+    while True:
+        groups = list(
+            Statement.objects.exclude(text_hash='').values(
+                'session_id', 'text_hash').annotate(
+                    rows=Count('id'), keep_id=Min('id')).filter(
+                        rows__gt=1).order_by('keep_id').values_list(
+                            'session_id', 'text_hash',
+                            'keep_id')[:COLLAPSE_BATCH_SIZE])
+        if not groups:
+            break
+        keep_ids = {(session_id, text_hash): keep_id
+                    for session_id, text_hash, keep_id in groups}
+        duplicate_of = {}
+        for statement_id, session_id, text_hash in Statement.objects.filter(
+                session_id__in={session_id for session_id, _, _ in groups},
+                text_hash__in={text_hash for _, text_hash, _ in groups
+                               }).values_list('id', 'session_id', 'text_hash'):
+            keep_id = keep_ids.get((session_id, text_hash))
+            if keep_id and statement_id != keep_id:
+                duplicate_of[statement_id] = keep_id
+        if not duplicate_of:
+            break
+
+        linked = set(
+            StatementCategory.objects.filter(
+                statement_id__in=set(keep_ids.values())).values_list(
+                    'statement_id', 'category_id'))
+        moved = []
+        for link in StatementCategory.objects.filter(
+                statement_id__in=list(duplicate_of)).order_by(
+                    '-confidence_score', 'id'):
+            target = (duplicate_of[link.statement_id], link.category_id)
+            if target in linked:
+                continue
+            linked.add(target)
+            link.statement_id = target[0]
+            moved.append(link)
+        if moved:
+            StatementCategory.objects.bulk_update(moved, ['statement'])
+        Statement.objects.filter(id__in=list(duplicate_of)).delete()
+
+
+class Migration(migrations.Migration):
+    # On PostgreSQL the deletes above leave deferred foreign key checks
+    # pending, and CREATE INDEX refuses to run on a table with pending
+    # trigger events. The collapse therefore commits in its own
+    # transaction before the constraint is built.
+    atomic = False
+
+    dependencies = [
+        ('api', '0025_statement_analysis_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(collapse_duplicates, migrations.RunPython.noop,
+                             atomic=True),
+        migrations.AddConstraint(
+            model_name='statement',
+            constraint=models.UniqueConstraint(condition=models.Q(('text_hash', ''), _negated=True), fields=('session', 'text_hash'), name='unique_statement_session_text_hash'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.0.2 on 2026-10-18 22:20
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def _count_subquery(model, field):
+    counts = model.objects.filter(**{
+        field: OuterRef('pk')
+    }).order_by().values(field).annotate(rows=Count('pk')).values('rows')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def backfill_counters(apps, schema_editor):
+    """
+    The columns are added as 0; count the existing statements and bills with
+    one correlated UPDATE per table so the lists show real numbers at once.
+    """
+    Session = apps.get_model('api', 'Session')
+    Bill = apps.get_model('api', 'Bill')
+    Statement = apps.get_model('api', 'Statement')
+
+    Session.objects.update(statement_count=_count_subquery(Statement, 'session'),
+                           bill_count=_count_subquery(Bill, 'session'))
+    Bill.objects.update(statement_count=_count_subquery(Statement, 'bill'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_statement_unique_text_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bill',
+            name='statement_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='발언 수'),
+        ),
+        migrations.AddField(
+            model_name='session',
+            name='bill_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='의안 수'),
+        ),
+        migrations.AddField(
+            model_name='session',
+            name='statement_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='발언 수'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.0.2 on 2026-10-18 22:41
+
+import re
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models, transaction
+from django.db.models import OuterRef, Subquery
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def backfill_statement_fields(apps, schema_editor):
+    """
+    Give existing statements their speaker's current party, their
+    session's conf_dt and the numeric era of the session's era_co,
+    BACKFILL_BATCH_SIZE ids at a time, each batch in its own transaction.
+    """
+    Statement = apps.get_model('api', 'Statement')
+    Session = apps.get_model('api', 'Session')
+    Speaker = apps.get_model('api', 'Speaker')
+
+    eras = {}
+    for era_co in Session.objects.values_list('era_co', flat=True).distinct():
+        match = re.search(r'\d+', era_co or '')
+        if match:
+            eras.setdefault(int(match.group()), []).append(era_co)
+
+    missing = Statement.objects.filter(conf_dt__isnull=True)
+    bounds = missing.order_by('id').values_list('id', flat=True)
+    start = bounds.first()
+    while start is not None:
+        end = start + BACKFILL_BATCH_SIZE
+        batch = missing.filter(id__gte=start, id__lt=end)
+        with transaction.atomic(using=schema_editor.connection.alias):
+            batch.filter(party__isnull=True).update(party_id=Subquery(
+                Speaker.objects.filter(
+                    pk=OuterRef('speaker_id')).values('current_party_id')[:1]))
+            for era, era_codes in eras.items():
+                batch.filter(session__era_co__in=era_codes).update(era=era)
+            batch.update(conf_dt=Subquery(
+                Session.objects.filter(
+                    pk=OuterRef('session_id')).values('conf_dt')[:1]))
+        start = bounds.filter(id__gte=end).first()
+
+
+class AddIndexConcurrentlyOnPostgres(AddIndexConcurrently):
+    """CREATE INDEX CONCURRENTLY on PostgreSQL, a plain CREATE INDEX elsewhere."""
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_forwards(app_label, schema_editor,
+                                             from_state, to_state)
+        return migrations.AddIndex.database_forwards(self, app_label,
+                                                     schema_editor,
+                                                     from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_backwards(app_label, schema_editor,
+                                              from_state, to_state)
+        return migrations.AddIndex.database_backwards(self, app_label,
+                                                      schema_editor,
+                                                      from_state, to_state)
+
+
+class Migration(migrations.Migration):
+    # Nothing here holds a long lock on api_statement: the backfill commits
+    # batch by batch, so its deferred foreign key checks are done before the
+    # indexes are built, and those are built without blocking writes.
+    atomic = False
+
+    dependencies = [
+        ('api', '0027_session_bill_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='statement',
+            name='conf_dt',
+            field=models.DateField(blank=True, help_text='회의일자', null=True, verbose_name='회의일자'),
+        ),
+        migrations.AddField(
+            model_name='statement',
+            name='era',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='대수 (숫자)', null=True, verbose_name='대수'),
+        ),
+        migrations.AddField(
+            model_name='statement',
+            name='party',
+            field=models.ForeignKey(blank=True, help_text='발언 당시 발언자의 소속 정당', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='statements', to='api.party', verbose_name='발언 당시 정당'),
+        ),
+        migrations.RunPython(backfill_statement_fields,
+                             migrations.RunPython.noop,
+                             atomic=False),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(fields=['era', 'party', 'conf_dt'], name='idx_statement_era_party_dt'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(fields=['party', 'conf_dt'], name='idx_statement_party_dt'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(fields=['conf_dt'], name='idx_statement_conf_dt'),
+        ),
+    ]
@@ -0,0 +1,129 @@
+# Generated by Django 5.0.2 on 2026-10-18 22:45
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+# Created with raw SQL by 0017 and by the removed add_performance_indexes /
+# add_sentiment_indexes commands. Indexes declared in Meta.indexes under
+# the same name are rebuilt from their declaration; the rest duplicate a
+# foreign key index or serve no current query.
+LEGACY_INDEXES = [
+    'idx_session_era_co',
+    'idx_speaker_era',
+    'idx_statement_session_id',
+    'idx_statement_sentiment',
+    'idx_statement_speaker_id',
+    'idx_statement_created_at',
+    'idx_session_era_date',
+    'idx_session_conf_dt',
+    'idx_session_era_only',
+    'idx_session_sess_dgr',
+    'idx_session_22nd',
+    'idx_session_era_22_date',
+    'idx_session_era_sess_dgr',
+    'idx_speaker_assembly_era',
+    'idx_speaker_party',
+    'idx_speaker_current_party',
+    'idx_bill_session_id',
+    'idx_bill_created_at',
+    'idx_party_assembly_era',
+    'idx_statement_session_sentiment',
+    'idx_statement_speaker_session',
+    'idx_statement_sentiment_score',
+    'idx_statement_sentiment_range',
+    'idx_statement_speaker_sentiment',
+    'idx_statement_session_sentiment_score',
+    'idx_statement_22nd_sentiment',
+    'idx_statement_sentiment_with_text',
+    'idx_speaker_current_party_sentiment',
+]
+
+
+def drop_legacy_indexes(apps, schema_editor):
+    concurrently = ('CONCURRENTLY '
+                    if schema_editor.connection.vendor == 'postgresql' else '')
+    for name in LEGACY_INDEXES:
+        schema_editor.execute(f'DROP INDEX {concurrently}IF EXISTS "{name}"')
+
+
+class AddIndexConcurrentlyOnPostgres(AddIndexConcurrently):
+    """CREATE INDEX CONCURRENTLY on PostgreSQL, a plain CREATE INDEX elsewhere."""
+
+    def database_forwards(self, app_label, schema_editor, from_state,
+                          to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_forwards(app_label, schema_editor,
+                                             from_state, to_state)
+        return migrations.AddIndex.database_forwards(self, app_label,
+                                                     schema_editor,
+                                                     from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state,
+                           to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            return super().database_backwards(app_label, schema_editor,
+                                              from_state, to_state)
+        return migrations.AddIndex.database_backwards(self, app_label,
+                                                      schema_editor,
+                                                      from_state, to_state)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('api', '0028_statement_party_date_era'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_legacy_indexes, migrations.RunPython.noop),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='bill',
+            index=models.Index(fields=['session', 'bill_nm'], name='idx_bill_session_name'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='bill',
+            index=models.Index(fields=['-created_at'], name='idx_bill_created_at'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='party',
+            index=models.Index(fields=['assembly_era'], name='idx_party_assembly_era'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='session',
+            index=models.Index(fields=['era_co', '-conf_dt'], name='idx_session_era_date'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='session',
+            index=models.Index(fields=['-conf_dt'], name='idx_session_conf_dt'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='session',
+            index=models.Index(fields=['era_co', 'sess', 'dgr'], name='idx_session_era_sess_dgr'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(fields=['-created_at'], name='idx_statement_created_at'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(fields=['text_hash'], name='idx_statement_text_hash'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(condition=models.Q(('sentiment_score__isnull', False)), fields=['sentiment_score'], name='idx_statement_sentiment'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(condition=models.Q(('sentiment_score__isnull', False)), fields=['session', 'sentiment_score'], name='idx_statement_session_sent'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(condition=models.Q(('sentiment_score__isnull', False)), fields=['speaker', 'sentiment_score'], name='idx_statement_speaker_sent'),
+        ),
+        AddIndexConcurrentlyOnPostgres(
+            model_name='statement',
+            index=models.Index(condition=models.Q(('sentiment_score__isnull', False)), fields=['party', 'sentiment_score'], name='idx_statement_party_sent'),
+        ),
+    ]
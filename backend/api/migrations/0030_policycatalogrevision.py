@@ -0,0 +1,25 @@
+# Generated by Django 5.0.2 on 2026-10-18 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0029_declarative_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PolicyCatalogRevision',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('revision', models.PositiveIntegerField(default=0, verbose_name='리비전')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '정책 카테고리 리비전',
+                'verbose_name_plural': '정책 카테고리 리비전',
+            },
+        ),
+    ]
@@ -3,6 +3,9 @@ from django.utils.translation import gettext_lazy as _
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 
+from .party_membership import parse_party_history
+from .statement_fields import era_number
+
 
 class Session(models.Model):
     conf_id = models.CharField(max_length=50,
@@ -42,6 +45,13 @@ class Session(models.Model):
                               verbose_name=_("종료시간"))
     down_url = models.URLField(help_text=_("PDF 다운로드 URL"),
                                verbose_name=_("PDF 다운로드 URL"))
+    # Denormalized counters, maintained by api.counters
+    statement_count = models.PositiveIntegerField(default=0,
+                                                  editable=False,
+                                                  verbose_name=_("발언 수"))
+    bill_count = models.PositiveIntegerField(default=0,
+                                             editable=False,
+                                             verbose_name=_("의안 수"))
     created_at = models.DateTimeField(auto_now_add=True,
                                       verbose_name=_("생성일시"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일시"))
@@ -50,10 +60,21 @@ class Session(models.Model):
         ordering = ['-conf_dt', '-bg_ptm']
         verbose_name = _("회의")
         verbose_name_plural = _("회의")
+        indexes = [
+            models.Index(fields=['era_co', '-conf_dt'],
+                         name='idx_session_era_date'),
+            models.Index(fields=['-conf_dt'], name='idx_session_conf_dt'),
+            models.Index(fields=['era_co', 'sess', 'dgr'],
+                         name='idx_session_era_sess_dgr'),
+        ]
 
     def __str__(self):
         return f"{self.era_co} {self.sess} {self.dgr} ({self.conf_dt})"
 
+    def get_era_number(self):
+        """Returns the assembly era as an int ('22' and '제22대' -> 22)"""
+        return era_number(self.era_co)
+
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
@@ -140,6 +161,10 @@ class Bill(models.Model):
                                            blank=True,
                                            help_text=_("정책 영향도 점수 (0-10)"),
                                            verbose_name=_("정책 영향도"))
+    # Denormalized counter, maintained by api.counters
+    statement_count = models.PositiveIntegerField(default=0,
+                                                  editable=False,
+                                                  verbose_name=_("발언 수"))
     created_at = models.DateTimeField(auto_now_add=True,
                                       verbose_name=_("생성일시"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일시"))
@@ -148,6 +173,13 @@ class Bill(models.Model):
         ordering = ['-created_at']
         verbose_name = _("의안")
         verbose_name_plural = _("의안")
+        indexes = [
+            # Bill name lookups within a session (SessionBillMatcher,
+            # discovery)
+            models.Index(fields=['session', 'bill_nm'],
+                         name='idx_bill_session_name'),
+            models.Index(fields=['-created_at'], name='idx_bill_created_at'),
+        ]
 
     def __str__(self):
         return self.bill_nm
@@ -195,6 +227,10 @@ class Party(models.Model):
         ordering = ['name']
         verbose_name = "정당"
         verbose_name_plural = "정당 목록"
+        indexes = [
+            models.Index(fields=['assembly_era'],
+                         name='idx_party_assembly_era'),
+        ]
 
 
 class Speaker(models.Model):
@@ -282,22 +318,15 @@ class Speaker(models.Model):
         ]
 
     def get_current_party_name(self):
-        """Returns the most recent (last) party from the party history with proper mapping"""
-        parties = self.get_party_list()
-        if not parties:
-            return "정당정보없음"
-
-        # Get the last (most recent) party
-        current_party = parties[-1]
-
-        # Apply party name mappings for consolidation
-        party_mappings = {
-            '민주통합당': '더불어민주당',
-            '더불어민주연합': '더불어민주당',
-            # Add other mappings as needed
-        }
-
-        return party_mappings.get(current_party, current_party)
+        """
+        Returns the current party name. Uses current_party when it was
+        loaded with select_related, otherwise the consolidated last party
+        of plpt_nm (the value the party backfill stores in current_party).
+        """
+        if self.current_party_id and Speaker.current_party.is_cached(self):
+            return self.current_party.name
+        parties = parse_party_history(self.plpt_nm)
+        return parties[-1] if parties else "정당정보없음"
 
 
 class SpeakerPartyHistory(models.Model):
@@ -348,6 +377,17 @@ class Statement(models.Model):
     sentiment_reason = models.TextField(blank=True,
                                         help_text=_("감성 분석 근거"),
                                         verbose_name=_("감성 분석 근거"))
+    sentiment_provisional = models.BooleanField(
+        default=False,
+        db_index=True,
+        help_text=_("사전 기반 임시 점수 여부 (LLM 재분석 필요)"),
+        verbose_name=_("임시 감성 점수"))
+    analysis_version = models.CharField(
+        max_length=30,
+        blank=True,
+        db_index=True,
+        help_text=_("감성/정책 분석 프롬프트 버전 (빈 값: 버전 기록 이전)"),
+        verbose_name=_("분석 버전"))
     bill_relevance_score = models.FloatField(null=True,
                                              blank=True,
                                              help_text="의안 관련성 점수 (0-1)",
@@ -356,6 +396,22 @@ class Statement(models.Model):
                                  blank=True,
                                  help_text=_("텍스트 해시"),
                                  verbose_name=_("텍스트 해시"))
+    # Denormalized at insert time (see Statement.fill_denormalized_fields)
+    party = models.ForeignKey(Party,
+                              on_delete=models.SET_NULL,
+                              null=True,
+                              blank=True,
+                              related_name='statements',
+                              help_text=_("발언 당시 발언자의 소속 정당"),
+                              verbose_name=_("발언 당시 정당"))
+    conf_dt = models.DateField(null=True,
+                               blank=True,
+                               help_text=_("회의일자"),
+                               verbose_name=_("회의일자"))
+    era = models.PositiveSmallIntegerField(null=True,
+                                           blank=True,
+                                           help_text=_("대수 (숫자)"),
+                                           verbose_name=_("대수"))
     created_at = models.DateTimeField(auto_now_add=True,
                                       verbose_name=_("생성일시"))
     updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일시"))
@@ -364,6 +420,39 @@ class Statement(models.Model):
         ordering = ['-created_at']
         verbose_name = _("발언")
         verbose_name_plural = _("발언")
+        constraints = [
+            # Inserts use ON CONFLICT DO NOTHING against this (see
+            # process_extracted_statements_data)
+            models.UniqueConstraint(fields=['session', 'text_hash'],
+                                    condition=~models.Q(text_hash=''),
+                                    name='unique_statement_session_text_hash'),
+        ]
+        indexes = [
+            # Party/time aggregates group by these without joining
+            # Speaker or Session
+            models.Index(fields=['era', 'party', 'conf_dt'],
+                         name='idx_statement_era_party_dt'),
+            models.Index(fields=['party', 'conf_dt'],
+                         name='idx_statement_party_dt'),
+            models.Index(fields=['conf_dt'], name='idx_statement_conf_dt'),
+            models.Index(fields=['-created_at'],
+                         name='idx_statement_created_at'),
+            # Cross-session hash lookups (collapse_duplicate_statements)
+            models.Index(fields=['text_hash'], name='idx_statement_text_hash'),
+            # Sentiment aggregates only read scored statements
+            models.Index(fields=['sentiment_score'],
+                         condition=models.Q(sentiment_score__isnull=False),
+                         name='idx_statement_sentiment'),
+            models.Index(fields=['session', 'sentiment_score'],
+                         condition=models.Q(sentiment_score__isnull=False),
+                         name='idx_statement_session_sent'),
+            models.Index(fields=['speaker', 'sentiment_score'],
+                         condition=models.Q(sentiment_score__isnull=False),
+                         name='idx_statement_speaker_sent'),
+            models.Index(fields=['party', 'sentiment_score'],
+                         condition=models.Q(sentiment_score__isnull=False),
+                         name='idx_statement_party_sent'),
+        ]
 
     def __str__(self):
         return f"{self.speaker.naas_nm}의 발언 ({self.created_at})"
@@ -382,6 +471,14 @@ class Statement(models.Model):
         return self.calculate_hash(self.text, self.speaker.naas_cd,
                                    self.session.conf_id)
 
+    def fill_denormalized_fields(self):
+        """Copy the speaker's current party and the session date and era"""
+        if self.party_id is None and self.speaker_id:
+            self.party_id = self.speaker.current_party_id
+        if self.session_id and (self.conf_dt is None or self.era is None):
+            self.conf_dt = self.session.conf_dt
+            self.era = self.session.get_era_number()
+
 
 class Category(models.Model):
     """
@@ -626,9 +723,106 @@ class VotingRecord(models.Model):
         verbose_name_plural = "투표 기록"
 
 
+class LLMBatchCheckpoint(models.Model):
+    """Progress of one unit of LLM work for a session, so interrupted runs can resume."""
+    KIND_SESSION = 'session'
+    KIND_DISCOVERY = 'discovery'
+    KIND_ANALYSIS = 'analysis'
+    KIND_CHOICES = [
+        (KIND_SESSION, '세션 실행'),
+        (KIND_DISCOVERY, '의안 구간 탐색'),
+        (KIND_ANALYSIS, '발언 분석 배치'),
+    ]
+
+    STATUS_PLANNED = 'planned'
+    STATUS_IN_FLIGHT = 'in_flight'
+    STATUS_DONE = 'done'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PLANNED, '계획됨'),
+        (STATUS_IN_FLIGHT, '처리 중'),
+        (STATUS_DONE, '완료'),
+        (STATUS_FAILED, '실패'),
+    ]
+
+    session = models.ForeignKey(Session,
+                                on_delete=models.CASCADE,
+                                related_name='llm_checkpoints',
+                                verbose_name=_("관련 회의"))
+    prompt_version = models.CharField(max_length=50,
+                                      verbose_name=_("프롬프트 버전"))
+    kind = models.CharField(max_length=20,
+                            choices=KIND_CHOICES,
+                            verbose_name=_("작업 종류"))
+    batch_key = models.CharField(max_length=100,
+                                 help_text=_("배치 내용 기반 고유 키"),
+                                 verbose_name=_("배치 키"))
+    bill_name = models.CharField(max_length=500,
+                                 blank=True,
+                                 verbose_name=_("의안명"))
+    model_name = models.CharField(max_length=100,
+                                  blank=True,
+                                  verbose_name=_("모델"))
+    segment_start = models.IntegerField(null=True,
+                                        blank=True,
+                                        verbose_name=_("시작 구간"))
+    segment_end = models.IntegerField(null=True,
+                                      blank=True,
+                                      verbose_name=_("끝 구간"))
+    estimated_tokens = models.IntegerField(default=0,
+                                           verbose_name=_("예상 토큰"))
+    status = models.CharField(max_length=20,
+                              choices=STATUS_CHOICES,
+                              default=STATUS_PLANNED,
+                              db_index=True,
+                              verbose_name=_("상태"))
+    attempts = models.IntegerField(default=0, verbose_name=_("시도 횟수"))
+    result = models.JSONField(null=True,
+                              blank=True,
+                              help_text=_("완료된 배치의 분석 결과"),
+                              verbose_name=_("결과"))
+    error = models.TextField(blank=True, verbose_name=_("오류"))
+    started_at = models.DateTimeField(null=True,
+                                      blank=True,
+                                      verbose_name=_("시작일시"))
+    finished_at = models.DateTimeField(null=True,
+                                       blank=True,
+                                       verbose_name=_("완료일시"))
+    created_at = models.DateTimeField(auto_now_add=True,
+                                      verbose_name=_("생성일시"))
+    updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일시"))
+
+    def __str__(self):
+        return f"{self.session_id} {self.kind} {self.batch_key} ({self.status})"
+
+    class Meta:
+        ordering = ['session', 'created_at']
+        unique_together = ['session', 'prompt_version', 'batch_key']
+        verbose_name = "LLM 배치 체크포인트"
+        verbose_name_plural = "LLM 배치 체크포인트 목록"
+
+
+class PolicyCatalogRevision(models.Model):
+    """
+    Single row counting changes to the policy categories. Every process
+    compares it with the revision its cached category catalog was built at.
+    """
+    revision = models.PositiveIntegerField(default=0,
+                                           verbose_name=_("리비전"))
+    updated_at = models.DateTimeField(auto_now=True, verbose_name=_("수정일시"))
+
+    def __str__(self):
+        return f"정책 카테고리 리비전 {self.revision}"
+
+    class Meta:
+        verbose_name = "정책 카테고리 리비전"
+        verbose_name_plural = "정책 카테고리 리비전"
+
+
 @receiver(pre_save, sender=Statement)
 def calculate_statement_hash(sender, instance, **kwargs):
     """Automatically calculate hash before saving statement"""
+    instance.fill_denormalized_fields()
     if instance.text and instance.speaker and instance.session:
         instance.text_hash = Statement.calculate_hash(instance.text,
                                                       instance.speaker.naas_cd,
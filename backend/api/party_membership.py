@@ -0,0 +1,112 @@
+import logging
+
+from django.db import transaction
+
+from .statement_fields import fill_statement_parties
+
+logger = logging.getLogger(__name__)
+
+# Renamed or merged parties are recorded under their successor
+PARTY_NAME_MAPPINGS = {
+    '민주통합당': '더불어민주당',
+    '더불어민주연합': '더불어민주당',
+}
+
+# plpt_nm placeholders that do not name a party
+NO_PARTY_NAMES = frozenset(['정당정보없음', '정보없음'])
+
+PARTY_SYNC_BATCH_SIZE = 500
+
+
+def consolidate_party_name(name):
+    return PARTY_NAME_MAPPINGS.get(name, name)
+
+
+def parse_party_history(plpt_nm):
+    """
+    Consolidated party names from a '/'-joined plpt_nm, oldest first.
+    Placeholders are dropped and a party that follows itself after
+    consolidation is kept once.
+    """
+    history = []
+    for name in (plpt_nm or '').split('/'):
+        name = name.strip()
+        if not name or name in NO_PARTY_NAMES:
+            continue
+        name = consolidate_party_name(name)
+        if not history or history[-1] != name:
+            history.append(name)
+    return history
+
+
+def sync_speaker_parties(speakers):
+    """
+    Rebuild SpeakerPartyHistory and Speaker.current_party of the given
+    speakers from their plpt_nm. Missing parties are inserted in one
+    statement, histories are replaced and current_party is written with
+    bulk_update, so a batch costs a fixed number of queries. Statements
+    stored before their speaker had a party get the new current party.
+    """
+    from .models import Party, Speaker, SpeakerPartyHistory
+
+    speakers = [speaker for speaker in speakers if speaker.pk]
+    if not speakers:
+        return 0
+    histories = {
+        speaker.pk: parse_party_history(speaker.plpt_nm)
+        for speaker in speakers
+    }
+    names = {name for history in histories.values() for name in history}
+
+    with transaction.atomic():
+        if names:
+            Party.objects.bulk_create([
+                Party(name=name, description=f'{name} - 자동 생성됨')
+                for name in names
+            ],
+                                      ignore_conflicts=True)
+        party_ids = dict(
+            Party.objects.filter(name__in=names).values_list('name', 'id'))
+
+        SpeakerPartyHistory.objects.filter(
+            speaker_id__in=list(histories)).delete()
+        SpeakerPartyHistory.objects.bulk_create([
+            SpeakerPartyHistory(speaker_id=speaker_id,
+                                party_id=party_ids[name],
+                                order=order,
+                                is_current=order == len(history) - 1)
+            for speaker_id, history in histories.items()
+            for order, name in enumerate(history)
+        ])
+
+        for speaker in speakers:
+            history = histories[speaker.pk]
+            speaker.current_party_id = party_ids[
+                history[-1]] if history else None
+        Speaker.objects.bulk_update(speakers, ['current_party'])
+        fill_statement_parties(histories)
+    return len(speakers)
+
+
+def backfill_party_membership(batch_size=PARTY_SYNC_BATCH_SIZE):
+    """
+    Populate current_party and the party history of every speaker from
+    plpt_nm, batch_size speakers at a time. Returns the number of speakers
+    synced.
+    """
+    from .models import Speaker
+
+    synced = 0
+    speakers = Speaker.objects.order_by('pk').only('pk', 'plpt_nm',
+                                                    'current_party')
+    last_pk = None
+    while True:
+        batch_qs = speakers if last_pk is None else speakers.filter(
+            pk__gt=last_pk)
+        batch = list(batch_qs[:batch_size])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+        synced += sync_speaker_parties(batch)
+    logger.info(f"🏛️ Synced party membership for {synced} speakers")
+    return synced
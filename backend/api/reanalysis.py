@@ -0,0 +1,235 @@
+import logging
+
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Length
+
+from . import tasks
+from .llm_analyzer import (STATEMENT_ANALYSIS_VERSION, STATEMENT_BATCH_WORKERS,
+                           STATEMENTS_PER_PROMPT, LLMPolicyAnalyzer)
+from .llm_checkpoints import LLM_PROMPT_VERSION
+from .models import Bill, LLMBatchCheckpoint, Session, Statement
+
+logger = logging.getLogger(__name__)
+
+# Versions written by the current prompts. Anything else (older prompt
+# versions, lexicon scores, rows from before versioning) is stale.
+CURRENT_STATEMENT_ANALYSIS_VERSIONS = (LLM_PROMPT_VERSION,
+                                       STATEMENT_ANALYSIS_VERSION)
+CURRENT_BILL_ANALYSIS_VERSION = LLM_PROMPT_VERSION
+
+REANALYSIS_CHUNK_SIZE = 200
+SESSION_PAGE_SIZE = 50
+
+
+def _filter_era(queryset, era_co, prefix=''):
+    if not era_co:
+        return queryset
+    return queryset.filter(**{f'{prefix}era_co__in': [era_co, f'제{era_co}대']})
+
+
+def stale_statements(era_co=None):
+    return _filter_era(
+        Statement.objects.exclude(
+            analysis_version__in=CURRENT_STATEMENT_ANALYSIS_VERSIONS),
+        era_co, 'session__')
+
+
+def stale_bills(era_co=None):
+    """Bills analyzed under an older prompt; never-analyzed bills are not stale."""
+    return _filter_era(
+        Bill.objects.exclude(llm_analysis_version='').exclude(
+            llm_analysis_version=CURRENT_BILL_ANALYSIS_VERSION), era_co,
+        'session__')
+
+
+def get_staleness_summary(era_co=None):
+    """Statement and bill counts per analysis version, plus stale totals."""
+    statements = _filter_era(Statement.objects.all(), era_co, 'session__')
+    bills = _filter_era(Bill.objects.all(), era_co, 'session__')
+    return {
+        'statements': {
+            'total': statements.count(),
+            'stale': stale_statements(era_co).count(),
+            'by_version': {
+                row['analysis_version']: row['count']
+                for row in statements.values('analysis_version').annotate(
+                    count=Count('pk')).order_by('analysis_version')
+            }
+        },
+        'bills': {
+            'total': bills.count(),
+            'stale': stale_bills(era_co).count(),
+            'by_version': {
+                row['llm_analysis_version']: row['count']
+                for row in bills.values('llm_analysis_version').annotate(
+                    count=Count('pk')).order_by('llm_analysis_version')
+            }
+        }
+    }
+
+
+def iter_session_ids_newest_first(sessions, page_size=SESSION_PAGE_SIZE):
+    """Keyset-paginate sessions by (conf_dt, conf_id) descending."""
+    cursor = None
+    while True:
+        page = sessions
+        if cursor:
+            conf_dt, conf_id = cursor
+            page = page.filter(
+                Q(conf_dt__lt=conf_dt) | Q(conf_dt=conf_dt, conf_id__lt=conf_id))
+        rows = list(
+            page.order_by('-conf_dt', '-conf_id').values_list(
+                'conf_dt', 'conf_id')[:page_size])
+        if not rows:
+            return
+        for _, conf_id in rows:
+            yield conf_id
+        cursor = rows[-1]
+
+
+def estimate_session_reprocess_tokens(session_id):
+    """
+    Token estimate for rerunning a session's transcript: the largest planned
+    total of an earlier checkpointed run, else twice its statement text.
+    """
+    previous = LLMBatchCheckpoint.objects.filter(session_id=session_id).exclude(
+        kind=LLMBatchCheckpoint.KIND_SESSION).values('prompt_version').annotate(
+            tokens=Sum('estimated_tokens')).order_by('-tokens').first()
+    if previous and previous['tokens']:
+        return previous['tokens']
+    chars = Statement.objects.filter(session_id=session_id).aggregate(
+        chars=Sum(Length('text')))['chars'] or 0
+    return 2 * (chars // tasks.CHARS_PER_TOKEN + 1)
+
+
+class ReanalysisScheduler:
+    """
+    Re-analyze stale statements (and optionally bills) under a token budget,
+    newest sessions first.
+
+    Sessions are walked with a (conf_dt, conf_id) keyset and each session's
+    stale statements with an id keyset, so chunk queries never use OFFSET and
+    rows re-analyzed in the meantime simply drop out. Statements go through
+    LLMPolicyAnalyzer batch mode. Bills are re-analyzed by reprocessing their
+    session's transcript, which is queued once the statements are done. Work
+    whose estimated cost exceeds the remaining budget ends the run.
+    """
+
+    def __init__(self,
+                 token_budget,
+                 era_co=None,
+                 include_bills=False,
+                 chunk_size=REANALYSIS_CHUNK_SIZE,
+                 statements_per_prompt=STATEMENTS_PER_PROMPT,
+                 max_workers=STATEMENT_BATCH_WORKERS,
+                 analyzer=None,
+                 on_progress=None):
+        self.era_co = era_co
+        self.include_bills = include_bills
+        self.chunk_size = chunk_size
+        self.statements_per_prompt = statements_per_prompt
+        self.max_workers = max_workers
+        self.analyzer = analyzer or LLMPolicyAnalyzer()
+        self.on_progress = on_progress
+        self.progress = {
+            'token_budget': token_budget,
+            'tokens_estimated': 0,
+            'sessions_scanned': 0,
+            'sessions_completed': 0,
+            'chunks': 0,
+            'statements_reanalyzed': 0,
+            'statements_failed': 0,
+            'bill_sessions_queued': 0,
+            'budget_exhausted': False,
+            'stale_statements_remaining': None,
+            'stale_bills_remaining': None,
+        }
+        self._prompt_prefix = None
+
+    @property
+    def tokens_remaining(self):
+        return self.progress['token_budget'] - self.progress['tokens_estimated']
+
+    def _report(self):
+        if self.on_progress:
+            self.on_progress(dict(self.progress))
+
+    def _spend(self, estimated_tokens):
+        """Charge the budget, or mark it exhausted and return False."""
+        if estimated_tokens > self.tokens_remaining:
+            self.progress['budget_exhausted'] = True
+            logger.info(
+                f"💰 Re-analysis token budget reached: {self.progress['tokens_estimated']:,}"
+                f"/{self.progress['token_budget']:,} spent, next step needs ~{estimated_tokens:,}")
+            return False
+        self.progress['tokens_estimated'] += estimated_tokens
+        return True
+
+    def run(self):
+        if not tasks.get_gemini_client():
+            logger.error("❌ Gemini not available. Cannot re-analyze stale rows.")
+            return self.progress
+
+        sessions = Session.objects.filter(
+            conf_id__in=stale_statements(self.era_co).values('session_id'))
+        for session_id in iter_session_ids_newest_first(sessions):
+            self.progress['sessions_scanned'] += 1
+            if not self._reanalyze_session_statements(session_id):
+                break
+            self.progress['sessions_completed'] += 1
+
+        if self.include_bills and not self.progress['budget_exhausted']:
+            self._queue_stale_bill_sessions()
+
+        self.progress['stale_statements_remaining'] = stale_statements(
+            self.era_co).count()
+        self.progress['stale_bills_remaining'] = stale_bills(self.era_co).count()
+        self._report()
+        logger.info(
+            f"✅ Re-analysis run finished: {self.progress['statements_reanalyzed']} statements "
+            f"re-analyzed, {self.progress['statements_failed']} failed, "
+            f"{self.progress['bill_sessions_queued']} sessions queued for bills, "
+            f"~{self.progress['tokens_estimated']:,} tokens")
+        return self.progress
+
+    def _reanalyze_session_statements(self, session_id):
+        """Re-analyze one session's stale statements; False once the budget runs out."""
+        if self._prompt_prefix is None:
+            self._prompt_prefix = self.analyzer.get_batch_prompt_prefix()
+
+        statements = stale_statements().filter(
+            session_id=session_id).select_related('speaker', 'bill')
+        last_id = 0
+        while True:
+            chunk = list(
+                statements.filter(id__gt=last_id).order_by('id')[:self.chunk_size])
+            if not chunk:
+                return True
+            last_id = chunk[-1].id
+
+            estimated_tokens = self.analyzer.estimate_batch_tokens(
+                chunk, self.statements_per_prompt, self._prompt_prefix)
+            if not self._spend(estimated_tokens):
+                return False
+
+            results = self.analyzer.batch_analyze_statements(
+                chunk, self.statements_per_prompt, self.max_workers)
+            analyzed = sum(1 for result in results if 'statement_id' in result)
+            self.progress['chunks'] += 1
+            self.progress['statements_reanalyzed'] += analyzed
+            self.progress['statements_failed'] += len(chunk) - analyzed
+            self._report()
+
+    def _queue_stale_bill_sessions(self):
+        sessions = Session.objects.filter(
+            conf_id__in=stale_bills(self.era_co).values('session_id'))
+        for session_id in iter_session_ids_newest_first(sessions):
+            if not self._spend(estimate_session_reprocess_tokens(session_id)):
+                return
+            logger.info(f"📋 Queueing session {session_id} to re-analyze its bills")
+            if tasks.is_celery_available():
+                tasks.process_session_pdf.delay(session_id=session_id, force=True)
+            else:
+                tasks.process_session_pdf_direct(session_id=session_id, force=True)
+            self.progress['bill_sessions_queued'] += 1
+            self._report()
@@ -0,0 +1,179 @@
+import logging
+import re
+import threading
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Reason stored on statements scored by the lexicon instead of the LLM
+LEXICON_SENTIMENT_REASON = "사전 기반 임시 감성 점수 (LLM 재분석 대기)"
+
+# Statement.analysis_version for lexicon scores; never current, so the
+# re-analysis scheduler always picks these statements up
+LEXICON_ANALYSIS_VERSION = "lexicon-v1"
+
+# Stems common in National Assembly debate, weighted -1 (negative) ~ 1
+# (positive). Matching is by substring, and longer stems win over the
+# shorter stems they contain (e.g. 부적절 over 적절, 무책임 over 책임).
+PARLIAMENTARY_SENTIMENT_LEXICON = {
+    # Support / agreement
+    '찬성': 0.6,
+    '지지': 0.5,
+    '동의': 0.5,
+    '공감': 0.5,
+    '환영': 0.7,
+    '감사': 0.4,
+    '축하': 0.6,
+    '다행': 0.4,
+    '훌륭': 0.7,
+    '좋': 0.4,
+    '바람직': 0.5,
+    '긍정적': 0.6,
+    '합리적': 0.5,
+    '적절': 0.3,
+    '타당': 0.4,
+    '필요': 0.3,
+    '중요': 0.3,
+    '충분': 0.3,
+    '효과적': 0.5,
+    '효율': 0.3,
+    '개선': 0.3,
+    '발전': 0.4,
+    '성과': 0.5,
+    '노력': 0.3,
+    '기대': 0.3,
+    '협력': 0.4,
+    '존중': 0.4,
+    '보호': 0.3,
+    '지원': 0.3,
+    '안정': 0.3,
+    '투명': 0.4,
+    '공정': 0.4,
+    '신뢰': 0.4,
+    # Opposition / criticism
+    '반대': -0.6,
+    '우려': -0.5,
+    '문제': -0.4,
+    '비판': -0.5,
+    '규탄': -0.8,
+    '개탄': -0.8,
+    '유감': -0.5,
+    '심각': -0.6,
+    '위험': -0.5,
+    '부족': -0.4,
+    '실패': -0.7,
+    '잘못': -0.6,
+    '부당': -0.6,
+    '부적절': -0.6,
+    '불충분': -0.5,
+    '비효율': -0.5,
+    '불투명': -0.5,
+    '불공정': -0.6,
+    '불안': -0.5,
+    '불법': -0.7,
+    '위반': -0.6,
+    '위헌': -0.7,
+    '졸속': -0.7,
+    '무책임': -0.8,
+    '피해': -0.5,
+    '훼손': -0.6,
+    '남용': -0.6,
+    '혼란': -0.5,
+    '악화': -0.6,
+    '갈등': -0.4,
+    '폐해': -0.7,
+    '의혹': -0.6,
+    '특혜': -0.6,
+    '나쁘': -0.5,
+    '납득하기 어렵': -0.6,
+    '동의하기 어렵': -0.6,
+    '받아들일 수 없': -0.7,
+}
+
+# Negation right after a stem ("동의하지 않", "찬성할 수 없", "문제가 없") or a
+# standalone 안/못 right before it ("안 좋", "못 믿"); either flips polarity.
+_NEGATION_SUFFIX = r'(?P<post>[가-힣]{0,3}\s?(?:수\s)?(?:않|못하|없|아니))?'
+_NEGATION_PREFIX = r'(?:(?<![가-힣])(?P<pre>안|못)\s)?'
+
+# Statements below this many lexicon hits get pulled toward neutral
+SMOOTHING_HITS = 1.0
+
+
+class LexiconSentimentScorer:
+    """
+    Offline sentiment scorer for parliamentary Korean.
+
+    Each text is reduced to a row of signed term counts (negated hits count
+    -1), and the whole batch is scored at once with NumPy:
+    score = (C @ w) / (|C| @ |w| + smoothing), clipped to [-1, 1]. Scores
+    are meant as provisional stand-ins until the LLM can analyze the text.
+    """
+
+    def __init__(self, lexicon=None):
+        lexicon = lexicon or PARLIAMENTARY_SENTIMENT_LEXICON
+        # Longest first so the alternation prefers the most specific stem
+        self.terms = sorted(lexicon, key=len, reverse=True)
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.weights = np.array([lexicon[term] for term in self.terms],
+                                dtype=np.float64)
+        self.abs_weights = np.abs(self.weights)
+        alternation = '|'.join(re.escape(term) for term in self.terms)
+        self.pattern = re.compile(
+            f'{_NEGATION_PREFIX}(?P<term>{alternation}){_NEGATION_SUFFIX}')
+
+    def count_matrix(self, texts):
+        """Signed term counts, shape (len(texts), len(self.terms))."""
+        counts = np.zeros((len(texts), len(self.terms)), dtype=np.float64)
+        for row, text in enumerate(texts):
+            for match in self.pattern.finditer(text or ''):
+                sign = -1.0 if (match.group('pre')
+                                or match.group('post')) else 1.0
+                counts[row, self.term_index[match.group('term')]] += sign
+        return counts
+
+    def score_texts(self, texts):
+        """Return a float array of sentiment scores in [-1, 1], one per text."""
+        if not texts:
+            return np.zeros(0, dtype=np.float64)
+        counts = self.count_matrix(texts)
+        raw = counts @ self.weights
+        magnitude = np.abs(counts) @ self.abs_weights
+        return np.clip(raw / (magnitude + SMOOTHING_HITS), -1.0, 1.0)
+
+    def score_text(self, text):
+        return float(self.score_texts([text])[0])
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def get_lexicon_scorer():
+    """Shared scorer instance; the regex and weight vector are built once."""
+    global _scorer
+    if _scorer is None:
+        with _scorer_lock:
+            if _scorer is None:
+                _scorer = LexiconSentimentScorer()
+    return _scorer
+
+
+def apply_lexicon_sentiment(statements):
+    """
+    Provisionally score statement dicts in place with the lexicon scorer.
+
+    Sets sentiment_score, sentiment_reason, sentiment_provisional and
+    analysis_version so the statements are picked up again for LLM
+    refinement once quota allows.
+    """
+    if not statements:
+        return statements
+    scores = get_lexicon_scorer().score_texts(
+        [stmt.get('text', '') for stmt in statements])
+    for stmt, score in zip(statements, scores):
+        stmt['sentiment_score'] = round(float(score), 3)
+        stmt['sentiment_reason'] = LEXICON_SENTIMENT_REASON
+        stmt['sentiment_provisional'] = True
+        stmt['analysis_version'] = LEXICON_ANALYSIS_VERSION
+    return statements
@@ -224,20 +224,12 @@ class SessionSerializer(serializers.ModelSerializer):
 
 class SessionListSerializer(serializers.ModelSerializer):
     """Optimized serializer for list views without heavy relationships"""
-    bill_count = serializers.SerializerMethodField()
-    statement_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Session
         fields = ['conf_id', 'era_co', 'sess', 'dgr', 'conf_dt', 'conf_knd', 
                  'cmit_nm', 'title', 'bill_count', 'statement_count']
 
-    def get_bill_count(self, obj):
-        return getattr(obj, 'bill_count', 0)
-
-    def get_statement_count(self, obj):
-        return getattr(obj, 'statement_count', 0)
-
 
 class StatementCreateSerializer(serializers.ModelSerializer):
 
@@ -0,0 +1,96 @@
+import logging
+
+from django.db import transaction
+from django.db.models import Count, Min
+
+logger = logging.getLogger(__name__)
+
+DEDUPE_BATCH_SIZE = 500
+
+
+def _duplicate_groups(statement_model, batch_size):
+    """(session_id, text_hash, keep_id) for up to batch_size duplicate groups."""
+    return list(
+        statement_model.objects.exclude(text_hash='').values(
+            'session_id', 'text_hash').annotate(
+                rows=Count('id'), keep_id=Min('id')).filter(
+                    rows__gt=1).order_by('keep_id').values_list(
+                        'session_id', 'text_hash', 'keep_id')[:batch_size])
+
+
+def _collapse_groups(groups, statement_model, category_model):
+    """
+    Keep the oldest statement of each group. Category links of the removed
+    rows move to it unless it already has that category; the rest are
+    deleted along with the duplicates. Returns the number of rows removed.
+    """
+    keep_ids = {(session_id, text_hash): keep_id
+                for session_id, text_hash, keep_id in groups}
+    rows = statement_model.objects.filter(
+        session_id__in={session_id for session_id, _, _ in groups},
+        text_hash__in={text_hash for _, text_hash, _ in groups}).values_list(
+            'id', 'session_id', 'text_hash')
+    duplicate_of = {}
+    for statement_id, session_id, text_hash in rows:
+        keep_id = keep_ids.get((session_id, text_hash))
+        if keep_id and statement_id != keep_id:
+            duplicate_of[statement_id] = keep_id
+    if not duplicate_of:
+        return 0
+
+    linked = set(
+        category_model.objects.filter(
+            statement_id__in=set(keep_ids.values())).values_list(
+                'statement_id', 'category_id'))
+    moved = []
+    for link in category_model.objects.filter(
+            statement_id__in=list(duplicate_of)).order_by(
+                '-confidence_score', 'id'):
+        target = (duplicate_of[link.statement_id], link.category_id)
+        if target in linked:
+            continue
+        linked.add(target)
+        link.statement_id = target[0]
+        moved.append(link)
+
+    with transaction.atomic():
+        if moved:
+            category_model.objects.bulk_update(moved, ['statement'])
+        statement_model.objects.filter(id__in=list(duplicate_of)).delete()
+    return len(duplicate_of)
+
+
+def collapse_duplicate_statements(batch_size=DEDUPE_BATCH_SIZE,
+                                  dry_run=False):
+    """
+    Collapse statements that share (session, text_hash), batch_size groups
+    at a time, so the unique constraint on that pair can be added.
+
+    With dry_run nothing is deleted. Returns a dict with the number of
+    duplicate groups and of rows removed (or to be removed).
+    """
+    from .models import Statement, StatementCategory
+
+    result = {'groups': 0, 'removed': 0}
+    if dry_run:
+        for row in Statement.objects.exclude(text_hash='').values(
+                'session_id', 'text_hash').annotate(rows=Count('id')).filter(
+                    rows__gt=1).values_list('rows', flat=True).iterator():
+            result['groups'] += 1
+            result['removed'] += row - 1
+        return result
+
+    while True:
+        groups = _duplicate_groups(Statement, batch_size)
+        if not groups:
+            break
+        removed = _collapse_groups(groups, Statement,
+                                   StatementCategory)
+        result['groups'] += len(groups)
+        result['removed'] += removed
+        logger.info(
+            f"🧹 Collapsed {len(groups)} duplicate statement groups "
+            f"({result['removed']} rows removed so far)")
+        if not removed:
+            break
+    return result
@@ -0,0 +1,66 @@
+import logging
+import re
+
+from django.db.models import OuterRef, Subquery
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_FIELDS_BATCH_SIZE = 5000
+
+
+def era_number(era_co):
+    """Assembly era as an int ('22' and '제22대' -> 22), None if absent."""
+    match = re.search(r'\d+', era_co or '')
+    return int(match.group()) if match else None
+
+
+def fill_statement_parties(speaker_ids):
+    """
+    Give the statements of the given speakers that have no party yet their
+    speaker's current party. Statements that already carry a party keep
+    the one captured at insert time.
+    """
+    from .models import Speaker, Statement
+
+    speaker_ids = list(speaker_ids)
+    if not speaker_ids:
+        return 0
+    return Statement.objects.filter(
+        speaker_id__in=speaker_ids, party__isnull=True).update(
+            party_id=Subquery(
+                Speaker.objects.filter(
+                    pk=OuterRef('speaker_id')).values('current_party_id')[:1]))
+
+
+def backfill_statement_fields(batch_size=STATEMENT_FIELDS_BATCH_SIZE):
+    """
+    Fill Statement.party, conf_dt and era of rows stored before those
+    columns existed, batch_size ids at a time. Returns the number of rows
+    updated.
+    """
+    from .models import Session, Speaker, Statement
+
+    eras = {}
+    for era_co in Session.objects.values_list('era_co', flat=True).distinct():
+        eras.setdefault(era_number(era_co), []).append(era_co)
+
+    updated = 0
+    missing = Statement.objects.filter(conf_dt__isnull=True)
+    bounds = missing.order_by('id').values_list('id', flat=True)
+    start = bounds.first()
+    while start is not None:
+        end = start + batch_size
+        batch = missing.filter(id__gte=start, id__lt=end)
+        batch.filter(party__isnull=True).update(party_id=Subquery(
+            Speaker.objects.filter(
+                pk=OuterRef('speaker_id')).values('current_party_id')[:1]))
+        for era, era_codes in eras.items():
+            if era is None:
+                continue
+            batch.filter(session__era_co__in=era_codes).update(era=era)
+        updated += batch.update(conf_dt=Subquery(
+            Session.objects.filter(
+                pk=OuterRef('session_id')).values('conf_dt')[:1]))
+        start = bounds.filter(id__gte=end).first()
+        logger.info(f"🗂️ Backfilled party/date/era on {updated} statements")
+    return updated
@@ -2,6 +2,8 @@ import requests
 import pdfplumber
 from celery import shared_task
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
 from .models import Session, Bill, Speaker, Statement, VotingRecord, Party, Category, Subcategory, BillCategoryMapping, BillSubcategoryMapping
 from celery.exceptions import MaxRetriesExceededError
 from requests.exceptions import RequestException
@@ -9,13 +11,31 @@ import logging
 from celery.schedules import crontab
 from datetime import datetime, timedelta, time as dt_time
 import json
+import hashlib
 import time
 from pathlib import Path
 import threading
 from collections import deque
+from concurrent.futures import (FIRST_COMPLETED, ThreadPoolExecutor,
+                                as_completed, wait)
 import re
+from .json_stream import StreamingJSONArrayParser
+from .category_catalog import (get_category_catalog, resolve_category_ids,
+                               save_category_links)
+from .counters import refresh_bill_counters, refresh_session_counters
+from .db_connections import DatabaseRetryPolicy, db_connection_metrics
+from .party_membership import sync_speaker_parties
+from .sentiment_lexicon import apply_lexicon_sentiment
+from .llm_checkpoints import (LLM_PROMPT_VERSION, begin_session_run,
+                              end_session_run, get_active_checkpoints,
+                              has_unfinished_run, make_batch_key)
+from .models import LLMBatchCheckpoint
+
+logger = logging.getLogger(__name__)
 
 # Import the new Gemini SDK
+genai_legacy = None
+GENAI_LEGACY_AVAILABLE = False
 try:
     from google import genai
     from google.genai import types
@@ -33,8 +53,6 @@ except ImportError:
         genai_legacy = None
         GENAI_LEGACY_AVAILABLE = False
 
-logger = logging.getLogger(__name__)
-
 
 class GeminiRateLimiter:
     """Enhanced rate limiter for Gemini API calls to respect token limits."""
@@ -113,6 +131,13 @@ class GeminiRateLimiter:
 
             return True, "OK"
 
+    def daily_quota_exhausted(self, estimated_tokens=0):
+        """True if the daily token budget cannot cover another request"""
+        with self.lock:
+            self._cleanup_old_records()
+            daily_tokens = sum(count for _, count in self.daily_token_usage)
+            return daily_tokens + estimated_tokens > self.max_tokens_per_day
+
     def record_request(self, actual_tokens=1000, success=True):
         """Record a completed request"""
         with self.lock:
@@ -199,8 +224,219 @@ class GeminiRateLimiter:
             }
 
 
-# Global instances
-gemini_rate_limiter = GeminiRateLimiter()
+class GeminiDeadlineExceeded(TimeoutError):
+    """A Gemini call ran past its caller's deadline."""
+
+
+class GeminiLatencyTracker:
+    """
+    Recent time-to-first-chunk samples per model, used to decide when a slow
+    streaming call gets a hedged duplicate.
+
+    A call is hedged after the HEDGE_LATENCY_PERCENTILE latency of its
+    model, once HEDGE_MIN_SAMPLES samples exist, and only while hedges stay
+    under HEDGE_MAX_FRACTION of hedge-eligible calls.
+    """
+
+    def __init__(self, window=200):
+        self.window = window
+        self.samples = {}
+        self.lock = threading.Lock()
+        self.stats = {
+            'calls': 0,
+            'hedged': 0,
+            'hedge_wins': 0,
+            'deadline_exceeded': 0
+        }
+
+    def record(self, model_name, seconds):
+        with self.lock:
+            self.samples.setdefault(model_name,
+                                    deque(maxlen=self.window)).append(seconds)
+
+    def count(self, stat):
+        with self.lock:
+            self.stats[stat] += 1
+
+    def hedge_delay(self, model_name):
+        """Seconds to wait before hedging a call, or None while samples are too few."""
+        with self.lock:
+            samples = sorted(self.samples.get(model_name, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        rank = max(0, -(-len(samples) * HEDGE_LATENCY_PERCENTILE // 100) - 1)
+        return samples[rank]
+
+    def try_hedge(self):
+        """Reserve a hedge if the hedge budget allows one."""
+        with self.lock:
+            if self.stats['hedged'] + 1 > HEDGE_MAX_FRACTION * max(
+                    1, self.stats['calls']):
+                return False
+            self.stats['hedged'] += 1
+            return True
+
+    def get_stats(self):
+        with self.lock:
+            stats = dict(self.stats)
+            stats['hedge_after'] = {}
+        for model_name in list(self.samples):
+            stats['hedge_after'][model_name] = self.hedge_delay(model_name)
+        return stats
+
+    def reset(self):
+        with self.lock:
+            self.samples = {}
+            for stat in self.stats:
+                self.stats[stat] = 0
+
+
+class AdaptiveConcurrencyController:
+    """
+    AIMD window for in-flight Gemini requests.
+
+    A healthy success (latency within CONCURRENCY_LATENCY_TOLERANCE times
+    the running baseline) widens the window by 1/window, about one slot per
+    window's worth of successes; a 429, 5xx or server timeout multiplies it
+    by CONCURRENCY_DECREASE_FACTOR. Only requests started after the last cut
+    can cut it again, so one overloaded burst counts once. floor(window)
+    requests may be in flight, so throughput follows whatever quota the key
+    actually has.
+    """
+
+    def __init__(self, initial_window=2, min_window=1, max_window=16):
+        self.initial_window = initial_window
+        self.min_window = min_window
+        self.max_window = max_window
+        self.window = float(max(min_window, min(initial_window, max_window)))
+        self.in_flight = 0
+        self.latency_baseline = None
+        self.last_decrease = 0.0
+        self.condition = threading.Condition()
+        self.stats = {
+            'successes': 0,
+            'overloads': 0,
+            'increases': 0,
+            'decreases': 0
+        }
+
+    @property
+    def limit(self):
+        return max(self.min_window, int(self.window))
+
+    def acquire(self, deadline=None, blocking=True):
+        """Take a request slot; returns its start time, or None if none was free in time."""
+        with self.condition:
+            while self.in_flight >= self.limit:
+                remaining = _remaining_seconds(deadline)
+                if not blocking or (remaining is not None and remaining <= 0):
+                    return None
+                self.condition.wait(remaining)
+            self.in_flight += 1
+            return time.monotonic()
+
+    def release(self, started, outcome):
+        """Return a slot taken at `started`; outcome is 'ok', 'overload' or anything neutral."""
+        with self.condition:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if outcome == 'ok':
+                self.stats['successes'] += 1
+                latency = now - started
+                baseline = self.latency_baseline
+                self.latency_baseline = latency if baseline is None else (
+                    baseline + CONCURRENCY_LATENCY_EWMA_ALPHA *
+                    (latency - baseline))
+                healthy = baseline is None or latency <= baseline * CONCURRENCY_LATENCY_TOLERANCE
+                if healthy and self.window < self.max_window:
+                    self.window = min(self.max_window,
+                                      self.window + 1 / self.window)
+                    self.stats['increases'] += 1
+            elif outcome == 'overload':
+                self.stats['overloads'] += 1
+                if started >= self.last_decrease:
+                    self.window = max(self.min_window,
+                                      self.window * CONCURRENCY_DECREASE_FACTOR)
+                    self.last_decrease = now
+                    self.stats['decreases'] += 1
+                    logger.warning(
+                        f"📉 Gemini overloaded; concurrency window cut to {self.window:.2f}"
+                    )
+            self.condition.notify_all()
+
+    def get_stats(self):
+        with self.condition:
+            return dict(self.stats,
+                        window=round(self.window, 2),
+                        limit=self.limit,
+                        in_flight=self.in_flight,
+                        max_window=self.max_window,
+                        latency_baseline=round(self.latency_baseline, 3)
+                        if self.latency_baseline is not None else None)
+
+    def reset(self):
+        with self.condition:
+            self.window = float(
+                max(self.min_window, min(self.initial_window,
+                                         self.max_window)))
+            self.latency_baseline = None
+            self.last_decrease = 0.0
+            for stat in self.stats:
+                self.stats[stat] = 0
+            self.condition.notify_all()
+
+
+_OVERLOAD_ERROR_MARKERS = ('429', 'resource_exhausted', 'quota', 'rate limit',
+                           '500', '502', '503', '504', 'unavailable',
+                           'internal error', 'timed out', 'timeout')
+
+
+def classify_gemini_error(error):
+    """'overload' for quota, 5xx and server timeout errors; 'error' otherwise."""
+    if isinstance(error, GeminiDeadlineExceeded):
+        return 'error'  # our own budget ran out, not a signal from the server
+    code = getattr(error, 'code', None)
+    if isinstance(code, int) and (code == 429 or code >= 500):
+        return 'overload'
+    message = str(error).lower()
+    if any(marker in message for marker in _OVERLOAD_ERROR_MARKERS):
+        return 'overload'
+    return 'error'
+
+
+# Adaptive concurrency: in-flight requests start at the initial window and
+# move between 1 and the maximum (AIMD, see AdaptiveConcurrencyController)
+GEMINI_INITIAL_CONCURRENCY = getattr(settings, 'GEMINI_INITIAL_CONCURRENCY', 2)
+GEMINI_MAX_CONCURRENCY = getattr(settings, 'GEMINI_MAX_CONCURRENCY', 16)
+CONCURRENCY_DECREASE_FACTOR = 0.5
+CONCURRENCY_LATENCY_TOLERANCE = 2.0
+CONCURRENCY_LATENCY_EWMA_ALPHA = 0.1
+
+# Client-side deadlines (seconds). Every Gemini request carries an HTTP
+# timeout no longer than what is left of its caller's deadline.
+GEMINI_REQUEST_TIMEOUT_SECONDS = 180
+BATCH_ANALYSIS_DEADLINE_SECONDS = 600
+
+# Hedged streaming calls: if no chunk has arrived after the p95
+# time-to-first-chunk, a duplicate request is sent and the first to answer
+# wins. Hedges are counted against the rate limiter and capped at 10% of calls.
+GEMINI_HEDGING_ENABLED = getattr(settings, 'GEMINI_HEDGING_ENABLED', True)
+HEDGE_LATENCY_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MAX_FRACTION = 0.1
+
+# Global instances. The per-minute limits are a ceiling for the key's quota
+# tier; within them, gemini_concurrency adapts to what the API accepts.
+gemini_rate_limiter = GeminiRateLimiter(
+    max_tokens_per_minute=getattr(settings, 'GEMINI_MAX_TOKENS_PER_MINUTE',
+                                  250000),
+    max_requests_per_minute=getattr(settings, 'GEMINI_MAX_REQUESTS_PER_MINUTE',
+                                    10),
+    max_tokens_per_day=getattr(settings, 'GEMINI_MAX_TOKENS_PER_DAY', 2000000))
+gemini_latency_tracker = GeminiLatencyTracker()
+gemini_concurrency = AdaptiveConcurrencyController(
+    initial_window=GEMINI_INITIAL_CONCURRENCY,
+    max_window=GEMINI_MAX_CONCURRENCY)
 client = None  # Will be initialized by initialize_gemini()
 model = None  # Deprecated - use client instead
 
@@ -255,8 +491,438 @@ def initialize_gemini():
         return False
 
 
-# Initialize on module load (only once)
-initialize_gemini()
+_gemini_init_attempted = False
+_gemini_init_lock = threading.Lock()
+
+
+def get_gemini_client():
+    """
+    Return the Gemini client, initializing it on first use.
+
+    Importing this module no longer talks to the API; the first caller pays
+    for initialization instead. Returns None if Gemini is unavailable.
+    """
+    global _gemini_init_attempted
+    if client is None and not _gemini_init_attempted:
+        with _gemini_init_lock:
+            if client is None and not _gemini_init_attempted:
+                _gemini_init_attempted = True
+                initialize_gemini()
+    return client
+
+
+def set_gemini_client(new_client):
+    """
+    Install a client object (e.g. api.fake_gemini.FakeGeminiClient) in place
+    of the real one and return the previous client. Pass None to go back to
+    lazy initialization.
+    """
+    global client, _gemini_init_attempted
+    previous = client
+    with _gemini_init_lock:
+        client = new_client
+        _gemini_init_attempted = new_client is not None
+    with _prompt_cache_lock:
+        _prompt_caches.clear()
+    return previous
+
+
+# Response schemas for Gemini JSON mode (OpenAPI subset accepted by google.genai)
+BATCH_ANALYSIS_RESPONSE_SCHEMA = {
+    'type': 'ARRAY',
+    'items': {
+        'type': 'OBJECT',
+        'properties': {
+            'segment_index': {'type': 'INTEGER'},
+            'speaker_name': {'type': 'STRING'},
+            'start_idx': {'type': 'INTEGER'},
+            'end_idx': {'type': 'INTEGER'},
+            'is_valid_member': {'type': 'BOOLEAN'},
+            'is_substantial': {'type': 'BOOLEAN'},
+            'sentiment_score': {'type': 'NUMBER'},
+            'bill_relevance_score': {'type': 'NUMBER'},
+            'confidence': {'type': 'NUMBER'},
+        },
+        'required': [
+            'segment_index', 'speaker_name', 'start_idx', 'end_idx',
+            'is_valid_member', 'is_substantial', 'sentiment_score',
+            'bill_relevance_score', 'confidence'
+        ],
+    },
+}
+
+_DISCOVERY_SPAN_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'bill_name': {'type': 'STRING'},
+        'start_index': {'type': 'INTEGER'},
+        'end_index': {'type': 'INTEGER'},
+        'category_id': {'type': 'INTEGER'},
+        'subcategory_ids': {'type': 'ARRAY', 'items': {'type': 'INTEGER'}},
+        'keywords': {'type': 'ARRAY', 'items': {'type': 'STRING'}},
+        'stance': {'type': 'STRING', 'enum': ['P', 'C', 'M']},
+    },
+    'required': ['bill_name', 'start_index', 'end_index'],
+}
+
+DISCOVERY_RESPONSE_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'bills_found': {'type': 'ARRAY', 'items': _DISCOVERY_SPAN_SCHEMA},
+        'newly_discovered': {'type': 'ARRAY', 'items': _DISCOVERY_SPAN_SCHEMA},
+    },
+    'required': ['bills_found', 'newly_discovered'],
+}
+
+
+# Gemini context caching for static prompt prefixes (e.g. the category list)
+PROMPT_CACHE_TTL_SECONDS = 3600
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_RETRY_SECONDS = 1800
+_prompt_caches = {}  # (model, prefix hash) -> (cache name or None, expires_at)
+_prompt_cache_lock = threading.Lock()
+
+
+def _get_prompt_cache_name(prompt_prefix: str, model_name: str):
+    """
+    Return the name of a Gemini cached content holding prompt_prefix, creating
+    it on first use. Returns None when caching is unavailable (legacy SDK,
+    prefix too small, model without caching support, API error); callers
+    then send the prefix inline. Failures are remembered for a while so we
+    do not retry the create call on every request.
+    """
+    global client
+    if not (get_gemini_client() and GENAI_AVAILABLE
+            and hasattr(client, 'caches')):
+        return None
+    if estimate_tokens(prompt_prefix) < PROMPT_CACHE_MIN_TOKENS:
+        return None
+
+    key = (model_name,
+           hashlib.sha1(prompt_prefix.encode('utf-8')).hexdigest())
+    with _prompt_cache_lock:
+        cache_name, expires_at = _prompt_caches.get(key, (None, 0))
+        if time.time() < expires_at:
+            return cache_name
+
+        try:
+            cached = client.caches.create(
+                model=model_name,
+                config=types.CreateCachedContentConfig(
+                    contents=[prompt_prefix],
+                    display_name=f"prompt-prefix-{key[1][:12]}",
+                    ttl=f"{PROMPT_CACHE_TTL_SECONDS}s"))
+            cache_name = cached.name
+            # Refresh a little before the server-side TTL runs out
+            _prompt_caches[key] = (cache_name, time.time() +
+                                   PROMPT_CACHE_TTL_SECONDS - 60)
+            logger.info(
+                f"🗄️ Registered prompt prefix cache {cache_name} for {model_name} (~{estimate_tokens(prompt_prefix)} tokens)"
+            )
+        except Exception as e:
+            cache_name = None
+            _prompt_caches[key] = (None,
+                                   time.time() + PROMPT_CACHE_RETRY_SECONDS)
+            logger.info(
+                f"Context caching unavailable for {model_name}, sending prompt prefix inline: {e}"
+            )
+        return cache_name
+
+
+def _drop_prompt_cache(cache_name: str):
+    with _prompt_cache_lock:
+        for key, (name, _) in list(_prompt_caches.items()):
+            if name == cache_name:
+                del _prompt_caches[key]
+
+
+def _remaining_seconds(deadline):
+    """Seconds left before a time.monotonic() deadline (None: no deadline)."""
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def _request_timeout_ms(deadline, timeout=GEMINI_REQUEST_TIMEOUT_SECONDS):
+    """HTTP timeout for one request: the default, capped by the deadline."""
+    remaining = _remaining_seconds(deadline)
+    if remaining is not None:
+        if remaining <= 0:
+            gemini_latency_tracker.count('deadline_exceeded')
+            raise GeminiDeadlineExceeded("Gemini deadline exceeded before request")
+        timeout = min(timeout, remaining)
+    return max(1, int(timeout * 1000))
+
+
+def _open_gemini_stream(prompt, model_name, response_schema, temperature,
+                        prompt_prefix, deadline):
+    """Text chunks of one google.genai streaming request (cache, then inline)."""
+    cache_name = _get_prompt_cache_name(
+        prompt_prefix, model_name) if prompt_prefix else None
+
+    def build_config(cached_content):
+        config = types.GenerateContentConfig(
+            response_mime_type="application/json"
+            if response_schema else "text/plain",
+            response_schema=response_schema,
+            http_options=types.HttpOptions(
+                timeout=_request_timeout_ms(deadline)))
+        if temperature is not None:
+            config.temperature = temperature
+        if cached_content:
+            config.cached_content = cached_content
+        return config
+
+    if cache_name:
+        yielded = False
+        try:
+            for chunk in client.models.generate_content_stream(
+                    model=model_name,
+                    contents=[prompt],
+                    config=build_config(cache_name)):
+                chunk_text = getattr(chunk, 'text', None)
+                if chunk_text:
+                    yielded = True
+                    yield chunk_text
+            return
+        except GeminiDeadlineExceeded:
+            raise
+        except Exception as e:
+            if yielded:
+                raise
+            # Cache expired or was deleted server-side; go inline
+            logger.warning(
+                f"Cached prompt prefix {cache_name} failed, retrying inline: {e}"
+            )
+            _drop_prompt_cache(cache_name)
+
+    contents = [(prompt_prefix or "") + prompt]
+    for chunk in client.models.generate_content_stream(
+            model=model_name, contents=contents, config=build_config(None)):
+        chunk_text = getattr(chunk, 'text', None)
+        if chunk_text:
+            yield chunk_text
+
+
+def _timed_stream(stream, model_name, deadline, started=None):
+    """
+    Pass chunks through, recording time-to-first-chunk when started is given
+    and aborting once the deadline passes (the HTTP timeout only bounds
+    each read, not a response that keeps trickling in).
+    """
+    try:
+        for chunk_text in stream:
+            if started is not None:
+                gemini_latency_tracker.record(model_name,
+                                              time.monotonic() - started)
+                started = None
+            yield chunk_text
+            remaining = _remaining_seconds(deadline)
+            if remaining is not None and remaining <= 0:
+                gemini_latency_tracker.count('deadline_exceeded')
+                raise GeminiDeadlineExceeded(
+                    f"Gemini deadline exceeded while streaming from {model_name}")
+    finally:
+        stream.close()
+
+
+class _ConcurrencySlot:
+    """A gemini_concurrency slot taken at `started`, given back at most once."""
+
+    def __init__(self, started):
+        self.started = started
+        self.lock = threading.Lock()
+        self.released = False
+
+    def release(self, outcome):
+        with self.lock:
+            if self.released:
+                return
+            self.released = True
+        gemini_concurrency.release(self.started, outcome)
+
+
+def _acquire_gemini_slot(deadline):
+    """
+    Take a gemini_concurrency slot in the calling thread, so time spent
+    queueing for it is not counted as model latency.
+    """
+    started = gemini_concurrency.acquire(deadline)
+    if started is None:
+        gemini_latency_tracker.count('deadline_exceeded')
+        raise GeminiDeadlineExceeded(
+            "Gemini deadline exceeded waiting for a concurrency slot")
+    return _ConcurrencySlot(started)
+
+
+def _limited_stream(stream, slot):
+    """
+    Hold a gemini_concurrency slot, taken by the caller, for the life of a
+    stream and report how the stream ended to the controller.
+    """
+    outcome = 'cancelled'
+    try:
+        yield from stream
+        outcome = 'ok'
+    except Exception as e:
+        outcome = classify_gemini_error(e)
+        raise
+    finally:
+        slot.release(outcome)
+
+
+_hedge_executor = ThreadPoolExecutor(max_workers=16,
+                                     thread_name_prefix='gemini-hedge')
+
+
+def _hedged_stream(open_stream, model_name, deadline, estimated_tokens):
+    """
+    Stream from the first of up to two identical requests to answer.
+
+    The primary request starts right away; if it has produced no chunk after
+    the model's p95 time-to-first-chunk (and the hedge budget and rate
+    limiter allow), a duplicate is sent. The first request to yield a chunk
+    wins. open_stream(slot) opens one request holding a concurrency slot;
+    the primary's is taken here, before the clock starts.
+
+    The SDK keeps the HTTP response of a streaming request private to its
+    generator, and a generator blocked in next() on another thread cannot
+    be closed, so a loser still waiting for its first chunk cannot be
+    aborted: it keeps a gemini-hedge thread until that read returns (at most
+    its request timeout) and is closed then. Its concurrency slot is given
+    back as soon as the winner is known, so the window is not held by it.
+    """
+    gemini_latency_tracker.count('calls')
+    hedge_after = gemini_latency_tracker.hedge_delay(model_name)
+    slot = _acquire_gemini_slot(deadline)
+    started = slot.started
+    if hedge_after is None:
+        yield from _timed_stream(open_stream(slot), model_name, deadline,
+                                 started)
+        return
+
+    pending = {}
+    slots = {}
+    launched = []
+
+    def launch(slot):
+        stream = open_stream(slot)
+        future = _hedge_executor.submit(next, stream, None)
+        pending[future] = stream
+        slots[future] = slot
+        launched.append(future)
+
+    launch(slot)
+    hedge_wait = hedge_after
+    remaining = _remaining_seconds(deadline)
+    if remaining is not None:
+        hedge_wait = min(hedge_wait, max(0, remaining))
+    done, _ = wait(pending, timeout=hedge_wait)
+    if not done and (remaining is None or remaining > hedge_after):
+        # The hedge only uses a free slot of the concurrency window
+        hedge_started = gemini_concurrency.acquire(blocking=False)
+        if (hedge_started is not None
+                and gemini_rate_limiter.can_make_request(estimated_tokens)[0]
+                and gemini_latency_tracker.try_hedge()):
+            logger.info(
+                f"🪃 Hedging {model_name} call after {hedge_after:.1f}s without a response")
+            gemini_rate_limiter.record_request(estimated_tokens, success=True)
+            launch(_ConcurrencySlot(hedge_started))
+        elif hedge_started is not None:
+            gemini_concurrency.release(hedge_started, 'cancelled')
+
+    winner = None
+    first_error = None
+    while pending and winner is None:
+        done, _ = wait(pending,
+                       timeout=_remaining_seconds(deadline),
+                       return_when=FIRST_COMPLETED)
+        if not done:
+            break
+        for future in done:
+            stream = pending.pop(future)
+            if future.exception() is not None:
+                first_error = first_error or future.exception()
+                stream.close()
+            elif winner is None:
+                winner = (future, stream)
+            else:
+                stream.close()
+
+    # Losers still waiting on their first read give their slot back now and
+    # are closed once the read returns (see above)
+    for future, stream in pending.items():
+        slots[future].release('cancelled')
+        future.add_done_callback(lambda _, stream=stream: stream.close())
+
+    if winner is None:
+        if first_error is not None:
+            raise first_error
+        gemini_latency_tracker.count('deadline_exceeded')
+        raise GeminiDeadlineExceeded(
+            f"Gemini deadline exceeded waiting for {model_name}")
+
+    future, stream = winner
+    if future is not launched[0]:
+        gemini_latency_tracker.count('hedge_wins')
+    first_chunk = future.result()
+    if first_chunk is None:
+        stream.close()
+        return
+    gemini_latency_tracker.record(model_name, time.monotonic() - started)
+    yield first_chunk
+    yield from _timed_stream(stream, model_name, deadline)
+
+
+def _stream_gemini_text(prompt: str,
+                        model_name: str = "gemini-2.0-flash-lite",
+                        response_schema: dict = None,
+                        temperature: float = None,
+                        prompt_prefix: str = None,
+                        deadline: float = None,
+                        hedge: bool = False):
+    """
+    Stream response text chunks from Gemini.
+
+    With a response_schema the request runs in JSON mode, so the chunks
+    concatenate to JSON matching the schema (no markdown fences). A static
+    prompt_prefix is served from the Gemini context cache when possible and
+    prepended to the prompt otherwise. Rate limiting is left to the caller.
+
+    Requests carry a client-side HTTP timeout, and a deadline (a
+    time.monotonic() value) raises GeminiDeadlineExceeded once passed. With
+    hedge=True a call slower than the model's p95 gets a duplicate request.
+    """
+    global client
+    if not get_gemini_client():
+        raise RuntimeError("Gemini client not initialized")
+
+    if GENAI_AVAILABLE and hasattr(client, 'models'):
+
+        def open_stream(slot):
+            return _limited_stream(
+                _open_gemini_stream(prompt, model_name, response_schema,
+                                    temperature, prompt_prefix, deadline),
+                slot)
+
+        if hedge and GEMINI_HEDGING_ENABLED:
+            yield from _hedged_stream(
+                open_stream, model_name, deadline,
+                estimate_tokens((prompt_prefix or "") + prompt))
+        else:
+            # Time-to-first-chunk is measured from when the slot is held
+            slot = _acquire_gemini_slot(deadline)
+            yield from _timed_stream(open_stream(slot), model_name, deadline,
+                                     slot.started)
+    elif GENAI_LEGACY_AVAILABLE:
+        # Legacy SDK has no schema support; the streaming parser skips fences
+        model = client.GenerativeModel(model_name)
+        for chunk in model.generate_content((prompt_prefix or "") + prompt,
+                                            stream=True):
+            if chunk.text:
+                yield chunk.text
+    else:
+        raise RuntimeError("No available Gemini API client")
 
 
 def _call_gemini_api(prompt: str,
@@ -264,13 +930,18 @@ def _call_gemini_api(prompt: str,
                      system_instruction: str = None,
                      response_mime_type: str = "text/plain",
                      max_retries: int = 2,
-                     timeout: int = 180) -> str | dict | None:
+                     timeout: int = GEMINI_REQUEST_TIMEOUT_SECONDS,
+                     response_schema: dict = None,
+                     deadline: float = None) -> str | dict | None:
     """
     A unified, robust function to call the Gemini API using new google.genai structure.
     Handles rate limiting, error handling, retries, and JSON parsing.
+
+    timeout bounds each attempt client-side; an optional deadline (a
+    time.monotonic() value) bounds all attempts and backoffs together.
     """
     global client
-    if not client:
+    if not get_gemini_client():
         logger.error("Gemini client not initialized. Cannot make API call.")
         return None
 
@@ -285,16 +956,30 @@ def _call_gemini_api(prompt: str,
             if GENAI_AVAILABLE and hasattr(client, 'models'):
                 # Use new google.genai structure
                 config = types.GenerateContentConfig(
-                    response_mime_type=response_mime_type)
+                    response_mime_type=response_mime_type,
+                    response_schema=response_schema,
+                    http_options=types.HttpOptions(
+                        timeout=_request_timeout_ms(deadline, timeout)))
 
                 # Add system instruction if provided
                 if system_instruction:
                     config.system_instruction = system_instruction
 
-                response = client.models.generate_content(model=model_name,
-                                                          contents=[prompt],
-                                                          config=config)
-                response_text = response.text
+                slot = gemini_concurrency.acquire(deadline)
+                if slot is None:
+                    raise GeminiDeadlineExceeded(
+                        "Gemini deadline exceeded waiting for a concurrency slot")
+                outcome = 'error'
+                try:
+                    response = client.models.generate_content(
+                        model=model_name, contents=[prompt], config=config)
+                    response_text = response.text
+                    outcome = 'ok'
+                except Exception as e:
+                    outcome = classify_gemini_error(e)
+                    raise
+                finally:
+                    gemini_concurrency.release(slot, outcome)
 
             elif GENAI_LEGACY_AVAILABLE:
                 # Use legacy google.generativeai
@@ -303,7 +988,13 @@ def _call_gemini_api(prompt: str,
                     model = client.GenerativeModel(
                         model_name, system_instruction=system_instruction)
 
-                response = model.generate_content(prompt)
+                remaining = _remaining_seconds(deadline)
+                response = model.generate_content(
+                    prompt,
+                    request_options={
+                        'timeout':
+                        timeout if remaining is None else min(timeout, remaining)
+                    })
                 response_text = response.text
             else:
                 logger.error("No available Gemini API client")
@@ -331,6 +1022,12 @@ def _call_gemini_api(prompt: str,
             if attempt < max_retries:
                 # Exponential backoff
                 backoff = min(60, 2**attempt)
+                remaining = _remaining_seconds(deadline)
+                if remaining is not None and remaining <= backoff:
+                    logger.warning(
+                        f"⏰ Gemini deadline leaves no time for a retry ({remaining:.1f}s left)"
+                    )
+                    return None
                 logger.info(f"Retrying in {backoff} seconds...")
                 time.sleep(backoff)
                 continue
@@ -341,81 +1038,21 @@ def _call_gemini_api(prompt: str,
 def log_rate_limit_status():
     """Log current rate limit status for monitoring"""
     stats = gemini_rate_limiter.get_usage_stats()
+    stats['concurrency'] = gemini_concurrency.get_stats()
+    stats['database'] = db_connection_metrics.get_stats()
     logger.info("Rate limit status: %s", stats)
     logger.info(f"📊 Rate Limit Status: {stats}")
     return stats
 
 
 def with_db_retry(func, max_retries=3):
-    """Wrapper to retry database operations with connection management for serverless databases"""
-
-    def wrapper(*args, **kwargs):
-        from django.db import connection
-        from django.db.utils import OperationalError, InterfaceError
-        import psycopg2
-
-        for attempt in range(max_retries):
-            try:
-                # Close any stale connections before starting
-                if connection.connection and hasattr(
-                        connection.connection,
-                        'closed') and connection.connection.closed:
-                    connection.close()
-
-                # Ensure fresh connection
-                connection.ensure_connection()
-                return func(*args, **kwargs)
-
-            except (OperationalError, InterfaceError,
-                    psycopg2.OperationalError, psycopg2.DatabaseError) as e:
-                error_msg = str(e).lower()
-                is_connection_error = any(phrase in error_msg for phrase in [
-                    'connection already closed',
-                    'server closed the connection',
-                    'ssl connection has been closed unexpectedly',
-                    'ssl connection has been closed', 'connection lost',
-                    'connection broken', 'server has gone away',
-                    'connection timeout', 'connection was lost',
-                    'database connection was lost',
-                    'server closed the connection unexpectedly'
-                ])
-
-                if is_connection_error:
-                    logger.warning(
-                        f"Database connection issue on attempt {attempt + 1}/{max_retries}: {e}"
-                    )
-                    if attempt < max_retries - 1:
-                        # Force close the connection and wait before retry
-                        try:
-                            connection.close()
-                        except:
-                            pass  # Ignore errors when closing
-
-                        # Exponential backoff: 1s, 2s, 4s
-                        wait_time = 2**attempt
-                        logger.info(f"Waiting {wait_time}s before retry...")
-                        time.sleep(wait_time)
-                        continue
-                    else:
-                        logger.error(
-                            f"Max retries ({max_retries}) exceeded for database operation"
-                        )
-                        raise e
-                else:
-                    # Non-connection database error, don't retry
-                    logger.error(
-                        f"Non-connection database error (not retrying): {e}")
-                    raise e
-
-            except Exception as e:
-                # For non-database errors, don't retry
-                logger.error(
-                    f"Non-database error in with_db_retry (not retrying): {e}")
-                raise e
-
-        return None
-
-    return wrapper
+    """
+    Retry a database operation on connection drops, deadlocks and
+    serialization failures, classified by SQLSTATE (see DatabaseRetryPolicy).
+    Stale connections are replaced per Celery task by the CONN_HEALTH_CHECKS
+    handlers in db_connections.
+    """
+    return DatabaseRetryPolicy(max_retries=max_retries).wrap(func)
 
 
 # Configure logger to actually show output if not already configured by Django
@@ -438,7 +1075,6 @@ if not logger.handlers or not any(
 # Configuration flags
 ENABLE_VOTING_DATA_COLLECTION = getattr(settings,
                                         'ENABLE_VOTING_DATA_COLLECTION', False)
-initialize_gemini()
 
 
 def reinitialize_gemini():
@@ -458,7 +1094,7 @@ def check_gemini_api_status():
     """
     global client
 
-    if client is None:
+    if get_gemini_client() is None:
         return "error", "Gemini API client not initialized"
 
     try:
@@ -587,6 +1223,7 @@ def fetch_speaker_details(speaker_name):
                 'ntr_div': member_data.get('NTR_DIV', ''),
                 'naas_pic': member_data.get('NAAS_PIC', '')
             })
+        sync_speaker_parties([speaker])
 
         status_msg = "Created" if created else "Updated"
         logger.info(
@@ -694,6 +1331,7 @@ def fetch_party_membership_data(self=None, force=False, debug=False):
 
         # Process and update Speaker records with party information
         processed_count = 0
+        synced_speakers = []
         for member_data in all_members:
             try:
                 member_name = member_data.get('NAAS_NM', '').strip()
@@ -718,20 +1356,7 @@ def fetch_party_membership_data(self=None, force=False, debug=False):
                         'ntr_div': member_data.get('NTR_DIV', ''),
                         'naas_pic': member_data.get('NAAS_PIC', '')
                     })
-
-                # Create or update Party record
-                if party_name and party_name != '정당정보없음':
-                    party, party_created = Party.objects.get_or_create(
-                        name=party_name,
-                        defaults={
-                            'description': f'정당 - {party_name}',
-                            'assembly_era': 22
-                        })
-
-                    # Update speaker's current party
-                    if not speaker.current_party:
-                        speaker.current_party = party
-                        speaker.save()
+                synced_speakers.append(speaker)
 
                 processed_count += 1
 
@@ -742,6 +1367,8 @@ def fetch_party_membership_data(self=None, force=False, debug=False):
                 logger.error(f"Error processing member data: {e}")
                 continue
 
+        # Parties, party histories and current_party in one batch
+        sync_speaker_parties(synced_speakers)
         logger.info(f"🎉 Processed {processed_count} party membership records")
 
     except RequestException as re_exc:
@@ -1558,6 +2185,7 @@ def fetch_session_bills(self,
                         fetch_bill_detail_info(bill_id_api,
                                                force=True,
                                                debug=debug)
+            refresh_session_counters([session_obj.pk])
             logger.info(
                 f"🎉 Bills processed for session {session_id}: {created_count} created, {updated_count} updated."
             )
@@ -1818,6 +2446,12 @@ IGNORED_SPEAKERS = [
     '간사'
 ]
 
+# Titles stripped from LLM speaker names before member validation
+SPEAKER_TITLES = [
+    '위원장', '부위원장', '의원', '장관', '차관', '의장', '부의장', '의사국장', '사무관', '국장',
+    '서기관', '실장', '청장', '원장', '대변인', '비서관', '수석', '정무위원', '간사'
+]
+
 
 def extract_statements_for_bill_segment(bill_text_segment,
                                         session_id,
@@ -1836,28 +2470,52 @@ def extract_statements_for_bill_segment(bill_text_segment,
         bill_text_segment, session_id, bill_name, debug)
 
 
-def process_single_segment_for_statements_with_splitting(
-        bill_text_segment, session_id, bill_name, debug=False):
-    """Process a single text segment by splitting at ◯ markers and analyzing each speech with LLM."""
-    if not bill_text_segment:
-        return []
-
-    logger.info(
-        f"🔍 Processing speech segments for bill '{bill_name}' (session: {session_id}) - {len(bill_text_segment)} chars"
-    )
+def split_speech_segments(text, min_segment_length=30):
+    """
+    Split text at ◯ speaker markers.
 
-    # Find all ◯ markers to determine individual speeches
+    Returns a list of (offset, segment) pairs for segments of at least
+    min_segment_length characters, each starting with ◯, or None if the
+    text has no markers at all.
+    """
     speaker_markers = []
     current_pos = 0
 
     while True:
-        marker_pos = bill_text_segment.find('◯', current_pos)
+        marker_pos = text.find('◯', current_pos)
         if marker_pos == -1:
             break
-        speaker_markers.append((marker_pos, '◯'))
+        speaker_markers.append(marker_pos)
         current_pos = marker_pos + 1
 
     if not speaker_markers:
+        return None
+
+    segments = []
+    # Create segments between each marker
+    for i, start_pos in enumerate(speaker_markers):
+        end_pos = speaker_markers[i + 1] if i + 1 < len(
+            speaker_markers) else len(text)
+        segment = text[start_pos:end_pos].strip()
+
+        # Only process segments with meaningful content
+        if segment and len(segment) >= min_segment_length:
+            segments.append((start_pos, segment))
+    return segments
+
+
+def process_single_segment_for_statements_with_splitting(
+        bill_text_segment, session_id, bill_name, debug=False):
+    """Process a single text segment by splitting at ◯ markers and analyzing each speech with LLM."""
+    if not bill_text_segment:
+        return []
+
+    logger.info(
+        f"🔍 Processing speech segments for bill '{bill_name}' (session: {session_id}) - {len(bill_text_segment)} chars"
+    )
+
+    segment_spans = split_speech_segments(bill_text_segment)
+    if segment_spans is None:
         logger.info(
             "No ◯ markers found, treating entire segment as one speech")
         if len(bill_text_segment) > 100:
@@ -1866,27 +2524,8 @@ def process_single_segment_for_statements_with_splitting(
                                                          debug)
         return []
 
-    speech_segments = []
-    total_chars = 0
-    min_segment_length = 30
-
-    # Create segments between each marker
-    for i in range(len(speaker_markers)):
-        start_pos, marker = speaker_markers[i]
-        if i + 1 < len(speaker_markers):
-            end_pos = speaker_markers[i + 1][0]
-        else:
-            end_pos = len(bill_text_segment)
-
-        segment = bill_text_segment[start_pos:end_pos].strip()
-
-        # Only process segments with meaningful content
-        if segment and len(segment) >= min_segment_length:
-            # Add marker back if it was part of the speech
-            if not segment.startswith(marker):
-                segment = marker + ' ' + segment
-            speech_segments.append(segment)
-            total_chars += len(segment)
+    speech_segments = [segment for _, segment in segment_spans]
+    total_chars = sum(len(segment) for segment in speech_segments)
 
     logger.info(
         f"Split text into {len(speech_segments)} segments with {total_chars} total characters "
@@ -2264,6 +2903,7 @@ def fetch_session_bills_direct(session_id=None, force=False, debug=False):
             )
             fetch_bill_detail_info_direct(bill_id_api, force=True, debug=debug)
 
+        refresh_session_counters([session_obj.pk])
         logger.info(
             f"🎉 Bills processed for session {session_id}: {created_count} created, {updated_count} updated."
         )
@@ -2435,6 +3075,52 @@ def fetch_bill_detail_info_direct(bill_id, force=False, debug=False):
         logger.exception(f"Full traceback for bill detail {bill_id}:")
 
 
+def download_session_transcript(session):
+    """
+    Download a session's PDF transcript and return its extracted text.
+
+    The temporary PDF is always removed. Request errors propagate so that
+    callers can retry.
+    """
+    temp_pdf_path = None
+    try:
+        logger.info(f"📥 Downloading PDF from: {session.down_url}")
+        response = requests.get(session.down_url, timeout=120, stream=True)
+        response.raise_for_status()
+
+        temp_dir = Path(getattr(settings, "TEMP_FILE_DIR", "temp_files"))
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        temp_pdf_path = temp_dir / f"session_{session.conf_id}_{int(time.time())}.pdf"
+
+        with open(temp_pdf_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=8192):
+                f.write(chunk)
+        logger.info(
+            f"📥 PDF for session {session.conf_id} downloaded to {temp_pdf_path}"
+        )
+
+        full_text = ""
+        with pdfplumber.open(temp_pdf_path) as pdf:
+            pages = pdf.pages
+            logger.info(f"Extracting text from {len(pages)} pages...")
+            for i, page in enumerate(pages):
+                page_text = page.extract_text(x_tolerance=1, y_tolerance=3)
+                if page_text:
+                    full_text += page_text + "\n"
+                if (i + 1) % 20 == 0:
+                    logger.info(f"Processed {i+1}/{len(pages)} pages...")
+        logger.info(f"📄 Extracted ~{len(full_text)} chars from PDF.")
+        return full_text
+    finally:
+        if temp_pdf_path and temp_pdf_path.exists():
+            try:
+                temp_pdf_path.unlink()
+                logger.info(f"🗑️ Deleted temporary PDF: {temp_pdf_path}")
+            except OSError as e_del:
+                logger.error(
+                    f"Error deleting temporary PDF {temp_pdf_path}: {e_del}")
+
+
 def process_session_pdf_direct(session_id=None, force=False, debug=False):
     """
     Direct wrapper for process_session_pdf that can be called without Celery.
@@ -2462,8 +3148,8 @@ def process_session_pdf_direct(session_id=None, force=False, debug=False):
         )
         return
 
-    if Statement.objects.filter(
-            session=session).exists() and not force and not debug:
+    if Statement.objects.filter(session=session).exists(
+    ) and not force and not debug and not has_unfinished_run(session_id):
         logger.info(
             f"Statements already exist for session {session_id} and not in force/debug mode. Skipping."
         )
@@ -2473,41 +3159,16 @@ def process_session_pdf_direct(session_id=None, force=False, debug=False):
         logger.debug(f"🐛 DEBUG: Simulating PDF processing for {session_id}.")
         return
 
-    temp_pdf_path = None
     try:
-        logger.info(f"📥 Downloading PDF from: {session.down_url}")
-        response = requests.get(session.down_url, timeout=120, stream=True)
-        response.raise_for_status()
+        full_text = download_session_transcript(session)
 
-        temp_dir = Path(getattr(settings, "TEMP_FILE_DIR", "temp_files"))
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_pdf_path = temp_dir / f"session_{session_id}_{int(time.time())}.pdf"
+        if not full_text.strip():
+            logger.warning(
+                f"Extracted text is empty for session {session_id}.")
+            return
 
-        with open(temp_pdf_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        logger.info(
-            f"📥 PDF for session {session_id} downloaded to {temp_pdf_path}")
-
-        full_text = ""
-        with pdfplumber.open(temp_pdf_path) as pdf:
-            pages = pdf.pages
-            logger.info(f"Extracting text from {len(pages)} pages...")
-            for i, page in enumerate(pages):
-                page_text = page.extract_text(x_tolerance=1, y_tolerance=3)
-                if page_text:
-                    full_text += page_text + "\n"
-                if (i + 1) % 20 == 0:
-                    logger.info(f"Processed {i+1}/{len(pages)} pages...")
-        logger.info(f"📄 Extracted ~{len(full_text)} chars from PDF.")
-
-        if not full_text.strip():
-            logger.warning(
-                f"Extracted text is empty for session {session_id}.")
-            return
-
-        # Fetch the list of bills from the database
-        bills_for_session = get_session_bill_names(session_id)
+        # Fetch the list of bills from the database
+        bills_for_session = get_session_bill_names(session_id)
 
         # Process the PDF text for statements
         process_session_pdf_text(
@@ -2527,14 +3188,6 @@ def process_session_pdf_direct(session_id=None, force=False, debug=False):
         logger.error(
             f"❌ Unexpected error processing PDF for session {session_id}: {e}")
         logger.exception(f"Full traceback for PDF processing {session_id}:")
-    finally:
-        if temp_pdf_path and temp_pdf_path.exists():
-            try:
-                temp_pdf_path.unlink()
-                logger.info(f"🗑️ Deleted temporary PDF: {temp_pdf_path}")
-            except OSError as e_del:
-                logger.error(
-                    f"Error deleting temporary PDF {temp_pdf_path}: {e_del}")
 
 
 def _deduplicate_speech_segments(all_indices):
@@ -2571,14 +3224,263 @@ def _deduplicate_speech_segments(all_indices):
     return deduplicated
 
 
+# Batch planning constants for ◯ segment analysis
+CHARS_PER_TOKEN = 2  # Korean transcript text is roughly 2 chars per token
+BATCH_PROMPT_OVERHEAD_TOKENS = 1000  # Instructions + JSON output format
+BATCH_TOKEN_BUDGET = 8000
+MAX_SEGMENTS_PER_BATCH = 30
+# Follow-up mini-batches for segment IDs missing from (or invalid in) a response
+MISSING_SEGMENT_RETRY_ROUNDS = 2
+MAX_RATE_LIMIT_STALLS = 3
+
+# Model cascade: a local heuristic drops procedural turns, the lite model
+# handles the rest and only malformed or low-confidence results escalate
+CASCADE_LITE_MODEL = "gemini-2.0-flash-lite"
+CASCADE_STRONG_MODEL = "gemini-2.0-flash"
+CASCADE_CONFIDENCE_THRESHOLD = 0.6
+PROCEDURAL_MAX_CHARS = 300
+MIN_STATEMENT_BODY_CHARS = 50  # _analysis_to_statement drops anything shorter
+
+# Pre-LLM turn classes read from the ◯ speaker header. Only member turns are
+# batched for the LLM; procedural chair turns and officials' answers
+# (ministers, civil servants, witnesses) can never yield a member statement.
+TURN_MEMBER = 'member'
+TURN_PROCEDURAL = 'procedural'
+TURN_OFFICIAL = 'official'
+CHAIR_TITLES = ('의장', '부의장', '위원장', '부위원장')
+OFFICIAL_TITLES = ('국무총리', '국무위원', '장관', '차관', '처장', '청장', '실장', '원장',
+                   '총장', '국장', '대변인', '비서관', '수석', '전문위원', '정무위원',
+                   '사무관', '서기관', '증인', '참고인', '진술인')
+# Presiding officers listed by name in IGNORED_SPEAKERS
+IGNORED_SPEAKER_NAMES = frozenset(
+    word for word in IGNORED_SPEAKERS
+    if word not in SPEAKER_TITLES and word not in OFFICIAL_TITLES)
+
+
+def _title_suffix_pattern(titles):
+    """Header words ending in one of the titles (e.g. 기획재정부장관, 위원장대리)."""
+    alternatives = '|'.join(
+        re.escape(title) for title in sorted(titles, key=len, reverse=True))
+    return re.compile(f'(?:{alternatives})(?:대리|직무대행)?$')
+
+
+CHAIR_TITLE_PATTERN = _title_suffix_pattern(CHAIR_TITLES)
+OFFICIAL_TITLE_PATTERN = _title_suffix_pattern(OFFICIAL_TITLES)
+PROCEDURAL_PHRASE_PATTERN = re.compile(
+    r'상정합니다|상정하겠습니다|의사일정\s*제\s*\d+\s*항|선포합니다|이의\s*(가\s*)?없으십니까|'
+    r'가결되었음을|산회|정회|개의하겠습니다|토론을\s*종결|표결하겠습니다|보고사항은\s*끝에\s*실음'
+)
+
+
+def estimate_tokens(text):
+    """Rough token estimate for transcript text (no tokenizer call)."""
+    if not text:
+        return 0
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def estimate_batch_tokens(batch_segments):
+    """Estimate prompt tokens for a batch of ◯ segments including prompt overhead."""
+    return BATCH_PROMPT_OVERHEAD_TOKENS + sum(
+        estimate_tokens(segment) for segment in batch_segments)
+
+
+def plan_segment_batches(speech_segments,
+                         token_budget=BATCH_TOKEN_BUDGET,
+                         max_segments=MAX_SEGMENTS_PER_BATCH):
+    """
+    Pack ◯ segments into contiguous batches that fit a token budget.
+
+    Segments keep transcript order, so each batch is a [start, end) range
+    of speech_segments. A single segment larger than the budget gets a
+    batch of its own and is flagged as oversized.
+
+    Returns a list of dicts: {'start', 'end', 'segment_count',
+    'estimated_tokens', 'oversized'}.
+    """
+    plan = []
+    if not speech_segments:
+        return plan
+
+    segment_budget = max(1, token_budget - BATCH_PROMPT_OVERHEAD_TOKENS)
+    batch_start = 0
+    batch_tokens = 0
+
+    for idx, segment in enumerate(speech_segments):
+        segment_tokens = estimate_tokens(segment)
+        batch_len = idx - batch_start
+        if batch_len > 0 and (batch_tokens + segment_tokens > segment_budget
+                              or batch_len >= max_segments):
+            plan.append(
+                _make_batch_plan_entry(batch_start, idx, batch_tokens,
+                                       segment_budget))
+            batch_start = idx
+            batch_tokens = 0
+        batch_tokens += segment_tokens
+
+    plan.append(
+        _make_batch_plan_entry(batch_start, len(speech_segments), batch_tokens,
+                               segment_budget))
+    return plan
+
+
+def _make_batch_plan_entry(start, end, segment_tokens, segment_budget):
+    return {
+        'start': start,
+        'end': end,
+        'segment_count': end - start,
+        'estimated_tokens': segment_tokens + BATCH_PROMPT_OVERHEAD_TOKENS,
+        'oversized': segment_tokens > segment_budget,
+    }
+
+
+def log_segment_batch_plan(plan, bill_name):
+    """Log a batch plan before any LLM calls are made."""
+    total_tokens = sum(entry['estimated_tokens'] for entry in plan)
+    total_segments = sum(entry['segment_count'] for entry in plan)
+    logger.info(
+        f"🧮 Batch plan for '{str(bill_name)[:50]}': {len(plan)} batches, "
+        f"{total_segments} segments, ~{total_tokens} tokens")
+    for n, entry in enumerate(plan, start=1):
+        oversized_note = " (oversized)" if entry['oversized'] else ""
+        logger.debug(
+            f"  batch {n}: segments {entry['start']+1}-{entry['end']} "
+            f"({entry['segment_count']} segs, ~{entry['estimated_tokens']} tokens){oversized_note}"
+        )
+
+
+def classify_turn(segment):
+    """
+    Classify a ◯ turn before batching, from its speaker header and the
+    precompiled title and phrase patterns.
+
+    Returns (turn_class, label). TURN_MEMBER turns (label None) go to the
+    LLM. TURN_PROCEDURAL turns ('too_short', 'ignored_speaker',
+    'procedural') and TURN_OFFICIAL turns ('official') are dropped.
+    Chair turns that are long and not procedural count as member turns.
+    """
+    text = segment.replace('\n', ' ').strip().lstrip('◯').strip()
+    header_tokens = text.split(None, 2)
+    header_words = header_tokens[:2]
+    body = header_tokens[2] if len(header_tokens) > 2 else ''
+
+    if len(body) <= MIN_STATEMENT_BODY_CHARS:
+        return TURN_PROCEDURAL, 'too_short'
+
+    if any(word in IGNORED_SPEAKER_NAMES for word in header_words):
+        return TURN_PROCEDURAL, 'ignored_speaker'
+
+    if any(CHAIR_TITLE_PATTERN.search(word) for word in header_words):
+        if len(body) < PROCEDURAL_MAX_CHARS or len(
+                PROCEDURAL_PHRASE_PATTERN.findall(body)) >= 2:
+            return TURN_PROCEDURAL, 'procedural'
+        return TURN_MEMBER, None
+
+    if any(OFFICIAL_TITLE_PATTERN.search(word) for word in header_words):
+        return TURN_OFFICIAL, 'official'
+
+    return TURN_MEMBER, None
+
+
+def _new_cascade_tier():
+    return {
+        'segments': 0,
+        'requests': 0,
+        'tokens': 0,
+        'statements': 0,
+        'skipped': 0,
+        'local': 0,
+        'retry_requests': 0,
+        'retry_segments': 0,
+        'retry_tokens': 0,
+        'wasted_tokens': 0
+    }
+
+
+def _new_batch_usage():
+    """Per-batch counters for targeted retries and tokens spent on discarded output."""
+    return {
+        'retry_requests': 0,
+        'retry_segments': 0,
+        'retry_tokens': 0,
+        'wasted_tokens': 0
+    }
+
+
+def _new_cascade_report():
+    return {
+        'heuristic': {
+            'segments': 0,
+            'tokens_saved': 0,
+            'classes': {},
+            'labels': {}
+        },
+        'lite': _new_cascade_tier(),
+        'strong': _new_cascade_tier(),
+        'escalated': 0
+    }
+
+
+def _merge_cascade_report(target, report):
+    target['heuristic']['segments'] += report['heuristic']['segments']
+    target['heuristic']['tokens_saved'] += report['heuristic']['tokens_saved']
+    for key in ('classes', 'labels'):
+        for name, count in report['heuristic'][key].items():
+            target['heuristic'][key][name] = target['heuristic'][key].get(
+                name, 0) + count
+    for tier in ('lite', 'strong'):
+        for key in target[tier]:
+            target[tier][key] += report[tier][key]
+    target['escalated'] += report['escalated']
+
+
+def log_cascade_report(report, label):
+    """Log per-tier segment counts and estimated token spend."""
+    heuristic = report['heuristic']
+    labels = ', '.join(f"{name}={count}"
+                       for name, count in sorted(heuristic['labels'].items()))
+    logger.info(
+        f"📊 Cascade report for {label}: "
+        f"heuristic dropped {heuristic['segments']} ({labels or 'none'}; "
+        f"~{heuristic['tokens_saved']} tokens saved), "
+        f"lite {report['lite']['segments']} segments / {report['lite']['requests']} requests / "
+        f"~{report['lite']['tokens']} tokens -> {report['lite']['statements']} statements, "
+        f"escalated {report['escalated']}, "
+        f"strong {report['strong']['segments']} segments / {report['strong']['requests']} requests / "
+        f"~{report['strong']['tokens']} tokens -> {report['strong']['statements']} statements, "
+        f"skipped {report['lite']['skipped'] + report['strong']['skipped']}, "
+        f"scored offline {report['lite']['local'] + report['strong']['local']}, "
+        f"re-submitted {report['lite']['retry_segments'] + report['strong']['retry_segments']} "
+        f"missing segments (~{report['lite']['retry_tokens'] + report['strong']['retry_tokens']} tokens), "
+        f"~{report['lite']['wasted_tokens'] + report['strong']['wasted_tokens']} tokens wasted on failed batches")
+
+
+_session_cascade_reports = {}
+_session_cascade_lock = threading.Lock()
+
+
+def pop_session_cascade_report(session_id):
+    """Return and forget the cascade totals accumulated for a session."""
+    with _session_cascade_lock:
+        return _session_cascade_reports.pop(session_id, None)
+
+
 def analyze_speech_segment_with_llm_batch(speech_segments,
                                           session_id,
                                           bill_name,
                                           debug=False):
-    """Batch analyze multiple speech segments with LLM using dynamic batching."""
+    """
+    Batch analyze speech segments through the model cascade.
+
+    Procedural and official turns are dropped by classify_turn(), the rest
+    go to the lite model following a token-budget plan, and segments whose
+    lite analysis was malformed, low-confidence or failed outright are
+    re-analyzed by the stronger model. Per-tier counts are logged and
+    added to the session's cascade report.
+    """
     global client
 
-    if not client:
+    if not get_gemini_client():
         logger.warning(
             "❌ Gemini not available. Cannot analyze speech segments.")
         return []
@@ -2590,107 +3492,345 @@ def analyze_speech_segment_with_llm_batch(speech_segments,
         f"🚀 Batch analyzing {len(speech_segments)} speech segments for bill '{bill_name[:50]}...'"
     )
 
+    report = _new_cascade_report()
+    llm_indices = []
+    for index, segment in enumerate(speech_segments):
+        turn_class, label = classify_turn(segment)
+        if turn_class == TURN_MEMBER:
+            llm_indices.append(index)
+            continue
+        heuristic = report['heuristic']
+        heuristic['segments'] += 1
+        heuristic['tokens_saved'] += estimate_tokens(segment)
+        heuristic['classes'][turn_class] = heuristic['classes'].get(
+            turn_class, 0) + 1
+        heuristic['labels'][label] = heuristic['labels'].get(label, 0) + 1
+
     # Get assembly members once for the entire batch
     assembly_members = get_all_assembly_members()
-    results = []
+    checkpoints = None if debug else get_active_checkpoints(session_id)
 
-    # Dynamic batch sizing based on content length
-    def calculate_batch_size(segments, start_idx, max_tokens=15000):
-        total_chars = 0
-        batch_size = 0
+    escalated = set()
+    results = _run_segment_batches([speech_segments[i] for i in llm_indices],
+                                   llm_indices, bill_name, assembly_members,
+                                   CASCADE_LITE_MODEL, report['lite'],
+                                   escalated, checkpoints)
 
-        for i in range(start_idx, len(segments)):
-            segment_chars = len(segments[i])
-            if total_chars + segment_chars > max_tokens and batch_size > 0:
-                break
-            total_chars += segment_chars
-            batch_size += 1
+    if escalated:
+        strong_indices = [llm_indices[i] for i in sorted(escalated)]
+        report['escalated'] = len(strong_indices)
+        logger.info(
+            f"⬆️ Escalating {len(strong_indices)} segments to {CASCADE_STRONG_MODEL}"
+        )
+        results.extend(
+            _run_segment_batches([speech_segments[i] for i in strong_indices],
+                                 strong_indices, bill_name, assembly_members,
+                                 CASCADE_STRONG_MODEL, report['strong'],
+                                 checkpoints=checkpoints))
+
+    log_cascade_report(report, f"bill '{bill_name[:50]}'")
+    with _session_cascade_lock:
+        _merge_cascade_report(
+            _session_cascade_reports.setdefault(session_id,
+                                                _new_cascade_report()),
+            report)
 
-        return batch_size or 1  # Always process at least one segment
+    logger.info(
+        f"✅ Batch analysis completed: {len(results)} valid statements from {len(speech_segments)} segments"
+        f" ({report['lite']['skipped'] + report['strong']['skipped']} skipped)")
+    return sorted(results, key=lambda x: x.get('segment_index', 0))
+
+
+def _score_segments_locally(segments, ranges, segment_indices,
+                            assembly_members):
+    """
+    Quota-free fallback: build statements straight from ◯ segments and score
+    them with the offline lexicon. The speaker comes from the ◯ header, and
+    the same member/length filters as LLM results apply. The statements are
+    flagged sentiment_provisional for later LLM refinement.
+    """
+    statements = []
+    for start, end in ranges:
+        for position in range(start, end):
+            if classify_turn(segments[position])[0] != TURN_MEMBER:
+                continue
+            text = segments[position].replace('\n', ' ').strip().lstrip(
+                '◯').strip()
+            header_tokens = text.split(None, 2)
+            if len(header_tokens) < 3:
+                continue
+            speaker_name = ''
+            for token in header_tokens[:2]:
+                for title in SPEAKER_TITLES:
+                    token = token.replace(title, '')
+                if token.strip():
+                    speaker_name = token.strip()
+                    break
+            body = header_tokens[2].strip()
+            if not speaker_name or len(body) <= MIN_STATEMENT_BODY_CHARS:
+                continue
+            if assembly_members and speaker_name not in assembly_members:
+                continue
+            statements.append({
+                'speaker_name': speaker_name,
+                'text': body,
+                'bill_relevance_score': 0.0,
+                'policy_categories': [],
+                'policy_keywords': [],
+                'bill_specific_keywords': [],
+                'segment_index': segment_indices[position]
+            })
+    return apply_lexicon_sentiment(statements)
 
-    i = 0
-    while i < len(speech_segments):
-        # Calculate dynamic batch size based on content length
-        batch_size = calculate_batch_size(speech_segments, i)
-        batch_end = min(i + batch_size, len(speech_segments))
-        batch_segments = speech_segments[i:batch_end]
 
-        # Estimate tokens (4 chars ~= 1 token, plus overhead)
-        total_chars = sum(len(s) for s in batch_segments)
-        estimated_tokens = (total_chars // 4) + 1000
+def _run_segment_batches(segments,
+                         segment_indices,
+                         bill_name,
+                         assembly_members,
+                         model_name,
+                         tier_stats,
+                         escalated=None,
+                         checkpoints=None):
+    """
+    Run one cascade tier over segments following a token-budget plan.
+
+    The plan is computed up front with plan_segment_batches(). A batch that
+    fails is bisected and only its halves are retried. A single segment that
+    still fails is added to `escalated` when given (positions in `segments`)
+    and skipped otherwise. Statement segment_index values are mapped back
+    through segment_indices. Targeted retries of missing segments and the
+    tokens of failed attempts are added to tier_stats.
+
+    Batches run on worker threads, as many at a time as the adaptive
+    concurrency window (gemini_concurrency) allows, with no fixed pauses in
+    between; results and checkpoint writes are handled in the calling thread.
+
+    With session checkpoints, every batch is recorded (planned, in flight,
+    done, failed) and batches finished by an earlier run are taken from
+    their checkpoint instead of calling the LLM again.
+    """
+    if not segments:
+        return []
 
-        logger.info(
-            f"Processing batch {i+1}-{batch_end} of {len(speech_segments)} "
-            f"(segments: {batch_size}, ~{estimated_tokens} tokens)")
+    plan = plan_segment_batches(segments)
+    log_segment_batch_plan(plan, bill_name)
 
-        # Wait if needed before submitting
-        if not gemini_rate_limiter.wait_if_needed(estimated_tokens):
-            logger.warning("Rate limit timeout, pausing before retry...")
-            time.sleep(10)  # Longer pause before retry
-            continue
+    def batch_key(start, end):
+        return make_batch_key(LLMBatchCheckpoint.KIND_ANALYSIS, model_name,
+                              bill_name, segments[start:end])
 
-        try:
-            # Process the batch
-            batch_results = analyze_batch_statements_single_request(
-                batch_segments, bill_name, assembly_members, estimated_tokens,
-                i)
-
-            if batch_results:
-                results.extend(batch_results)
-                # Record successful API usage
-                gemini_rate_limiter.record_request(estimated_tokens,
-                                                   success=True)
-
-                # Dynamic sleep based on batch size and content length
-                sleep_time = min(
-                    5, 1 + (total_chars / 10000))  # Up to 5s for large batches
-                if i + batch_size < len(speech_segments):
-                    logger.debug(
-                        f"Resting {sleep_time:.1f}s before next batch...")
-                    time.sleep(sleep_time)
+    if checkpoints:
+        checkpoints.plan([{
+            'kind': LLMBatchCheckpoint.KIND_ANALYSIS,
+            'batch_key': batch_key(entry['start'], entry['end']),
+            'bill_name': (bill_name or '')[:500],
+            'model_name': model_name,
+            'segment_start': entry['start'],
+            'segment_end': entry['end'],
+            'estimated_tokens': entry['estimated_tokens'],
+        } for entry in plan])
 
-                i = batch_end  # Move to next batch on success
+    results = []
+    tier_stats['segments'] += len(segments)
+
+    pending = deque((entry['start'], entry['end']) for entry in plan)
+    rate_limit_stalls = 0
+    in_flight = {}
+    stopped = False
+
+    with ThreadPoolExecutor(max_workers=GEMINI_MAX_CONCURRENCY) as executor:
+        while pending or in_flight:
+            # Keep as many batches in flight as the adaptive window allows
+            while pending and not stopped and len(
+                    in_flight) < gemini_concurrency.limit:
+                start, end = pending.popleft()
+                batch_segments = segments[start:end]
+                estimated_tokens = estimate_batch_tokens(batch_segments)
+                key = batch_key(start, end) if checkpoints else None
+
+                stored = checkpoints.get_done(key) if checkpoints else None
+                if stored is not None:
+                    batch_results = [
+                        dict(statement,
+                             segment_index=segment_indices[
+                                 start + statement['segment_index']])
+                        for statement in stored['statements']
+                    ]
+                    if escalated is not None:
+                        escalated.update(start + offset
+                                         for offset in stored['escalated'])
+                    results.extend(batch_results)
+                    tier_stats['statements'] += len(batch_results)
+                    logger.info(
+                        f"♻️ Batch {start+1}-{end} restored from checkpoint ({len(batch_results)} statements)"
+                    )
+                    continue
 
-            else:
-                # If no results, reduce batch size and retry
-                if batch_size > 1:
-                    batch_size = max(1, batch_size // 2)
+                logger.info(
+                    f"Processing batch {start+1}-{end} of {len(segments)} with {model_name} "
+                    f"(segments: {end - start}, ~{estimated_tokens} tokens, "
+                    f"{len(in_flight)} in flight, window {gemini_concurrency.limit})")
+
+                # Wait if needed before submitting
+                if not gemini_rate_limiter.wait_if_needed(estimated_tokens):
+                    if gemini_rate_limiter.daily_quota_exhausted(
+                            estimated_tokens):
+                        remaining = [(start, end)] + list(pending)
+                        pending.clear()
+                        stopped = True
+                        local_results = _score_segments_locally(
+                            segments, remaining, segment_indices,
+                            assembly_members)
+                        results.extend(local_results)
+                        tier_stats['local'] += sum(e - s
+                                                   for s, e in remaining)
+                        tier_stats['statements'] += len(local_results)
+                        logger.warning(
+                            f"📴 Daily Gemini quota exhausted; scored {len(local_results)} statements "
+                            f"from {tier_stats['local']} remaining segments with the offline lexicon"
+                        )
+                        break
+                    rate_limit_stalls += 1
+                    if rate_limit_stalls >= MAX_RATE_LIMIT_STALLS:
+                        remaining = end - start + sum(e - s
+                                                      for s, e in pending)
+                        pending.clear()
+                        stopped = True
+                        tier_stats['skipped'] += remaining
+                        logger.error(
+                            f"Rate limit timeout {rate_limit_stalls} times in a row, "
+                            f"stopping with {remaining} segments unprocessed")
+                        break
+                    logger.warning(
+                        "Rate limit timeout, pausing before retry...")
+                    time.sleep(10)  # Longer pause before retry
+                    pending.appendleft((start, end))
+                    continue
+                rate_limit_stalls = 0
+
+                tier_stats['requests'] += 1
+                tier_stats['tokens'] += estimated_tokens
+                if checkpoints:
+                    checkpoints.start(key,
+                                      LLMBatchCheckpoint.KIND_ANALYSIS,
+                                      bill_name=(bill_name or '')[:500],
+                                      model_name=model_name,
+                                      segment_start=start,
+                                      segment_end=end,
+                                      estimated_tokens=estimated_tokens)
+                batch_escalated = set() if escalated is not None else None
+                batch_usage = _new_batch_usage()
+                future = executor.submit(
+                    analyze_batch_statements_single_request,
+                    batch_segments,
+                    bill_name,
+                    assembly_members,
+                    estimated_tokens,
+                    start,
+                    model_name=model_name,
+                    escalation=batch_escalated,
+                    usage=batch_usage)
+                in_flight[future] = (start, end, key, estimated_tokens,
+                                     batch_escalated, batch_usage)
+
+            if not in_flight:
+                continue
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                (start, end, key, estimated_tokens, batch_escalated,
+                 batch_usage) = in_flight.pop(future)
+                batch_results = None
+                batch_error = None
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    batch_error = e
+                    batch_usage['wasted_tokens'] += estimated_tokens
+                    error_type = "timeout" if "timeout" in str(
+                        e).lower() else "api_error"
+                    gemini_rate_limiter.record_error(error_type)
+                    logger.error(f"Batch analysis failed: {e}")
+                for usage_key, value in batch_usage.items():
+                    tier_stats[usage_key] += value
+
+                if batch_results is not None:
+                    if batch_escalated:
+                        escalated.update(batch_escalated)
+                    if checkpoints:
+                        # Positions relative to the batch, so the checkpoint is
+                        # valid wherever the same segments land in a later plan
+                        checkpoints.finish(
+                            key, {
+                                'statements': [
+                                    dict(statement,
+                                         segment_index=statement.get(
+                                             'segment_index', start) - start)
+                                    for statement in batch_results
+                                ],
+                                'escalated':
+                                sorted(i - start
+                                       for i in batch_escalated or ())
+                            })
+                    for statement in batch_results:
+                        position = statement.get('segment_index', 0)
+                        if 0 <= position < len(segment_indices):
+                            statement['segment_index'] = segment_indices[
+                                position]
+                    results.extend(batch_results)
+                    tier_stats['statements'] += len(batch_results)
+                    # Record successful API usage
+                    gemini_rate_limiter.record_request(estimated_tokens,
+                                                       success=True)
+                    continue
+
+                if checkpoints:
+                    if batch_error is None:
+                        batch_error = ("failed; split into halves"
+                                       if end - start > 1 else
+                                       "no valid response")
+                    checkpoints.fail(key, batch_error)
+
+                if stopped:
+                    tier_stats['skipped'] += end - start
+                elif end - start > 1:
+                    # Bisect only the failing batch; the halves run next
+                    mid = (start + end) // 2
+                    pending.appendleft((mid, end))
+                    pending.appendleft((start, mid))
+                    logger.warning(
+                        f"Batch {start+1}-{end} failed, splitting into {start+1}-{mid} and {mid+1}-{end}"
+                    )
+                elif escalated is not None:
+                    escalated.add(start)
                     logger.warning(
-                        f"No results, reducing batch size to {batch_size}")
+                        f"Segment {start+1} failed with {model_name}, escalating"
+                    )
                 else:
-                    i += 1  # Skip problematic segment
+                    tier_stats['skipped'] += 1
+                    logger.error(
+                        f"Failed to process segment {start+1}, skipping")
 
-        except Exception as e:
-            error_type = "timeout" if "timeout" in str(
-                e).lower() else "api_error"
-            gemini_rate_limiter.record_error(error_type)
-            logger.error(f"Batch analysis failed: {e}")
-
-            # On error, reduce batch size and retry
-            if batch_size > 1:
-                batch_size = max(1, batch_size // 2)
-                logger.warning(f"Error, reducing batch size to {batch_size}")
-            else:
-                logger.error(
-                    f"Failed to process segment {i}, skipping: {str(e)}")
-                i += 1  # Skip problematic segment if we can't process it even with batch size 1
+    return results
 
-    logger.info(
-        f"✅ Batch analysis completed: {len(results)} valid statements from {len(speech_segments)} segments"
-    )
-    return sorted(results, key=lambda x: x.get('segment_index', 0))
 
+def build_batch_analysis_prompt(batch_segments, bill_name, positions=None):
+    """
+    Build the batch analysis prompt for a list of ◯ segments.
 
-def analyze_batch_statements_single_request(batch_segments, bill_name,
-                                            assembly_members, estimated_tokens,
-                                            batch_start_index):
-    """Analyze ◯ segments to extract speaker statements using LLM."""
-    if not batch_segments:
-        return []
+    Each segment is labelled "--- 구간 N ---" with N = batch position + 1,
+    and the model echoes N as segment_index. With positions, only those
+    segments are included and keep their IDs, which is how missing segments
+    are re-submitted.
 
+    Returns (prompt, cleaned_segments), or (None, []) if no segment is long
+    enough to analyze. Shared by live analysis and offline batch jobs.
+    """
     # Clean and prepare ◯ segments for LLM analysis
     cleaned_segments = []
     for i, segment in enumerate(batch_segments):
+        if positions is not None and i not in positions:
+            continue
         # Clean the segment
         cleaned_segment = segment.replace('\n', ' ').replace('\r', '').strip()
 
@@ -2708,13 +3848,11 @@ def analyze_batch_statements_single_request(batch_segments, bill_name,
             })
 
     if not cleaned_segments:
-        logger.warning("No valid ◯ segments after cleaning")
-        return []
+        return None, []
 
-    # Limit batch size for reliable processing
-    max_segments_per_batch = 30
-    if len(cleaned_segments) > max_segments_per_batch:
-        cleaned_segments = cleaned_segments[:max_segments_per_batch]
+    # Limit batch size for reliable processing (the planner already caps this)
+    if len(cleaned_segments) > MAX_SEGMENTS_PER_BATCH:
+        cleaned_segments = cleaned_segments[:MAX_SEGMENTS_PER_BATCH]
 
     # Create safe bill name
     safe_bill_name = str(bill_name)[:100] if bill_name else "알 수 없는 의안"
@@ -2742,22 +3880,52 @@ def analyze_batch_statements_single_request(batch_segments, bill_name,
     "is_valid_member": true,
     "is_substantial": true,
     "sentiment_score": 0.0,
-    "bill_relevance_score": 0.8
+    "bill_relevance_score": 0.8,
+    "confidence": 0.9
   }}
 ]
 
 중요한 규칙:
 - ◯ 다음에 나오는 이름이 발언자
 - 발언자명에서 "의원", "위원장", "장관" 등 직책 제거
-- 실제 의원 발언만 포함 (의사진행, 보고 제외)
+- segment_index는 "--- 구간 N ---"의 번호 N을 그대로 사용
+- 모든 구간마다 정확히 하나의 객체로 응답 (의사진행, 보고 등 의원 발언이 아닌 구간도 is_valid_member 또는 is_substantial을 false로 하여 포함)
 - start_idx와 end_idx는 전체 문서에서의 정확한 문자 위치
 - sentiment_score: -1(매우 부정) ~ 1(매우 긍정)
 - bill_relevance_score: 0(무관) ~ 1(매우 관련)
+- confidence: 발언자와 인덱스 추출 결과에 대한 확신도 0(불확실) ~ 1(확실)
 - JSON 배열만 응답, 다른 텍스트 없이"""
 
-    return _execute_batch_analysis(prompt, cleaned_segments, batch_segments,
-                                   assembly_members, batch_start_index,
-                                   bill_name)
+    return prompt, cleaned_segments
+
+
+def analyze_batch_statements_single_request(batch_segments,
+                                            bill_name,
+                                            assembly_members,
+                                            estimated_tokens,
+                                            batch_start_index,
+                                            model_name=CASCADE_LITE_MODEL,
+                                            escalation=None,
+                                            usage=None):
+    """Analyze ◯ segments to extract speaker statements using LLM."""
+    if not batch_segments:
+        return []
+
+    prompt, cleaned_segments = build_batch_analysis_prompt(
+        batch_segments, bill_name)
+    if not cleaned_segments:
+        logger.warning("No valid ◯ segments after cleaning")
+        return []
+
+    return _execute_batch_analysis(prompt,
+                                   cleaned_segments,
+                                   batch_segments,
+                                   assembly_members,
+                                   batch_start_index,
+                                   bill_name,
+                                   model_name=model_name,
+                                   escalation=escalation,
+                                   usage=usage)
 
 
 def _process_large_batch_in_chunks(batch_model, segments, bill_name,
@@ -2776,7 +3944,7 @@ def _process_large_batch_in_chunks(batch_model, segments, bill_name,
             estimated_tokens // (len(segments) // chunk_size + 1),
             batch_start_index + chunk_start)
 
-        all_results.extend(chunk_results)
+        all_results.extend(chunk_results or [])
 
         # Brief pause between chunks
         if chunk_end < len(segments):
@@ -2785,145 +3953,231 @@ def _process_large_batch_in_chunks(batch_model, segments, bill_name,
     return all_results
 
 
-def _execute_batch_analysis(prompt,
-                            cleaned_segments,
-                            original_segments,
-                            assembly_members,
-                            batch_start_index,
-                            bill_name,
-                            max_retries=3):
-    """Execute the actual batch analysis request with retry logic for API errors using new google.genai structure."""
-    global client
+def _analysis_to_statement(analysis_json, position, original_segments,
+                           assembly_members, batch_start_index):
+    """Turn one LLM analysis object into a statement dict, or None if it should be skipped."""
+    speaker_name = (analysis_json.get('speaker_name') or '').strip()
+    start_idx = analysis_json.get('start_idx')
+    end_idx = analysis_json.get('end_idx')
+    is_valid_member = analysis_json.get('is_valid_member', False)
+    is_substantial = analysis_json.get('is_substantial', False)
+
+    # Extract text locally using the indices provided by LLM
+    extracted_text = ""
+    if start_idx is not None and end_idx is not None and position < len(
+            original_segments):
+        segment_text = original_segments[position]
+        start_idx = max(0, min(start_idx, len(segment_text)))
+        end_idx = max(start_idx, min(end_idx, len(segment_text)))
+        extracted_text = segment_text[start_idx:end_idx].strip()
+
+    # Clean speaker name from titles (LLM should have done this, but double-check)
+    if speaker_name:
+        for title in SPEAKER_TITLES:
+            speaker_name = speaker_name.replace(title, '').strip()
+
+    # Validate speaker against assembly members
+    is_real_member = speaker_name in assembly_members if assembly_members and speaker_name else is_valid_member
+
+    should_ignore = any(
+        ignored in speaker_name
+        for ignored in IGNORED_SPEAKERS) if speaker_name else True
+
+    # Only include valid, substantial statements from real members
+    if not (speaker_name and extracted_text and is_valid_member
+            and is_substantial and not should_ignore and is_real_member
+            and len(extracted_text) > 50):
+        logger.debug(
+            f"⚠️ Skipped statement - speaker: '{speaker_name}', valid: {is_valid_member}, substantial: {is_substantial}, real_member: {is_real_member}, text_len: {len(extracted_text) if extracted_text else 0}"
+        )
+        return None
+
+    logger.info(
+        f"✅ Extracted statement from {speaker_name}: {extracted_text[:100]}...")
+    return {
+        'speaker_name': speaker_name,
+        'text': extracted_text,  # Use the locally extracted text
+        'start_idx': start_idx,  # Include indices for further processing
+        'end_idx': end_idx,
+        'sentiment_score': analysis_json.get('sentiment_score', 0.0),
+        'sentiment_reason': '◯ 구간 LLM 분석',
+        'analysis_version': LLM_PROMPT_VERSION,
+        'bill_relevance_score': analysis_json.get('bill_relevance_score', 0.0),
+        'policy_categories': [],
+        'policy_keywords': [],
+        'bill_specific_keywords': [],
+        'segment_index': batch_start_index + position
+    }
+
+
+def batch_segment_ids(cleaned_segments):
+    """Map the 구간 IDs of a batch prompt to positions in its batch."""
+    return {item['index'] + 1: item['index'] for item in cleaned_segments}
+
+
+def _analysis_segment_position(analysis_json, segment_ids):
+    """
+    Batch position of the segment an analysis object answers, from the 구간
+    ID echoed in segment_index, or None if the ID is missing or was not in
+    the prompt.
+    """
+    segment_id = analysis_json.get('segment_index')
+    if isinstance(segment_id, bool) or not isinstance(segment_id, int):
+        return None
+    return segment_ids.get(segment_id)
 
-    if not client:
-        logger.error("Gemini client not initialized for batch analysis.")
-        return []
 
+def _needs_escalation(analysis_json, segment_text, confidence_threshold):
+    """True if an analysis object is malformed or not confident enough to trust."""
+    speaker_name = analysis_json.get('speaker_name')
+    start_idx = analysis_json.get('start_idx')
+    end_idx = analysis_json.get('end_idx')
+    if not isinstance(speaker_name, str):
+        return True
+    if not isinstance(start_idx, int) or not isinstance(end_idx, int):
+        return True
+    if start_idx < 0 or end_idx <= start_idx or start_idx >= len(
+            segment_text or ''):
+        return True
+    sentiment_score = analysis_json.get('sentiment_score', 0.0)
+    if not isinstance(sentiment_score,
+                      (int, float)) or not -1.0 <= sentiment_score <= 1.0:
+        return True
+    confidence = analysis_json.get('confidence', 1.0)
+    if not isinstance(confidence, (int, float)):
+        return True
+    return confidence < confidence_threshold
+
+
+def iter_batch_analysis_statements(prompt,
+                                   original_segments,
+                                   assembly_members,
+                                   batch_start_index,
+                                   stream_state=None,
+                                   model_name=CASCADE_LITE_MODEL,
+                                   confidence_threshold=None,
+                                   deadline=None,
+                                   cleaned_segments=None):
+    """
+    Stream a batch analysis request and yield each valid statement as soon as
+    its JSON object is complete, before the full response has arrived. The
+    request is hedged and bounded by deadline (see _stream_gemini_text).
+
+    Objects are matched to segments by the 구간 ID they echo, never by their
+    order in the response. Objects whose ID is missing, unknown or repeated
+    are not used. cleaned_segments (from build_batch_analysis_prompt)
+    gives the IDs in the prompt, by default one per original segment.
+
+    stream_state (a dict) is updated with 'objects', 'complete', 'answered'
+    (positions that got a usable analysis) and 'invalid' (objects not used),
+    so callers can tell which segments still need an answer. With a
+    confidence_threshold, objects that are malformed or below it are not
+    yielded; their positions are collected in stream_state['escalate'].
+    """
+    if stream_state is None:
+        stream_state = {}
+    stream_state.update({
+        'objects': 0,
+        'complete': False,
+        'escalate': [],
+        'answered': set(),
+        'invalid': 0
+    })
+    if cleaned_segments is None:
+        cleaned_segments = [{'index': i} for i in range(len(original_segments))]
+    segment_ids = batch_segment_ids(cleaned_segments)
+
+    parser = StreamingJSONArrayParser()
+    for chunk_text in _stream_gemini_text(
+            prompt,
+            model_name=model_name,
+            response_schema=BATCH_ANALYSIS_RESPONSE_SCHEMA,
+            deadline=deadline,
+            hedge=True):
+        for _, analysis_json in parser.feed(chunk_text):
+            stream_state['objects'] += 1
+            position = _analysis_segment_position(
+                analysis_json, segment_ids) if isinstance(analysis_json,
+                                                          dict) else None
+            if (position is None or position in stream_state['answered']
+                    or position in stream_state['escalate']):
+                stream_state['invalid'] += 1
+                continue
+            if confidence_threshold is not None and _needs_escalation(
+                    analysis_json, original_segments[position]
+                    if position < len(original_segments) else '',
+                    confidence_threshold):
+                stream_state['escalate'].append(position)
+                continue
+            stream_state['answered'].add(position)
+            statement = _analysis_to_statement(analysis_json, position,
+                                               original_segments,
+                                               assembly_members,
+                                               batch_start_index)
+            if statement:
+                yield statement
+    stream_state['complete'] = parser.is_complete
+
+
+def _request_batch_analysis(prompt, cleaned_segments, original_segments,
+                            assembly_members, batch_start_index, max_retries,
+                            model_name, confidence_threshold, deadline, usage):
+    """
+    One batch analysis request with retries for API errors, all within
+    deadline. Returns (statements, stream_state) once a response produced
+    anything usable, or None. The prompt tokens of attempts that were
+    processed but produced nothing (server errors, timeouts, unparseable
+    output) are added to usage['wasted_tokens'].
+    """
+    prompt_tokens = estimate_tokens(prompt)
     for attempt in range(max_retries + 1):
         start_time = time.time()
+        results = []
+        stream_state = {}
         try:
-            if GENAI_AVAILABLE and hasattr(client, 'models'):
-                # Use new google.genai structure
-                response = client.models.generate_content(
-                    model="gemini-2.0-flash-lite",
-                    contents=[prompt],
-                    config=types.GenerateContentConfig(
-                        response_mime_type="text/plain"))
-                response_text_raw = response.text
-            elif GENAI_LEGACY_AVAILABLE:
-                # Use legacy google.generativeai
-                model = client.GenerativeModel("gemini-2.0-flash-lite")
-                response = model.generate_content(prompt)
-                response_text_raw = response.text
-            else:
-                logger.error(
-                    "No available Gemini API client for batch analysis")
-                return []
+            for statement in iter_batch_analysis_statements(
+                    prompt,
+                    original_segments,
+                    assembly_members,
+                    batch_start_index,
+                    stream_state,
+                    model_name=model_name,
+                    confidence_threshold=confidence_threshold,
+                    deadline=deadline,
+                    cleaned_segments=cleaned_segments):
+                results.append(statement)
 
             processing_time = time.time() - start_time
             logger.info(
                 f"Batch processing took {processing_time:.1f}s for {len(cleaned_segments)} segments"
             )
 
-            if not response_text_raw:
+            if not stream_state['complete']:
+                if stream_state['objects'] == 0:
+                    logger.warning(
+                        f"Empty or unparseable batch response from LLM after {processing_time:.1f}s"
+                    )
+                    usage['wasted_tokens'] += prompt_tokens
+                    return None
                 logger.warning(
-                    f"Empty batch response from LLM after {processing_time:.1f}s"
+                    f"Batch response was cut off after {stream_state['objects']} objects; keeping parsed statements"
                 )
-                return []
-
-            response_text_cleaned = response_text_raw.strip().replace(
-                "```json", "").replace("```", "").strip()
-
-            try:
-                analysis_array = json.loads(response_text_cleaned)
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error in batch response: {e}")
-                logger.debug(f"Raw response: {response_text_cleaned[:500]}...")
-                return []
-
-            if not isinstance(analysis_array, list):
-                logger.warning(f"Expected list but got {type(analysis_array)}")
-                return []
-
-            results = []
-
-            for i, analysis_json in enumerate(analysis_array):
-                if not isinstance(analysis_json, dict):
-                    continue
-
-                speaker_name = analysis_json.get('speaker_name', '').strip()
-                start_idx = analysis_json.get('start_idx')
-                end_idx = analysis_json.get('end_idx')
-                is_valid_member = analysis_json.get('is_valid_member', False)
-                is_substantial = analysis_json.get('is_substantial', False)
-
-                # Extract text locally using the indices provided by LLM
-                extracted_text = ""
-                if start_idx is not None and end_idx is not None and i < len(original_segments):
-                    segment_text = original_segments[i]
-                    start_idx = max(0, min(start_idx, len(segment_text)))
-                    end_idx = max(start_idx, min(end_idx, len(segment_text)))
-                    extracted_text = segment_text[start_idx:end_idx].strip()
-
-                # Clean speaker name from titles (LLM should have done this, but double-check)
-                if speaker_name:
-                    titles_to_remove = [
-                        '위원장', '부위원장', '의원', '장관', '차관', '의장', '부의장', '의사국장',
-                        '사무관', '국장', '서기관', '실장', '청장', '원장', '대변인', '비서관',
-                        '수석', '정무위원', '간사'
-                    ]
-                    for title in titles_to_remove:
-                        speaker_name = speaker_name.replace(title, '').strip()
-
-                # Validate speaker against assembly members
-                is_real_member = speaker_name in assembly_members if assembly_members and speaker_name else is_valid_member
-
-                should_ignore = any(
-                    ignored in speaker_name
-                    for ignored in IGNORED_SPEAKERS) if speaker_name else True
-
-                # Only include valid, substantial statements from real members
-                if (speaker_name and extracted_text and is_valid_member
-                        and is_substantial and not should_ignore
-                        and is_real_member and len(extracted_text) > 50):
-
-                    results.append({
-                        'speaker_name':
-                        speaker_name,
-                        'text':
-                        extracted_text,  # Use the locally extracted text
-                        'start_idx': start_idx,  # Include indices for further processing
-                        'end_idx': end_idx,
-                        'sentiment_score':
-                        analysis_json.get('sentiment_score', 0.0),
-                        'sentiment_reason':
-                        '◯ 구간 LLM 분석',
-                        'bill_relevance_score':
-                        analysis_json.get('bill_relevance_score', 0.0),
-                        'policy_categories': [],
-                        'policy_keywords': [],
-                        'bill_specific_keywords': [],
-                        'segment_index':
-                        batch_start_index + i
-                    })
-
-                    logger.info(
-                        f"✅ Extracted statement from {speaker_name}: {extracted_text[:100]}..."
-                    )
-                else:
-                    logger.debug(
-                        f"⚠️ Skipped statement - speaker: '{speaker_name}', valid: {is_valid_member}, substantial: {is_substantial}, real_member: {is_real_member}, text_len: {len(extracted_text) if extracted_text else 0}"
-                    )
 
             logger.info(
                 f"✅ Batch processed {len(results)} valid statements from {len(cleaned_segments)} segments"
             )
-            return results
+            return results, stream_state
 
         except Exception as e:
             processing_time = time.time() - start_time
             error_msg = str(e).lower()
 
+            if stream_state.get('objects'):
+                logger.warning(
+                    f"Batch stream failed after {stream_state['objects']} objects ({processing_time:.1f}s): {e}. "
+                    f"Keeping {len(results)} parsed statements.")
+                return results, stream_state
+
             # Determine error type and retry strategy
             is_retryable_error = False
             wait_time = 5  # Default wait time
@@ -2931,12 +4185,15 @@ def _execute_batch_analysis(prompt,
             if "500" in error_msg and "internal error" in error_msg:
                 is_retryable_error = True
                 wait_time = 10 + (attempt * 10)  # 10s, 20s, 30s
+                usage['wasted_tokens'] += prompt_tokens
                 logger.error(
                     f"Error in batch analysis after {processing_time:.1f}s: 500 An internal error has occurred. Please retry or report in https://developers.generativeai.google/guide/troubleshooting"
                 )
-            elif "504" in error_msg or "deadline" in error_msg or "timeout" in error_msg:
+            elif ("504" in error_msg or "deadline" in error_msg
+                  or "timeout" in error_msg or "timed out" in error_msg):
                 is_retryable_error = True
                 wait_time = 15 + (attempt * 15)  # 15s, 30s, 45s
+                usage['wasted_tokens'] += prompt_tokens
                 logger.warning(
                     f"⏰ BATCH TIMEOUT after {processing_time:.1f}s: {e}")
             elif "429" in error_msg or "quota" in error_msg or "rate" in error_msg:
@@ -2948,8 +4205,14 @@ def _execute_batch_analysis(prompt,
                 logger.error(
                     f"Non-retryable error in batch analysis after {processing_time:.1f}s: {e}"
                 )
-                return []
+                return None
 
+            remaining = _remaining_seconds(deadline)
+            if is_retryable_error and remaining <= wait_time:
+                logger.error(
+                    f"⏰ Batch analysis deadline reached ({remaining:.1f}s left); not retrying. Final error: {e}"
+                )
+                return None
             if is_retryable_error and attempt < max_retries:
                 logger.info(
                     f"Resting {wait_time}s before retry {attempt + 1}/{max_retries}..."
@@ -2960,11 +4223,108 @@ def _execute_batch_analysis(prompt,
                 logger.error(
                     f"Max retries ({max_retries}) exceeded for batch analysis. Final error: {e}"
                 )
-                return []
+                return None
             else:
-                return []
+                return None
 
-    return []
+    return None
+
+
+def _execute_batch_analysis(prompt,
+                            cleaned_segments,
+                            original_segments,
+                            assembly_members,
+                            batch_start_index,
+                            bill_name,
+                            max_retries=3,
+                            model_name=CASCADE_LITE_MODEL,
+                            escalation=None,
+                            deadline=None,
+                            usage=None):
+    """
+    Execute the batch analysis request with retry logic for API errors.
+
+    All attempts and retry waits share one deadline (a time.monotonic()
+    value, default BATCH_ANALYSIS_DEADLINE_SECONDS from now); a retry that
+    cannot start in time is not attempted.
+
+    The response is requested in JSON mode with a schema and consumed as a
+    stream. Results are keyed by the 구간 ID each object echoes, so a
+    dropped or merged segment cannot shift the others. Segments whose ID
+    did not come back (left out, invalid, or lost when the stream broke)
+    are re-submitted on their own in up to MISSING_SEGMENT_RETRY_ROUNDS
+    follow-up mini-batches; statements parsed before an error are kept.
+    Returns a (possibly empty) list of statements, or None if the request
+    failed without producing anything usable.
+
+    When an escalation set is given, segments whose analysis was malformed,
+    low-confidence or still missing after the follow-ups are added to it
+    (as batch_start_index-based indices) instead of being returned. usage
+    (see _new_batch_usage) collects follow-up and wasted token counts.
+    """
+    global client
+
+    if not get_gemini_client():
+        logger.error("Gemini client not initialized for batch analysis.")
+        return None
+    if deadline is None:
+        deadline = time.monotonic() + BATCH_ANALYSIS_DEADLINE_SECONDS
+    if usage is None:
+        usage = _new_batch_usage()
+    confidence_threshold = (CASCADE_CONFIDENCE_THRESHOLD
+                            if escalation is not None else None)
+
+    outcome = _request_batch_analysis(prompt, cleaned_segments,
+                                      original_segments, assembly_members,
+                                      batch_start_index, max_retries,
+                                      model_name, confidence_threshold,
+                                      deadline, usage)
+    if outcome is None:
+        return None
+    results, stream_state = outcome
+    answered = set(stream_state['answered'])
+    escalate_positions = set(stream_state['escalate'])
+    missing = {item['index']
+               for item in cleaned_segments} - answered - escalate_positions
+
+    for round_number in range(1, MISSING_SEGMENT_RETRY_ROUNDS + 1):
+        if not missing or _remaining_seconds(deadline) <= 0:
+            break
+        retry_prompt, retry_cleaned = build_batch_analysis_prompt(
+            original_segments, bill_name, positions=missing)
+        if not retry_cleaned:
+            break
+        logger.info(
+            f"🔁 Re-submitting {len(retry_cleaned)} missing segment IDs "
+            f"{sorted(item['index'] + 1 for item in retry_cleaned)} "
+            f"(round {round_number}/{MISSING_SEGMENT_RETRY_ROUNDS})")
+        usage['retry_requests'] += 1
+        usage['retry_segments'] += len(retry_cleaned)
+        usage['retry_tokens'] += estimate_tokens(retry_prompt)
+        outcome = _request_batch_analysis(retry_prompt, retry_cleaned,
+                                          original_segments,
+                                          assembly_members,
+                                          batch_start_index, 0, model_name,
+                                          confidence_threshold, deadline,
+                                          usage)
+        if outcome is None:
+            continue
+        retry_results, stream_state = outcome
+        results.extend(retry_results)
+        answered.update(stream_state['answered'])
+        escalate_positions.update(stream_state['escalate'])
+        missing -= answered | escalate_positions
+
+    if missing:
+        logger.warning(
+            f"⚠️ No valid analysis for segment IDs {sorted(p + 1 for p in missing)} "
+            f"of batch starting at {batch_start_index + 1}")
+        if escalation is not None:
+            escalate_positions.update(missing)
+    if escalation is not None:
+        escalation.update(batch_start_index + position
+                          for position in escalate_positions)
+    return results
 
 
 # Legacy single statement analysis functions removed - all processing now goes through batch analysis
@@ -2989,316 +4349,209 @@ def create_placeholder_bill_from_llm(session_obj, bill_title):
             # bill_no will be NULL (if your model allows it).
         })
     if created:
+        refresh_session_counters([session_obj.pk])
         logger.info(
             f"✨ LLM discovered and created placeholder for: '{bill_title[:60]}...'"
         )
     return bill
 
 
-@with_db_retry
-def update_bill_policy_data(bill_obj, segment_data):
-    """Update bill with policy analysis data from segmentation and create database mappings."""
-    try:
-        from .models import Category, Subcategory, BillCategoryMapping, BillSubcategoryMapping
-
-        # Extract data from segment
-        main_policy_category = segment_data.get('main_policy_category', '')
-        policy_subcategories = segment_data.get('policy_subcategories', [])
-        key_policy_phrases = segment_data.get('key_policy_phrases', [])
-        bill_specific_keywords = segment_data.get('bill_specific_keywords', [])
-        policy_stance = segment_data.get('policy_stance', 'moderate')
-        bill_analysis = segment_data.get('bill_analysis', '')
-
-        # Update bill fields
-        bill_obj.policy_categories = [main_policy_category
-                                      ] if main_policy_category else []
-        bill_obj.key_policy_phrases = key_policy_phrases
-        bill_obj.bill_specific_keywords = bill_specific_keywords
-
-        # Create category analysis text
-        if main_policy_category:
-            category_analysis = f"주요 정책 분야: {main_policy_category}"
-            if policy_subcategories:
-                category_analysis += f"\n세부 분야: {', '.join(policy_subcategories)}"
-            if bill_analysis:
-                category_analysis += f"\n분석: {bill_analysis}"
-            bill_obj.category_analysis = category_analysis
-
-        # Create policy keywords string
-        if key_policy_phrases:
-            bill_obj.policy_keywords = ', '.join(key_policy_phrases)
-
-        # Set LLM analysis metadata
-        bill_obj.llm_analysis_version = "v1.0"
-        bill_obj.llm_confidence_score = 0.8  # Default confidence
-
-        # Calculate policy impact score based on keywords and content
-        impact_score = len(key_policy_phrases) * 2 + len(
-            bill_specific_keywords)
-        bill_obj.policy_impact_score = min(10.0, impact_score)
-
-        bill_obj.save()
-
-        # Create category mappings in database
-        if main_policy_category:
-            try:
-                # Find or create main category
-                category_obj = Category.objects.filter(
-                    name=main_policy_category).first()
-                if category_obj:
-                    # Create or update bill-category mapping
-                    mapping, created = BillCategoryMapping.objects.update_or_create(
-                        bill=bill_obj,
-                        category=category_obj,
-                        defaults={
-                            'confidence_score': 0.8,
-                            'is_primary': True,
-                            'analysis_method': 'llm_discovery'
-                        })
-
-                    # Create subcategory mappings
-                    for subcat_name in policy_subcategories:
-                        subcategory_obj = Subcategory.objects.filter(
-                            category=category_obj, name=subcat_name).first()
-
-                        if subcategory_obj:
-                            subcat_mapping, sub_created = BillSubcategoryMapping.objects.update_or_create(
-                                bill=bill_obj,
-                                subcategory=subcategory_obj,
-                                defaults={
-                                    'relevance_score':
-                                    0.7,
-                                    'supporting_evidence':
-                                    bill_analysis,
-                                    'extracted_keywords':
-                                    bill_specific_keywords,
-                                    'policy_position':
-                                    'support' if policy_stance == 'progressive'
-                                    else 'neutral'
-                                })
-                            if sub_created:
-                                logger.info(
-                                    f"✅ Created subcategory mapping: {bill_obj.bill_nm[:30]}... -> {subcat_name}"
-                                )
-
-                    if created:
-                        logger.info(
-                            f"✅ Created category mapping: {bill_obj.bill_nm[:30]}... -> {main_policy_category}"
-                        )
-                else:
-                    logger.warning(
-                        f"⚠️ Category '{main_policy_category}' not found in database"
-                    )
-
-            except Exception as mapping_error:
-                logger.error(
-                    f"❌ Error creating category mappings: {mapping_error}")
-
-        logger.info(
-            f"✅ Updated policy data for bill: {bill_obj.bill_nm[:50]}...")
-
-    except Exception as e:
-        logger.error(f"❌ Error updating bill policy data: {e}")
-        logger.exception("Full traceback for bill policy update:")
-
-
-import json
-import logging
-
-
-def _attempt_json_repair(response_text):
-    """Attempt to repair common JSON issues in LLM responses."""
-    try:
-        # Remove any trailing incomplete content after the last complete object
-        response_text = response_text.strip()
+BILL_POLICY_FIELDS = [
+    'policy_categories', 'key_policy_phrases', 'bill_specific_keywords',
+    'category_analysis', 'policy_keywords', 'llm_analysis_version',
+    'llm_confidence_score', 'policy_impact_score', 'updated_at'
+]
 
-        # Find the last complete closing brace
-        last_brace = response_text.rfind('}')
-        if last_brace == -1:
-            return None
 
-        # Check if we have proper array closing
-        remaining = response_text[last_brace + 1:].strip()
-        if remaining and not remaining.startswith(']'):
-            # Try to find the last complete array closing
-            last_bracket = response_text.rfind(']')
-            if last_bracket > last_brace:
-                last_brace = last_bracket
+def _apply_bill_policy_data(bill_obj, segment_data):
+    """Set the policy fields of bill_obj from a discovery segment (in memory)."""
+    # Extract data from segment
+    main_policy_category = segment_data.get('main_policy_category', '')
+    policy_subcategories = segment_data.get('policy_subcategories', [])
+    key_policy_phrases = segment_data.get('key_policy_phrases', [])
+    bill_specific_keywords = segment_data.get('bill_specific_keywords', [])
+    policy_stance = segment_data.get('policy_stance', 'moderate')
+    bill_analysis = segment_data.get('bill_analysis', '')
+
+    # Update bill fields
+    bill_obj.policy_categories = [main_policy_category
+                                  ] if main_policy_category else []
+    bill_obj.key_policy_phrases = key_policy_phrases
+    bill_obj.bill_specific_keywords = bill_specific_keywords
+
+    # Create category analysis text
+    if main_policy_category:
+        category_analysis = f"주요 정책 분야: {main_policy_category}"
+        if policy_subcategories:
+            category_analysis += f"\n세부 분야: {', '.join(policy_subcategories)}"
+        if bill_analysis:
+            category_analysis += f"\n분석: {bill_analysis}"
+        bill_obj.category_analysis = category_analysis
+
+    # Create policy keywords string
+    if key_policy_phrases:
+        bill_obj.policy_keywords = ', '.join(key_policy_phrases)
+
+    # Set LLM analysis metadata
+    bill_obj.llm_analysis_version = LLM_PROMPT_VERSION
+    bill_obj.llm_confidence_score = 0.8  # Default confidence
+
+    # Calculate policy impact score based on keywords and content
+    impact_score = len(key_policy_phrases) * 2 + len(bill_specific_keywords)
+    bill_obj.policy_impact_score = min(10.0, impact_score)
+
+
+def _collect_bill_policy_mappings(bill_obj, segment_data, category_mappings,
+                                  subcategory_mappings, catalog):
+    """
+    Collect the category/subcategory mappings of a discovery segment for
+    bill_obj, keyed on their unique (bill, category) and (bill, subcategory)
+    pairs.
+    """
+    from .models import BillCategoryMapping, BillSubcategoryMapping
 
-        # Truncate to last complete structure
-        truncated = response_text[:last_brace + 1]
+    main_policy_category = segment_data.get('main_policy_category', '')
+    if not main_policy_category:
+        return
+    policy_subcategories = segment_data.get('policy_subcategories', [])
+    bill_specific_keywords = segment_data.get('bill_specific_keywords', [])
+    policy_stance = segment_data.get('policy_stance', 'moderate')
+    bill_analysis = segment_data.get('bill_analysis', '')
+    category_id, _ = resolve_category_ids(main_policy_category,
+                                          catalog=catalog)
+    if not category_id:
+        logger.warning(
+            f"⚠️ Category '{main_policy_category}' not found in database")
+        return
 
-        # Try to close any unclosed arrays or objects
-        open_braces = truncated.count('{') - truncated.count('}')
-        open_brackets = truncated.count('[') - truncated.count(']')
+    category_mappings[(bill_obj.pk, category_id)] = BillCategoryMapping(
+        bill=bill_obj,
+        category_id=category_id,
+        confidence_score=0.8,
+        is_primary=True,
+        analysis_method='llm_discovery')
+    for subcat_name in policy_subcategories:
+        _, subcategory_id = resolve_category_ids(main_policy_category,
+                                                 subcat_name,
+                                                 catalog=catalog)
+        if subcategory_id:
+            subcategory_mappings[(
+                bill_obj.pk, subcategory_id)] = BillSubcategoryMapping(
+                    bill=bill_obj,
+                    subcategory_id=subcategory_id,
+                    relevance_score=0.7,
+                    supporting_evidence=bill_analysis,
+                    extracted_keywords=bill_specific_keywords,
+                    policy_position='support'
+                    if policy_stance == 'progressive' else 'neutral')
 
-        # Add missing closing characters
-        for _ in range(open_braces):
-            truncated += '}'
-        for _ in range(open_brackets):
-            truncated += ']'
 
-        # Validate the structure
-        json.loads(truncated)
-        return truncated
+@with_db_retry
+def bulk_update_bill_policy_data(bill_segments):
+    """
+    Write the policy analysis of discovery segments to their bills in one
+    batch: a bulk_update of the bill policy fields and bulk upserts of the
+    category and subcategory mappings on their unique constraints.
+
+    bill_segments is a list of (bill, segment_data) pairs; when a bill
+    appears more than once its last segment wins, as with sequential
+    updates. The mappings are written in a savepoint, so category ids that
+    went stale cannot undo the bill update. Returns the number of bills
+    updated.
+    """
+    from .models import BillCategoryMapping, BillSubcategoryMapping
 
-    except Exception as e:
-        logger.debug(f"JSON repair attempt failed: {e}")
+    bills = {}
+    now = timezone.now()
+    for bill_obj, segment_data in bill_segments:
+        try:
+            _apply_bill_policy_data(bill_obj, segment_data)
+        except Exception as e:
+            logger.error(
+                f"❌ Error preparing policy data for bill {bill_obj.bill_nm[:50]}: {e}"
+            )
+            continue
+        bill_obj.updated_at = now  # bulk_update skips auto_now
+        bills[bill_obj.pk] = (bill_obj, segment_data)
+    if not bills:
+        return 0
+
+    def build_mappings(catalog):
+        category_mappings = {}
+        subcategory_mappings = {}
+        for bill_obj, segment_data in bills.values():
+            _collect_bill_policy_mappings(bill_obj, segment_data,
+                                          category_mappings,
+                                          subcategory_mappings, catalog)
+        if category_mappings or subcategory_mappings:
+            return list(category_mappings.values()), list(
+                subcategory_mappings.values())
         return None
 
+    def save_mappings(mappings):
+        category_mappings, subcategory_mappings = mappings
+        if category_mappings:
+            BillCategoryMapping.objects.bulk_create(
+                category_mappings,
+                batch_size=STATEMENT_BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=['bill', 'category'],
+                update_fields=[
+                    'confidence_score', 'is_primary', 'analysis_method'
+                ])
+        if subcategory_mappings:
+            BillSubcategoryMapping.objects.bulk_create(
+                subcategory_mappings,
+                batch_size=STATEMENT_BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=['bill', 'subcategory'],
+                update_fields=[
+                    'relevance_score', 'supporting_evidence',
+                    'extracted_keywords', 'policy_position'
+                ])
 
-def extract_statements_with_llm_discovery(full_text,
-                                          session_id,
-                                          known_bill_names,
-                                          session_obj,
-                                          debug=False):
+    with transaction.atomic():
+        Bill.objects.bulk_update([bill_obj for bill_obj, _ in bills.values()],
+                                 BILL_POLICY_FIELDS,
+                                 batch_size=STATEMENT_BULK_BATCH_SIZE)
+        mappings = save_category_links(build_mappings, save_mappings, [
+            BillCategoryMapping._meta.db_table,
+            BillSubcategoryMapping._meta.db_table
+        ]) or ([], [])
 
-    logger = logging.getLogger(__name__)
     logger.info(
-        f"🤖 Starting LLM discovery and segmentation for session: {session_id}")
+        f"✅ Updated policy data for {len(bills)} bills "
+        f"({len(mappings[0])} category, {len(mappings[1])} subcategory mappings)"
+    )
+    return len(bills)
 
-    if not reinitialize_gemini():
-        logger.error("❌ Gemini not available. Cannot perform LLM discovery.")
-        return []
 
-    # Load policy categories from code.txt file for enhanced analysis
-    policy_categories_from_db = {}
+def update_bill_policy_data(bill_obj, segment_data):
+    """Update one bill with policy analysis data from segmentation."""
     try:
-        logger.info(
-            "📁 Loading policy categories from: ../Additional_Files/code.txt")
-
-        code_file_path = Path("../Additional_Files/code.txt")
-        if not code_file_path.exists():
-            code_file_path = Path("Additional_Files/code.txt")
-
-        if code_file_path.exists():
-            with open(code_file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-
-            # Skip header line
-            lines = lines[1:] if lines else []
-
-            current_categories = {}
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    parts = line.split(',')
-                    if len(parts) >= 4:
-                        main_category = parts[0].strip()
-                        sub_category = parts[1].strip()
-                        main_description = parts[2].strip()
-
-                        if main_category not in current_categories:
-                            current_categories[main_category] = {
-                                'description': main_description,
-                                'subcategories': []
-                            }
-
-                        if sub_category and sub_category not in current_categories[
-                                main_category]['subcategories']:
-                            current_categories[main_category][
-                                'subcategories'].append(sub_category)
-
-                except Exception as line_error:
-                    logger.warning(
-                        f"Error parsing line: {line[:50]}... - {line_error}")
-                    continue
-
-            policy_categories_from_db = current_categories
-
-            # Summary logging
-            total_categories = len(policy_categories_from_db)
-            total_subcategories = sum(
-                len(cat['subcategories'])
-                for cat in policy_categories_from_db.values())
-
-            logger.info(f"📊 Category Summary:")
-            for cat_name, cat_data in policy_categories_from_db.items():
-                subcat_count = len(cat_data['subcategories'])
-                logger.info(f"  📂 {cat_name}: {subcat_count} subcategories")
-
-        else:
-            logger.warning(
-                "❌ code.txt file not found, using fallback categories")
-            policy_categories_from_db = {}
-
+        bulk_update_bill_policy_data([(bill_obj, segment_data)])
     except Exception as e:
-        logger.warning(f"Could not load policy categories from code.txt: {e}")
-        policy_categories_from_db = {}
-
-    # Prepare the list of known bills for the prompt
-    if known_bill_names:
-        known_bills_str = "\n".join(f"- {name}" for name in known_bill_names)
-    else:
-        known_bills_str = "No known bills were provided."
+        logger.error(f"❌ Error updating bill policy data: {e}")
+        logger.exception("Full traceback for bill policy update:")
 
-    # Create indexed categories for more efficient LLM responses
-    if policy_categories_from_db:
-        policy_categories_section = "**POLICY CATEGORIES (use index numbers):**\n"
-        category_index = 1
-        subcategory_index = 1
-        category_mapping = {}
-        subcategory_mapping = {}
-
-        for cat_name, cat_data in policy_categories_from_db.items():
-            policy_categories_section += f"{category_index}. {cat_name}\n"
-            category_mapping[category_index] = cat_name
-
-            if cat_data['subcategories']:
-                for subcat in cat_data[
-                        'subcategories'][:
-                                         3]:  # Limit to 3 subcategories for brevity
-                    policy_categories_section += f"  {subcategory_index}. {subcat}\n"
-                    subcategory_mapping[subcategory_index] = (category_index,
-                                                              subcat)
-                    subcategory_index += 1
-
-            category_index += 1
-    else:
-        policy_categories_section = """**POLICY CATEGORIES (use index numbers):**
-1. 경제정책
-2. 사회정책  
-3. 외교안보정책
-4. 법행정제도
-5. 과학기술정책
-6. 문화체육정책
-7. 인권소수자정책
-8. 지역균형정책
-9. 정치정책"""
-
-        # Fallback mapping
-        category_mapping = {
-            1: "경제정책",
-            2: "사회정책",
-            3: "외교안보정책",
-            4: "법행정제도",
-            5: "과학기술정책",
-            6: "문화체육정책",
-            7: "인권소수자정책",
-            8: "지역균형정책",
-            9: "정치정책"
-        }
-        subcategory_mapping = {}
 
-    prompt = f"""You are a world-class legislative analyst AI. Your task is to read a parliamentary transcript
+def _build_discovery_prompt_prefix(catalog):
+    """
+    Static part of the discovery prompt: instructions, the indexed category
+    list and the output format. It only changes with the category catalog,
+    so it comes first and can be served from the Gemini context cache.
+    """
+    return f"""You are a world-class legislative analyst AI. Your task is to read a parliamentary transcript
 and perfectly segment the entire discussion for all topics, while also analyzing policy content.
 
-**CONTEXT:**
-I already know about the following bills. You MUST find the discussion for these if they exist.
---- KNOWN BILLS ---
-{known_bills_str}
-
 **YOUR CRITICAL MISSION:**
-1. Read the entire transcript below.
+1. Read the entire transcript given after these instructions.
 2. Identify the exact start and end character index for the complete discussion of each **KNOWN BILL**.
 3. Discover any additional bills/topics not in the known list, and identify their discussion spans.
 4. For each bill/topic, analyze the policy content and categorize it using the categories below.
 5. Return a JSON object with segmentation AND detailed policy analysis.
 
-{policy_categories_section}
+{catalog.discovery_categories_section}
 
 **ANALYSIS REQUIREMENTS:**
 - For each bill/topic, identify the main policy category and up to 3 subcategories
@@ -3317,11 +4570,6 @@ I already know about the following bills. You MUST find the discussion for these
 - Use exact category names from the policy categories list above.
 - Return **ONLY** the final JSON object.
 
-**TRANSCRIPT:**
----
-{full_text}
----
-
 **REQUIRED JSON OUTPUT FORMAT (use category indices):**
 {{
   "bills_found": [
@@ -3353,110 +4601,343 @@ I already know about the following bills. You MUST find the discussion for these
 - Use subcategory_ids array (max 3 numbers)
 - Max 5 keywords per bill
 - stance: "P"=progressive, "C"=conservative, "M"=moderate
+
 """
-    try:
-        global client
-        if not client:
-            logger.error("Gemini client not initialized for LLM discovery.")
-            return []
 
-        estimated_tokens = len(prompt) // 3
 
-        if not gemini_rate_limiter.wait_if_needed(estimated_tokens):
-            logger.error(
-                "Rate limit timeout for LLM discovery. Falling back to keyword extraction."
-            )
-            return extract_statements_with_keyword_fallback(
-                full_text, session_id, debug)
+# Map-reduce discovery: long transcripts are split into overlapping windows
+# that are segmented in parallel and merged back into document-level spans
+DISCOVERY_WINDOW_CHARS = 60000
+DISCOVERY_WINDOW_OVERLAP_CHARS = 5000
+DISCOVERY_MAX_WORKERS = 4
+DISCOVERY_WINDOW_MAX_RETRIES = 2
+DISCOVERY_SPAN_MERGE_GAP_CHARS = 2000
+
+
+def split_transcript_windows(text,
+                             window_chars=DISCOVERY_WINDOW_CHARS,
+                             overlap_chars=DISCOVERY_WINDOW_OVERLAP_CHARS):
+    """
+    Split a transcript into overlapping windows for parallel discovery.
+
+    Window boundaries prefer a ◯ speaker marker so a speech is not cut in
+    half, looking back at most a quarter window from the hard limit. Each
+    window overlaps the previous one by roughly overlap_chars so that a
+    discussion crossing a boundary is seen whole by at least one window.
+    Returns a list of {'index', 'start', 'end'} dicts covering the text.
+    """
+    text_length = len(text)
+    if text_length <= window_chars:
+        return [{'index': 0, 'start': 0, 'end': text_length}]
+
+    overlap_chars = min(overlap_chars, window_chars // 2)
+    slack = window_chars // 4
+    windows = []
+    start = 0
+    while start < text_length:
+        end = min(start + window_chars, text_length)
+        if end < text_length:
+            marker = text.rfind('◯', end - slack, end)
+            if marker > start:
+                end = marker
+        windows.append({'index': len(windows), 'start': start, 'end': end})
+        if end >= text_length:
+            break
+
+        next_start = end - overlap_chars
+        marker = text.rfind('◯', next_start - slack // 2, next_start + 1)
+        if marker > start:
+            next_start = marker
+        start = max(next_start, start + 1)
+
+    return windows
+
+
+def _discover_spans_in_window(window,
+                              window_text,
+                              window_count,
+                              known_bills_str,
+                              prompt_prefix,
+                              max_retries=DISCOVERY_WINDOW_MAX_RETRIES):
+    """
+    Map step: run span discovery on a single transcript window.
+
+    Returns the parsed spans with start/end converted to absolute transcript
+    offsets, or None if the window failed after all retries. A response
+    that is cut off after producing spans is kept as-is.
+    """
+    if window_count > 1:
+        transcript_header = (
+            f"**TRANSCRIPT EXCERPT (part {window['index'] + 1} of {window_count}):**\n"
+            "This is one overlapping excerpt of a longer transcript. Report only "
+            "discussions that appear in this excerpt, even if they start or end "
+            "outside it, and give character indices relative to this excerpt.")
+    else:
+        transcript_header = "**TRANSCRIPT:**"
+
+    prompt = f"""**CONTEXT:**
+I already know about the following bills. You MUST find the discussion for these if they exist.
+--- KNOWN BILLS ---
+{known_bills_str}
+
+{transcript_header}
+---
+{window_text}
+---
+"""
+    estimated_tokens = (len(prompt_prefix) + len(prompt)) // 3
+
+    for attempt in range(max_retries + 1):
+        if not gemini_rate_limiter.wait_if_needed(estimated_tokens):
+            logger.error(
+                f"Rate limit timeout for discovery window {window['index'] + 1}/{window_count}"
+            )
+            return None
+
+        # JSON mode with a response schema, consumed as a stream so that
+        # spans parsed before an error or truncation are still usable
+        spans = []
+        parser = StreamingJSONArrayParser()
+        stream_error = None
+        try:
+            for chunk_text in _stream_gemini_text(
+                    prompt,
+                    response_schema=DISCOVERY_RESPONSE_SCHEMA,
+                    temperature=0.1,
+                    prompt_prefix=prompt_prefix):
+                for array_key, seg in parser.feed(chunk_text):
+                    if array_key in ('bills_found', 'newly_discovered'
+                                     ) and isinstance(seg, dict):
+                        seg['is_newly_discovered'] = (
+                            array_key == 'newly_discovered')
+                        spans.append(seg)
+        except Exception as e:
+            stream_error = e
+
+        if spans or (stream_error is None and parser.is_complete):
+            gemini_rate_limiter.record_request(estimated_tokens,
+                                               success=stream_error is None)
+            if stream_error is not None or not parser.is_complete:
+                logger.warning(
+                    f"⚠️ Discovery window {window['index'] + 1}/{window_count} incomplete "
+                    f"({stream_error or 'truncated'}); continuing with {len(spans)} parsed spans"
+                )
+            for seg in spans:
+                for key in ('start_index', 'end_index'):
+                    try:
+                        seg[key] = window['start'] + max(0, int(seg.get(key, 0)))
+                    except (TypeError, ValueError):
+                        seg[key] = window['start']
+                    seg[key] = min(seg[key], window['end'])
+            return spans
+
+        gemini_rate_limiter.record_error("llm_discovery_error")
+        wait_time = min(5 * (2**attempt), 30)
+        logger.warning(
+            f"Discovery window {window['index'] + 1}/{window_count} failed "
+            f"(attempt {attempt + 1}/{max_retries + 1}): {stream_error or 'empty response'}"
+        )
+        if attempt < max_retries:
+            time.sleep(wait_time)
+
+    return None
+
+
+def merge_discovered_spans(spans,
+                           known_bill_names=None,
+                           max_gap=DISCOVERY_SPAN_MERGE_GAP_CHARS):
+    """
+    Reduce step: reconcile spans reported by overlapping windows.
+
+    Spans for the same bill (compared on whitespace-insensitive name) that
+    overlap or lie within max_gap characters of each other are merged into
+    one span covering both; the longer span's analysis is kept and
+    keywords/subcategories are unioned. A bill one window calls "new" but
+    that matches a known bill name is reported as known.
+    """
+
+    def normalize(name):
+        return re.sub(r'\s+', '', name or '').lower()
+
+    known_names = {
+        normalize(name): name
+        for name in (known_bill_names or [])
+    }
+    by_bill = {}
+    for seg in spans:
+        key = normalize(seg.get('bill_name'))
+        if not key:
+            continue
+        by_bill.setdefault(key, []).append(seg)
+
+    merged = []
+    for key, bill_spans in by_bill.items():
+        bill_spans.sort(key=lambda seg: seg.get('start_index', 0))
+        current = None
+        for seg in bill_spans:
+            if current is None:
+                current = dict(seg)
+                continue
+            if seg['start_index'] <= current['end_index'] + max_gap:
+                longer = seg if (
+                    seg['end_index'] - seg['start_index'] >
+                    current['end_index'] - current['start_index']) else current
+                combined = dict(longer)
+                combined['start_index'] = current['start_index']
+                combined['end_index'] = max(current['end_index'],
+                                            seg['end_index'])
+                combined['keywords'] = list(
+                    dict.fromkeys(
+                        current.get('keywords', []) +
+                        seg.get('keywords', [])))[:5]
+                combined['subcategory_ids'] = list(
+                    dict.fromkeys(
+                        current.get('subcategory_ids', []) +
+                        seg.get('subcategory_ids', [])))[:3]
+                combined['is_newly_discovered'] = (
+                    current.get('is_newly_discovered', False)
+                    and seg.get('is_newly_discovered', False))
+                current = combined
+            else:
+                merged.append(current)
+                current = dict(seg)
+        if current is not None:
+            merged.append(current)
+
+    for seg in merged:
+        known_name = known_names.get(normalize(seg.get('bill_name')))
+        if known_name:
+            seg['bill_name'] = known_name
+            seg['is_newly_discovered'] = False
 
-        # Use new google.genai structure with more conservative settings
-        response = client.models.generate_content(
-            model="gemini-2.0-flash-lite",
-            contents=[prompt],
-            config=types.GenerateContentConfig(
-                response_mime_type="text/plain",
-                temperature=0.1))  # Reduced since we're using compact format
-        gemini_rate_limiter.record_request(estimated_tokens, success=True)
-
-        # Check if response exists and has text
-        if not response or not hasattr(response, 'text') or not response.text:
-            logger.error(
-                "❌ No response or empty response from LLM discovery. Falling back to keyword extraction."
-            )
-            return extract_statements_with_keyword_fallback(
-                full_text, session_id, debug)
+    merged.sort(key=lambda seg: seg.get('start_index', 0))
+    return merged
 
-        # Strip markdown fences if present
-        response_text = response.text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text.replace("```json",
-                                                  "").replace("```",
-                                                              "").strip()
-        elif response_text.startswith("```"):
-            response_text = response_text.split("```", 2)[-1].strip()
 
-        # Print/log the raw LLM response for debugging
-        logger.info(
-            f"🐛 DEBUG: Raw LLM response length: {len(response_text)} chars")
+def discover_bill_spans(full_text, known_bill_names, prompt_prefix):
+    """
+    Map-reduce span discovery over transcript windows.
+
+    Windows are processed concurrently (bounded by DISCOVERY_MAX_WORKERS and
+    the shared Gemini rate limiter) and merged by merge_discovered_spans.
+    Returns the merged spans with absolute offsets, or None when every
+    window failed.
+    """
+    if known_bill_names:
+        known_bills_str = "\n".join(f"- {name}" for name in known_bill_names)
+    else:
+        known_bills_str = "No known bills were provided."
+
+    windows = split_transcript_windows(full_text, DISCOVERY_WINDOW_CHARS,
+                                       DISCOVERY_WINDOW_OVERLAP_CHARS)
+    window_count = len(windows)
+    if window_count > 1:
         logger.info(
-            f"🐛 DEBUG: Raw LLM response (first 1000 chars): {response_text[:1000]}"
+            f"🪟 Splitting transcript ({len(full_text)} chars) into {window_count} discovery windows"
         )
-        if len(response_text) > 1000:
-            logger.info(
-                f"🐛 DEBUG: Raw LLM response (last 500 chars): {response_text[-500:]}"
-            )
 
-        # Check if response is empty or invalid
-        if not response_text or len(response_text) < 10:
-            logger.error(
-                f"❌ Empty or too short response from LLM discovery ({len(response_text)} chars). Falling back to keyword extraction."
-            )
-            return extract_statements_with_keyword_fallback(
-                full_text, session_id, debug)
+    window_results = {}
+    with ThreadPoolExecutor(
+            max_workers=min(DISCOVERY_MAX_WORKERS, window_count)) as executor:
+        futures = {
+            executor.submit(_discover_spans_in_window, window,
+                            full_text[window['start']:window['end']],
+                            window_count, known_bills_str, prompt_prefix):
+            window
+            for window in windows
+        }
+        for future in as_completed(futures):
+            window = futures[future]
+            try:
+                window_results[window['index']] = future.result()
+            except Exception as e:
+                logger.error(
+                    f"❌ Discovery window {window['index'] + 1}/{window_count} crashed: {e}"
+                )
+                window_results[window['index']] = None
 
-        try:
-            data = json.loads(response_text)
-        except json.JSONDecodeError as json_err:
-            logger.error(f"❌ JSON decode error in LLM discovery: {json_err}")
-            logger.error(
-                f"Raw response (first 500 chars): {response_text[:500]}...")
+    failed_windows = [
+        index for index, result in window_results.items() if result is None
+    ]
+    if len(failed_windows) == window_count:
+        return None
+    if failed_windows:
+        logger.warning(
+            f"⚠️ {len(failed_windows)}/{window_count} discovery windows failed: "
+            f"{sorted(index + 1 for index in failed_windows)}")
 
-            # Try to fix common JSON issues
-            fixed_response = _attempt_json_repair(response_text)
-            if fixed_response:
-                try:
-                    data = json.loads(fixed_response)
-                    logger.info(
-                        "✅ Successfully repaired and parsed JSON response")
-                except json.JSONDecodeError:
-                    logger.error("❌ JSON repair attempt failed")
-                    logger.info("🔄 Falling back to keyword-based extraction.")
-                    return extract_statements_with_keyword_fallback(
-                        full_text, session_id, debug)
-            else:
-                logger.info("🔄 Falling back to keyword-based extraction.")
-                return extract_statements_with_keyword_fallback(
-                    full_text, session_id, debug)
-        if not isinstance(data, dict):
-            logger.error(
-                "LLM discovery did not return a JSON object. Falling back to keyword extraction."
-            )
-            return extract_statements_with_keyword_fallback(
-                full_text, session_id, debug)
+    all_spans = [
+        seg for index in sorted(window_results)
+        for seg in (window_results[index] or [])
+    ]
+    merged = merge_discovered_spans(all_spans, known_bill_names)
+    logger.info(
+        f"🐛 DEBUG: LLM discovery found {len(all_spans)} spans in {window_count} windows, "
+        f"{len(merged)} after merging")
+    return merged
+
+
+def extract_statements_with_llm_discovery(full_text,
+                                          session_id,
+                                          known_bill_names,
+                                          session_obj,
+                                          debug=False):
+
+    logger = logging.getLogger(__name__)
+    logger.info(
+        f"🤖 Starting LLM discovery and segmentation for session: {session_id}")
+
+    if not reinitialize_gemini():
+        logger.error("❌ Gemini not available. Cannot perform LLM discovery.")
+        return []
+
+    catalog = get_category_catalog()
+    category_mapping = catalog.category_index
+    subcategory_mapping = catalog.subcategory_index
+    prompt_prefix = catalog.get_prompt_prefix('discovery',
+                                              _build_discovery_prompt_prefix)
+
+    try:
+        global client
+        if not client:
+            logger.error("Gemini client not initialized for LLM discovery.")
+            return []
 
-        # Validate required structure
-        if 'bills_found' not in data and 'newly_discovered' not in data:
+        checkpoints = None if debug else get_active_checkpoints(session_id)
+        discovery_key = make_batch_key(
+            LLMBatchCheckpoint.KIND_DISCOVERY, catalog.version, None,
+            [full_text] + list(known_bill_names or []))
+        stored = checkpoints.get_done(discovery_key) if checkpoints else None
+        if stored is not None:
+            spans = stored['spans']
+            logger.info(
+                f"♻️ Restored {len(spans)} discovered spans from checkpoint")
+        else:
+            if checkpoints:
+                checkpoints.start(discovery_key,
+                                  LLMBatchCheckpoint.KIND_DISCOVERY,
+                                  estimated_tokens=estimate_tokens(full_text))
+            spans = discover_bill_spans(full_text, known_bill_names,
+                                        prompt_prefix)
+            if checkpoints:
+                if spans is None:
+                    checkpoints.fail(discovery_key,
+                                     "discovery failed for every window")
+                else:
+                    checkpoints.finish(discovery_key, {'spans': spans})
+        if spans is None:
             logger.error(
-                "LLM discovery response missing required fields. Falling back to keyword extraction."
+                "❌ LLM discovery failed for every transcript window. Falling back to keyword extraction."
             )
             return extract_statements_with_keyword_fallback(
                 full_text, session_id, debug)
 
-        # Ensure arrays exist
-        if 'bills_found' not in data:
-            data['bills_found'] = []
-        if 'newly_discovered' not in data:
-            data['newly_discovered'] = []
+        data = {
+            'bills_found':
+            [seg for seg in spans if not seg.get('is_newly_discovered')],
+            'newly_discovered':
+            [seg for seg in spans if seg.get('is_newly_discovered')]
+        }
 
         # Resolve category indices back to names and merge segments
         all_segments = []
@@ -3517,15 +4998,20 @@ I already know about the following bills. You MUST find the discussion for these
         logger.info(
             f"✅ LLM segmented {len(all_segments)} total discussion topics.")
 
-        # Create placeholders for newly discovered bills with policy analysis
+        # Create placeholders for newly discovered bills; their policy
+        # analysis is written with the known bills' in one batch below
+        bill_policy_updates = []
+        session_bills = {}
         if not debug:
             for segment in all_segments:
                 if segment.get("is_newly_discovered"):
                     bill_obj = create_placeholder_bill_from_llm(
                         session_obj, segment["bill_name"])
-                    # Update bill with policy analysis from segmentation
                     if bill_obj:
-                        update_bill_policy_data(bill_obj, segment)
+                        bill_policy_updates.append((bill_obj, segment))
+            for bill_obj in Bill.objects.filter(
+                    session=session_obj).order_by('pk'):
+                session_bills.setdefault(bill_obj.bill_nm.lower(), bill_obj)
 
         # Process each segment to extract statements and update policy data
         all_statements = []
@@ -3554,17 +5040,9 @@ I already know about the following bills. You MUST find the discussion for these
 
             # Update policy data for known bills as well
             if not debug and not segment.get("is_newly_discovered"):
-                try:
-                    # Find the existing bill and update its policy data
-                    existing_bill = Bill.objects.filter(
-                        session=session_obj,
-                        bill_nm__iexact=bill_name).first()
-                    if existing_bill:
-                        update_bill_policy_data(existing_bill, segment)
-                except Exception as e:
-                    logger.error(
-                        f"Could not update policy data for known bill '{bill_name}': {e}"
-                    )
+                existing_bill = session_bills.get(bill_name.lower())
+                if existing_bill:
+                    bill_policy_updates.append((existing_bill, segment))
 
             segment_text = full_text[start:end]
 
@@ -3583,10 +5061,20 @@ I already know about the following bills. You MUST find the discussion for these
 
             all_statements.extend(statements_in_segment)
 
+        if bill_policy_updates:
+            try:
+                bulk_update_bill_policy_data(bill_policy_updates)
+            except Exception as e:
+                logger.error(
+                    f"❌ Could not update bill policy data for session {session_id}: {e}"
+                )
+
+        session_report = pop_session_cascade_report(session_id)
+        if session_report:
+            log_cascade_report(session_report, f"session {session_id}")
         return all_statements
 
     except Exception as e:
-        gemini_rate_limiter.record_error("llm_discovery_error")
         logger.error(
             f"❌ Critical error during LLM discovery and segmentation: {e}")
         logger.exception("Full traceback for LLM discovery:")
@@ -3623,8 +5111,8 @@ def process_session_pdf(self=None, session_id=None, force=False, debug=False):
         )
         return
 
-    if Statement.objects.filter(
-            session=session).exists() and not force and not debug:
+    if Statement.objects.filter(session=session).exists(
+    ) and not force and not debug and not has_unfinished_run(session_id):
         logger.info(
             f"Statements already exist for session {session_id} and not in force/debug mode. Skipping."
         )
@@ -3634,33 +5122,8 @@ def process_session_pdf(self=None, session_id=None, force=False, debug=False):
         logger.debug(f"🐛 DEBUG: Simulating PDF processing for {session_id}.")
         return
 
-    temp_pdf_path = None
     try:
-        logger.info(f"📥 Downloading PDF from: {session.down_url}")
-        response = requests.get(session.down_url, timeout=120, stream=True)
-        response.raise_for_status()
-
-        temp_dir = Path(getattr(settings, "TEMP_FILE_DIR", "temp_files"))
-        temp_dir.mkdir(parents=True, exist_ok=True)
-        temp_pdf_path = temp_dir / f"session_{session_id}_{int(time.time())}.pdf"
-
-        with open(temp_pdf_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        logger.info(
-            f"📥 PDF for session {session_id} downloaded to {temp_pdf_path}")
-
-        full_text = ""
-        with pdfplumber.open(temp_pdf_path) as pdf:
-            pages = pdf.pages
-            logger.info(f"Extracting text from {len(pages)} pages...")
-            for i, page in enumerate(pages):
-                page_text = page.extract_text(x_tolerance=1, y_tolerance=3)
-                if page_text:
-                    full_text += page_text + "\n"
-                if (i + 1) % 20 == 0:
-                    logger.info(f"Processed {i+1}/{len(pages)} pages...")
-        logger.info(f"📄 Extracted ~{len(full_text)} chars from PDF.")
+        full_text = download_session_transcript(session)
 
         if not full_text.strip():
             logger.warning(
@@ -3691,14 +5154,38 @@ def process_session_pdf(self=None, session_id=None, force=False, debug=False):
         logger.exception(f"Full traceback for PDF processing {session_id}:")
         if self:
             self.retry(exc=e)
-    finally:
-        if temp_pdf_path and temp_pdf_path.exists():
-            try:
-                temp_pdf_path.unlink()
-                logger.info(f"🗑️ Deleted temporary PDF: {temp_pdf_path}")
-            except OSError as e_del:
-                logger.error(
-                    f"Error deleting temporary PDF {temp_pdf_path}: {e_del}")
+
+
+LLM_BATCH_POLL_SECONDS = 300
+
+
+@shared_task(bind=True,
+             max_retries=288,
+             default_retry_delay=LLM_BATCH_POLL_SECONDS)
+def poll_llm_batch_job(self=None, job_id=None):
+    """Poll an offline LLM batch job and ingest its results once it succeeds."""
+    from . import batch_jobs
+
+    if not job_id:
+        logger.error("job_id is required for poll_llm_batch_job.")
+        return None
+
+    job = batch_jobs.refresh_batch_job(job_id)
+    if not job:
+        return None
+
+    if job['state'] in batch_jobs.ACTIVE_JOB_STATES:
+        logger.info(f"⏳ Batch job {job_id} still {job['state']}")
+        if self:
+            raise self.retry(countdown=LLM_BATCH_POLL_SECONDS)
+        return job['state']
+
+    if job['state'] == batch_jobs.JOB_SUCCEEDED:
+        if batch_jobs.ingest_batch_results(job_id) is not None:
+            return batch_jobs.JOB_INGESTED
+    elif job['state'] == batch_jobs.JOB_FAILED:
+        logger.error(f"❌ Batch job {job_id} failed")
+    return job['state']
 
 
 def process_extracted_statements_data(statements_data_list,
@@ -3706,7 +5193,15 @@ def process_extracted_statements_data(statements_data_list,
                                       full_text,
                                       debug=False):
     """Saves a list of processed statement data (dictionaries) to the database.
-    Now accepts start/end indices and extracts text locally."""
+
+    Bulk path: the session's speakers and bills are preloaded (bills are
+    matched in memory by SessionBillMatcher), hashes are computed in Python
+    and checked with one IN query per chunk, and new statements and their
+    categories are written with bulk_create, so a session costs a handful
+    of round trips however many statements it has.
+    The unique (session, text_hash) constraint settles races between
+    workers: conflicting inserts are ignored.
+    full_text is only sliced for items without a 'text' field."""
     if debug:
         logger.debug(
             f"🐛 DEBUG: Would process {len(statements_data_list)} statement data items. Not saving to DB."
@@ -3718,34 +5213,6 @@ def process_extracted_statements_data(statements_data_list,
             f"No statement data to save for session {session_obj.conf_id}.")
         return
 
-    @with_db_retry
-    def _check_statement_exists(session_obj, speaker_obj, statement_text):
-        return Statement.objects.filter(session=session_obj,
-                                        speaker=speaker_obj,
-                                        text_hash=Statement.calculate_hash(
-                                            statement_text,
-                                            speaker_obj.naas_cd,
-                                            session_obj.conf_id)).exists()
-
-    @with_db_retry
-    def _find_bill_for_statement(session_obj, assoc_bill_name_from_data):
-        associated_bill_obj = Bill.objects.filter(
-            session=session_obj,
-            bill_nm__iexact=assoc_bill_name_from_data).first()
-        if not associated_bill_obj:
-            bill_candidates = Bill.objects.filter(
-                session=session_obj,
-                bill_nm__icontains=assoc_bill_name_from_data.split(
-                    '(')[0].strip())
-            if bill_candidates.count() == 1:
-                associated_bill_obj = bill_candidates.first()
-        return associated_bill_obj
-
-    @with_db_retry
-    def _save_statement(new_statement):
-        new_statement.save()
-        return new_statement
-
     def _is_valid_statement_content(text):
         """Validate that extracted text is actual statement content, not headers/metadata."""
         if not text:
@@ -3843,170 +5310,297 @@ def process_extracted_statements_data(statements_data_list,
 
         return True
 
-    created_count = 0
+    # Validate and extract texts before touching the database
+    candidates = []
     skipped_invalid_count = 0
-    logger.info(
-        f"Attempting to save {len(statements_data_list)} statements for session {session_obj.conf_id}."
-    )
     for stmt_data in statements_data_list:
-        try:
-            speaker_name = stmt_data.get('speaker_name', '').strip()
+        speaker_name = (stmt_data.get('speaker_name') or '').strip()
+
+        # LLM statements carry their text; start/end indices are relative to
+        # their ◯ segment, so full_text is only sliced for bare index pairs
+        statement_text = (stmt_data.get('text') or '').strip()
+        start_idx = stmt_data.get('start_idx')
+        end_idx = stmt_data.get('end_idx')
+        if not statement_text and start_idx is not None and end_idx is not None and full_text:
+            start_idx = max(0, min(start_idx, len(full_text)))
+            end_idx = max(start_idx, min(end_idx, len(full_text)))
+            statement_text = full_text[start_idx:end_idx].strip()
+
+        if not _is_valid_statement_content(statement_text):
+            logger.debug(
+                f"Skipping invalid statement content: {statement_text[:100]}..."
+            )
+            skipped_invalid_count += 1
+            continue
 
-            # Extract text using start/end indices if provided, otherwise use 'text' field
-            start_idx = stmt_data.get('start_idx')
-            end_idx = stmt_data.get('end_idx')
+        if not speaker_name:
+            logger.warning(
+                f"Skipping statement with missing speaker for session {session_obj.conf_id}."
+            )
+            continue
+        candidates.append((stmt_data, speaker_name, statement_text))
 
-            if start_idx is not None and end_idx is not None and full_text:
-                # Extract text locally using indices
-                start_idx = max(0, min(start_idx, len(full_text)))
-                end_idx = max(start_idx, min(end_idx, len(full_text)))
-                statement_text = full_text[start_idx:end_idx].strip()
-                logger.debug(
-                    f"Extracted text from indices [{start_idx}:{end_idx}]: {len(statement_text)} chars"
-                )
-            else:
-                # Fallback to provided text field
-                statement_text = stmt_data.get('text', '').strip()
+    logger.info(
+        f"Attempting to save {len(candidates)} statements for session {session_obj.conf_id} "
+        f"({skipped_invalid_count} invalid content items skipped).")
+    if not candidates:
+        return
 
-            # Validate statement content
-            if not _is_valid_statement_content(statement_text):
-                logger.debug(
-                    f"Skipping invalid statement content: {statement_text[:100]}..."
-                )
-                skipped_invalid_count += 1
-                continue
+    speakers = preload_speakers({name for _, name, _ in candidates}, debug)
+    bill_matcher = SessionBillMatcher.for_session(session_obj)
 
-            if not speaker_name or not statement_text:
-                logger.warning(
-                    f"Skipping statement with missing speaker ('{speaker_name}') or text for session {session_obj.conf_id}."
-                )
-                continue
+    # Hash in Python; one IN query per chunk finds what is already stored
+    rows = []
+    seen_hashes = set()
+    for stmt_data, speaker_name, statement_text in candidates:
+        speaker_obj = speakers.get(speaker_name)
+        if not speaker_obj:
+            logger.warning(
+                f"⚠️ Could not get/create speaker: {speaker_name}. Skipping statement."
+            )
+            continue
+        text_hash = Statement.calculate_hash(statement_text,
+                                             speaker_obj.naas_cd,
+                                             session_obj.conf_id)
+        if text_hash in seen_hashes:
+            continue
+        seen_hashes.add(text_hash)
+        rows.append((stmt_data, speaker_obj, statement_text, text_hash))
+
+    existing_hashes = _fetch_existing_statement_hashes(session_obj,
+                                                       list(seen_hashes))
+    session_era = session_obj.get_era_number()
+    new_statements = []
+    statement_categories = []
+    for stmt_data, speaker_obj, statement_text, text_hash in rows:
+        if text_hash in existing_hashes:
+            logger.debug(
+                f"ℹ️ Identical statement by {speaker_obj.naas_nm} (hash match) already exists for session {session_obj.conf_id}. Skipping."
+            )
+            continue
 
-            speaker_obj = get_or_create_speaker(
-                speaker_name,
-                debug=debug)  # Debug here should match overall debug
-            if not speaker_obj:
-                logger.warning(
-                    f"⚠️ Could not get/create speaker: {speaker_name}. Skipping statement."
-                )
-                continue
+        assoc_bill_name_from_data = stmt_data.get(
+            'associated_bill_name'
+        )  # Set during segmentation/full_text processing
+        associated_bill_obj = None
+        if assoc_bill_name_from_data and assoc_bill_name_from_data not in [
+                "General Discussion / Full Transcript",
+                "Unknown Bill Segment", "General Discussion"
+        ]:
+            associated_bill_obj = bill_matcher.match(
+                assoc_bill_name_from_data)
+
+        # text_hash and the denormalized party/date/era are set here because
+        # bulk_create skips the pre_save signal
+        new_statement = Statement(
+            session=session_obj,
+            bill=associated_bill_obj,
+            speaker=speaker_obj,
+            text=statement_text,
+            text_hash=text_hash,
+            party_id=speaker_obj.current_party_id,
+            conf_dt=session_obj.conf_dt,
+            era=session_era,
+            sentiment_score=stmt_data.get('sentiment_score', 0.0),
+            sentiment_reason=stmt_data.get('sentiment_reason',
+                                           'Analysis not fully run'),
+            sentiment_provisional=stmt_data.get('sentiment_provisional',
+                                                False),
+            analysis_version=stmt_data.get('analysis_version', ''),
+            bill_relevance_score=stmt_data.get('bill_relevance_score', 0.0))
+        new_statements.append(new_statement)
+        if stmt_data.get('policy_categories'):
+            statement_categories.append(
+                (new_statement, stmt_data['policy_categories']))
+
+    duplicate_count = len(candidates) - len(new_statements)
+    if new_statements:
+        _bulk_save_statements(session_obj, new_statements,
+                              statement_categories)
 
-            # Check for existing identical statement (text, speaker, session) to avoid duplicates from reprocessing
-            if _check_statement_exists(session_obj, speaker_obj,
-                                       statement_text):
-                logger.info(
-                    f"ℹ️ Identical statement by {speaker_name} (hash match) already exists for session {session_obj.conf_id}. Skipping."
-                )
-                continue
+    logger.info(
+        f"🎉 Saved {len(new_statements)} new statements for session {session_obj.conf_id}. "
+        f"Skipped {skipped_invalid_count} invalid content items and {duplicate_count} duplicates or unknown speakers."
+    )
 
-            associated_bill_obj = None
-            assoc_bill_name_from_data = stmt_data.get(
-                'associated_bill_name'
-            )  # Set during segmentation/full_text processing
-            if assoc_bill_name_from_data and assoc_bill_name_from_data not in [
-                    "General Discussion / Full Transcript",
-                    "Unknown Bill Segment", "General Discussion"
-            ]:
-                # Try to find the Bill object with improved matching
-                try:
-                    # First try exact match
-                    associated_bill_obj = Bill.objects.filter(
-                        session=session_obj,
-                        bill_nm__iexact=assoc_bill_name_from_data).first()
-
-                    if not associated_bill_obj:
-                        # Try partial match by removing common suffixes/prefixes
-                        clean_name = assoc_bill_name_from_data.split(
-                            '(')[0].strip()
-                        clean_name = clean_name.replace('의안', '').replace(
-                            '법률안', '').strip()
-
-                        # Try contains match
-                        bill_candidates = Bill.objects.filter(
-                            session=session_obj, bill_nm__icontains=clean_name)
-
-                        if bill_candidates.count() == 1:
-                            associated_bill_obj = bill_candidates.first()
-                            logger.info(
-                                f"✅ Found bill match via partial matching: '{assoc_bill_name_from_data}' -> '{associated_bill_obj.bill_nm}'"
-                            )
-                        elif bill_candidates.count() > 1:
-                            # Try to find best match by similarity
-                            best_match = None
-                            best_score = 0
-                            for candidate in bill_candidates:
-                                # Simple similarity check - count common words
-                                data_words = set(
-                                    assoc_bill_name_from_data.lower().split())
-                                candidate_words = set(
-                                    candidate.bill_nm.lower().split())
-                                common_words = len(
-                                    data_words.intersection(candidate_words))
-                                total_words = len(
-                                    data_words.union(candidate_words))
-                                similarity = common_words / total_words if total_words > 0 else 0
-
-                                if similarity > best_score and similarity > 0.5:  # At least 50% similarity
-                                    best_score = similarity
-                                    best_match = candidate
-
-                            if best_match:
-                                associated_bill_obj = best_match
-                                logger.info(
-                                    f"✅ Found best bill match (similarity: {best_score:.2f}): '{assoc_bill_name_from_data}' -> '{associated_bill_obj.bill_nm}'"
-                                )
-                            else:
-                                logger.warning(
-                                    f"Multiple ambiguous bill matches for '{assoc_bill_name_from_data}' in session {session_obj.conf_id}. Not associating."
-                                )
-                    else:
-                        logger.info(
-                            f"✅ Found exact bill match: '{assoc_bill_name_from_data}'"
-                        )
 
-                except Exception as e_bill_find:
-                    logger.warning(
-                        f"⚠️ Error finding bill '{assoc_bill_name_from_data}' for statement: {e_bill_find}"
-                    )
+STATEMENT_BULK_BATCH_SIZE = 500
+
 
-            # Construct statement model instance
-            new_statement = Statement(
+@with_db_retry
+def _fetch_existing_statement_hashes(session_obj, text_hashes):
+    existing = set()
+    for i in range(0, len(text_hashes), STATEMENT_BULK_BATCH_SIZE):
+        existing.update(
+            Statement.objects.filter(
                 session=session_obj,
-                bill=associated_bill_obj,
-                speaker=speaker_obj,
-                text=statement_text,
-                sentiment_score=stmt_data.get('sentiment_score', 0.0),
-                sentiment_reason=stmt_data.get('sentiment_reason',
-                                               'Analysis not fully run'),
-                bill_relevance_score=stmt_data.get('bill_relevance_score',
-                                                   0.0))
-            new_statement = _save_statement(
-                new_statement
-            )  # This also calculates and saves text_hash via pre_save signal
-            created_count += 1
-
-            bill_info_log = f" (Bill: {associated_bill_obj.bill_nm[:20]}...)" if associated_bill_obj else f" (Assoc. Bill Name: {assoc_bill_name_from_data[:20]})" if assoc_bill_name_from_data else ""
-            logger.info(
-                f"✨ Created statement ({new_statement.id}) for {speaker_name}{bill_info_log}: {statement_text[:40]}..."
-            )
+                text_hash__in=text_hashes[i:i + STATEMENT_BULK_BATCH_SIZE]).
+            values_list('text_hash', flat=True))
+    return existing
 
-            if stmt_data.get('policy_categories'):
-                create_statement_categories(new_statement,
-                                            stmt_data['policy_categories'])
 
-        except Exception as e_stmt_save:
-            logger.error(
-                f"❌ Error creating statement object in DB: {e_stmt_save} for speaker {stmt_data.get('speaker_name', 'N/A')}"
+@with_db_retry
+def _bulk_save_statements(session_obj, new_statements, statement_categories):
+    """
+    INSERT ... ON CONFLICT DO NOTHING against the (session, text_hash)
+    constraint, so rows a concurrent worker stored first are skipped. Primary
+    keys are not returned for ignored conflicts, so they are read back by
+    hash before the category links are written. The session and bill
+    counters are recounted in the same transaction.
+    """
+    with transaction.atomic():
+        Statement.objects.bulk_create(new_statements,
+                                      batch_size=STATEMENT_BULK_BATCH_SIZE,
+                                      ignore_conflicts=True)
+        refresh_session_counters([session_obj.pk])
+        refresh_bill_counters(
+            [statement.bill_id for statement in new_statements])
+        if not statement_categories:
+            return
+        text_hashes = [statement.text_hash for statement in new_statements]
+        ids = {}
+        for i in range(0, len(text_hashes), STATEMENT_BULK_BATCH_SIZE):
+            ids.update(
+                Statement.objects.filter(
+                    session=session_obj,
+                    text_hash__in=text_hashes[i:i + STATEMENT_BULK_BATCH_SIZE]
+                ).values_list('text_hash', 'id'))
+        for statement in new_statements:
+            statement.pk = ids.get(statement.text_hash)
+        bulk_create_statement_categories([
+            (statement, categories)
+            for statement, categories in statement_categories if statement.pk
+        ])
+
+
+def preload_speakers(speaker_names, debug=False):
+    """
+    Map speaker names to Speaker objects with one query. Names not in the
+    database go through get_or_create_speaker() once each (API lookup,
+    then a temporary record).
+    """
+    speakers = {}
+    for speaker in Speaker.objects.filter(
+            naas_nm__in=list(speaker_names)).order_by('naas_nm', 'naas_cd'):
+        speakers.setdefault(speaker.naas_nm, speaker)
+    for name in speaker_names:
+        if name not in speakers:
+            speaker_obj = get_or_create_speaker(name, debug=debug)
+            if speaker_obj:
+                speakers[name] = speaker_obj
+    return speakers
+
+
+BILL_NUMBERING_PATTERN = re.compile(r'^\s*(?:\d+\s*[.)]\s*)+')
+BILL_PARENTHETICAL_PATTERN = re.compile(r'\([^()]*\)')
+BILL_NAME_SUFFIXES = ('법률안', '일부개정', '전부개정', '대안', '의안')
+BILL_JACCARD_THRESHOLD = 0.5
+
+
+def normalize_bill_name(name):
+    """
+    Bill name without agenda numbering ("10. "), parentheticals such as
+    "(대안)" or "(홍길동의원 대표발의)" and trailing 법률안/일부개정/대안
+    suffixes, lowercased. Returns (key without whitespace, token set).
+    """
+    name = BILL_PARENTHETICAL_PATTERN.sub(' ', (name or '').lower())
+    name = BILL_NUMBERING_PATTERN.sub('', name).strip()
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in BILL_NAME_SUFFIXES:
+            if name.endswith(suffix) and len(name) > len(suffix):
+                name = name[:-len(suffix)].rstrip()
+                stripped = True
+    return re.sub(r'\s+', '', name), frozenset(name.split())
+
+
+class SessionBillMatcher:
+    """
+    Attribute statement bill names to one session's bills in memory.
+
+    The bills are loaded once and their normalized names (see
+    normalize_bill_name) and token sets precomputed. match() tries, in
+    order: case-insensitive exact name, exact normalized name, the only
+    bill whose normalized name starts with (or is the start of) the
+    query's, then the single best token Jaccard similarity above
+    BILL_JACCARD_THRESHOLD. Answers are memoized per name.
+    """
+
+    def __init__(self, bills):
+        self.bills = list(bills)
+        self._by_name = {}
+        self._by_key = {}
+        self._entries = []
+        for bill in self.bills:
+            key, tokens = normalize_bill_name(bill.bill_nm)
+            if not key:
+                continue
+            self._by_name.setdefault(bill.bill_nm.strip().lower(), bill)
+            self._by_key.setdefault(key, []).append(bill)
+            self._entries.append((key, tokens, bill))
+        self._memo = {}
+
+    @classmethod
+    def for_session(cls, session_obj):
+        return cls(
+            Bill.objects.filter(session=session_obj).only('bill_id', 'bill_nm'))
+
+    def match(self, bill_name):
+        """The Bill a name refers to, or None if nothing matches unambiguously."""
+        if bill_name not in self._memo:
+            self._memo[bill_name] = self._match(bill_name)
+        return self._memo[bill_name]
+
+    def _match(self, bill_name):
+        exact = self._by_name.get((bill_name or '').strip().lower())
+        if exact:
+            return exact
+
+        key, tokens = normalize_bill_name(bill_name)
+        if not key:
+            return None
+        same_key = self._by_key.get(key, [])
+        if len(same_key) == 1:
+            return same_key[0]
+
+        candidates = same_key or [
+            bill for bill_key, _, bill in self._entries
+            if bill_key.startswith(key) or key.startswith(bill_key)
+        ]
+        if len(candidates) == 1:
+            logger.info(
+                f"✅ Found bill match via prefix matching: '{bill_name}' -> '{candidates[0].bill_nm}'"
             )
-            logger.error(
-                f"Failing statement data: {json.dumps(stmt_data, ensure_ascii=False, indent=2)}"
+            return candidates[0]
+
+        candidate_ids = {id(bill) for bill in candidates}
+        best_match = None
+        best_score = BILL_JACCARD_THRESHOLD
+        tied = False
+        for _, bill_tokens, bill in self._entries:
+            if candidates and id(bill) not in candidate_ids:
+                continue
+            union = len(tokens | bill_tokens)
+            similarity = len(tokens & bill_tokens) / union if union else 0
+            if similarity > best_score:
+                best_score = similarity
+                best_match = bill
+                tied = False
+            elif best_match and similarity == best_score:
+                tied = True
+        if tied:
+            best_match = None
+
+        if best_match:
+            logger.info(
+                f"✅ Found best bill match (similarity: {best_score:.2f}): '{bill_name}' -> '{best_match.bill_nm}'"
             )
-            logger.exception("Traceback for statement save error:")
-            continue  # Continue with the next statement
-
-    logger.info(
-        f"🎉 Saved {created_count} new statements for session {session_obj.conf_id}. Skipped {skipped_invalid_count} invalid content items."
-    )
+        elif candidates or tied:
+            logger.warning(
+                f"Multiple ambiguous bill matches for '{bill_name}'. Not associating."
+            )
+        return best_match
 
 
 def extract_statements_with_keyword_fallback(text, session_id, debug=False):
@@ -4280,6 +5874,9 @@ def extract_statements_with_regex_fallback(text, session_id, debug=False):
             'policy_keywords': []
         })
 
+    # No LLM analysis in this fallback; score provisionally from the lexicon
+    apply_lexicon_sentiment(statements)
+
     logger.info(
         f"Regex fallback completed: Extracted {len(statements)} potential statement blocks for session {session_id}."
     )
@@ -4309,76 +5906,79 @@ def get_bills_context(session_id):
 
 def create_statement_categories(statement_obj,
                                 policy_categories_list_from_llm):
-    '''Create/update Category, Subcategory, and StatementCategory associations for a Statement.'''
+    '''Create Category, Subcategory, and StatementCategory associations for a Statement.'''
     if not statement_obj or not policy_categories_list_from_llm:
         return
+    bulk_create_statement_categories([(statement_obj,
+                                       policy_categories_list_from_llm)])
+    logger.info(
+        f"Updated category associations for statement {statement_obj.id}.")
 
-    from .models import Category, Subcategory, StatementCategory  # Ensure models are importable
-
-    @with_db_retry
-    def _get_or_create_category(main_cat_name):
-        return Category.objects.get_or_create(
-            name=main_cat_name,
-            defaults={'description': f'{main_cat_name} 관련 정책'})
-
-    @with_db_retry
-    def _get_or_create_subcategory(sub_cat_name, category_obj, main_cat_name):
-        return Subcategory.objects.get_or_create(
-            name=sub_cat_name,
-            category=category_obj,
-            defaults={
-                'description': f'{sub_cat_name} 관련 세부 정책 ({main_cat_name})'
-            })
 
-    @with_db_retry
-    def _update_or_create_statement_category(statement_obj, category_obj,
-                                             subcategory_obj, confidence):
-        return StatementCategory.objects.update_or_create(
-            statement=statement_obj,
-            category=category_obj,
-            subcategory=subcategory_obj,
-            defaults={'confidence_score': confidence})
-
-    # Clear existing categories for this statement to repopulate, or implement update logic
-    # StatementCategory.objects.filter(statement=statement_obj).delete() # Simple way: delete and recreate
-
-    processed_categories_for_statement = set()
-
-    for cat_data in policy_categories_list_from_llm:
-        main_cat_name = cat_data.get('main_category', '').strip()
-        sub_cat_name = cat_data.get('sub_category', '').strip()
-        confidence = float(cat_data.get('confidence',
-                                        0.5))  # Default confidence
-
-        if not main_cat_name:
-            continue
+def bulk_create_statement_categories(statement_categories):
+    """
+    Link saved statements to their LLM policy categories in one bulk insert.
+
+    statement_categories is a list of (statement, policy_categories) pairs
+    with LLM category dicts (main_category, sub_category, confidence).
+    Names resolve to ids through the cached category catalog; unknown ones
+    are created once per call. A statement keeps only the first entry per
+    category. The links are written in a savepoint (save_category_links),
+    so a failure leaves the statements saved in the enclosing transaction.
+    """
+    from .models import StatementCategory
+
+    def save_links(links):
+        StatementCategory.objects.bulk_create(
+            links, batch_size=STATEMENT_BULK_BATCH_SIZE, ignore_conflicts=True)
+
+    links = save_category_links(
+        lambda catalog: _statement_category_links(statement_categories,
+                                                  catalog), save_links,
+        [StatementCategory._meta.db_table])
+    return len(links or [])
+
+
+def _statement_category_links(statement_categories, catalog):
+    """Unsaved StatementCategory links, with ids resolved through catalog."""
+    from .models import StatementCategory
+
+    category_ids = {}
+    links = []
+    for statement_obj, policy_categories in statement_categories:
+        linked = set()
+        for cat_data in policy_categories:
+            main_cat_name = (cat_data.get('main_category') or '').strip()
+            sub_cat_name = (cat_data.get('sub_category') or '').strip()
+            if not main_cat_name or main_cat_name in linked:
+                continue
+            linked.add(main_cat_name)
+            if sub_cat_name.lower() in ('일반', '없음'):
+                sub_cat_name = ''
 
-        # Avoid duplicate (Main, Sub) for the same statement
-        category_tuple = (main_cat_name,
-                          sub_cat_name if sub_cat_name else "일반")
-        if category_tuple in processed_categories_for_statement:
-            continue
-        processed_categories_for_statement.add(category_tuple)
+            key = (main_cat_name, sub_cat_name)
+            if key not in category_ids:
+                try:
+                    category_ids[key] = resolve_category_ids(main_cat_name,
+                                                             sub_cat_name,
+                                                             create=True,
+                                                             catalog=catalog)
+                except Exception as e:
+                    logger.error(
+                        f"❌ Could not resolve category {main_cat_name}/{sub_cat_name}: {e}"
+                    )
+                    category_ids[key] = (None, None)
+            category_id, subcategory_id = category_ids[key]
+            if category_id is None:
+                continue
 
-        try:
-            category_obj, _ = _get_or_create_category(main_cat_name)
-
-            subcategory_obj = None
-            if sub_cat_name and sub_cat_name.lower(
-            ) != '일반' and sub_cat_name.lower() != '없음':
-                subcategory_obj, _ = _get_or_create_subcategory(
-                    sub_cat_name, category_obj, main_cat_name)
-
-            # Create or update StatementCategory link
-            _update_or_create_statement_category(statement_obj, category_obj,
-                                                 subcategory_obj, confidence)
-        except Exception as e_cat_create:
-            logger.error(
-                f"Error creating category links for statement {statement_obj.id} (Cat: {main_cat_name}/{sub_cat_name}): {e_cat_create}"
-            )
-            continue
-    logger.info(
-        f"Updated category associations for statement {statement_obj.id}.")
+            links.append(
+                StatementCategory(statement=statement_obj,
+                                  category_id=category_id,
+                                  subcategory_id=subcategory_id,
+                                  confidence_score=float(
+                                      cat_data.get('confidence', 0.5))))
+    return links
 
 
 def get_or_create_speaker(speaker_name_raw, debug=False):
@@ -4891,8 +6491,7 @@ def create_placeholder_bill(session_obj, title, bill_no=None):
             'proposer': None,  # Proposer is unknown from PDF agenda
         })
     if created:
-        pass
-        # Only log the rightmost party in the chain
+        refresh_session_counters([session_obj.pk])
 
 
 def process_session_pdf_text(
@@ -4916,21 +6515,29 @@ def process_session_pdf_text(
             f"No text remaining after cleaning for session {session_id}")
         return
 
-    # Call the new all-in-one function. It handles discovery, placeholder creation, and segmentation.
-    statements_data = extract_statements_with_llm_discovery(
-        cleaned_text, session_id, bill_names_list_from_api, session_obj, debug)
-
-    if not statements_data:
-        logger.warning(
-            f"No statements were extracted by the LLM discovery process for session {session_id}"
-        )
-        return
+    # Checkpoint the run so an interrupted session resumes where it stopped
+    if not debug:
+        begin_session_run(session_id)
+    try:
+        # Call the new all-in-one function. It handles discovery, placeholder creation, and segmentation.
+        statements_data = extract_statements_with_llm_discovery(
+            cleaned_text, session_id, bill_names_list_from_api, session_obj,
+            debug)
 
-    logger.info(
-        f"✅ Extracted {len(statements_data)} statements in total for session {session_id}"
-    )
-    process_extracted_statements_data(statements_data, session_obj, full_text,
-                                      debug)
+        if not statements_data:
+            logger.warning(
+                f"No statements were extracted by the LLM discovery process for session {session_id}"
+            )
+        else:
+            logger.info(
+                f"✅ Extracted {len(statements_data)} statements in total for session {session_id}"
+            )
+            process_extracted_statements_data(statements_data, session_obj,
+                                              full_text, debug)
+    except Exception as e:
+        end_session_run(session_id, error=e)
+        raise
+    end_session_run(session_id)
 
 
 def process_pdf_text_for_statements(full_text,
@@ -369,3 +369,1466 @@ class StatementSerializerTests(APITestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn('text', serializer.errors)
         self.assertEqual(serializer.errors['text'][0], "이 필드는 필수 항목입니다.") # Corrected expected error message
+
+
+from unittest import mock
+from django.test import SimpleTestCase
+from . import tasks
+
+
+class SegmentBatchPlannerTests(SimpleTestCase):
+    def test_plan_respects_token_budget(self):
+        segments = ['◯' + '가' * 2000 for _ in range(10)]
+        plan = tasks.plan_segment_batches(segments, token_budget=4000)
+
+        self.assertEqual(sum(entry['segment_count'] for entry in plan), 10)
+        self.assertEqual(plan[0]['start'], 0)
+        self.assertEqual(plan[-1]['end'], 10)
+        for entry in plan:
+            self.assertLessEqual(entry['estimated_tokens'], 4000)
+            self.assertFalse(entry['oversized'])
+
+    def test_plan_flags_oversized_segment(self):
+        segments = ['◯ 짧은 발언입니다', '◯' + '나' * 20000, '◯ 또 다른 발언']
+        plan = tasks.plan_segment_batches(segments, token_budget=4000)
+
+        oversized = [entry for entry in plan if entry['oversized']]
+        self.assertEqual(len(oversized), 1)
+        self.assertEqual(oversized[0]['segment_count'], 1)
+
+    def test_plan_caps_segments_per_batch(self):
+        segments = ['◯ 발언'] * 75
+        plan = tasks.plan_segment_batches(segments, max_segments=30)
+        self.assertEqual([entry['segment_count'] for entry in plan], [30, 30, 15])
+
+    def test_failing_batch_is_bisected(self):
+        segments = [f'◯ 발언 {n} ' + '다' * 100 for n in range(4)]
+        calls = []
+
+        def fake_request(batch_segments, bill_name, members, tokens, start, **kwargs):
+            calls.append((start, len(batch_segments)))
+            if len(batch_segments) > 1:
+                return None
+            return [{'segment_index': start, 'speaker_name': '홍길동'}]
+
+        with mock.patch.object(tasks, 'client', object()), \
+                mock.patch.object(tasks, 'get_all_assembly_members', return_value=set()), \
+                mock.patch.object(tasks, 'analyze_batch_statements_single_request', side_effect=fake_request), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'record_request'), \
+                mock.patch.object(tasks.time, 'sleep'):
+            results = tasks.analyze_speech_segment_with_llm_batch(
+                segments, 'session', '테스트 법안')
+
+        self.assertEqual([r['segment_index'] for r in results], [0, 1, 2, 3])
+        self.assertEqual(calls[0], (0, 4))
+        # Halves run concurrently, so only the set of calls is fixed
+        self.assertEqual(sorted(calls[1:]), [(0, 1), (0, 2), (1, 1), (2, 1), (2, 2), (3, 1)])
+
+
+import subprocess
+import sys
+from django.conf import settings
+
+
+class TasksImportTests(SimpleTestCase):
+    def test_imports_without_google_genai(self):
+        # A fresh interpreter, since api.tasks is already imported here
+        script = ("import sys; sys.modules['google.genai'] = None\n"
+                  "import django; django.setup()\n"
+                  "from api import tasks; print(tasks.GENAI_AVAILABLE)")
+        result = subprocess.run([sys.executable, '-c', script], cwd=settings.BASE_DIR,
+                                capture_output=True, text=True, timeout=120)
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], 'False')
+
+
+from .json_stream import StreamingJSONArrayParser
+
+
+class StreamingJSONParserTests(SimpleTestCase):
+
+    def test_objects_are_emitted_across_chunks(self):
+        parser = StreamingJSONArrayParser()
+        items = []
+        for chunk in ['```json\n{"bills_found": [{"a": ', '1}, {"b": "x}', '"}], "newly_discovered": []}\n```']:
+            items.extend(parser.feed(chunk))
+        self.assertEqual(items, [('bills_found', {'a': 1}), ('bills_found', {'b': 'x}'})])
+        self.assertTrue(parser.is_complete)
+
+    def test_truncated_stream_keeps_complete_objects(self):
+        parser = StreamingJSONArrayParser()
+        items = parser.feed('[{"segment_index": 0}, {"segment_index": 1}, {"segment_ind')
+        self.assertEqual([obj['segment_index'] for _, obj in items], [0, 1])
+        self.assertFalse(parser.is_complete)
+
+    def test_truncated_batch_stream_returns_partial_statements(self):
+        def fake_stream(*args, **kwargs):
+            yield '[{"segment_index": 1, "speaker_name": "홍길동", "start_idx": 0, "end_idx": 80, '
+            yield '"is_valid_member": true, "is_substantial": true, "sentiment_score": 0.5, '
+            yield '"bill_relevance_score": 0.8}, {"segment_index": 2'
+            raise ConnectionError('stream reset')
+
+        segments = ['◯홍길동 의원 ' + '정책 발언입니다 ' * 10, '◯김철수 의원 ' + '다른 발언입니다 ' * 10]
+        prompt, cleaned = tasks.build_batch_analysis_prompt(segments, '테스트 법안')
+        with mock.patch.object(tasks, 'client', object()), \
+                mock.patch.object(tasks, '_stream_gemini_text', side_effect=fake_stream):
+            results = tasks._execute_batch_analysis(
+                prompt, cleaned, segments, set(), 0, '테스트 법안')
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['speaker_name'], '홍길동')
+
+
+class SegmentIdMatchingTests(SimpleTestCase):
+
+    def setUp(self):
+        self.segments = [f'◯{name} 위원 ' + '이 법안은 국민 안전을 위해 반드시 필요합니다. ' * 3
+                         for name in ('김철수', '이영희', '박민수')]
+
+    @staticmethod
+    def _answer(segment_id, speaker_name):
+        return {'segment_index': segment_id, 'speaker_name': speaker_name, 'start_idx': 0,
+                'end_idx': 80, 'is_valid_member': True, 'is_substantial': True,
+                'sentiment_score': 0.5, 'bill_relevance_score': 0.8, 'confidence': 0.9}
+
+    def test_results_are_keyed_by_id_and_only_missing_ids_are_resubmitted(self):
+        prompts = []
+
+        def fake_stream(prompt, **kwargs):
+            prompts.append(prompt)
+            if len(prompts) == 1:
+                # Out of order, segment 2 dropped and an unknown ID added
+                answers = [self._answer(3, '박민수'), self._answer(1, '김철수'),
+                           self._answer(7, '유령')]
+            else:
+                answers = [self._answer(2, '이영희')]
+            yield json.dumps(answers, ensure_ascii=False)
+
+        prompt, cleaned = tasks.build_batch_analysis_prompt(self.segments, '테스트 법안')
+        usage = tasks._new_batch_usage()
+        with mock.patch.object(tasks, 'client', object()), \
+                mock.patch.object(tasks, '_stream_gemini_text', side_effect=fake_stream):
+            results = tasks._execute_batch_analysis(
+                prompt, cleaned, self.segments, set(), 10, '테스트 법안', usage=usage)
+
+        self.assertEqual(sorted((r['segment_index'], r['speaker_name']) for r in results),
+                         [(10, '김철수'), (11, '이영희'), (12, '박민수')])
+        self.assertEqual(len(prompts), 2)
+        self.assertIn('--- 구간 2 ---', prompts[1])
+        self.assertNotIn('--- 구간 1 ---', prompts[1])
+        self.assertNotIn('--- 구간 3 ---', prompts[1])
+        self.assertEqual((usage['retry_requests'], usage['retry_segments']), (1, 1))
+        self.assertEqual(usage['retry_tokens'], tasks.estimate_tokens(prompts[1]))
+        self.assertEqual(usage['wasted_tokens'], 0)
+
+    def test_ids_still_missing_escalate_and_unparseable_output_is_wasted(self):
+        def partial_stream(prompt, **kwargs):
+            yield json.dumps([self._answer(1, '김철수')], ensure_ascii=False)
+
+        prompt, cleaned = tasks.build_batch_analysis_prompt(self.segments, '테스트 법안')
+        usage = tasks._new_batch_usage()
+        escalation = set()
+        with mock.patch.object(tasks, 'client', object()), \
+                mock.patch.object(tasks, '_stream_gemini_text', side_effect=partial_stream):
+            results = tasks._execute_batch_analysis(
+                prompt, cleaned, self.segments, set(), 0, '테스트 법안',
+                escalation=escalation, usage=usage)
+        self.assertEqual([r['speaker_name'] for r in results], ['김철수'])
+        self.assertEqual(escalation, {1, 2})
+        self.assertEqual(usage['retry_requests'], tasks.MISSING_SEGMENT_RETRY_ROUNDS)
+
+        usage = tasks._new_batch_usage()
+        with mock.patch.object(tasks, 'client', object()), \
+                mock.patch.object(tasks, '_stream_gemini_text', return_value=iter(['죄송합니다'])):
+            result = tasks._execute_batch_analysis(
+                prompt, cleaned, self.segments, set(), 0, '테스트 법안', usage=usage)
+        self.assertIsNone(result)
+        self.assertEqual(usage['wasted_tokens'], tasks.estimate_tokens(prompt))
+
+
+from django.test import TestCase
+from django.db.models import F
+from .category_catalog import get_category_catalog, invalidate_category_catalog
+from .models import Category, PolicyCatalogRevision, Subcategory
+
+
+class CategoryCatalogTests(TestCase):
+
+    def setUp(self):
+        invalidate_category_catalog()
+
+    def tearDown(self):
+        invalidate_category_catalog()
+
+    def test_catalog_is_loaded_once_until_invalidated(self):
+        catalog = get_category_catalog()
+        self.assertIs(get_category_catalog(), catalog)
+        self.assertIn(catalog.source, ('code.txt', 'fallback'))
+
+        category = Category.objects.create(name='경제정책')
+        Subcategory.objects.create(category=category, name='확장재정', description='재정 확대')
+        self.assertIs(get_category_catalog(), catalog)
+
+        invalidate_category_catalog()
+        reloaded = get_category_catalog()
+        self.assertEqual(reloaded.source, 'database')
+        self.assertNotEqual(reloaded.version, catalog.version)
+        self.assertEqual(reloaded.category_index, {1: '경제정책'})
+        self.assertEqual(reloaded.subcategory_index, {1: (1, '확장재정')})
+        self.assertEqual(reloaded.categories['경제정책']['id'], category.id)
+
+    def test_revision_bumped_by_another_process_reloads_catalog(self):
+        category = Category.objects.create(name='경제정책')
+        catalog = get_category_catalog()
+        self.assertIs(get_category_catalog(), catalog)
+
+        # What load_policy_categories --clear-existing does in its own process
+        category.delete()
+        Category.objects.create(name='사회정책')
+        PolicyCatalogRevision.objects.filter(pk=1).update(revision=F('revision') + 1)
+
+        reloaded = get_category_catalog()
+        self.assertIsNot(reloaded, catalog)
+        self.assertEqual(reloaded.category_index, {1: '사회정책'})
+        self.assertIs(get_category_catalog(), reloaded)
+
+    def test_prompt_prefix_is_built_once_per_version(self):
+        builds = []
+
+        def builder(catalog):
+            builds.append(catalog.version)
+            return f"prefix {catalog.discovery_categories_section}"
+
+        catalog = get_category_catalog()
+        first = catalog.get_prompt_prefix('discovery', builder)
+        self.assertEqual(catalog.get_prompt_prefix('discovery', builder), first)
+        self.assertEqual(len(builds), 1)
+
+        prefix = tasks._build_discovery_prompt_prefix(catalog)
+        self.assertIn(catalog.discovery_categories_section, prefix)
+        self.assertIn('"bills_found": [', prefix)
+
+
+class MapReduceDiscoveryTests(SimpleTestCase):
+
+    def test_windows_overlap_and_prefer_speaker_markers(self):
+        text = ''.join(f'◯발언자{n} ' + '가' * 90 for n in range(100))
+        windows = tasks.split_transcript_windows(text, window_chars=1000, overlap_chars=200)
+
+        self.assertEqual(windows[0]['start'], 0)
+        self.assertEqual(windows[-1]['end'], len(text))
+        for previous, window in zip(windows, windows[1:]):
+            self.assertLess(window['start'], previous['end'])
+            self.assertEqual(text[previous['end']], '◯')
+            self.assertEqual(text[window['start']], '◯')
+
+    def test_spans_split_by_window_boundary_are_merged(self):
+        spans = [
+            {'bill_name': '도로교통법 일부개정법률안', 'start_index': 100, 'end_index': 900,
+             'keywords': ['교통'], 'is_newly_discovered': True},
+            {'bill_name': '도로교통법  일부개정법률안', 'start_index': 800, 'end_index': 1500,
+             'keywords': ['교통', '안전'], 'is_newly_discovered': True},
+            {'bill_name': '다른 법안', 'start_index': 2000, 'end_index': 2500,
+             'is_newly_discovered': True},
+        ]
+        merged = tasks.merge_discovered_spans(spans, ['도로교통법 일부개정법률안'])
+
+        self.assertEqual(len(merged), 2)
+        self.assertEqual((merged[0]['start_index'], merged[0]['end_index']), (100, 1500))
+        self.assertEqual(merged[0]['keywords'], ['교통', '안전'])
+        self.assertFalse(merged[0]['is_newly_discovered'])
+        self.assertTrue(merged[1]['is_newly_discovered'])
+
+    def test_failed_window_is_retried_and_offsets_are_absolute(self):
+        text = ''.join(f'◯발언자{n} ' + '가' * 90 for n in range(30))
+        attempts = []
+
+        def fake_stream(prompt, **kwargs):
+            attempts.append(prompt)
+            if len(attempts) == 1:
+                raise ConnectionError('reset')
+            yield '{"bills_found": [], "newly_discovered": [{"bill_name": "법안%d", ' % len(attempts)
+            yield '"start_index": 10, "end_index": 500}]}'
+
+        with mock.patch.object(tasks, 'DISCOVERY_WINDOW_CHARS', 2000), \
+                mock.patch.object(tasks, 'DISCOVERY_MAX_WORKERS', 1), \
+                mock.patch.object(tasks, '_stream_gemini_text', side_effect=fake_stream), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'record_request'), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'record_error'), \
+                mock.patch.object(tasks.time, 'sleep'):
+            windows = tasks.split_transcript_windows(text, window_chars=2000)
+            spans = tasks.discover_bill_spans(text, [], 'prefix')
+
+        self.assertEqual(len(attempts), len(windows) + 1)
+        self.assertEqual(len(spans), len(windows))
+        self.assertEqual(spans[0]['start_index'], 10)
+        self.assertEqual(spans[1]['start_index'], windows[1]['start'] + 10)
+
+
+class ModelCascadeTests(SimpleTestCase):
+
+    def test_turns_are_classified_before_batching(self):
+        self.assertEqual(tasks.classify_turn('◯위원장 홍길동 의사일정 제1항을 상정합니다.'),
+                         (tasks.TURN_PROCEDURAL, 'too_short'))
+        chair_turn = '◯위원장 홍길동 ' + '의사일정 제1항을 상정합니다. 이의 없으십니까? 가결되었음을 선포합니다. ' * 3
+        self.assertEqual(tasks.classify_turn(chair_turn), (tasks.TURN_PROCEDURAL, 'procedural'))
+        speaker_turn = '◯의장 우원식 ' + '국민 여러분께 말씀드립니다. ' * 10
+        self.assertEqual(tasks.classify_turn(speaker_turn), (tasks.TURN_PROCEDURAL, 'ignored_speaker'))
+        minister_turn = '◯기획재정부장관 최상목 ' + '위원님 말씀에 답변드리겠습니다. 재정 여건을 고려하겠습니다. ' * 3
+        self.assertEqual(tasks.classify_turn(minister_turn), (tasks.TURN_OFFICIAL, 'official'))
+        witness_turn = '◯증인 홍길동 ' + '당시 상황에 대해 말씀드리겠습니다. 저는 보고받지 못했습니다. ' * 3
+        self.assertEqual(tasks.classify_turn(witness_turn), (tasks.TURN_OFFICIAL, 'official'))
+        member_turn = '◯홍길동 위원 ' + '이 법안은 국민의 안전을 위해 반드시 필요합니다. ' * 5
+        self.assertEqual(tasks.classify_turn(member_turn), (tasks.TURN_MEMBER, None))
+        chair_question = '◯위원장 홍길동 ' + '위원장으로서 정부의 재정 운용 방식에 우려를 표합니다. ' * 10
+        self.assertEqual(tasks.classify_turn(chair_question), (tasks.TURN_MEMBER, None))
+
+    def test_low_confidence_segments_escalate_to_strong_model(self):
+        segments = [
+            '◯위원장 홍길동 상정합니다.',
+            '◯김철수 위원 ' + '법안에 대해 질의하겠습니다. ' * 5,
+            '◯이영희 위원 ' + '법안에 대해 반대 의견을 말씀드립니다. ' * 5,
+        ]
+        calls = []
+
+        def fake_request(batch_segments, bill_name, members, tokens, start,
+                         model_name=None, escalation=None, usage=None):
+            calls.append((model_name, len(batch_segments)))
+            if escalation is not None:
+                escalation.add(start + 1)
+                return [{'segment_index': start, 'speaker_name': '김철수'}]
+            return [{'segment_index': start, 'speaker_name': '이영희'}]
+
+        with mock.patch.object(tasks, 'client', object()), \
+                mock.patch.object(tasks, 'get_all_assembly_members', return_value=set()), \
+                mock.patch.object(tasks, 'analyze_batch_statements_single_request', side_effect=fake_request), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'record_request'), \
+                mock.patch.object(tasks.time, 'sleep'):
+            results = tasks.analyze_speech_segment_with_llm_batch(segments, 'cascade-session', '테스트 법안')
+
+        self.assertEqual(calls, [(tasks.CASCADE_LITE_MODEL, 2), (tasks.CASCADE_STRONG_MODEL, 1)])
+        self.assertEqual([(r['segment_index'], r['speaker_name']) for r in results],
+                         [(1, '김철수'), (2, '이영희')])
+        report = tasks.pop_session_cascade_report('cascade-session')
+        self.assertEqual(report['heuristic']['segments'], 1)
+        self.assertEqual(report['heuristic']['classes'], {tasks.TURN_PROCEDURAL: 1})
+        self.assertEqual(report['heuristic']['tokens_saved'], tasks.estimate_tokens(segments[0]))
+        self.assertEqual(report['escalated'], 1)
+        self.assertEqual(report['lite']['statements'], 1)
+        self.assertEqual(report['strong']['requests'], 1)
+
+    def test_malformed_or_unsure_analysis_needs_escalation(self):
+        segment = '◯김철수 위원 ' + '가' * 100
+        good = {'speaker_name': '김철수', 'start_idx': 0, 'end_idx': 80,
+                'sentiment_score': 0.2, 'confidence': 0.9}
+        self.assertFalse(tasks._needs_escalation(good, segment, 0.6))
+        self.assertTrue(tasks._needs_escalation(dict(good, confidence=0.3), segment, 0.6))
+        self.assertTrue(tasks._needs_escalation(dict(good, end_idx='80'), segment, 0.6))
+        self.assertTrue(tasks._needs_escalation(dict(good, sentiment_score=3), segment, 0.6))
+
+
+from django.core.management import call_command
+from io import StringIO
+from .sentiment_lexicon import LexiconSentimentScorer, LEXICON_SENTIMENT_REASON
+
+
+class LexiconSentimentTests(TestCase):
+
+    def test_scores_follow_lexicon_and_negation(self):
+        scores = LexiconSentimentScorer().score_texts([
+            '이 법안에 찬성합니다. 매우 바람직한 개선입니다.',
+            '졸속 처리에 우려가 큽니다.',
+            '이 법안에 찬성할 수 없습니다.',
+            '문제가 없습니다.',
+            '회의를 시작하겠습니다.',
+        ])
+        self.assertEqual(scores.shape, (5,))
+        self.assertGreater(scores[0], 0.3)
+        self.assertLess(scores[1], -0.3)
+        self.assertLess(scores[2], 0)
+        self.assertGreater(scores[3], 0)
+        self.assertEqual(scores[4], 0)
+
+    def test_quota_exhaustion_scores_remaining_segments_offline(self):
+        segments = ['◯김철수 위원 ' + '이 법안은 국민 안전을 위해 반드시 필요하고 바람직합니다. ' * 3]
+
+        with mock.patch.object(tasks, 'client', object()), \
+                mock.patch.object(tasks, 'get_all_assembly_members', return_value={'김철수'}), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=False), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'daily_quota_exhausted', return_value=True), \
+                mock.patch.object(tasks, 'analyze_batch_statements_single_request') as llm_request:
+            results = tasks.analyze_speech_segment_with_llm_batch(segments, 'quota-session', '테스트 법안')
+        tasks.pop_session_cascade_report('quota-session')
+
+        llm_request.assert_not_called()
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['speaker_name'], '김철수')
+        self.assertTrue(results[0]['sentiment_provisional'])
+        self.assertGreater(results[0]['sentiment_score'], 0)
+
+    def test_populate_sentiment_scores_lexicon_mode(self):
+        session = Session.objects.create(
+            conf_id="lexicon_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        speaker = Speaker.objects.create(
+            naas_cd="lexicon_speaker", naas_nm="김철수", plpt_nm="미래당",
+            elecd_nm="서울", elecd_div_nm="지역구", rlct_div_nm="초선",
+            gtelt_eraco="22", ntr_div="남")
+        statement = Statement.objects.create(
+            session=session, speaker=speaker, text='졸속 처리에 심각한 우려를 표합니다.',
+            sentiment_score=0.0)
+
+        call_command('populate_sentiment_scores', '--lexicon', stdout=StringIO())
+
+        statement.refresh_from_db()
+        self.assertTrue(statement.sentiment_provisional)
+        self.assertLess(statement.sentiment_score, 0)
+        self.assertEqual(statement.sentiment_reason, LEXICON_SENTIMENT_REASON)
+
+
+import json
+import tempfile
+from django.test import override_settings
+from . import batch_jobs
+
+
+class OfflineBatchJobTests(TestCase):
+
+    def setUp(self):
+        self.job_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.job_dir.cleanup)
+        self.session = Session.objects.create(
+            conf_id="batch_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        Speaker.objects.create(
+            naas_cd="BATCH001", naas_nm="김철수", plpt_nm="테스트당",
+            elecd_nm="서울", elecd_div_nm="지역구", cmit_nm="본회의",
+            blng_cmit_nm="본회의", rlct_div_nm="초선", gtelt_eraco="22",
+            ntr_div="남", era_int=22)
+        speech = '이 법안은 국민 안전을 위해 반드시 필요하고 바람직합니다. ' * 3
+        self.transcript = (
+            '◯의장 회의를 시작하겠습니다.\n'
+            f'◯김철수 위원 {speech}\n'
+            f'◯김철수 위원 {speech}\n')
+
+    @staticmethod
+    def _responder(request_id, request):
+        prompt = request['contents'][0]['parts'][0]['text']
+        count = prompt.count('◯김철수')
+        return json.dumps([{
+            'segment_index': i + 1, 'speaker_name': '김철수', 'start_idx': 0,
+            'end_idx': 500, 'is_valid_member': True, 'is_substantial': True,
+            'sentiment_score': 0.5, 'bill_relevance_score': 0.8,
+            'confidence': 0.9
+        } for i in range(count)], ensure_ascii=False)
+
+    def test_request_ids_are_stable(self):
+        first = batch_jobs.make_request_id('s1', 120, ['a', 'b'])
+        self.assertEqual(first, batch_jobs.make_request_id('s1', 120, ['a', 'b']))
+        self.assertNotEqual(first, batch_jobs.make_request_id('s1', 120, ['a', 'c']))
+        self.assertTrue(first.startswith('s1-0000120-'))
+
+    def test_local_executor_end_to_end(self):
+        with override_settings(LLM_BATCH_JOB_DIR=self.job_dir.name), \
+                mock.patch.object(tasks, 'get_all_assembly_members', return_value={'김철수'}), \
+                mock.patch.object(tasks, 'get_session_bill_names', return_value=[]):
+            job = batch_jobs.create_batch_job(
+                ['batch_conf'], executor='local',
+                transcript_loader=lambda session: self.transcript)
+            self.assertEqual(job['request_count'], 1)
+            request = next(iter(job['requests'].values()))
+            # The chair's procedural remark never reaches the job file
+            self.assertEqual(len(request['segments']), 2)
+
+            executor = batch_jobs.LocalBatchExecutor(responder=self._responder)
+            batch_jobs.submit_batch_job(job['job_id'], executor=executor)
+            job = batch_jobs.refresh_batch_job(job['job_id'], executor=executor)
+            self.assertEqual(job['state'], batch_jobs.JOB_SUCCEEDED)
+
+            counts = batch_jobs.ingest_batch_results(job['job_id'])
+            self.assertEqual(counts['statements'], 2)
+            # Re-ingesting the same results is a no-op
+            again = batch_jobs.ingest_batch_results(job['job_id'])
+            self.assertEqual(again['requests'], 0)
+
+        statements = Statement.objects.filter(session=self.session)
+        self.assertEqual(statements.count(), 1)  # identical text is deduplicated
+        self.assertEqual(statements.first().speaker.naas_nm, '김철수')
+
+
+from pathlib import Path
+from .fake_gemini import FakeGeminiClient, FakeGeminiError
+
+
+class FakeGeminiClientTests(TestCase):
+
+    def setUp(self):
+        previous = tasks.set_gemini_client(None)
+        self.addCleanup(tasks.set_gemini_client, previous)
+        speech = '이 법안은 국민 안전을 위해 반드시 필요하고 바람직합니다. ' * 3
+        self.segments = [f'◯김철수 위원 {speech}', f'◯이영희 위원 졸속 처리에 우려가 큽니다. {speech}']
+
+    def test_batch_analysis_round_trip(self):
+        tasks.set_gemini_client(FakeGeminiClient(seed=1))
+        prompt, cleaned = tasks.build_batch_analysis_prompt(self.segments, '테스트 법안')
+
+        with mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True):
+            results = tasks._execute_batch_analysis(
+                prompt, cleaned, self.segments, {'김철수', '이영희'}, 0, '테스트 법안')
+
+        self.assertEqual([r['speaker_name'] for r in results], ['김철수', '이영희'])
+        self.assertEqual([r['segment_index'] for r in results], [0, 1])
+        self.assertTrue(results[1]['text'].startswith('위원 졸속'))
+
+    def test_error_rates(self):
+        prompt, _ = tasks.build_batch_analysis_prompt(self.segments, '테스트 법안')
+
+        fake = FakeGeminiClient(rate_limit_rate=1.0)
+        with self.assertRaises(FakeGeminiError):
+            list(fake.models.generate_content_stream('m', [prompt]))
+        self.assertEqual(fake.stats['rate_limited'], 1)
+
+        fake = FakeGeminiClient(malformed_rate=1.0)
+        text = fake.models.generate_content('m', [prompt]).text
+        with self.assertRaises(json.JSONDecodeError):
+            json.loads(text)
+        self.assertEqual(fake.stats['malformed'], 1)
+
+    def test_benchmark_command(self):
+        corpus = tempfile.TemporaryDirectory()
+        self.addCleanup(corpus.cleanup)
+        transcript = '(10시00분 개의)\n◯의장 테스트 법안을 상정합니다.\n' + '\n'.join(self.segments)
+        Path(corpus.name, 'session1.txt').write_text(transcript, encoding='utf-8')
+        Path(corpus.name, 'session1.bills.txt').write_text('테스트 법안\n', encoding='utf-8')
+
+        out = StringIO()
+        call_command('benchmark_llm_pipeline', corpus.name, '--latency', '0', stdout=out)
+
+        output = out.getvalue()
+        self.assertIn('Statements extracted: 2', output)
+        self.assertIn('Per-call latency', output)
+        self.assertIsNone(tasks.client)
+
+
+import threading
+
+from . import llm_analyzer
+from .llm_analyzer import LLMPolicyAnalyzer
+from .models import StatementCategory
+
+
+class StatementBatchAnalysisTests(TestCase):
+
+    def setUp(self):
+        previous = tasks.set_gemini_client(None)
+        self.addCleanup(tasks.set_gemini_client, previous)
+        invalidate_category_catalog()
+        self.addCleanup(invalidate_category_catalog)
+        self.category = Category.objects.create(name='경제정책', description='경제')
+        Subcategory.objects.create(category=self.category, name='재정', description='재정 정책')
+
+        session = Session.objects.create(
+            conf_id="batch_llm_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        speaker = Speaker.objects.create(
+            naas_cd="batch_llm_speaker", naas_nm="김철수", plpt_nm="미래당",
+            elecd_nm="서울", elecd_div_nm="지역구", rlct_div_nm="초선",
+            gtelt_eraco="22", ntr_div="남")
+        self.statements = [
+            Statement.objects.create(session=session, speaker=speaker, text=text)
+            for text in ['이 법안에 찬성합니다.\n매우 바람직합니다.',
+                         '졸속 처리에 심각한 우려를 표합니다.',
+                         '재정 건전성 개선이 필요합니다.']
+        ]
+
+    def test_populate_sentiment_scores_batches_statements(self):
+        fake = FakeGeminiClient(seed=1)
+        tasks.set_gemini_client(fake)
+
+        with mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True):
+            call_command('populate_sentiment_scores', '--statements-per-prompt', '2',
+                         stdout=StringIO())
+
+        self.assertEqual(fake.stats['batch_requests'], 2)
+        scores = []
+        for statement in self.statements:
+            statement.refresh_from_db()
+            self.assertFalse(statement.sentiment_provisional)
+            scores.append(statement.sentiment_score)
+        self.assertGreater(scores[0], 0)
+        self.assertLess(scores[1], 0)
+        self.assertEqual(
+            StatementCategory.objects.filter(category=self.category).count(), 3)
+
+    def test_missing_answers_are_reported_not_saved(self):
+        tasks.set_gemini_client(FakeGeminiClient(malformed_rate=1.0))
+        analyzer = LLMPolicyAnalyzer()
+
+        with mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True), \
+                mock.patch.object(llm_analyzer.time, 'sleep'):
+            results = analyzer.batch_analyze_statements(self.statements)
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all('statement_id' not in result for result in results[1:]))
+        self.assertEqual(StatementCategory.objects.count(),
+                         sum('statement_id' in result for result in results))
+
+    def test_prompts_are_built_in_calling_thread(self):
+        tasks.set_gemini_client(FakeGeminiClient(seed=1))
+        analyzer = LLMPolicyAnalyzer()
+        prompt_threads = []
+        create_batch_prompt = analyzer.create_batch_prompt
+
+        def recording_create_batch_prompt(statements):
+            prompt_threads.append(threading.current_thread())
+            return create_batch_prompt(statements)
+
+        statements = list(Statement.objects.order_by('id'))
+        with mock.patch.object(analyzer, 'create_batch_prompt', recording_create_batch_prompt), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True):
+            results = analyzer.batch_analyze_statements(statements, statements_per_prompt=1)
+
+        self.assertTrue(all('statement_id' in result for result in results))
+        self.assertEqual(prompt_threads, [threading.current_thread()] * 3)
+
+
+from .llm_checkpoints import has_unfinished_run
+from .models import LLMBatchCheckpoint
+
+
+class LLMCheckpointTests(TestCase):
+
+    def setUp(self):
+        previous = tasks.set_gemini_client(None)
+        self.addCleanup(tasks.set_gemini_client, previous)
+        self.session = Session.objects.create(
+            conf_id="checkpoint_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        Speaker.objects.create(
+            naas_cd="CKPT001", naas_nm="김철수", plpt_nm="테스트당",
+            elecd_nm="서울", elecd_div_nm="지역구", rlct_div_nm="초선",
+            gtelt_eraco="22", ntr_div="남")
+        speech = '이 법안은 국민 안전을 위해 반드시 필요하고 바람직합니다. ' * 3
+        self.transcript = ('(10시00분 개의)\n◯의장 테스트 법안을 상정합니다.\n'
+                           f'◯김철수 위원 {speech}\n◯김철수 위원 추가로 말씀드리면 {speech}\n')
+
+    def _run(self, fake):
+        tasks.set_gemini_client(fake)
+        with mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True), \
+                mock.patch.object(tasks.time, 'sleep'):
+            tasks.process_session_pdf_text(self.transcript, 'checkpoint_conf', self.session,
+                                           None, ['테스트 법안'])
+
+    def test_interrupted_run_resumes_without_llm_calls(self):
+        with mock.patch.object(tasks, 'process_extracted_statements_data',
+                               side_effect=RuntimeError('worker crashed')):
+            with self.assertRaises(RuntimeError):
+                self._run(FakeGeminiClient(seed=1))
+
+        self.assertTrue(has_unfinished_run('checkpoint_conf'))
+        self.assertEqual(
+            LLMBatchCheckpoint.objects.filter(
+                kind=LLMBatchCheckpoint.KIND_ANALYSIS,
+                status=LLMBatchCheckpoint.STATUS_DONE).count(), 1)
+
+        resumed = FakeGeminiClient(seed=1)
+        self._run(resumed)
+
+        self.assertEqual(resumed.stats['requests'], 0)
+        self.assertEqual(Statement.objects.filter(session=self.session).count(), 2)
+        self.assertFalse(has_unfinished_run('checkpoint_conf'))
+
+        out = StringIO()
+        call_command('llm_checkpoints', stdout=out)
+        self.assertIn('checkpoint_conf: 2/2 done', out.getvalue())
+
+
+from .llm_analyzer import STATEMENT_ANALYSIS_VERSION
+from .reanalysis import ReanalysisScheduler, get_staleness_summary
+from .sentiment_lexicon import LEXICON_ANALYSIS_VERSION
+
+
+class ReanalysisSchedulerTests(TestCase):
+
+    def setUp(self):
+        previous = tasks.set_gemini_client(None)
+        self.addCleanup(tasks.set_gemini_client, previous)
+        invalidate_category_catalog()
+        self.addCleanup(invalidate_category_catalog)
+        speaker = Speaker.objects.create(
+            naas_cd="REANALYZE001", naas_nm="김철수", plpt_nm="미래당",
+            elecd_nm="서울", elecd_div_nm="지역구", rlct_div_nm="초선",
+            gtelt_eraco="22", ntr_div="남")
+        self.sessions = {}
+        for conf_id, days_ago in (('reanalyze_old', 30), ('reanalyze_new', 1)):
+            self.sessions[conf_id] = Session.objects.create(
+                conf_id=conf_id, era_co="22", sess="1", dgr="1",
+                conf_dt=datetime.date.today() - datetime.timedelta(days=days_ago),
+                conf_knd="본회의", cmit_nm="본회의",
+                bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+                down_url="http://example.com/pdf")
+            for version in ('', LEXICON_ANALYSIS_VERSION, STATEMENT_ANALYSIS_VERSION):
+                Statement.objects.create(
+                    session=self.sessions[conf_id], speaker=speaker,
+                    text=f'이 법안에 찬성합니다. ({conf_id} {version})',
+                    analysis_version=version)
+
+    def test_budget_limits_run_to_newest_session(self):
+        fake = FakeGeminiClient(seed=1)
+        tasks.set_gemini_client(fake)
+        scheduler = ReanalysisScheduler(token_budget=0)
+        newest = list(Statement.objects.filter(
+            session=self.sessions['reanalyze_new']).exclude(
+                analysis_version=STATEMENT_ANALYSIS_VERSION).select_related('speaker', 'bill'))
+        scheduler.progress['token_budget'] = scheduler.analyzer.estimate_batch_tokens(newest)
+
+        with mock.patch.object(tasks.gemini_rate_limiter, 'wait_if_needed', return_value=True):
+            progress = scheduler.run()
+
+        self.assertTrue(progress['budget_exhausted'])
+        self.assertEqual(progress['statements_reanalyzed'], 2)
+        self.assertEqual(progress['sessions_completed'], 1)
+        self.assertEqual(progress['stale_statements_remaining'], 2)
+        self.assertEqual(fake.stats['batch_requests'], 1)
+        self.assertFalse(
+            Statement.objects.filter(session=self.sessions['reanalyze_new']).exclude(
+                analysis_version=STATEMENT_ANALYSIS_VERSION).exists())
+
+        summary = get_staleness_summary(era_co=22)
+        self.assertEqual(summary['statements']['stale'], 2)
+        self.assertEqual(summary['statements']['by_version'][STATEMENT_ANALYSIS_VERSION], 4)
+
+    def test_bill_analysis_stamps_prompt_version(self):
+        bill = Bill.objects.create(bill_id="reanalyze_bill", session=self.sessions['reanalyze_new'],
+                                   bill_nm="재정 건전화 법안", llm_analysis_version="v1.0")
+        self.assertEqual(get_staleness_summary()['bills']['stale'], 1)
+
+        tasks.update_bill_policy_data(bill, {'main_policy_category': '경제정책',
+                                             'key_policy_phrases': ['재정']})
+
+        bill.refresh_from_db()
+        self.assertEqual(bill.llm_analysis_version, tasks.LLM_PROMPT_VERSION)
+        self.assertEqual(get_staleness_summary()['bills']['stale'], 0)
+
+
+import time
+
+
+class GeminiDeadlineTests(TestCase):
+
+    def setUp(self):
+        previous = tasks.set_gemini_client(None)
+        self.addCleanup(tasks.set_gemini_client, previous)
+        tasks.gemini_latency_tracker.reset()
+        self.addCleanup(tasks.gemini_latency_tracker.reset)
+        tasks.gemini_concurrency.reset()
+        self.addCleanup(tasks.gemini_concurrency.reset)
+
+    def test_request_timeout_comes_from_deadline(self):
+        tasks.set_gemini_client(FakeGeminiClient(latency=10, latency_jitter=0))
+        started = time.monotonic()
+
+        with self.assertRaises(FakeGeminiError):
+            list(tasks._stream_gemini_text('hello', deadline=time.monotonic() + 0.2))
+
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_slot_queueing_is_not_counted_as_latency(self):
+        tasks.set_gemini_client(FakeGeminiClient(latency=0, latency_jitter=0))
+        slots = [tasks.gemini_concurrency.acquire() for _ in range(tasks.gemini_concurrency.limit)]
+        timer = threading.Timer(0.3, lambda: [tasks.gemini_concurrency.release(slot, 'cancelled')
+                                              for slot in slots])
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        self.assertEqual(''.join(tasks._stream_gemini_text('hello', model_name='test-model')), 'OK')
+
+        self.assertLess(max(tasks.gemini_latency_tracker.samples['test-model']), 0.2)
+
+    def test_slow_call_is_hedged_and_first_answer_wins(self):
+        fake = FakeGeminiClient()
+        tasks.set_gemini_client(fake)
+        for _ in range(tasks.HEDGE_MIN_SAMPLES):
+            tasks.gemini_latency_tracker.record('test-model', 0.05)
+        tasks.gemini_latency_tracker.stats['calls'] = 20
+        started = time.monotonic()
+
+        with mock.patch.object(fake, '_draw', side_effect=[(0.5, False, False), (0.0, False, False)]), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'can_make_request',
+                                  return_value=(True, 'OK')), \
+                mock.patch.object(tasks.gemini_rate_limiter, 'record_request'):
+            text = ''.join(tasks._stream_gemini_text('hello', model_name='test-model', hedge=True))
+
+        self.assertEqual(text, 'OK')
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(fake.stats['requests'], 2)
+        stats = tasks.gemini_latency_tracker.get_stats()
+        self.assertEqual((stats['hedged'], stats['hedge_wins']), (1, 1))
+
+        # The losing primary gives its slot back as soon as the hedge wins,
+        # and not a second time when its slow first read returns
+        self.assertEqual(tasks.gemini_concurrency.get_stats()['in_flight'], 0)
+        time.sleep(0.6)
+        self.assertEqual(tasks.gemini_concurrency.get_stats()['in_flight'], 0)
+
+    def test_batch_analysis_does_not_retry_past_deadline(self):
+        fake = FakeGeminiClient(rate_limit_rate=1.0)
+        tasks.set_gemini_client(fake)
+
+        with mock.patch.object(tasks.time, 'sleep') as sleep:
+            result = tasks._execute_batch_analysis('prompt', [], [], None, 0, '테스트 법안',
+                                                   deadline=time.monotonic() + 5)
+
+        self.assertIsNone(result)
+        self.assertEqual(fake.stats['requests'], 1)
+        self.assertFalse([call for call in sleep.call_args_list if call.args[0] > 0])
+
+
+class AdaptiveConcurrencyTests(SimpleTestCase):
+
+    def test_window_grows_additively_while_healthy(self):
+        controller = tasks.AdaptiveConcurrencyController(initial_window=2, max_window=4)
+        for _ in range(6):
+            controller.release(controller.acquire(), 'ok')
+
+        self.assertGreater(controller.window, 3)
+        self.assertLessEqual(controller.window, 4)
+        self.assertEqual(controller.get_stats()['limit'], int(controller.window))
+
+    def test_overload_burst_cuts_window_once(self):
+        controller = tasks.AdaptiveConcurrencyController(initial_window=4)
+        slots = [controller.acquire() for _ in range(4)]
+        self.assertIsNone(controller.acquire(blocking=False))
+
+        for slot in slots:
+            controller.release(slot, 'overload')
+
+        stats = controller.get_stats()
+        self.assertEqual((stats['window'], stats['overloads'], stats['decreases']), (2, 4, 1))
+        controller.release(controller.acquire(), 'overload')
+        self.assertEqual(controller.get_stats()['window'], 1)
+
+    def test_rate_limited_stream_reports_overload(self):
+        previous = tasks.set_gemini_client(FakeGeminiClient(rate_limit_rate=1.0))
+        self.addCleanup(tasks.set_gemini_client, previous)
+        tasks.gemini_concurrency.reset()
+        self.addCleanup(tasks.gemini_concurrency.reset)
+
+        with self.assertRaises(FakeGeminiError):
+            list(tasks._stream_gemini_text('hello'))
+
+        stats = tasks.gemini_concurrency.get_stats()
+        self.assertEqual((stats['overloads'], stats['in_flight']), (1, 0))
+        self.assertEqual(tasks.classify_gemini_error(tasks.GeminiDeadlineExceeded('x')), 'error')
+
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class StatementPersistenceTests(TestCase):
+
+    def setUp(self):
+        self.session = Session.objects.create(
+            conf_id="bulk_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        for code, name in (("BULK001", "김철수"), ("BULK002", "이영희")):
+            Speaker.objects.create(
+                naas_cd=code, naas_nm=name, plpt_nm="테스트당", elecd_nm="서울",
+                elecd_div_nm="지역구", rlct_div_nm="초선", gtelt_eraco="22", ntr_div="남")
+        self.bill = Bill.objects.create(bill_id="BULK_BILL", session=self.session,
+                                        bill_nm="국민안전 기본법 일부개정법률안")
+        category = Category.objects.create(name='사회정책')
+        Subcategory.objects.create(category=category, name='안전')
+        invalidate_category_catalog()
+        self.addCleanup(invalidate_category_catalog)
+
+    def _statement(self, n, speaker_name='김철수'):
+        return {
+            'speaker_name': speaker_name,
+            'text': f'{n}번째 발언입니다. 이 법안은 국민 안전을 위해 반드시 필요합니다.',
+            # Segment-relative indices must not be used to slice the transcript
+            'start_idx': 0,
+            'end_idx': 5,
+            'sentiment_score': 0.4,
+            'associated_bill_name': '국민안전 기본법 일부개정법률안',
+            'policy_categories': [{'main_category': '사회정책', 'sub_category': '안전', 'confidence': 0.8}],
+        }
+
+    def test_statements_are_saved_in_a_few_round_trips(self):
+        statements = [self._statement(n, ('김철수', '이영희')[n % 2]) for n in range(200)]
+        statements.append(dict(statements[0]))  # duplicate within the batch
+
+        with CaptureQueriesContext(connection) as queries:
+            tasks.process_extracted_statements_data(statements, self.session, '전혀 다른 회의록 본문')
+
+        self.assertLess(len(queries), 24)
+        saved = Statement.objects.filter(session=self.session)
+        self.assertEqual(saved.count(), 200)
+        first = saved.get(text=statements[0]['text'])
+        self.assertEqual(first.bill, self.bill)
+        self.assertEqual(first.text_hash, first.get_hash())
+        self.assertEqual(StatementCategory.objects.filter(statement__session=self.session).count(), 200)
+        self.assertEqual(first.categories.get().subcategory.name, '안전')
+
+        # Reprocessing the same statements adds nothing
+        tasks.process_extracted_statements_data(statements, self.session, None)
+        self.assertEqual(Statement.objects.filter(session=self.session).count(), 200)
+
+    def test_stale_category_ids_do_not_roll_back_statements(self):
+        get_category_catalog()
+        # Another process reloads the categories without this one noticing
+        Category.objects.filter(name='사회정책').delete()
+        category = Category.objects.create(name='사회정책')
+        subcategory = Subcategory.objects.create(category=category, name='안전')
+
+        tasks.process_extracted_statements_data(
+            [self._statement(n) for n in range(3)], self.session, None)
+
+        self.assertEqual(Statement.objects.filter(session=self.session).count(), 3)
+        links = StatementCategory.objects.filter(statement__session=self.session)
+        self.assertEqual(links.count(), 3)
+        self.assertFalse(links.exclude(category=category, subcategory=subcategory).exists())
+
+    def test_bill_names_match_preloaded_session_bills(self):
+        self.assertEqual(tasks.normalize_bill_name('10. 국민안전 기본법 일부개정법률안(대안)(위원장)'),
+                         ('국민안전기본법', frozenset(['국민안전', '기본법'])))
+        bills = [self.bill,
+                 Bill(bill_id="B2", bill_nm="지방재정법 일부개정법률안(홍길동의원 대표발의)"),
+                 Bill(bill_id="B3", bill_nm="지방재정법 일부개정법률안(김철수의원 대표발의)"),
+                 Bill(bill_id="B4", bill_nm="청년 주거 지원 특별법안")]
+        matcher = tasks.SessionBillMatcher(bills)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(matcher.match('3. 국민안전 기본법 일부개정법률안(대안)'), self.bill)
+            self.assertEqual(matcher.match('국민안전 기본법'), self.bill)
+            self.assertEqual(matcher.match('청년 주거 지원'), bills[3])  # prefix
+            self.assertEqual(matcher.match('주거 지원 청년 특별법안'), bills[3])  # Jaccard
+            self.assertIsNone(matcher.match('지방재정법 일부개정법률안'))  # ambiguous
+            self.assertIsNone(matcher.match('없는 법안'))
+            self.assertEqual(matcher.match('국민안전 기본법'), self.bill)  # memoized
+
+
+from django.db import IntegrityError
+from django.test import TransactionTestCase
+from .statement_dedupe import collapse_duplicate_statements
+
+
+class StatementDedupeTests(TransactionTestCase):
+
+    def setUp(self):
+        self.session = Session.objects.create(
+            conf_id="dedupe_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        self.speaker = Speaker.objects.create(
+            naas_cd="DEDUPE001", naas_nm="김철수", plpt_nm="테스트당", elecd_nm="서울",
+            elecd_div_nm="지역구", rlct_div_nm="초선", gtelt_eraco="22", ntr_div="남")
+        self.text = '이 법안은 국민 안전을 위해 반드시 필요합니다. 찬성합니다.'
+
+    def test_conflicting_inserts_are_ignored(self):
+        Statement.objects.create(session=self.session, speaker=self.speaker, text=self.text)
+        duplicate = Statement(session=self.session, speaker=self.speaker, text=self.text,
+                              text_hash=Statement.calculate_hash(self.text, 'DEDUPE001', 'dedupe_conf'))
+        other = Statement(session=self.session, speaker=self.speaker, text=self.text + ' 다시',
+                          text_hash=Statement.calculate_hash(self.text + ' 다시', 'DEDUPE001', 'dedupe_conf'))
+
+        # Another worker stored the first row between the hash check and the insert
+        tasks._bulk_save_statements(self.session, [duplicate, other], [
+            (duplicate, [{'main_category': '사회정책'}]),
+            (other, [{'main_category': '경제정책'}]),
+        ])
+
+        self.assertEqual(Statement.objects.filter(session=self.session).count(), 2)
+        self.assertEqual(StatementCategory.objects.filter(statement__session=self.session).count(), 2)
+
+    def test_collapse_keeps_oldest_row_and_its_category_links(self):
+        keeper = Statement.objects.create(session=self.session, speaker=self.speaker, text=self.text)
+        with self.assertRaises(IntegrityError):
+            Statement.objects.create(session=self.session, speaker=self.speaker, text=self.text)
+
+        # Duplicates stored before the constraint existed
+        constraint = Statement._meta.constraints[0]
+        with connection.schema_editor() as editor:
+            editor.remove_constraint(Statement, constraint)
+        self.addCleanup(self._restore_constraint, constraint)
+        social = Category.objects.create(name='사회정책')
+        economy = Category.objects.create(name='경제정책')
+        StatementCategory.objects.create(statement=keeper, category=social, confidence_score=0.5)
+        duplicates = []
+        for _ in range(2):
+            statement = Statement.objects.create(session=self.session, speaker=self.speaker, text='임시')
+            duplicates.append(statement)
+        StatementCategory.objects.create(statement=duplicates[0], category=social, confidence_score=0.9)
+        StatementCategory.objects.create(statement=duplicates[1], category=economy, confidence_score=0.7)
+        Statement.objects.filter(id__in=[s.id for s in duplicates]).update(text=self.text,
+                                                                          text_hash=keeper.text_hash)
+
+        self.assertEqual(collapse_duplicate_statements(dry_run=True), {'groups': 1, 'removed': 2})
+        self.assertEqual(collapse_duplicate_statements(batch_size=1), {'groups': 1, 'removed': 2})
+
+        self.assertEqual(list(Statement.objects.filter(session=self.session).values_list('id', flat=True)),
+                         [keeper.id])
+        self.assertEqual(sorted(keeper.categories.values_list('category__name', flat=True)),
+                         ['경제정책', '사회정책'])
+
+    @staticmethod
+    def _restore_constraint(constraint):
+        Statement.objects.all().delete()
+        with connection.schema_editor() as editor:
+            editor.add_constraint(Statement, constraint)
+
+
+from django.db.utils import OperationalError
+from . import db_connections
+
+
+class _DriverError(Exception):
+
+    def __init__(self, pgcode):
+        super().__init__(f'driver error {pgcode}')
+        self.pgcode = pgcode
+
+
+class DatabaseRetryPolicyTests(SimpleTestCase):
+
+    def _wrapped(self, pgcode):
+        error = OperationalError(f'failed ({pgcode})')
+        error.__cause__ = _DriverError(pgcode) if pgcode else None
+        return error
+
+    def test_errors_are_classified_by_sqlstate(self):
+        classify = db_connections.DatabaseRetryPolicy.classify
+        self.assertEqual(classify(self._wrapped('08006')), db_connections.DB_RETRY_RECONNECT)
+        self.assertEqual(classify(self._wrapped('57P01')), db_connections.DB_RETRY_RECONNECT)
+        self.assertEqual(classify(self._wrapped('40P01')), db_connections.DB_RETRY_TRANSIENT)
+        self.assertEqual(classify(self._wrapped('40001')), db_connections.DB_RETRY_TRANSIENT)
+        self.assertIsNone(classify(self._wrapped('23505')))
+        # "server closed the connection unexpectedly" has no SQLSTATE
+        self.assertEqual(classify(self._wrapped(None)), db_connections.DB_RETRY_RECONNECT)
+
+    def test_retries_reconnect_and_record_metrics(self):
+        metrics = db_connections.DatabaseConnectionMetrics()
+        policy = db_connections.DatabaseRetryPolicy(max_retries=3, metrics=metrics)
+        errors = [self._wrapped('57P01'), self._wrapped('40P01')]
+
+        def operation():
+            if errors:
+                raise errors.pop(0)
+            return 'ok'
+
+        with mock.patch.object(db_connections.connection, 'close') as close, \
+                mock.patch.object(db_connections.time, 'sleep') as sleep:
+            self.assertEqual(policy.call(operation), 'ok')
+            close.assert_called_once()
+            self.assertEqual([call.args[0] for call in sleep.call_args_list], [1.0, 2.0])
+
+            with self.assertRaises(OperationalError):
+                policy.call(mock.Mock(side_effect=self._wrapped('23505')))
+
+        stats = metrics.get_stats()
+        self.assertEqual((stats['reconnects'], stats['transient_retries']), (1, 1))
+        self.assertEqual(stats['by_sqlstate'], {'57P01': 1, '40P01': 1})
+
+    def test_task_start_recycles_stale_connections(self):
+        fake_connection = mock.Mock(in_atomic_block=False, connection=object())
+
+        def drop_connection():
+            fake_connection.connection = None
+
+        db_connections.db_connection_metrics.reset()
+        self.addCleanup(db_connections.db_connection_metrics.reset)
+        with mock.patch.object(db_connections, 'connection', fake_connection), \
+                mock.patch.object(db_connections, 'close_old_connections') as close_old:
+            db_connections._recycle_connection_before_task(sender=None)
+            close_old.side_effect = drop_connection
+            db_connections._recycle_connection_before_task(sender=None)
+            db_connections._recycle_connection_before_task(sender=None)
+
+        stats = db_connections.db_connection_metrics.get_stats()
+        self.assertEqual((stats['tasks'], stats['reused'], stats['opened'], stats['discarded']),
+                         (3, 1, 2, 1))
+
+
+from .models import BillCategoryMapping, BillSubcategoryMapping
+from .category_catalog import resolve_category_ids
+
+
+class CategoryLookupCacheTests(TestCase):
+
+    def setUp(self):
+        self.session = Session.objects.create(
+            conf_id="lookup_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        self.speaker = Speaker.objects.create(
+            naas_cd="LOOKUP001", naas_nm="김철수", plpt_nm="테스트당", elecd_nm="서울",
+            elecd_div_nm="지역구", rlct_div_nm="초선", gtelt_eraco="22", ntr_div="남")
+        self.category = Category.objects.create(name='경제정책')
+        self.subcategory = Subcategory.objects.create(category=self.category, name='재정')
+        invalidate_category_catalog()
+        self.addCleanup(invalidate_category_catalog)
+
+    def _statements(self, count):
+        return [Statement.objects.create(session=self.session, speaker=self.speaker,
+                                         text=f'{n}번째 재정 관련 발언') for n in range(count)]
+
+    def _category_queries(self, queries):
+        return [q['sql'] for q in queries.captured_queries
+                if 'api_category' in q['sql'] or 'api_subcategory' in q['sql']]
+
+    def test_tagging_uses_cached_ids(self):
+        get_category_catalog()
+        statements = self._statements(30)
+        categories = [{'main_category': '경제정책', 'sub_category': '재정', 'confidence': 0.9}]
+
+        with CaptureQueriesContext(connection) as queries:
+            created = tasks.bulk_create_statement_categories(
+                [(statement, categories) for statement in statements])
+
+        self.assertEqual(created, 30)
+        self.assertEqual(self._category_queries(queries), [])
+        self.assertEqual(StatementCategory.objects.filter(subcategory=self.subcategory).count(), 30)
+
+        bill = Bill.objects.create(bill_id="LOOKUP_BILL", session=self.session, bill_nm="재정법")
+        with CaptureQueriesContext(connection) as queries:
+            tasks.update_bill_policy_data(bill, {'main_policy_category': '경제정책',
+                                                 'policy_subcategories': ['재정', '없는분야']})
+        self.assertEqual(self._category_queries(queries), [])
+        self.assertTrue(BillCategoryMapping.objects.filter(bill=bill, category=self.category).exists())
+        self.assertEqual(BillSubcategoryMapping.objects.get(bill=bill).subcategory, self.subcategory)
+
+    def test_unknown_names_are_created_once_and_invalidate(self):
+        version = get_category_catalog().version
+        self.assertEqual(resolve_category_ids('사회정책'), (None, None))
+
+        statements = self._statements(3)
+        tasks.bulk_create_statement_categories(
+            [(statement, [{'main_category': '사회정책', 'sub_category': '안전'},
+                          {'main_category': '경제정책', 'sub_category': '일반'}])
+             for statement in statements])
+
+        social = Category.objects.get(name='사회정책')
+        self.assertEqual(Subcategory.objects.filter(category=social, name='안전').count(), 1)
+        self.assertEqual(StatementCategory.objects.filter(category=social).count(), 3)
+        self.assertFalse(StatementCategory.objects.filter(category=self.category,
+                                                          subcategory__isnull=False).exists())
+        catalog = get_category_catalog()
+        self.assertNotEqual(catalog.version, version)
+        self.assertEqual(resolve_category_ids('사회정책', '안전'),
+                         (social.id, catalog.subcategory_ids[('사회정책', '안전')]))
+
+
+class BillPolicyWriterTests(TestCase):
+
+    def setUp(self):
+        self.session = Session.objects.create(
+            conf_id="policy_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        category = Category.objects.create(name='경제정책')
+        self.subcategory = Subcategory.objects.create(category=category, name='재정')
+        invalidate_category_catalog()
+        self.addCleanup(invalidate_category_catalog)
+        self.bills = [Bill.objects.create(bill_id=f"POLICY{n}", session=self.session,
+                                          bill_nm=f"재정법 {n}") for n in range(10)]
+
+    def _segment(self, stance):
+        return {'main_policy_category': '경제정책', 'policy_subcategories': ['재정'],
+                'key_policy_phrases': ['재정', '예산'], 'bill_specific_keywords': ['재정'],
+                'policy_stance': stance, 'bill_analysis': '재정 관련 정책'}
+
+    def test_session_is_written_in_one_batch(self):
+        get_category_catalog()
+        with CaptureQueriesContext(connection) as queries:
+            updated = tasks.bulk_update_bill_policy_data(
+                [(bill, self._segment('moderate')) for bill in self.bills])
+        self.assertEqual(updated, 10)
+        # Revision read, bill update, mapping upserts and their checked savepoint
+        self.assertLessEqual(len(queries), 10)
+
+        # Re-running upserts the mappings instead of duplicating them
+        tasks.bulk_update_bill_policy_data(
+            [(bill, self._segment('progressive')) for bill in self.bills])
+        self.assertEqual(BillCategoryMapping.objects.filter(bill__session=self.session).count(), 10)
+        mappings = BillSubcategoryMapping.objects.filter(subcategory=self.subcategory)
+        self.assertEqual(mappings.count(), 10)
+        self.assertEqual(set(mappings.values_list('policy_position', flat=True)), {'support'})
+
+        bill = Bill.objects.get(pk=self.bills[0].pk)
+        self.assertEqual(bill.llm_analysis_version, tasks.LLM_PROMPT_VERSION)
+        self.assertEqual(bill.policy_keywords, '재정, 예산')
+        self.assertEqual(bill.policy_impact_score, 5.0)
+
+    def test_stale_category_ids_are_reloaded(self):
+        get_category_catalog()
+        Category.objects.filter(name='경제정책').delete()
+        category = Category.objects.create(name='경제정책')
+        subcategory = Subcategory.objects.create(category=category, name='재정')
+
+        tasks.bulk_update_bill_policy_data(
+            [(bill, self._segment('moderate')) for bill in self.bills[:2]])
+
+        self.assertEqual(BillCategoryMapping.objects.filter(category=category).count(), 2)
+        self.assertEqual(BillSubcategoryMapping.objects.filter(subcategory=subcategory).count(), 2)
+        self.assertEqual(Bill.objects.get(pk=self.bills[0].pk).policy_keywords, '재정, 예산')
+
+
+from .counters import reconcile_counters
+from .serializers import SessionListSerializer
+
+
+class CounterTests(TestCase):
+
+    def setUp(self):
+        self.session = Session.objects.create(
+            conf_id="counter_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        Speaker.objects.create(
+            naas_cd="COUNT001", naas_nm="김철수", plpt_nm="테스트당", elecd_nm="서울",
+            elecd_div_nm="지역구", rlct_div_nm="초선", gtelt_eraco="22", ntr_div="남")
+        self.bill = Bill.objects.create(bill_id="COUNT_BILL", session=self.session,
+                                        bill_nm="국민안전 기본법 일부개정법률안")
+
+    def _statements(self, count):
+        return [{'speaker_name': '김철수',
+                 'text': f'{n}번째 발언입니다. 이 법안은 국민 안전을 위해 반드시 필요합니다.',
+                 'associated_bill_name': '국민안전 기본법 일부개정법률안'}
+                for n in range(count)]
+
+    def test_bulk_persistence_maintains_counters(self):
+        tasks.process_extracted_statements_data(self._statements(3), self.session, None)
+        tasks.create_placeholder_bill(self.session, '청년 주거 지원 특별법안')
+
+        self.session.refresh_from_db()
+        self.bill.refresh_from_db()
+        self.assertEqual((self.session.statement_count, self.session.bill_count), (3, 2))
+        self.assertEqual(self.bill.statement_count, 3)
+
+        data = SessionListSerializer(self.session).data
+        self.assertEqual((data['statement_count'], data['bill_count']), (3, 2))
+
+    def test_reconcile_repairs_drifted_counters(self):
+        tasks.process_extracted_statements_data(self._statements(2), self.session, None)
+        Session.objects.update(statement_count=7, bill_count=0)
+        Bill.objects.update(statement_count=0)
+
+        self.assertEqual(reconcile_counters(dry_run=True)['sessions']['drifted'], 1)
+        self.assertEqual(Session.objects.get().statement_count, 7)
+
+        call_command('reconcile_counters', batch_size=1, stdout=StringIO())
+        self.session.refresh_from_db()
+        self.bill.refresh_from_db()
+        self.assertEqual((self.session.statement_count, self.session.bill_count), (2, 1))
+        self.assertEqual(self.bill.statement_count, 2)
+        self.assertEqual(reconcile_counters(dry_run=True),
+                         {'sessions': {'rows': 0, 'drifted': 0},
+                          'bills': {'rows': 0, 'drifted': 0}})
+
+    def test_api_and_cleanup_writes_maintain_counters(self):
+        User.objects.create_user(username='testuser', password='testpassword')
+        self.client.login(username='testuser', password='testpassword')
+        response = self.client.post(reverse('statement-list'), {
+            'session': self.session.pk, 'bill': self.bill.pk, 'speaker': 'COUNT001',
+            'text': '이 법안은 국민 안전을 위해 반드시 필요합니다.', 'sentiment_score': 0.5},
+            content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.session.refresh_from_db()
+        self.bill.refresh_from_db()
+        self.assertEqual((self.session.statement_count, self.bill.statement_count), (1, 1))
+
+        statement_id = response.data['data']['id']
+        response = self.client.delete(reverse('statement-detail', kwargs={'pk': statement_id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.session.refresh_from_db()
+        self.assertEqual(self.session.statement_count, 0)
+
+        tasks.process_extracted_statements_data(self._statements(2), self.session, None)
+        Speaker.objects.filter(naas_cd="COUNT001").update(plpt_nm="정보없음")
+        call_command('cleanup_problematic_speakers', stdout=StringIO())
+        self.session.refresh_from_db()
+        self.bill.refresh_from_db()
+        self.assertEqual((self.session.statement_count, self.bill.statement_count), (0, 0))
+
+
+from .models import SpeakerPartyHistory
+from .party_membership import backfill_party_membership, parse_party_history
+
+
+class PartyMembershipTests(TestCase):
+
+    def setUp(self):
+        for code, plpt_nm in (("PARTY001", "민주통합당/더불어민주당"),
+                              ("PARTY002", "새누리당/국민의힘"),
+                              ("PARTY003", "정당정보없음")):
+            Speaker.objects.create(
+                naas_cd=code, naas_nm=code, plpt_nm=plpt_nm, elecd_nm="서울",
+                elecd_div_nm="지역구", rlct_div_nm="초선", gtelt_eraco="22", ntr_div="남")
+
+    def test_party_history_is_consolidated(self):
+        self.assertEqual(parse_party_history('민주통합당/ 더불어민주연합 /정의당'),
+                         ['더불어민주당', '정의당'])
+        self.assertEqual(parse_party_history('정보없음'), [])
+        self.assertEqual(parse_party_history(None), [])
+
+    def test_backfill_populates_current_party_and_history(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(backfill_party_membership(batch_size=10), 3)
+        self.assertLessEqual(len(queries), 10)
+
+        speaker = Speaker.objects.select_related('current_party').get(pk="PARTY001")
+        self.assertEqual(speaker.current_party.name, '더불어민주당')
+        self.assertEqual(list(SpeakerPartyHistory.objects.filter(speaker=speaker).values_list(
+            'party__name', 'is_current')), [('더불어민주당', True)])
+        with self.assertNumQueries(0):
+            self.assertEqual(speaker.get_current_party_name(), '더불어민주당')
+        self.assertIsNone(Speaker.objects.get(pk="PARTY003").current_party)
+        self.assertEqual(Speaker.objects.get(pk="PARTY003").get_current_party_name(), '정당정보없음')
+
+        # Re-running replaces the history instead of duplicating it
+        Speaker.objects.filter(pk="PARTY002").update(plpt_nm="새누리당/국민의힘/개혁신당")
+        backfill_party_membership()
+        self.assertEqual(SpeakerPartyHistory.objects.count(), 4)
+        self.assertEqual(Speaker.objects.get(pk="PARTY002").current_party.name, '개혁신당')
+        self.assertEqual(Party.objects.filter(name='더불어민주당').count(), 1)
+
+    def test_speaker_party_filter_matches_partial_names(self):
+        backfill_party_membership()
+
+        response = self.client.get(reverse('speaker-list'), {'party': '민주'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([speaker['naas_cd'] for speaker in response.data['results']], ['PARTY001'])
+
+
+from .statement_fields import backfill_statement_fields
+
+
+class StatementDenormalizationTests(APITestCase):
+
+    def setUp(self):
+        self.party = Party.objects.create(name='테스트당')
+        self.session = Session.objects.create(
+            conf_id="denorm_conf", era_co="제22대", sess="1", dgr="1",
+            conf_dt=datetime.date(2026, 3, 4), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        self.speaker = Speaker.objects.create(
+            naas_cd="DENORM001", naas_nm="김철수", plpt_nm="테스트당", current_party=self.party,
+            elecd_nm="서울", elecd_div_nm="지역구", rlct_div_nm="초선", gtelt_eraco="22", ntr_div="남")
+        self.bill = Bill.objects.create(bill_id="DENORM_BILL", session=self.session,
+                                        bill_nm="국민안전 기본법 일부개정법률안")
+
+    def test_statements_capture_party_date_and_era(self):
+        tasks.process_extracted_statements_data([{
+            'speaker_name': '김철수',
+            'text': '이 법안은 국민 안전을 위해 반드시 필요합니다.',
+            'sentiment_score': 0.5,
+            'associated_bill_name': '국민안전 기본법 일부개정법률안',
+        }], self.session, None)
+        Statement.objects.create(session=self.session, speaker=self.speaker, bill=self.bill,
+                                 text='반대 의견을 말씀드리겠습니다.', sentiment_score=-0.5)
+
+        self.assertEqual(set(Statement.objects.values_list('party', 'conf_dt', 'era')),
+                         {(self.party.id, datetime.date(2026, 3, 4), 22)})
+
+        # A later party change does not rewrite statements already captured
+        Speaker.objects.filter(pk=self.speaker.pk).update(current_party=None)
+        Statement.objects.update(party=None, conf_dt=None, era=None)
+        self.assertEqual(backfill_statement_fields(batch_size=1), 2)
+        self.assertEqual(set(Statement.objects.values_list('party', 'conf_dt', 'era')),
+                         {(None, datetime.date(2026, 3, 4), 22)})
+
+    def test_party_sentiment_is_one_group_by(self):
+        for n, score in enumerate((0.5, -0.5, 0.6)):
+            Statement.objects.create(session=self.session, speaker=self.speaker, bill=self.bill,
+                                     text=f'{n}번째 발언입니다.', sentiment_score=score)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('party-sentiment-analysis'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries), 1)
+        result = response.data['results'][0]
+        self.assertEqual((result['party_name'], result['bill_id'], result['statement_count']),
+                         ('테스트당', 'DENORM_BILL', 3))
+        self.assertEqual((result['positive_count'], result['negative_count'], result['neutral_count']),
+                         (2, 1, 0))
+
+
+from unittest import skipUnless
+
+
+@skipUnless(connection.vendor == 'postgresql', 'The declared indexes target the PostgreSQL planner')
+class IndexUsageTests(APITestCase):
+    """The query plans of hot endpoints and lookups use the declared indexes."""
+
+    def setUp(self):
+        self.party = Party.objects.create(name='테스트당')
+        self.session = Session.objects.create(
+            conf_id="index_conf", era_co="22", sess="1", dgr="1",
+            conf_dt=datetime.date.today(), conf_knd="본회의", cmit_nm="본회의",
+            bg_ptm=datetime.time(10, 0), ed_ptm=datetime.time(12, 0),
+            down_url="http://example.com/pdf")
+        speaker = Speaker.objects.create(
+            naas_cd="INDEX001", naas_nm="김철수", plpt_nm="테스트당", current_party=self.party,
+            elecd_nm="서울", elecd_div_nm="지역구", rlct_div_nm="초선", gtelt_eraco="22", ntr_div="남")
+        bill = Bill.objects.create(bill_id="INDEX_BILL", session=self.session, bill_nm="국민안전 기본법")
+        for n in range(5):
+            Statement.objects.create(session=self.session, speaker=speaker, bill=bill,
+                                     text=f'{n}번째 발언입니다.', sentiment_score=0.1 * n)
+        with connection.cursor() as cursor:
+            # Tiny test tables would otherwise always be scanned
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+    def assertUsesDeclaredIndex(self, plan, model):
+        names = {index.name for index in model._meta.indexes}
+        self.assertTrue(any(name in plan for name in names),
+                        f'No {model.__name__} index of {sorted(names)} in plan:\n{plan}')
+
+    def _endpoint_plan(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        plans = []
+        with connection.cursor() as cursor:
+            for query in queries:
+                if query['sql'].startswith('SELECT'):
+                    cursor.execute('EXPLAIN ' + query['sql'])
+                    plans.extend(row[0] for row in cursor.fetchall())
+        return '\n'.join(plans)
+
+    def test_home_data_uses_statement_and_session_indexes(self):
+        plan = self._endpoint_plan(reverse('home-data'))
+        self.assertUsesDeclaredIndex(plan, Statement)
+        self.assertUsesDeclaredIndex(plan, Session)
+
+    def test_party_detail_uses_statement_indexes(self):
+        self.assertUsesDeclaredIndex(
+            self._endpoint_plan(reverse('party-detail-extended', kwargs={'party_id': self.party.id})),
+            Statement)
+
+    def test_persistence_lookups_use_indexes(self):
+        self.assertUsesDeclaredIndex(
+            Statement.objects.filter(text_hash__in=['a', 'b']).values_list('id', flat=True).explain(),
+            Statement)
+        self.assertUsesDeclaredIndex(
+            Bill.objects.filter(session=self.session, bill_nm='국민안전 기본법').explain(),
+            Bill)
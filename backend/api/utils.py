@@ -72,6 +72,7 @@ from django.http import Http404
 from django.utils import timezone
 from datetime import datetime, timedelta
 from .models import Session, Bill, Speaker, Statement
+from .counters import refresh_session_counters
 
 logger = logging.getLogger(__name__)
 
@@ -237,6 +238,7 @@ class DataCollector:
     def save_bill_data(self, bills_data):
         """Save bill data to database"""
         saved_count = 0
+        session_ids = set()
 
         for bill_data in bills_data:
             try:
@@ -260,12 +262,14 @@ class DataCollector:
 
                 if created:
                     saved_count += 1
+                    session_ids.add(bill.session_id)
 
             except Exception as e:
                 logger.error(
                     f"Error saving bill {bill_data.get('BILL_ID')}: {e}")
                 continue
 
+        refresh_session_counters(session_ids)
         logger.info(f"Saved {saved_count} bills to database")
         return saved_count
 
@@ -34,9 +34,11 @@ from datetime import datetime, timedelta
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from django.db import models
-from django.db.models import F
+from django.db.models import F, Value
+from django.db.models.functions import Coalesce, TruncMonth
 from django.db import connection
 from .utils import ensure_basic_data_exists
+from .counters import refresh_bill_counters, refresh_counters, refresh_session_counters, statement_counter_targets
 
 logger = logging.getLogger(__name__)
 
@@ -219,6 +221,20 @@ class BillViewSet(viewsets.ModelViewSet):
     serializer_class = BillSerializer
     pagination_class = StandardResultsSetPagination
 
+    def perform_create(self, serializer):
+        bill = serializer.save()
+        refresh_session_counters([bill.session_id])
+
+    def perform_update(self, serializer):
+        old_session_id = serializer.instance.session_id
+        bill = serializer.save()
+        refresh_session_counters([old_session_id, bill.session_id])
+
+    def perform_destroy(self, instance):
+        session_id = instance.session_id
+        instance.delete()
+        refresh_session_counters([session_id])
+
     def retrieve(self, request, *args, **kwargs):
         """Override retrieve to ensure consistent response format"""
         try:
@@ -228,9 +244,7 @@ class BillViewSet(viewsets.ModelViewSet):
             # Add extra data for the bill
             response_data = serializer.data
 
-            # Add statement count
-            statement_count = Statement.objects.filter(bill=instance).count()
-            response_data['statement_count'] = statement_count
+            response_data['statement_count'] = instance.statement_count
 
             # Add voting records count if available
             try:
@@ -308,11 +322,13 @@ class BillViewSet(viewsets.ModelViewSet):
             bill = self.get_object()
 
             # Get statements for this bill
-            statements = Statement.objects.filter(bill=bill)
+            statements = Statement.objects.filter(bill=bill).select_related(
+                'speaker__current_party')
 
             # Get voting records for this bill - make this optional
-            voting_records = VotingRecord.objects.filter(bill=bill) if hasattr(
-                VotingRecord, 'objects') else VotingRecord.objects.none()
+            voting_records = VotingRecord.objects.filter(
+                bill=bill).select_related('speaker__current_party') if hasattr(
+                    VotingRecord, 'objects') else VotingRecord.objects.none()
 
             # Combine sentiment from statements and voting
             combined_sentiment = {}
@@ -517,7 +533,8 @@ class BillViewSet(viewsets.ModelViewSet):
             neutral_count = total_statements - positive_count - negative_count
 
             # Party breakdown
-            party_breakdown = statements.values('speaker__plpt_nm').annotate(
+            party_breakdown = statements.values(
+                party_name=F('party__name')).annotate(
                 count=Count('id'),
                 avg_sentiment=Avg('sentiment_score'),
                 positive_count=Count('id', filter=Q(sentiment_score__gt=0.3)),
@@ -526,15 +543,16 @@ class BillViewSet(viewsets.ModelViewSet):
 
             # Top speakers by sentiment (most positive and most negative)
             speaker_breakdown = statements.values(
-                'speaker__naas_nm', 'speaker__plpt_nm').annotate(
+                'speaker__naas_nm',
+                party_name=F('party__name')).annotate(
                     count=Count('id'),
                     avg_sentiment=Avg('sentiment_score')).filter(
                         count__gte=2).order_by('-avg_sentiment')[:10]
 
             # Sentiment timeline (by session date)
-            timeline_data = statements.values('session__conf_dt').annotate(
+            timeline_data = statements.values('conf_dt').annotate(
                 avg_sentiment=Avg('sentiment_score'),
-                count=Count('id')).order_by('session__conf_dt')
+                count=Count('id')).order_by('conf_dt')
 
             return Response({
                 'bill': {
@@ -563,7 +581,7 @@ class BillViewSet(viewsets.ModelViewSet):
                 list(speaker_breakdown),
                 'sentiment_timeline': [{
                     'date':
-                    item['session__conf_dt'].strftime('%Y-%m-%d'),
+                    item['conf_dt'].strftime('%Y-%m-%d'),
                     'avg_sentiment':
                     round(item['avg_sentiment'], 3),
                     'statement_count':
@@ -582,6 +600,12 @@ class SpeakerViewSet(viewsets.ModelViewSet):
     serializer_class = SpeakerSerializer
     pagination_class = StandardResultsSetPagination
 
+    def perform_destroy(self, instance):
+        # Deleting a speaker cascades to their statements
+        counter_targets = statement_counter_targets(instance.statements.all())
+        instance.delete()
+        refresh_counters(*counter_targets)
+
     def get_queryset(self):
         try:
             # Filter to only show 22nd Assembly speakers - handle missing/null fields safely
@@ -603,7 +627,8 @@ class SpeakerViewSet(viewsets.ModelViewSet):
             if name and name.strip():
                 queryset = queryset.filter(naas_nm__icontains=name.strip())
             if party and party.strip():
-                queryset = queryset.filter(plpt_nm__icontains=party.strip())
+                queryset = queryset.filter(
+                    current_party__name__icontains=party.strip())
             if constituency and constituency.strip():
                 # Handle constituency filtering more safely
                 queryset = queryset.filter(
@@ -632,11 +657,11 @@ class SpeakerViewSet(viewsets.ModelViewSet):
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() -
+                conf_dt__gte=now.date() -
                 timezone.timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timezone.timedelta(days=30))
+                conf_dt__gte=now.date() - timezone.timedelta(days=30))
 
         ordered_statements = statements_qs.order_by('-session__conf_dt',
                                                     '-created_at')
@@ -660,6 +685,22 @@ class StatementViewSet(viewsets.ModelViewSet):
             return StatementCreateSerializer
         return StatementSerializer
 
+    def perform_create(self, serializer):
+        statement = serializer.save()
+        refresh_counters([statement.session_id], [statement.bill_id])
+
+    def perform_update(self, serializer):
+        old = serializer.instance
+        old_session_id, old_bill_id = old.session_id, old.bill_id
+        statement = serializer.save()
+        refresh_counters([old_session_id, statement.session_id],
+                         [old_bill_id, statement.bill_id])
+
+    def perform_destroy(self, instance):
+        session_id, bill_id = instance.session_id, instance.bill_id
+        instance.delete()
+        refresh_counters([session_id], [bill_id])
+
     def create(self, request, *args, **kwargs):
         try:
             serializer = self.get_serializer(data=request.data)
@@ -935,9 +976,8 @@ def data_status(request):
         created_at__gte=yesterday).count()
 
     # Processing status
-    sessions_with_statements = Session.objects.annotate(
-        statement_count=Count('statements')).filter(
-            statement_count__gt=0).count()
+    sessions_with_statements = Session.objects.filter(
+        statement_count__gt=0).count()
 
     sessions_with_pdfs = Session.objects.exclude(down_url='').count()
 
@@ -1041,10 +1081,10 @@ def category_analytics(request):
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
 
         # Apply category filter if provided
         if categories_param:
@@ -1069,7 +1109,7 @@ def category_analytics(request):
 
                 # Get party breakdown for this category
                 party_breakdown = category_statements.values(
-                    'speaker__plpt_nm').annotate(
+                    party_name=F('party__name')).annotate(
                         count=Count('id'),
                         avg_sentiment=Avg('sentiment_score')).order_by(
                             '-count')[:5]
@@ -1128,10 +1168,10 @@ def check_data_status(request):
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
 
         # Apply category filter if provided
         if categories_param:
@@ -1156,7 +1196,7 @@ def check_data_status(request):
 
                 # Get party breakdown for this category
                 party_breakdown = category_statements.values(
-                    'speaker__plpt_nm').annotate(
+                    party_name=F('party__name')).annotate(
                         count=Count('id'),
                         avg_sentiment=Avg('sentiment_score')).order_by(
                             '-count')[:5]
@@ -1189,34 +1229,18 @@ def category_trend_analysis(request, category_id):
 
         # Get statements for this category over the last year
         one_year_ago = timezone.now().date() - timedelta(days=365)
-        statements = Statement.objects.filter(
+        monthly_stats = Statement.objects.filter(
             categories__category=category,
-            session__conf_dt__gte=one_year_ago).order_by('session__conf_dt')
+            conf_dt__gte=one_year_ago).annotate(
+                month=TruncMonth('conf_dt')).values('month').annotate(
+                    count=Count('id'),
+                    avg_sentiment=Avg('sentiment_score')).order_by('month')
 
-        # Group by month
-        monthly_data = {}
-        for statement in statements:
-            month_key = statement.session.conf_dt.strftime('%Y-%m')
-            if month_key not in monthly_data:
-                monthly_data[month_key] = {'count': 0, 'sentiment_scores': []}
-            monthly_data[month_key]['count'] += 1
-            if statement.sentiment_score is not None:
-                monthly_data[month_key]['sentiment_scores'].append(
-                    statement.sentiment_score)
-
-        # Calculate monthly averages
-        trend_data = []
-        for month, data in sorted(monthly_data.items()):
-            if data['sentiment_scores']:
-                avg_sentiment = sum(data['sentiment_scores']) / len(
-                    data['sentiment_scores'])
-            else:
-                avg_sentiment = 0
-            trend_data.append({
-                'month': month,
-                'statement_count': data['count'],
-                'avg_sentiment': round(avg_sentiment, 3)
-            })
+        trend_data = [{
+            'month': data['month'].strftime('%Y-%m'),
+            'statement_count': data['count'],
+            'avg_sentiment': round(data['avg_sentiment'] or 0, 3)
+        } for data in monthly_stats]
 
         return Response({
             'category': {
@@ -1239,19 +1263,19 @@ def overall_sentiment_stats(request):
         time_range = request.query_params.get('time_range', 'all')
 
         statements_qs = Statement.objects.filter(
-            session__era_co__in=['22', '제22대'])
+            era=22)
 
         # Apply time filter
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
         elif time_range == 'week':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=7))
+                conf_dt__gte=now.date() - timedelta(days=7))
 
         # Get total statements count
         total_statements = statements_qs.count()
@@ -1285,9 +1309,9 @@ def overall_sentiment_stats(request):
         neutral_count = total_statements - positive_count - negative_count
 
         # Party sentiment ranking - filter out invalid party names
-        party_stats = statements_qs.exclude(
-            speaker__plpt_nm__in=['', ' ', '정보없음', '무소속']
-        ).values('speaker__plpt_nm').annotate(
+        party_stats = statements_qs.filter(party__isnull=False).exclude(
+            party__name='무소속').values(
+                    party_name=F('party__name')).annotate(
             avg_sentiment=Avg('sentiment_score'),
             statement_count=Count('id'),
             positive_count=Count('id', filter=Q(sentiment_score__gt=0.3)),
@@ -1298,7 +1322,8 @@ def overall_sentiment_stats(request):
         # Most active speakers
         speaker_stats = statements_qs.exclude(
             speaker__naas_nm__in=['', ' ', '정보없음']).values(
-                'speaker__naas_nm', 'speaker__plpt_nm').annotate(
+                'speaker__naas_nm',
+                party_name=F('party__name')).annotate(
                     avg_sentiment=Avg('sentiment_score'),
                     statement_count=Count('id')).filter(
                         statement_count__gte=1).order_by(
@@ -1358,73 +1383,52 @@ def sentiment_by_party_and_topic(request):
         time_range = request.query_params.get('time_range', 'all')
 
         # Base queryset for statements
-        statements_qs = Statement.objects.select_related(
-            'speaker', 'bill', 'session').all()
+        statements_qs = Statement.objects.filter(
+            sentiment_score__isnull=False)
 
         # Apply time filter
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
 
         results = []
 
         if group_by == 'bill':
             # Group by party and bill
-            party_bill_data = {}
-
-            for statement in statements_qs.filter(
-                    sentiment_score__isnull=False, bill__isnull=False):
-                party_name = statement.speaker.get_current_party_name()
-                bill_name = statement.bill.bill_nm
-
-                key = f"{party_name}|{bill_name}"
-                if key not in party_bill_data:
-                    party_bill_data[key] = {
-                        'party_name': party_name,
-                        'bill_name': bill_name,
-                        'bill_id': statement.bill.bill_id,
-                        'sentiment_scores': [],
-                        'statement_count': 0
-                    }
-
-                party_bill_data[key]['sentiment_scores'].append(
-                    statement.sentiment_score)
-                party_bill_data[key]['statement_count'] += 1
-
-            # Calculate averages
-            for data in party_bill_data.values():
-                if data['sentiment_scores']:
-                    data['avg_sentiment'] = round(
-                        sum(data['sentiment_scores']) /
-                        len(data['sentiment_scores']), 3)
-                    data['positive_count'] = len(
-                        [s for s in data['sentiment_scores'] if s > 0.3])
-                    data['negative_count'] = len(
-                        [s for s in data['sentiment_scores'] if s < -0.3])
-                    data['neutral_count'] = data['statement_count'] - data[
-                        'positive_count'] - data['negative_count']
-                    # Remove raw sentiment scores to reduce response size
-                    del data['sentiment_scores']
-                    results.append(data)
+            party_bill_stats = statements_qs.filter(
+                bill__isnull=False).values(
+                    'bill_id',
+                    party_name=Coalesce(F('party__name'),
+                                        Value('정당정보없음')),
+                    bill_name=F('bill__bill_nm')).annotate(
+                        statement_count=Count('id'),
+                        avg_sentiment=Avg('sentiment_score'),
+                        positive_count=Count(
+                            'id', filter=Q(sentiment_score__gt=0.3)),
+                        negative_count=Count(
+                            'id', filter=Q(sentiment_score__lt=-0.3)))
+
+            for data in party_bill_stats:
+                data['avg_sentiment'] = round(data['avg_sentiment'], 3)
+                data['neutral_count'] = data['statement_count'] - data[
+                    'positive_count'] - data['negative_count']
+                results.append(data)
 
         # Sort by average sentiment
         results.sort(key=lambda x: x['avg_sentiment'], reverse=True)
 
         return Response({
             'time_range': time_range,
-            'category_filter': category_filter,
-            'party_filter': party_filter,
-            'stance_filter': stance_filter,
-            'results': results,
-            'total_categories_analyzed': len(results)
+            'group_by': group_by,
+            'results': results
         })
 
     except Exception as e:
-        logger.error(f"Error in policy_sentiment_by_category: {e}")
+        logger.error(f"Error in sentiment_by_party_and_topic: {e}")
         return Response({'error': 'Failed to analyze policy sentiment'},
                         status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -1449,17 +1453,17 @@ def policy_sentiment_by_category(request):
         # Apply time filter
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=timezone.now().date() -
+                conf_dt__gte=timezone.now().date() -
                 timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=timezone.now().date() -
+                conf_dt__gte=timezone.now().date() -
                 timedelta(days=30))
 
         # Apply party filter
         if party_filter:
             statements_qs = statements_qs.filter(
-                speaker__current_party__name__icontains=party_filter)
+                party__name__icontains=party_filter)
 
         results = []
 
@@ -1530,8 +1534,7 @@ def policy_sentiment_by_category(request):
             # Party breakdown for this category
             party_breakdown = []
             party_data = category_statements.values(
-                'speaker__current_party__name').annotate(
-                    party_name=F('speaker__current_party__name'),
+                party_name=F('party__name')).annotate(
                     statement_count=Count('id'),
                     avg_sentiment=Avg('sentiment_score'),
                     positive_count=Count('id',
@@ -1753,7 +1756,7 @@ def party_policy_comparison(request):
 
         for party in parties:
             party_statements = Statement.objects.filter(
-                speaker__current_party=party,
+                party=party,
                 sentiment_score__isnull=False,
                 bill__isnull=False).select_related('bill')
 
@@ -1868,15 +1871,15 @@ def category_sentiment_analysis(request):
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
 
         # Apply party filter
         if party_filter:
             statements_qs = statements_qs.filter(
-                speaker__plpt_nm__icontains=party_filter)
+                party__name__icontains=party_filter)
 
         # Apply category filter
         if category_filter:
@@ -1904,7 +1907,7 @@ def category_sentiment_analysis(request):
 
             # Get party breakdown for this category
             party_breakdown = category_statements.values(
-                'speaker__plpt_nm').annotate(
+                party_name=F('party__name')).annotate(
                     count=Count('id'), avg_sentiment=Avg(
                         'sentiment_score')).order_by('-avg_sentiment')[:10]
 
@@ -2048,8 +2051,7 @@ def parties_list(request):
 
         for party in parties:
             # Get speakers for this party
-            all_speakers = Speaker.objects.filter(
-                plpt_nm__icontains=party.name)
+            all_speakers = Speaker.objects.filter(current_party=party)
             member_count = all_speakers.count()
 
             # Skip if no members found
@@ -2057,15 +2059,14 @@ def parties_list(request):
                 continue
 
             # Get statements and sentiment analysis
-            statements = Statement.objects.filter(
-                speaker__plpt_nm__icontains=party.name)
+            statements = Statement.objects.filter(party=party)
             avg_sentiment = statements.aggregate(
                 Avg('sentiment_score'))['sentiment_score__avg']
             total_statements = statements.count()
 
             # Get bills related to this party's speakers
             bills = Bill.objects.filter(
-                statements__speaker__plpt_nm__icontains=party.name).distinct()
+                statements__party=party).distinct()
             total_bills = bills.count()
 
             party_info = {
@@ -2144,7 +2145,7 @@ def party_detail(request, party_id):
             'sort_by', 'sentiment')  # 'sentiment', 'statements', 'bills'
 
         # Filter statements based on time range
-        statements_filter = Q(speaker__plpt_nm=party.name)
+        statements_filter = Q(party=party)
         if time_range == 'month':
             from datetime import datetime, timedelta
             last_month = datetime.now() - timedelta(days=30)
@@ -2155,7 +2156,7 @@ def party_detail(request, party_id):
             statements_filter &= Q(created_at__gte=last_year)
 
         # Get party statistics
-        speakers = Speaker.objects.filter(plpt_nm=party.name)
+        speakers = Speaker.objects.filter(current_party=party)
         statements = Statement.objects.filter(statements_filter)
 
         # Calculate sentiment statistics
@@ -2170,7 +2171,7 @@ def party_detail(request, party_id):
 
         # Get bills related to this party
         bills = Bill.objects.filter(
-            statements__speaker__plpt_nm=party.name).distinct()
+            statements__party=party).distinct()
 
         # Get recent statements
         recent_statements = statements.order_by('-created_at')[:10]
@@ -2235,20 +2236,21 @@ def sentiment_analysis_list(request):
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
         elif time_range == 'week':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=7))
+                conf_dt__gte=now.date() - timedelta(days=7))
 
         # Get sentiment analysis data grouped by different dimensions
         results = []
 
         # By speaker sentiment
         speaker_sentiment = statements_qs.values(
-            'speaker__naas_nm', 'speaker__plpt_nm').annotate(
+            'speaker__naas_nm',
+            party_name=F('party__name')).annotate(
                 avg_sentiment=Avg('sentiment_score'),
                 statement_count=Count('id'),
                 positive_count=Count('id', filter=Q(sentiment_score__gt=0.3)),
@@ -2263,7 +2265,7 @@ def sentiment_analysis_list(request):
                 'name':
                 speaker['speaker__naas_nm'],
                 'party':
-                speaker['speaker__plpt_nm'],
+                speaker['party_name'],
                 'avg_sentiment':
                 round(speaker['avg_sentiment'] or 0, 3),
                 'statement_count':
@@ -2290,7 +2292,8 @@ def session_sentiment_by_party(request, pk):
         # Get statements for this session
         statements = Statement.objects.filter(
             session=session,
-            sentiment_score__isnull=False).select_related('speaker')
+            sentiment_score__isnull=False).select_related(
+                'speaker__current_party')
 
         if not statements.exists():
             return Response({
@@ -2382,17 +2385,17 @@ def party_analytics(request):
 
         # Base queryset for statements
         statements_qs = Statement.objects.filter(
-            session__era_co__in=['제22대', '22']).select_related(
+            era=22).select_related(
                 'speaker', 'session', 'bill')
 
         # Apply time filter
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
 
         # Apply category filter if provided
         if categories:
@@ -2403,8 +2406,8 @@ def party_analytics(request):
                 categories__category_id__in=category_ids)
 
         # Get party analytics
-        party_stats = statements_qs.values('speaker__plpt_nm').annotate(
-            party_name=F('speaker__plpt_nm'),
+        party_stats = statements_qs.values(
+            party_name=F('party__name')).annotate(
             statement_count=Count('id'),
             avg_sentiment=Avg('sentiment_score'),
             positive_count=Count('id', filter=Q(sentiment_score__gt=0.3)),
@@ -2421,7 +2424,7 @@ def party_analytics(request):
                 continue
 
             member_count = Speaker.objects.filter(
-                plpt_nm__icontains=party['party_name'],
+                current_party__name=party['party_name'],
                 gtelt_eraco__icontains='22').count()
 
             neutral_count = party['statement_count'] - party[
@@ -2473,20 +2476,20 @@ def overall_analytics(request):
         bills_qs = Bill.objects.filter(session__era_co__in=['제22대', '22'])
         speakers_qs = Speaker.objects.filter(gtelt_eraco__icontains='22')
         statements_qs = Statement.objects.filter(
-            session__era_co__in=['제22대', '22'])
+            era=22)
 
         # Apply time filter
         now = timezone.now()
         if time_range == 'year':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=365))
+                conf_dt__gte=now.date() - timedelta(days=365))
             sessions_qs = sessions_qs.filter(conf_dt__gte=now.date() -
                                              timedelta(days=365))
             bills_qs = bills_qs.filter(session__conf_dt__gte=now.date() -
                                        timedelta(days=365))
         elif time_range == 'month':
             statements_qs = statements_qs.filter(
-                session__conf_dt__gte=now.date() - timedelta(days=30))
+                conf_dt__gte=now.date() - timedelta(days=30))
             sessions_qs = sessions_qs.filter(conf_dt__gte=now.date() -
                                              timedelta(days=30))
             bills_qs = bills_qs.filter(session__conf_dt__gte=now.date() -
@@ -2524,8 +2527,8 @@ def overall_analytics(request):
         }
 
         # Top parties by activity
-        top_parties = statements_qs.values('speaker__plpt_nm').annotate(
-            party_name=F('speaker__plpt_nm'),
+        top_parties = statements_qs.values(
+            party_name=F('party__name')).annotate(
             statement_count=Count('id'),
             avg_sentiment=Avg('sentiment_score')).filter(
                 statement_count__gt=5).order_by('-statement_count')[:10]
@@ -2578,8 +2581,7 @@ def stats_overview(request):
             session__era_co__in=['제22대', '22']).count()
         speakers_22 = Speaker.objects.filter(
             gtelt_eraco__icontains='22').count()
-        statements_22 = Statement.objects.filter(
-            session__era_co__in=['제22대', '22']).count()
+        statements_22 = Statement.objects.filter(era=22).count()
         parties_22 = Party.objects.filter(assembly_era=22).count()
 
         # If no 22nd Assembly data, get from any assembly
@@ -2632,10 +2634,6 @@ def home_data(request):
 
         sessions_data = []
         for session in recent_sessions:
-            # Count statements for this session
-            statement_count = Statement.objects.filter(session=session).count()
-            bill_count = Bill.objects.filter(session=session).count()
-
             # Handle missing session data gracefully
             title = session.title
             if not title:
@@ -2654,9 +2652,9 @@ def home_data(request):
                 'committee':
                 session.cmit_nm or '',
                 'statement_count':
-                statement_count,
+                session.statement_count,
                 'bill_count':
-                bill_count
+                session.bill_count
             })
 
         # Get recent bills - simple query, ordered by session date
@@ -2666,9 +2664,6 @@ def home_data(request):
 
         bills_data = []
         for bill in recent_bills:
-            # Count statements for this bill
-            statement_count = Statement.objects.filter(bill=bill).count()
-
             # Clean bill title - remove leading numbers like "10. "
             clean_title = bill.bill_nm
             if clean_title and '. ' in clean_title:
@@ -2690,13 +2685,14 @@ def home_data(request):
                 (f"제{bill.session.era_co}대 제{bill.session.sess}회 제{bill.session.dgr}차"
                  if bill.session else None),
                 'statement_count':
-                statement_count
+                bill.statement_count
             })
 
         # Get recent statements - simple query
         recent_statements = Statement.objects.filter(
-            session__era_co__in=['제22대', '22']).select_related(
-                'speaker', 'session', 'bill').order_by('-created_at')[:10]
+            era=22).select_related(
+                'speaker__current_party', 'session',
+                'bill').order_by('-created_at')[:10]
 
         statements_data = []
         for statement in recent_statements:
@@ -2730,13 +2726,11 @@ def home_data(request):
             session__era_co__in=['22', '제22대']).count()
         total_speakers = Speaker.objects.filter(
             gtelt_eraco__icontains='22').count()
-        total_statements = Statement.objects.filter(
-            session__era_co__in=['22', '제22대']).count()
+        total_statements = Statement.objects.filter(era=22).count()
 
         # Calculate sentiment stats
         sentiment_stats = Statement.objects.filter(
-            session__era_co__in=['22', '제22대'],
-            sentiment_score__isnull=False).aggregate(
+            era=22, sentiment_score__isnull=False).aggregate(
                 avg_sentiment=Avg('sentiment_score'),
                 positive_count=Count('id', filter=Q(sentiment_score__gt=0.3)),
                 negative_count=Count('id', filter=Q(sentiment_score__lt=-0.3)))
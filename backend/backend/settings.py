@@ -122,6 +122,19 @@ else:
         }
     }
 
+# Connections close after each request or Celery task unless DB_CONN_MAX_AGE
+# is set. Celery workers opt in (e.g. DB_CONN_MAX_AGE=600) to keep one
+# connection across tasks; web processes keep the default so idle threads do
+# not hold Postgres slots. Reused connections are health-checked, and
+# Serverless Postgres drops idle ones, so a dead connection is replaced at the
+# start of the next request or task (see api.db_connections) instead of
+# failing it.
+DATABASES['default']['CONN_MAX_AGE'] = int(os.getenv('DB_CONN_MAX_AGE', '0'))
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+# Behind pgbouncer in transaction pooling mode, server-side cursors break
+if os.getenv('DB_PGBOUNCER_TRANSACTION_POOLING', 'False') == 'True':
+    DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -151,7 +151,7 @@ const SentimentDashboard = ({ billId = null }) => {
               <div key={index} className="flex items-center justify-between p-3 border border-gray-200 rounded-lg">
                 <div className="flex-1">
                   <div className="font-medium text-gray-900 text-sm">
-                    {party.speaker__plpt_nm?.split('/').pop() || party.speaker__plpt_nm}
+                    {party.party_name}
                   </div>
                   <div className="text-xs text-gray-600">
                     발언 수: {party.statement_count} | 긍정: {party.positive_count} | 부정: {party.negative_count}
@@ -177,7 +177,7 @@ const SentimentDashboard = ({ billId = null }) => {
                     {speaker.speaker__naas_nm}
                   </div>
                   <div className="text-xs text-gray-600">
-                    {speaker.speaker__plpt_nm?.split('/').pop() || speaker.speaker__plpt_nm} | 발언 수: {speaker.statement_count}
+                    {speaker.party_name} | 발언 수: {speaker.statement_count}
                   </div>
                 </div>
                 <div className={`px-3 py-1 rounded text-sm font-medium ${getSentimentColor(speaker.avg_sentiment)}`}>
@@ -380,7 +380,8 @@ def main():
     if redis_started:
         # Start Celery worker
         print("🚀 Starting Celery worker...")
-        celery_worker_cmd = f"cd {project_root}/backend && celery -A backend worker -l info"
+        # Workers keep their DB connection across tasks (see settings.py)
+        celery_worker_cmd = f"cd {project_root}/backend && DB_CONN_MAX_AGE=${{DB_CONN_MAX_AGE:-600}} celery -A backend worker -l info"
         celery_worker_process = start_service(celery_worker_cmd,
                                               "Celery-Worker",
                                               working_dir=str(project_root / "backend"))